@@ -12,9 +12,17 @@ import sqlite3
 from werkzeug.utils import secure_filename
 from datetime import datetime
 import time
+import functools
+import operator
 
 # 백엔드 패키지 임포트
 from backend.services.macro_service import macro_service
+from backend.services.macro_index import macro_index
+from backend.services.macro_matching_service import get_macro_matching_service
+from backend.services.speculative_matching_service import get_speculative_matching_service
+from backend.services.command_segmentation_service import get_command_segmentation_service
+from backend.services.utterance_assembler_service import get_utterance_assembler_service
+from backend.services.client_task_executor import ClientTaskExecutor
 from backend.services.voice_service import get_voice_recognition_service
 from backend.services.whisper_service import whisper_service
 from backend.services.macro_execution_service import macro_execution_service
@@ -23,6 +31,9 @@ from backend.services.custom_script_service import custom_script_service
 from backend.services.gpt4o_transcription_service import GPT4oTranscriptionService
 from backend.database.database_manager import DatabaseManager
 from backend.utils.config import Config
+from backend.utils.audio_frame import FrameSequenceTracker, parse_audio_frame
+from backend.utils.resampler import Resampler
+from backend.utils.audio_codec import AUDIO_CODECS, decode_audio, negotiate_codec
 
 # Flask 애플리케이션 초기화
 app = Flask(__name__)
@@ -57,6 +68,13 @@ gpt4o_connection_status = {
 connected_clients = {}
 voice_sessions = {}
 
+# 서버 마이크 녹음(음성 인식 서비스)의 인식 결과에 쓰는 세션 ID
+LOCAL_VOICE_SESSION_ID = 'local_microphone'
+
+# 최대 대기 시간이 지난 발화를 내보내는 백그라운드 작업 상태
+utterance_sweeper_started = False
+utterance_sweeper_lock = threading.Lock()
+
 def initialize_gpt4o_service():
     """
     GPT-4o 트랜스크립션 서비스를 초기화하는 함수
@@ -92,16 +110,29 @@ initialize_gpt4o_service()
 
 # Socket.IO 이벤트 핸들러
 @socketio.on('connect')
-def handle_connect():
+def handle_connect(auth=None):
     """
     클라이언트 연결 시 호출되는 이벤트 핸들러
-    새로운 음성인식 세션을 생성하고 클라이언트에 연결 확인을 전송합니다.
+    새로운 음성인식 세션을 생성하고 업링크 오디오 코덱을 정한 뒤 클라이언트에 연결 확인을 전송합니다.
+    
+    Args:
+        auth (dict): 연결 인증 데이터 (선택사항)
+            - audio_codecs: 클라이언트가 보낼 수 있는 코덱 목록 (예: ['ima_adpcm', 'mulaw', 'pcm16'])
+              쿼리 문자열 audio_codecs=ima_adpcm,mulaw 로도 전달 가능, 없으면 pcm16
     """
     client_id = request.sid
+    
+    # 업링크 코덱 협상 (서버 우선순위 중 클라이언트가 지원하는 첫 코덱)
+    client_codecs = auth.get('audio_codecs') if isinstance(auth, dict) else None
+    if client_codecs is None and request.args.get('audio_codecs'):
+        client_codecs = request.args.get('audio_codecs').split(',')
+    audio_codec = negotiate_codec(client_codecs, Config.AUDIO_UPLINK_CODECS)
+    
     client_info = {
         'session_id': client_id,
         'connected_at': datetime.now().isoformat(),
         'is_recording': False,
+        'audio_codec': audio_codec,
         'last_activity': datetime.now().isoformat()
     }
     
@@ -110,17 +141,21 @@ def handle_connect():
         'session_id': client_id,
         'start_time': datetime.now(),
         'transcription_count': 0,
-        'audio_chunks_received': 0
+        'audio_chunks_received': 0,
+        'utterances_submitted': 0,
+        'frame_sequence': FrameSequenceTracker()  # audio_frame 손실/순서 뒤바뀜 검출
     }
     
-    print(f"✅ Socket.IO 클라이언트 연결: {client_id}")
+    print(f"✅ Socket.IO 클라이언트 연결: {client_id} (오디오 코덱: {audio_codec})")
     
     # 연결 성공 메시지 전송
     emit('connection_established', {
         'success': True,
         'session_id': client_id,
         'server_time': datetime.now().isoformat(),
-        'features': ['gpt4o_transcription', 'real_time_audio', 'macro_matching'],
+        'features': ['gpt4o_transcription', 'real_time_audio', 'macro_matching', 'binary_audio_frames'],
+        'audio_codec': audio_codec,
+        'supported_audio_codecs': [codec for codec in Config.AUDIO_UPLINK_CODECS if codec in AUDIO_CODECS],
         'message': '실시간 음성인식 서버에 연결되었습니다'
     })
 
@@ -138,6 +173,14 @@ def handle_disconnect():
     if client_id in voice_sessions:
         del voice_sessions[client_id]
     
+    # 조립 중인 발화와 대기 중인 작업 정리
+    get_utterance_assembler_service().clear_session(client_id)
+    transcription_executor.clear_client(client_id)
+    macro_executor.clear_client(client_id)
+    
+    # 선행 매칭 예약 정리
+    get_speculative_matching_service().clear_session(client_id)
+    
     print(f"❌ Socket.IO 클라이언트 연결 해제: {client_id}")
 
 @socketio.on('start_voice_recognition')
@@ -153,6 +196,13 @@ def handle_start_voice_recognition():
             connected_clients[client_id]['is_recording'] = True
             connected_clients[client_id]['last_activity'] = datetime.now().isoformat()
             
+            # 새 녹음은 새 오디오 스트림으로 조립 (프레임 시퀀스도 새로 시작,
+            # 이전 녹음의 리샘플러 잔여 오디오는 중지 시 조립되었고 남은 것은 버리는 스트림의 일부)
+            get_utterance_assembler_service().clear_session(client_id)
+            if client_id in voice_sessions:
+                voice_sessions[client_id]['frame_sequence'].reset()
+                voice_sessions[client_id].pop('frame_resampler', None)
+            
             print(f"🎤 음성 인식 시작: {client_id}")
             
             emit('voice_recognition_started', {
@@ -189,6 +239,10 @@ def handle_stop_voice_recognition():
             connected_clients[client_id]['is_recording'] = False
             connected_clients[client_id]['last_activity'] = datetime.now().isoformat()
             
+            # 리샘플러 필터 지연에 남은 오디오까지 조립한 뒤 마지막 발화 트랜스크립션
+            flush_frame_resampler(client_id)
+            submit_utterances(get_utterance_assembler_service().flush(client_id))
+            
             print(f"🛑 음성 인식 중지: {client_id}")
             
             emit('voice_recognition_stopped', {
@@ -222,6 +276,7 @@ def handle_audio_chunk(data):
         data (dict): 오디오 데이터 (Base64 인코딩)
             - audio: Base64 인코딩된 오디오 데이터
             - format: 오디오 포맷 정보 (선택사항)
+            - codec: 오디오 코덱 ('pcm16' | 'mulaw' | 'ima_adpcm', 선택사항, 기본값: 연결 시 협상한 코덱)
     """
     client_id = request.sid
     
@@ -244,16 +299,19 @@ def handle_audio_chunk(data):
             audio_bytes = base64.b64decode(audio_base64)
             audio_length = len(audio_bytes)
             
-            print(f"🎵 오디오 청크 수신: {client_id} ({audio_length} bytes)")
+            # 협상한 코덱으로 PCM16 디코딩 (pcm16은 복사 없이 그대로 사용)
+            codec = data.get('codec') or connected_clients[client_id]['audio_codec']
+            samples = decode_audio(audio_bytes, codec)
             
-            # 오디오 데이터를 음성인식 서비스로 전달 (향후 GPT-4o 통합)
-            # 현재는 Whisper 서비스를 사용하여 임시 처리
-            process_audio_for_transcription(client_id, audio_bytes)
+            print(f"🎵 오디오 청크 수신: {client_id} ({audio_length} bytes, {codec})")
             
             # 클라이언트에 수신 확인 전송
             emit('audio_chunk_received', {
                 'success': True,
                 'audio_length': audio_length,
+                'codec': codec,
+                'samples': len(samples),
+                'is_speech': feed_client_audio(client_id, memoryview(samples).cast('B')),
                 'timestamp': datetime.now().isoformat()
             })
             
@@ -271,157 +329,382 @@ def handle_audio_chunk(data):
             'timestamp': datetime.now().isoformat()
         })
 
-def process_audio_for_transcription(client_id: str, audio_bytes: bytes):
+@socketio.on('audio_frame')
+def handle_audio_frame(data):
     """
-    오디오 데이터를 GPT-4o 또는 Whisper로 음성인식 처리하는 함수
+    바이너리 오디오 프레임 처리 (Base64 audio_chunk의 바이너리 버전)
+    헤더(시퀀스 번호, 샘플레이트, 형식)를 해석하고 오디오는 복사 없이 발화 조립으로 전달합니다.
     
     Args:
-        client_id (str): 클라이언트 세션 ID
-        audio_bytes (bytes): 디코딩된 PCM 오디오 데이터
+        data (bytes | dict): 헤더가 붙은 바이너리 프레임 또는 헤더 필드 딕셔너리
+            - seq: 프레임 시퀀스 번호
+            - sample_rate: 샘플레이트 (Hz, 조립 샘플레이트와 다르면 변환)
+            - format: 오디오 형식 ('pcm16' | 'mulaw' | 'ima_adpcm')
+            - audio: 바이너리 오디오 데이터
     """
-    def run_transcription():
-        global gpt4o_service, gpt4o_connection_status
+    client_id = request.sid
+    
+    try:
+        if client_id not in connected_clients or not connected_clients[client_id]['is_recording']:
+            return
         
         try:
-            # 오디오 파일 크기 체크 (최소 크기 확인)
-            if len(audio_bytes) < 1024:  # 1KB 미만이면 처리하지 않음
-                print(f"⚠️ 오디오 데이터가 너무 작음: {len(audio_bytes)} bytes")
-                return
-            
-            # GPT-4o 서비스 우선 시도
-            if gpt4o_service and Config.GPT4O_ENABLED:
-                try:
-                    print(f"🤖 GPT-4o 트랜스크립션 시도: {len(audio_bytes)} bytes")
-                    
-                    # GPT-4o 서비스로 직접 오디오 전송
-                    def handle_gpt4o_transcription(transcription_data):
-                        if transcription_data["type"] == "final":
-                            text = transcription_data["text"].strip()
-                            confidence = transcription_data["confidence"]
-                            
-                            if text and len(text) > 0:
-                                # 세션 통계 업데이트
-                                if client_id in voice_sessions:
-                                    voice_sessions[client_id]['transcription_count'] += 1
-                                
-                                print(f"📝 GPT-4o 음성인식 결과: '{text}' (신뢰도: {confidence:.2f})")
-                                
-                                # 연결 상태 업데이트
-                                gpt4o_connection_status.update({
-                                    'connected': True,
-                                    'last_attempt': datetime.now().isoformat(),
-                                    'error_message': None
-                                })
-                                
-                                # 클라이언트에 트랜스크립션 결과 전송
-                                socketio.emit('transcription_result', {
-                                    'type': 'final',
-                                    'text': text,
-                                    'confidence': confidence,
-                                    'session_id': client_id,
-                                    'source': 'gpt4o',
-                                    'timestamp': datetime.now().isoformat()
-                                }, room=client_id)
-                                
-                                # 매크로 매칭 시도
-                                try_macro_matching(client_id, text, confidence)
-                    
-                    # GPT-4o 서비스에 콜백 설정 후 오디오 전송
-                    gpt4o_service.set_transcription_callback(handle_gpt4o_transcription)
-                    
-                    # 비동기적으로 오디오 전송 (실제 구현에서는 이미 연결된 상태에서 전송)
-                    # 여기서는 테스트를 위해 직접 결과 생성
-                    print("✅ GPT-4o 오디오 전송 완료")
-                    return
-                    
-                except Exception as gpt4o_error:
-                    print(f"⚠️ GPT-4o 처리 실패, Whisper로 폴백: {gpt4o_error}")
-                    gpt4o_connection_status.update({
-                        'connected': False,
-                        'last_attempt': datetime.now().isoformat(),
-                        'error_message': str(gpt4o_error)
-                    })
-            
-            # Whisper 폴백 처리
-            print(f"🎙️ Whisper 트랜스크립션 폴백 시작...")
-            
-            # 임시 오디오 파일 저장 (Whisper 처리용)
-            temp_audio_path = f"temp_audio/audio_{client_id}_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}.wav"
+            frame = parse_audio_frame(data)
+        except ValueError as frame_error:
+            emit('audio_processing_error', {
+                'error': f'오디오 프레임 해석 실패: {str(frame_error)}',
+                'timestamp': datetime.now().isoformat()
+            })
+            return
+        
+        session = voice_sessions.get(client_id)
+        if session is None:
+            return
+        session['audio_chunks_received'] += 1
+        
+        # 늦게 도착하거나 중복된 프레임은 이미 지나간 스트림이므로 조립하지 않음
+        tracker = session['frame_sequence']
+        sequence_status = tracker.track(frame.sequence)
+        if sequence_status == 'gap':
+            print(f"⚠️ 오디오 프레임 손실: {client_id} (seq {frame.sequence}, 누적 {tracker.stats['lost']}개)")
+        
+        assembler = get_utterance_assembler_service()
+        is_speech = assembler.is_speech(client_id)
+        if sequence_status in ('ok', 'gap'):
+            # PCM16 디코딩 (pcm16은 받은 버퍼를 그대로 가리키는 뷰)
+            samples = decode_audio(frame.audio, frame.format)
             
-            # temp_audio 디렉토리가 없으면 생성
-            os.makedirs("temp_audio", exist_ok=True)
+            # 샘플레이트가 바뀌면 이전 리샘플러에 남은 오디오부터 조립
+            resampler = session.get('frame_resampler')
+            if resampler is not None and resampler.src_rate != frame.sample_rate:
+                flush_frame_resampler(client_id)
+                resampler = None
             
-            # PCM 데이터를 WAV 파일로 변환하여 저장
-            import wave
+            # 조립 샘플레이트와 다르면 세션별 스트리밍 리샘플러로 변환 (같으면 복사 없이 전달)
+            if frame.sample_rate != assembler.sample_rate:
+                if resampler is None:
+                    resampler = Resampler(frame.sample_rate, assembler.sample_rate, np.int16)
+                    session['frame_resampler'] = resampler
+                samples = resampler.process(samples).astype('<i2', copy=False)
             
+            is_speech = feed_client_audio(client_id, memoryview(samples).cast('B'))
+        
+        emit('audio_frame_received', {
+            'success': True,
+            'sequence': frame.sequence,
+            'sequence_status': sequence_status,
+            'audio_length': frame.audio.nbytes,
+            'lost_frames': tracker.stats['lost'],
+            'is_speech': is_speech,
+            'timestamp': datetime.now().isoformat()
+        })
+    
+    except Exception as e:
+        print(f"❌ 오디오 프레임 처리 오류: {e}")
+        emit('audio_processing_error', {
+            'error': str(e),
+            'timestamp': datetime.now().isoformat()
+        })
+
+def feed_client_audio(client_id: str, pcm) -> bool:
+    """
+    클라이언트 PCM16 오디오를 세션 발화 조립에 추가하고 완성된 발화를 트랜스크립션에 제출하는 함수
+    (무음은 VAD가 거르고, 청크 하나씩 따로 트랜스크립션하지 않음)
+    
+    Args:
+        client_id (str): 클라이언트 세션 ID
+        pcm (bytes | memoryview): PCM16 오디오 데이터
+        
+    Returns:
+        bool: 세션이 현재 음성 구간 안인지 여부
+    """
+    assembler = get_utterance_assembler_service()
+    submit_utterances(assembler.push(client_id, pcm))
+    ensure_utterance_sweeper()
+    return assembler.is_speech(client_id)
+
+def flush_frame_resampler(client_id: str):
+    """
+    세션 프레임 리샘플러에 필터 지연만큼 남은 오디오를 발화 조립에 추가하고 리샘플러를 제거하는 함수
+    (녹음 중지 또는 클라이언트 샘플레이트 변경 시)
+    
+    Args:
+        client_id (str): 클라이언트 세션 ID
+    """
+    session = voice_sessions.get(client_id)
+    resampler = session.pop('frame_resampler', None) if session else None
+    if resampler is None:
+        return
+    
+    tail = resampler.flush().astype('<i2', copy=False)
+    if tail.size:
+        feed_client_audio(client_id, memoryview(tail).cast('B'))
+
+def submit_utterances(utterances: list):
+    """
+    완성된 발화마다 트랜스크립션 작업을 하나씩 시작하는 함수
+    
+    Args:
+        utterances (list): 발화 조립 서비스가 내보낸 Utterance 목록
+    """
+    for utterance in utterances:
+        if utterance.client_id in voice_sessions:
+            voice_sessions[utterance.client_id]['utterances_submitted'] += 1
+        print(f"🧩 발화 조립 완료: {utterance.client_id} ({utterance.duration:.2f}초, {utterance.reason})")
+        process_audio_for_transcription(utterance.client_id, utterance.audio)
+
+def ensure_utterance_sweeper():
+    """최대 대기 시간이 지난 발화를 주기적으로 내보내는 백그라운드 작업 시작 (한 번만)"""
+    global utterance_sweeper_started
+    
+    with utterance_sweeper_lock:
+        if utterance_sweeper_started:
+            return
+        utterance_sweeper_started = True
+    
+    def sweep_utterances():
+        assembler = get_utterance_assembler_service()
+        interval = max(0.05, assembler.max_latency_ms / 1000 / 4)
+        while True:
+            socketio.sleep(interval)
             try:
-                # NAudio에서 전송된 PCM 데이터 (24kHz, 16-bit, mono)
-                sample_rate = 24000
-                channels = 1
-                sample_width = 2  # 16-bit = 2 bytes
+                submit_utterances(assembler.collect_expired())
+            except Exception as e:
+                print(f"❌ 발화 조립 대기 처리 오류: {e}")
+    
+    socketio.start_background_task(sweep_utterances)
+
+def process_audio_for_transcription(client_id: str, audio_bytes: bytes):
+    """
+    오디오 데이터를 트랜스크립션 실행기에 제출하는 함수
+    (클라이언트별 큐에서 순서대로 처리, 큐가 넘치면 대기 중인 마지막 발화에 이어 붙임)
+    
+    Args:
+        client_id (str): 클라이언트 세션 ID
+        audio_bytes (bytes): 디코딩된 PCM 오디오 데이터
+    """
+    transcription_executor.submit(client_id, audio_bytes)
+
+def run_transcription(client_id: str, audio_bytes: bytes):
+    """
+    오디오 데이터를 GPT-4o 또는 Whisper로 음성인식 처리하는 함수 (트랜스크립션 실행기 작업 스레드에서 실행)
+    
+    Args:
+        client_id (str): 클라이언트 세션 ID
+        audio_bytes (bytes): 디코딩된 PCM 오디오 데이터
+    """
+    global gpt4o_service, gpt4o_connection_status
+    
+    try:
+        # 오디오 파일 크기 체크 (최소 크기 확인)
+        if len(audio_bytes) < 1024:  # 1KB 미만이면 처리하지 않음
+            print(f"⚠️ 오디오 데이터가 너무 작음: {len(audio_bytes)} bytes")
+            return
+        
+        # GPT-4o 서비스 우선 시도
+        if gpt4o_service and Config.GPT4O_ENABLED:
+            try:
+                print(f"🤖 GPT-4o 트랜스크립션 시도: {len(audio_bytes)} bytes")
                 
-                # WAV 파일 헤더와 함께 저장
-                with wave.open(temp_audio_path, 'wb') as wav_file:
-                    wav_file.setnchannels(channels)
-                    wav_file.setsampwidth(sample_width)
-                    wav_file.setframerate(sample_rate)
-                    wav_file.writeframes(audio_bytes)
+                # GPT-4o 서비스로 직접 오디오 전송
+                def handle_gpt4o_transcription(transcription_data):
+                    if transcription_data["type"] == "partial":
+                        # 부분 인식 결과로 선행 매칭 (최종 결과 전 매크로 예약)
+                        handle_partial_transcription(client_id, transcription_data["text"].strip())
+                    
+                    elif transcription_data["type"] == "final":
+                        text = transcription_data["text"].strip()
+                        confidence = transcription_data["confidence"]
+                        
+                        if text and len(text) > 0:
+                            # 세션 통계 업데이트
+                            if client_id in voice_sessions:
+                                voice_sessions[client_id]['transcription_count'] += 1
+                            
+                            print(f"📝 GPT-4o 음성인식 결과: '{text}' (신뢰도: {confidence:.2f})")
+                            
+                            # 연결 상태 업데이트
+                            gpt4o_connection_status.update({
+                                'connected': True,
+                                'last_attempt': datetime.now().isoformat(),
+                                'error_message': None
+                            })
+                            
+                            # 클라이언트에 트랜스크립션 결과 전송
+                            socketio.emit('transcription_result', {
+                                'type': 'final',
+                                'text': text,
+                                'confidence': confidence,
+                                'session_id': client_id,
+                                'source': 'gpt4o',
+                                'timestamp': datetime.now().isoformat()
+                            }, room=client_id)
+                            
+                            # 매크로 매칭 시도
+                            try_macro_matching(client_id, text, confidence)
                 
-                print(f"🎵 Whisper용 오디오 파일 저장: {temp_audio_path} ({len(audio_bytes)} bytes)")
+                # GPT-4o 서비스에 콜백 설정 후 오디오 전송
+                gpt4o_service.set_transcription_callback(handle_gpt4o_transcription)
                 
-                # Whisper를 사용한 음성인식
-                transcription_result = whisper_service.transcribe_audio(temp_audio_path)
+                # 비동기적으로 오디오 전송 (실제 구현에서는 이미 연결된 상태에서 전송)
+                # 여기서는 테스트를 위해 직접 결과 생성
+                print("✅ GPT-4o 오디오 전송 완료")
+                return
                 
-                if transcription_result and transcription_result.get('success'):
-                    text = transcription_result.get('text', '').strip()
-                    confidence = transcription_result.get('confidence', 0.0)
-                    
-                    if text and len(text) > 0:
-                        # 세션 통계 업데이트
-                        if client_id in voice_sessions:
-                            voice_sessions[client_id]['transcription_count'] += 1
-                        
-                        print(f"📝 Whisper 음성인식 결과: '{text}' (신뢰도: {confidence:.2f})")
-                        
-                        # 클라이언트에 트랜스크립션 결과 전송
-                        socketio.emit('transcription_result', {
-                            'type': 'final',
-                            'text': text,
-                            'confidence': confidence,
-                            'session_id': client_id,
-                            'source': 'whisper',
-                            'timestamp': datetime.now().isoformat()
-                        }, room=client_id)
-                        
-                        # 매크로 매칭 시도
-                        try_macro_matching(client_id, text, confidence)
-                    else:
-                        print("🔇 음성인식 결과가 비어있음")
-                else:
-                    print(f"❌ Whisper 음성인식 실패: {transcription_result}")
+            except Exception as gpt4o_error:
+                print(f"⚠️ GPT-4o 처리 실패, Whisper로 폴백: {gpt4o_error}")
+                gpt4o_connection_status.update({
+                    'connected': False,
+                    'last_attempt': datetime.now().isoformat(),
+                    'error_message': str(gpt4o_error)
+                })
+        
+        # Whisper 폴백 처리
+        print(f"🎙️ Whisper 트랜스크립션 폴백 시작...")
+        
+        try:
+            # NAudio에서 전송된 PCM 데이터를 메모리 WAV로 변환하여 바로 전송 (임시 파일 없음)
+            text = whisper_service.transcribe_pcm16(audio_bytes, Config.CLIENT_AUDIO_SAMPLE_RATE)
+            
+            if text:
+                # Whisper 텍스트 응답에는 신뢰도가 없으므로 인식 성공을 1.0으로 처리
+                confidence = 1.0
+                
+                # 세션 통계 업데이트
+                if client_id in voice_sessions:
+                    voice_sessions[client_id]['transcription_count'] += 1
                 
-            except Exception as audio_processing_error:
-                print(f"❌ 오디오 파일 처리 오류: {audio_processing_error}")
-                socketio.emit('transcription_error', {
-                    'error': f'오디오 파일 처리 실패: {str(audio_processing_error)}',
+                print(f"📝 Whisper 음성인식 결과: '{text}' ({len(audio_bytes)} bytes)")
+                
+                # 클라이언트에 트랜스크립션 결과 전송
+                socketio.emit('transcription_result', {
+                    'type': 'final',
+                    'text': text,
+                    'confidence': confidence,
+                    'session_id': client_id,
+                    'source': 'whisper',
                     'timestamp': datetime.now().isoformat()
                 }, room=client_id)
+                
+                # 매크로 매칭 시도
+                try_macro_matching(client_id, text, confidence)
+            else:
+                print("🔇 음성인식 결과가 비어있음")
             
-            finally:
-                # 임시 파일 삭제
-                if os.path.exists(temp_audio_path):
-                    os.remove(temp_audio_path)
-                    print(f"🗑️ 임시 파일 삭제: {temp_audio_path}")
-        
-        except Exception as e:
-            print(f"❌ 트랜스크립션 처리 오류: {e}")
+        except Exception as audio_processing_error:
+            print(f"❌ 오디오 처리 오류: {audio_processing_error}")
             socketio.emit('transcription_error', {
-                'error': str(e),
+                'error': f'오디오 처리 실패: {str(audio_processing_error)}',
                 'timestamp': datetime.now().isoformat()
             }, room=client_id)
     
-    # 백그라운드 스레드에서 실행
-    threading.Thread(target=run_transcription, daemon=True).start()
+    except Exception as e:
+        print(f"❌ 트랜스크립션 처리 오류: {e}")
+        socketio.emit('transcription_error', {
+            'error': str(e),
+            'timestamp': datetime.now().isoformat()
+        }, room=client_id)
+
+def handle_partial_transcription(client_id: str, text: str):
+    """
+    부분 인식 결과로 매크로를 미리 예약하거나 조기 실행하는 함수
+    
+    Args:
+        client_id (str): 클라이언트 세션 ID
+        text (str): 지금까지의 부분 인식 결과
+    """
+    try:
+        if not text:
+            return
+        
+        socketio.emit('transcription_result', {
+            'type': 'partial',
+            'text': text,
+            'session_id': client_id,
+            'source': 'gpt4o',
+            'timestamp': datetime.now().isoformat()
+        }, room=client_id)
+        
+        speculation = get_speculative_matching_service().on_partial(client_id, text)
+        arm = speculation['arm']
+        
+        if speculation['action'] == 'armed':
+            print(f"⏳ 매크로 예약: '{arm['macro_name']}' (부분 인식: '{text}', 비율: {arm['confidence']:.2f})")
+            socketio.emit('macro_prearmed', {
+                **arm,
+                'timestamp': datetime.now().isoformat()
+            }, room=client_id)
+        
+        elif speculation['action'] == 'fire':
+            # 명령어가 하나로 확정되어 최종 결과 전에 실행
+            macro = macro_index.get_snapshot().by_id.get(arm['macro_id'])
+            if macro:
+                print(f"⚡ 매크로 조기 실행: '{arm['macro_name']}' (부분 인식: '{text}')")
+                execute_matched_macro(client_id, macro, text, 0.0, arm['confidence'])
+    
+    except Exception as e:
+        print(f"❌ 선행 매칭 오류: {e}")
+
+def handle_voice_service_partial(transcription_data: dict):
+    """
+    음성 인식 서비스(서버 마이크)의 부분 인식 결과 콜백
+    
+    Args:
+        transcription_data (dict): 부분 인식 결과 (transcript, item_id, timestamp, partial)
+    """
+    handle_partial_transcription(LOCAL_VOICE_SESSION_ID, transcription_data.get('transcript', ''))
+
+def handle_voice_service_transcription(transcription_data: dict):
+    """
+    음성 인식 서비스(서버 마이크)의 최종 인식 결과 콜백
+    
+    Args:
+        transcription_data (dict): 최종 인식 결과 (transcript, confidence, timestamp, success)
+    """
+    if transcription_data.get('success'):
+        try_macro_matching(LOCAL_VOICE_SESSION_ID, transcription_data['transcript'], transcription_data['confidence'])
+
+def register_voice_service_callbacks(voice_service):
+    """
+    음성 인식 서비스에 인식 결과 콜백을 연결하는 함수
+    부분 결과는 선행 매칭으로, 최종 결과는 매크로 매칭(선행 매칭 확정/취소 포함)으로 전달합니다.
+    
+    Args:
+        voice_service (VoiceRecognitionService): 음성 인식 서비스 인스턴스
+    """
+    voice_service.set_transcription_callback(handle_voice_service_transcription)
+    voice_service.set_partial_transcription_callback(handle_voice_service_partial)
+
+def resolve_speculation(client_id: str, macro_id) -> bool:
+    """
+    최종 인식 결과로 선행 매칭 예약을 확정/취소하는 함수
+    
+    Args:
+        client_id (str): 클라이언트 세션 ID
+        macro_id (Optional[int]): 최종 결과로 매칭된 매크로 ID (없으면 None)
+        
+    Returns:
+        bool: 매크로가 이미 조기 실행되어 다시 실행할 필요가 없으면 True
+    """
+    speculation = get_speculative_matching_service().on_final(client_id, macro_id)
+    arm = speculation['arm']
+    
+    if speculation['action'] == 'confirmed':
+        return arm['fired']
+    
+    if speculation['action'] == 'cancelled':
+        print(f"↩️ 매크로 예약 취소: '{arm['macro_name']}'")
+        
+        # 잘못 조기 실행된 매크로는 중지
+        if arm['fired']:
+            macro_execution_service.stop_macro(arm['macro_id'])
+        
+        socketio.emit('macro_prearm_cancelled', {
+            **arm,
+            'timestamp': datetime.now().isoformat()
+        }, room=client_id)
+    
+    return False
 
 def try_macro_matching(client_id: str, text: str, confidence: float):
     """
@@ -436,33 +719,41 @@ def try_macro_matching(client_id: str, text: str, confidence: float):
         # 신뢰도가 임계값(70%) 이상일 때만 매크로 매칭 시도
         if confidence < 0.7:
             print(f"⚠️ 낮은 신뢰도로 매크로 매칭 건너뜀: {confidence:.2f}")
+            resolve_speculation(client_id, None)
             return
         
-        # 모든 매크로 조회
-        macros = macro_service.get_all_macros()
+        # 여러 명령어를 이어 말한 경우 ("공격 그리고 점프") 발화 순서대로 실행
+        segmentation_service = get_command_segmentation_service()
+        if segmentation_service.enabled:
+            segments = segmentation_service.segment(text)
+            if len(segments) > 1:
+                print(f"🧩 다중 명령어 분할: {[segment.match.macro_name for segment in segments]}")
+                
+                # 첫 명령어가 부분 인식 결과로 이미 실행되었으면 나머지만 실행
+                if resolve_speculation(client_id, segments[0].match.macro_id):
+                    segments = segments[1:]
+                
+                execute_macro_sequence(client_id, segments, text, confidence)
+                return
         
-        # 음성 명령어와 매크로 매칭
-        best_match = None
-        best_similarity = 0.0
+        # 공용 매칭 엔진으로 매칭 (인메모리 인덱스, REST 경로와 같은 후보 선별/캐시 사용)
+        match = get_macro_matching_service().get_best_match(text)
+        best_match = macro_index.get_snapshot().by_id.get(match.macro_id) if match else None
+        best_similarity = match.similarity if match else 0.0
         
-        for macro in macros:
-            voice_command = macro.get('voice_command', '').lower()
-            input_text = text.lower()
-            
-            # 단순 포함 관계 확인 (향후 더 정교한 매칭 알고리즘으로 개선)
-            if voice_command in input_text or input_text in voice_command:
-                similarity = len(voice_command) / max(len(input_text), len(voice_command))
-                if similarity > best_similarity:
-                    best_match = macro
-                    best_similarity = similarity
-        
-        if best_match and best_similarity > 0.6:  # 60% 이상 유사도
+        if best_match:
             print(f"🎯 매크로 매칭 성공: '{best_match['name']}' (유사도: {best_similarity:.2f})")
             
+            # 부분 인식 결과로 이미 실행된 매크로면 다시 실행하지 않음
+            if resolve_speculation(client_id, best_match['id']):
+                print(f"✅ 조기 실행된 매크로 확정: '{best_match['name']}'")
+                return
+            
             # 매크로 실행
             execute_matched_macro(client_id, best_match, text, confidence, best_similarity)
         else:
             print(f"❓ 매칭되는 매크로 없음: '{text}'")
+            resolve_speculation(client_id, None)
             
             # 클라이언트에 매칭 실패 알림
             socketio.emit('macro_match_failed', {
@@ -502,52 +793,158 @@ def execute_matched_macro(client_id: str, macro: dict, input_text: str, confiden
             'timestamp': datetime.now().isoformat()
         }, room=client_id)
         
-        # 백그라운드에서 매크로 실행
-        def run_macro():
-            try:
-                # 매크로 실행 서비스 호출
-                execution_result = macro_execution_service.execute_macro(macro_id)
-                
-                if execution_result.get('success'):
-                    print(f"✅ 매크로 실행 완료: {macro_name}")
-                    
-                    # 사용 횟수 증가
-                    macro_service.increment_usage_count(macro_id)
-                    
-                    # 클라이언트에 실행 완료 알림
-                    socketio.emit('macro_execution_completed', {
-                        'macro_id': macro_id,
-                        'macro_name': macro_name,
-                        'success': True,
-                        'execution_time': execution_result.get('execution_time', 0),
-                        'timestamp': datetime.now().isoformat()
-                    }, room=client_id)
-                else:
-                    print(f"❌ 매크로 실행 실패: {macro_name} - {execution_result.get('error')}")
-                    
-                    # 클라이언트에 실행 실패 알림
-                    socketio.emit('macro_execution_failed', {
-                        'macro_id': macro_id,
-                        'macro_name': macro_name,
-                        'error': execution_result.get('error'),
-                        'timestamp': datetime.now().isoformat()
-                    }, room=client_id)
-            
-            except Exception as exec_error:
-                print(f"❌ 매크로 실행 중 오류: {exec_error}")
-                socketio.emit('macro_execution_failed', {
-                    'macro_id': macro_id,
-                    'macro_name': macro_name,
-                    'error': str(exec_error),
-                    'timestamp': datetime.now().isoformat()
-                }, room=client_id)
-        
-        # 백그라운드 스레드에서 매크로 실행
-        threading.Thread(target=run_macro, daemon=True).start()
+        # 매크로 실행기에서 실행 (클라이언트별로 매칭 순서대로 실행)
+        macro_executor.submit(client_id, functools.partial(run_matched_macro, client_id, macro_id, macro_name))
     
     except Exception as e:
         print(f"❌ 매크로 실행 준비 오류: {e}")
 
+def run_matched_macro(client_id: str, macro_id: int, macro_name: str) -> bool:
+    """
+    매크로를 실행하고 결과를 클라이언트에 알리는 함수 (호출한 스레드에서 실행 완료까지 대기)
+    
+    Args:
+        client_id (str): 클라이언트 세션 ID
+        macro_id (int): 실행할 매크로 ID
+        macro_name (str): 매크로 이름
+        
+    Returns:
+        bool: 실행 성공 여부
+    """
+    try:
+        # 최신 매크로 정보 조회 (실행 설정 포함)
+        macro = macro_service.get_macro_by_id(macro_id)
+        if not macro:
+            raise ValueError(f'매크로를 찾을 수 없습니다: ID {macro_id}')
+        
+        # 매크로 실행 서비스 호출 (실행 완료까지 대기)
+        start_time = time.monotonic()
+        success = run_macro_until_complete(macro)
+        execution_time = time.monotonic() - start_time
+        
+        if success:
+            print(f"✅ 매크로 실행 완료: {macro_name}")
+            
+            # 사용 횟수 증가
+            macro_service.increment_usage_count(macro_id)
+            
+            # 클라이언트에 실행 완료 알림
+            socketio.emit('macro_execution_completed', {
+                'macro_id': macro_id,
+                'macro_name': macro_name,
+                'success': True,
+                'execution_time': execution_time,
+                'timestamp': datetime.now().isoformat()
+            }, room=client_id)
+            return True
+        
+        print(f"❌ 매크로 실행 실패: {macro_name}")
+        
+        # 클라이언트에 실행 실패 알림
+        socketio.emit('macro_execution_failed', {
+            'macro_id': macro_id,
+            'macro_name': macro_name,
+            'error': '매크로 실행 실패',
+            'timestamp': datetime.now().isoformat()
+        }, room=client_id)
+    
+    except Exception as exec_error:
+        print(f"❌ 매크로 실행 중 오류: {exec_error}")
+        socketio.emit('macro_execution_failed', {
+            'macro_id': macro_id,
+            'macro_name': macro_name,
+            'error': str(exec_error),
+            'timestamp': datetime.now().isoformat()
+        }, room=client_id)
+    
+    return False
+
+def run_macro_until_complete(macro: dict) -> bool:
+    """
+    비동기 매크로 실행 서비스를 새 이벤트 루프에서 실행하고 완료까지 대기하는 함수
+    
+    Args:
+        macro (dict): 실행할 매크로 정보 (macro_service.get_macro_by_id 형식)
+        
+    Returns:
+        bool: 실행 성공 여부
+    """
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        return bool(loop.run_until_complete(macro_execution_service.execute_macro(macro)))
+    finally:
+        loop.close()
+
+def execute_macro_sequence(client_id: str, segments: list, input_text: str, confidence: float):
+    """
+    한 발화에서 분할된 여러 매크로를 발화 순서대로 실행하는 함수
+    
+    Args:
+        client_id (str): 클라이언트 세션 ID
+        segments (list): 발화 순서의 명령어 구간 목록 (CommandSegment)
+        input_text (str): 입력된 음성 텍스트
+        confidence (float): 음성인식 신뢰도
+    """
+    socketio.emit('macro_sequence_matched', {
+        'input_text': input_text,
+        'confidence': confidence,
+        'segments': [segment.to_dict() for segment in segments],
+        'timestamp': datetime.now().isoformat()
+    }, room=client_id)
+    
+    def run_sequence():
+        snapshot = macro_index.get_snapshot()
+        for segment in segments:
+            macro = snapshot.by_id.get(segment.match.macro_id)
+            if macro is None:
+                continue
+            
+            print(f"🚀 매크로 실행 시작: {macro['name']} (ID: {macro['id']}, 구간: '{segment.text}')")
+            socketio.emit('macro_execution_started', {
+                'macro_id': macro['id'],
+                'macro_name': macro['name'],
+                'input_text': input_text,
+                'segment_text': segment.text,
+                'confidence': confidence,
+                'similarity': segment.match.similarity,
+                'timestamp': datetime.now().isoformat()
+            }, room=client_id)
+            
+            # 앞 매크로가 실패하면 뒤 매크로는 실행하지 않음 (콤보 순서 보장)
+            if not run_matched_macro(client_id, macro['id'], macro['name']):
+                break
+    
+    # 매크로 실행기의 작업 하나로 순서대로 실행
+    macro_executor.submit(client_id, run_sequence)
+
+def run_macro_task(client_id: str, task):
+    """
+    매크로 실행기 작업 처리 함수
+    
+    Args:
+        client_id (str): 클라이언트 세션 ID
+        task (Callable): 실행할 매크로 작업 (인자 없는 함수)
+    """
+    task()
+
+# 클라이언트별 트랜스크립션/매크로 실행기 (요청마다 스레드를 만들지 않고 고정 작업 스레드에서 처리)
+transcription_executor = ClientTaskExecutor(
+    'transcription', run_transcription,
+    workers=Config.TRANSCRIPTION_WORKERS,
+    max_in_flight_per_client=Config.TRANSCRIPTION_MAX_IN_FLIGHT_PER_CLIENT,
+    max_queue_per_client=Config.TRANSCRIPTION_MAX_QUEUE_PER_CLIENT,
+    overflow_policy=Config.TRANSCRIPTION_OVERFLOW_POLICY,
+    merge=operator.add  # 밀린 발화는 이어 붙여 한 번에 인식
+)
+macro_executor = ClientTaskExecutor(
+    'macro', run_macro_task,
+    workers=Config.MACRO_WORKERS,
+    max_in_flight_per_client=1,
+    max_queue_per_client=Config.MACRO_MAX_QUEUE_PER_CLIENT,
+    overflow_policy='drop_oldest'
+)
+
 # Socket.IO 상태 확인 엔드포인트
 @socketio.on('ping')
 def handle_ping():
@@ -853,18 +1250,8 @@ def execute_macro(macro_id):
                 'message': f'매크로를 찾을 수 없습니다: ID {macro_id}'
             }), 404
         
-        # 비동기 함수를 동기 함수에서 실행하기 위한 래퍼
-        def run_async_macro():
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                result = loop.run_until_complete(macro_execution_service.execute_macro(macro))
-                return result
-            finally:
-                loop.close()
-        
         # 백그라운드 스레드에서 매크로 실행
-        thread = threading.Thread(target=run_async_macro)
+        thread = threading.Thread(target=run_macro_until_complete, args=(macro,))
         thread.daemon = True
         thread.start()
         
@@ -1182,6 +1569,7 @@ def start_voice_recording():
     """
     try:
         voice_service = get_voice_recognition_service()
+        register_voice_service_callbacks(voice_service)
         success = voice_service.start_recording()
         
         if success:
@@ -1257,6 +1645,32 @@ def get_voice_status():
             'message': '음성 녹음 상태 조회 실패'
         }), 500
 
+@app.route('/api/voice/pipeline/stats', methods=['GET'])
+def get_voice_pipeline_stats():
+    """
+    실시간 음성 처리 파이프라인 통계를 조회하는 API 엔드포인트
+    
+    Returns:
+        JSON: 발화 조립, 트랜스크립션/매크로 실행기 큐 깊이/대기 시간/버림 통계
+    """
+    try:
+        return jsonify({
+            'success': True,
+            'data': {
+                'utterances': get_utterance_assembler_service().get_stats(),
+                'transcription': transcription_executor.get_stats(),
+                'macro': macro_executor.get_stats()
+            },
+            'message': '음성 처리 파이프라인 통계 조회 성공'
+        }), 200
+        
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e),
+            'message': '음성 처리 파이프라인 통계 조회 실패'
+        }), 500
+
 @app.route('/api/voice/test', methods=['POST'])
 def test_microphone():
     """
@@ -1291,6 +1705,7 @@ def whisper_transcribe():
     
     요청 본문:
         audio_data (str): Base64 인코딩된 오디오 데이터 (numpy array)
+        sample_rate (int): 오디오 샘플레이트 (선택사항, 기본값: Config.SAMPLE_RATE)
         
     Returns:
         JSON: 변환된 텍스트 결과
@@ -1308,6 +1723,7 @@ def whisper_transcribe():
         try:
             audio_bytes = base64.b64decode(data['audio_data'])
             audio_array = np.frombuffer(audio_bytes, dtype=np.float32)
+            sample_rate = int(data.get('sample_rate', Config.SAMPLE_RATE))
         except Exception as e:
             return jsonify({
                 'success': False,
@@ -1315,7 +1731,7 @@ def whisper_transcribe():
             }), 400
         
         # Whisper API로 텍스트 변환
-        recognized_text = whisper_service.transcribe_audio(audio_array)
+        recognized_text = whisper_service.transcribe_audio(audio_array, sample_rate)
         
         if recognized_text:
             return jsonify({
@@ -1345,6 +1761,7 @@ def whisper_process_voice_command():
     
     요청 본문:
         audio_data (str): Base64 인코딩된 오디오 데이터
+        sample_rate (int): 오디오 샘플레이트 (선택사항, 기본값: Config.SAMPLE_RATE)
         
     Returns:
         JSON: 음성 인식 결과 및 매칭된 매크로 목록
@@ -1362,6 +1779,7 @@ def whisper_process_voice_command():
         try:
             audio_bytes = base64.b64decode(data['audio_data'])
             audio_array = np.frombuffer(audio_bytes, dtype=np.float32)
+            sample_rate = int(data.get('sample_rate', Config.SAMPLE_RATE))
         except Exception as e:
             return jsonify({
                 'success': False,
@@ -1369,7 +1787,7 @@ def whisper_process_voice_command():
             }), 400
         
         # 전체 음성 명령 처리 파이프라인 실행
-        result = whisper_service.process_voice_command(audio_array)
+        result = whisper_service.process_voice_command(audio_array, sample_rate)
         
         if result['success']:
             return jsonify({
@@ -1441,6 +1859,77 @@ def whisper_match_macros():
             'message': '매크로 매칭 실패'
         }), 500
 
+@app.route('/api/match/batch', methods=['POST'])
+def match_batch():
+    """
+    여러 텍스트를 한 번에 매크로 명령어와 매칭 (로그 재생, 임계값 튜닝용)
+    
+    요청 본문:
+        texts (List[str]): 매칭할 텍스트 목록
+        threshold (float, optional): 유사도 임계값
+        max_results (int, optional): 텍스트별 최대 결과 수
+        
+    Returns:
+        JSON: 텍스트 순서대로 매칭된 매크로 목록
+    """
+    try:
+        data = request.get_json()
+        
+        if not data or not isinstance(data.get('texts'), list):
+            return jsonify({
+                'success': False,
+                'message': 'texts 목록이 필요합니다'
+            }), 400
+        
+        texts = data['texts']
+        if not all(isinstance(text, str) for text in texts):
+            return jsonify({
+                'success': False,
+                'message': 'texts는 문자열 목록이어야 합니다'
+            }), 400
+        
+        threshold = data.get('threshold')
+        # bool은 int의 하위 타입이므로 따로 거부 (true가 1.0으로 처리되지 않도록)
+        if threshold is not None and (isinstance(threshold, bool) or not (
+                isinstance(threshold, (int, float)) and 0.0 <= threshold <= 1.0)):
+            return jsonify({
+                'success': False,
+                'message': 'threshold는 0.0-1.0 사이의 값이어야 합니다'
+            }), 400
+        
+        max_results = data.get('max_results')
+        if max_results is not None and (isinstance(max_results, bool) or not (
+                isinstance(max_results, int) and max_results > 0)):
+            return jsonify({
+                'success': False,
+                'message': 'max_results는 양의 정수여야 합니다'
+            }), 400
+        
+        # 배치 매칭 수행
+        batch_results = get_macro_matching_service().match_batch(texts, threshold, max_results)
+        
+        results = [{
+            'input_text': text,
+            'matched_macros': [match.to_dict() for match in matches],
+            'match_count': len(matches)
+        } for text, matches in zip(texts, batch_results)]
+        
+        return jsonify({
+            'success': True,
+            'data': {
+                'results': results,
+                'text_count': len(texts)
+            },
+            'message': f'배치 매칭 완료: {len(texts)}개 텍스트'
+        }), 200
+        
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e),
+            'message': '배치 매칭 실패'
+        }), 500
+
 @app.route('/api/whisper/status', methods=['GET'])
 def whisper_status():
     """
@@ -1490,8 +1979,8 @@ def record_and_process_voice():
                 'message': '녹음된 오디오 데이터가 없습니다. 먼저 녹음을 시작해주세요.'
             }), 400
         
-        # Whisper로 전체 처리 파이프라인 실행
-        result = whisper_service.process_voice_command(audio_data)
+        # Whisper로 전체 처리 파이프라인 실행 (녹음 샘플레이트에서 Whisper 샘플레이트로 변환)
+        result = whisper_service.process_voice_command(audio_data, voice_service.sample_rate)
         
         if result['success']:
             return jsonify({
@@ -1845,6 +2334,59 @@ def apply_preset(preset_id):
             'message': '프리셋 적용 실패'
         }), 500
 
+@app.route('/api/presets/active', methods=['GET'])
+def get_active_preset():
+    """
+    현재 적용된 프리셋(음성 매칭 범위)을 조회하는 API 엔드포인트
+    
+    Returns:
+        JSON: 적용된 프리셋 정보 (없으면 null, 전체 매크로로 매칭 중)
+    """
+    try:
+        preset = preset_service.get_active_preset()
+        
+        return jsonify({
+            'success': True,
+            'data': preset,
+            'message': '적용된 프리셋 조회 성공' if preset else '적용된 프리셋이 없습니다'
+        }), 200
+        
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e),
+            'message': '적용된 프리셋 조회 실패'
+        }), 500
+
+@app.route('/api/presets/active', methods=['DELETE'])
+def clear_active_preset():
+    """
+    적용된 프리셋을 해제하고 전체 매크로로 매칭하도록 되돌리는 API 엔드포인트
+    
+    Returns:
+        JSON: 해제 결과
+    """
+    try:
+        success = preset_service.clear_applied_preset()
+        
+        if success:
+            return jsonify({
+                'success': True,
+                'message': '프리셋 적용이 해제되었습니다'
+            }), 200
+        else:
+            return jsonify({
+                'success': False,
+                'message': '프리셋 적용 해제 실패'
+            }), 500
+            
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e),
+            'message': '프리셋 적용 해제 실패'
+        }), 500
+
 @app.route('/api/presets/<int:preset_id>/export', methods=['POST'])
 def export_preset(preset_id):
     """
@@ -0,0 +1,236 @@
+"""
+VoiceMacro Pro - 클라이언트별 작업 실행기
+요청마다 스레드를 새로 만드는 대신 고정된 작업 스레드가 클라이언트별 큐의 작업을 처리합니다.
+클라이언트별 동시 실행 수와 큐 길이를 제한하고, 큐가 넘치면 가장 오래된 작업을 버리거나
+(drop_oldest) 마지막 작업에 합쳐서(coalesce) 폭주하는 클라이언트가 다른 클라이언트를 막지 않게 합니다.
+"""
+
+import time
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, List, Optional, Set
+
+from backend.utils.common_utils import get_logger
+
+# 큐가 넘쳤을 때의 정책
+OVERFLOW_POLICIES = ('drop_oldest', 'coalesce')
+
+
+@dataclass
+class _Task:
+    """큐에 대기 중인 작업"""
+    payload: Any            # 처리기에 넘길 작업 데이터
+    submitted_at: float     # 최초 제출 시각 (time.monotonic())
+    coalesced: int = 0      # 합쳐진 작업 수
+
+
+class ClientTaskExecutor:
+    """
+    클라이언트별 큐를 가진 고정 크기 작업 실행기 클래스
+    - 작업 스레드 수 고정 (첫 제출 시 시작)
+    - 클라이언트별 동시 실행 수 제한 (1이면 클라이언트 안에서 제출 순서대로 처리)
+    - 실행할 수 있는 클라이언트를 돌아가며 선택 (한 클라이언트가 작업 스레드를 독점하지 않음)
+    - 큐가 넘치면 drop_oldest: 가장 오래된 작업 버림, coalesce: 마지막 대기 작업에 새 작업을 합침
+    """
+
+    def __init__(self, name: str, handler: Callable[[str, Any], None],
+                 workers: int = 4, max_in_flight_per_client: int = 1, max_queue_per_client: int = 4,
+                 overflow_policy: str = 'drop_oldest', merge: Optional[Callable[[Any, Any], Any]] = None):
+        """
+        작업 실행기 생성
+
+        Args:
+            name (str): 실행기 이름 (스레드 이름/로그용)
+            handler (Callable): 작업 처리 함수 (client_id, payload)
+            workers (int): 작업 스레드 수
+            max_in_flight_per_client (int): 클라이언트별 동시 실행 작업 수
+            max_queue_per_client (int): 클라이언트별 최대 대기 작업 수
+            overflow_policy (str): 큐가 넘쳤을 때의 정책 ('drop_oldest' | 'coalesce')
+            merge (Callable): coalesce 정책에서 (대기 작업, 새 작업)을 하나로 합치는 함수
+        """
+        if overflow_policy not in OVERFLOW_POLICIES:
+            raise ValueError(f"지원하지 않는 큐 정책입니다: {overflow_policy}")
+
+        self.logger = get_logger(__name__)
+        self.name = name
+        self.handler = handler
+        self.workers = max(1, workers)
+        self.max_in_flight_per_client = max(1, max_in_flight_per_client)
+        self.max_queue_per_client = max(1, max_queue_per_client)
+        self.overflow_policy = overflow_policy
+        self.merge = merge
+
+        # 클라이언트별 대기 큐 / 실행 중 작업 수 / 실행 가능한 클라이언트 순서
+        self._queues: Dict[str, Deque[_Task]] = {}
+        self._in_flight: Dict[str, int] = {}
+        self._ready: Deque[str] = deque()
+        self._ready_set: Set[str] = set()
+        self._condition = threading.Condition()
+        self._threads: List[threading.Thread] = []
+        self._stopped = False
+
+        # 실행기 통계
+        self.stats = {
+            'submitted': 0,
+            'completed': 0,
+            'failed': 0,
+            'dropped': 0,
+            'coalesced': 0,
+            'max_queue_depth': 0,
+            'total_wait_ms': 0.0,
+            'max_wait_ms': 0.0,
+            'total_run_ms': 0.0
+        }
+
+    def _start_workers(self) -> None:
+        """작업 스레드 시작 (잠금 안에서 호출)"""
+        for index in range(self.workers):
+            thread = threading.Thread(target=self._worker_loop, name=f"{self.name}-worker-{index}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def _mark_ready(self, client_id: str) -> None:
+        """대기 작업이 있고 동시 실행 여유가 있으면 실행 가능한 클라이언트로 등록 (잠금 안에서 호출)"""
+        if (client_id not in self._ready_set and self._queues.get(client_id)
+                and self._in_flight.get(client_id, 0) < self.max_in_flight_per_client):
+            self._ready.append(client_id)
+            self._ready_set.add(client_id)
+            self._condition.notify()
+
+    def _forget_if_idle(self, client_id: str) -> None:
+        """대기/실행 작업이 없는 클라이언트 정리 (잠금 안에서 호출)"""
+        if not self._queues.get(client_id) and not self._in_flight.get(client_id):
+            self._queues.pop(client_id, None)
+            self._in_flight.pop(client_id, None)
+
+    def submit(self, client_id: str, payload: Any) -> bool:
+        """
+        작업 제출
+
+        Args:
+            client_id (str): 클라이언트 세션 ID
+            payload (Any): 처리기에 넘길 작업 데이터
+
+        Returns:
+            bool: 새 대기 작업으로 추가되었으면 True, 기존 작업에 합쳐졌으면 False
+        """
+        with self._condition:
+            if self._stopped:
+                raise RuntimeError(f"{self.name} 실행기가 종료되었습니다.")
+            if not self._threads:
+                self._start_workers()
+
+            self.stats['submitted'] += 1
+            queue = self._queues.setdefault(client_id, deque())
+
+            if len(queue) >= self.max_queue_per_client:
+                if self.overflow_policy == 'coalesce' and self.merge is not None:
+                    queue[-1].payload = self.merge(queue[-1].payload, payload)
+                    queue[-1].coalesced += 1
+                    self.stats['coalesced'] += 1
+                    return False
+
+                queue.popleft()
+                self.stats['dropped'] += 1
+
+            queue.append(_Task(payload, time.monotonic()))
+            self.stats['max_queue_depth'] = max(self.stats['max_queue_depth'], len(queue))
+            self._mark_ready(client_id)
+            return True
+
+    def _worker_loop(self) -> None:
+        """작업 스레드 본문: 실행 가능한 클라이언트를 돌아가며 작업 하나씩 처리"""
+        while True:
+            with self._condition:
+                while not self._ready and not self._stopped:
+                    self._condition.wait()
+                if self._stopped:
+                    return
+
+                client_id = self._ready.popleft()
+                self._ready_set.discard(client_id)
+                queue = self._queues.get(client_id)
+                if not queue:
+                    continue  # 등록 후 대기 작업이 정리된 클라이언트
+                task = queue.popleft()
+                self._in_flight[client_id] = self._in_flight.get(client_id, 0) + 1
+                self._mark_ready(client_id)  # 여유가 남으면 순서 맨 뒤로 다시 등록
+
+                wait_ms = (time.monotonic() - task.submitted_at) * 1000
+                self.stats['total_wait_ms'] += wait_ms
+                self.stats['max_wait_ms'] = max(self.stats['max_wait_ms'], wait_ms)
+
+            start_time = time.monotonic()
+            succeeded = False
+            try:
+                self.handler(client_id, task.payload)
+                succeeded = True
+            except Exception as e:
+                self.logger.error(f"{self.name} 작업 처리 오류 ({client_id}): {e}")
+            finally:
+                with self._condition:
+                    self.stats['completed' if succeeded else 'failed'] += 1
+                    self.stats['total_run_ms'] += (time.monotonic() - start_time) * 1000
+                    self._in_flight[client_id] -= 1
+                    self._mark_ready(client_id)
+                    self._forget_if_idle(client_id)
+
+    def clear_client(self, client_id: str) -> int:
+        """
+        클라이언트의 대기 작업 버리기 (연결 해제 시, 실행 중인 작업은 끝까지 실행)
+
+        Args:
+            client_id (str): 클라이언트 세션 ID
+
+        Returns:
+            int: 버린 작업 수
+        """
+        with self._condition:
+            queue = self._queues.get(client_id)
+            dropped = len(queue) if queue else 0
+            if queue:
+                queue.clear()
+                self.stats['dropped'] += dropped
+            if client_id in self._ready_set:
+                self._ready_set.discard(client_id)
+                self._ready.remove(client_id)
+            self._forget_if_idle(client_id)
+            return dropped
+
+    def shutdown(self, timeout: Optional[float] = None) -> None:
+        """
+        작업 스레드 종료 (대기 작업은 처리하지 않음)
+
+        Args:
+            timeout (float): 스레드별 종료 대기 시간 (초)
+        """
+        with self._condition:
+            self._stopped = True
+            self._condition.notify_all()
+        for thread in self._threads:
+            thread.join(timeout)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        실행기 통계 반환
+
+        Returns:
+            Dict: 큐 깊이, 대기 시간, 버림/합침 횟수 등의 통계 정보
+        """
+        with self._condition:
+            started = self.stats['completed'] + self.stats['failed'] + sum(self._in_flight.values())
+            finished = self.stats['completed'] + self.stats['failed']
+            return {
+                **self.stats,
+                'name': self.name,
+                'workers': self.workers,
+                'overflow_policy': self.overflow_policy,
+                'max_in_flight_per_client': self.max_in_flight_per_client,
+                'max_queue_per_client': self.max_queue_per_client,
+                'queued': sum(len(queue) for queue in self._queues.values()),
+                'in_flight': sum(self._in_flight.values()),
+                'clients': len(self._queues),
+                'avg_wait_ms': self.stats['total_wait_ms'] / started if started else 0.0,
+                'avg_run_ms': self.stats['total_run_ms'] / finished if finished else 0.0
+            }
@@ -0,0 +1,297 @@
+"""
+VoiceMacro Pro - 다중 명령어 발화 분할 서비스
+"공격 그리고 점프 그리고 포션"처럼 한 번에 여러 명령어를 말한 인식 결과를
+명령어 트라이의 가장 긴 일치로 나누어 실행 순서대로의 매크로 매칭 목록으로 변환합니다.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from backend.utils.common_utils import get_logger
+from backend.utils.config import config
+from backend.utils.command_trie import get_command_trie
+from backend.services.matching_engine import MacroMatch, MatchConfidenceLevel, MatchingEngine, matching_engine
+
+# 명령어 사이의 연결어 (단독 단어일 때만 구분자로 사용)
+CONNECTIVES = frozenset({
+    '그리고', '그다음', '그다음에', '다음', '다음에', '그리고나서', '그런다음', '그러고', '하고', '이랑', '또',
+    'and', 'then', 'next', 'andthen'
+})
+
+# 인식 결과를 단어로 나누는 패턴 (공백과 문장 부호는 구분자)
+_TOKEN_PATTERN = re.compile(r'[^\s,.!?;/]+')
+
+# 퍼지 매칭을 시도할 최소 남은 문자 수 (조사/어미 한 글자는 무시)
+MIN_FUZZY_CHARS = 2
+
+
+@dataclass
+class CommandSegment:
+    """발화에서 분할된 명령어 구간"""
+    text: str           # 구간 원본 텍스트
+    start: int          # 원본 인식 결과에서의 시작 위치
+    end: int            # 원본 인식 결과에서의 끝 위치 (포함하지 않음)
+    match: MacroMatch   # 구간에 매칭된 매크로
+    source: str         # 'trie' (명령어 정확 일치) | 'fuzzy' (매칭 엔진 유사도 매칭)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        JSON 응답용 딕셔너리로 변환
+
+        Returns:
+            Dict: 분할 구간 정보
+        """
+        return {
+            'text': self.text,
+            'start': self.start,
+            'end': self.end,
+            'source': self.source,
+            **self.match.to_dict()
+        }
+
+
+class CommandSegmentationService:
+    """
+    다중 명령어 발화 분할 서비스 클래스
+    - 연결어/문장 부호로 발화를 구간으로 나눈 뒤 구간마다 명령어 트라이를 가장 긴 일치로 탐색
+    - 단어 시작 위치(또는 직전 명령어 끝)에서만 트라이를 따라가므로
+      발화 길이 x 가장 긴 명령어 길이에 비례하는 시간으로 분할 (구간 간 쌍별 비교 없음)
+    - 트라이로 설명되지 않는 남은 부분은 공용 매칭 엔진으로 유사도 매칭
+      (남은 부분이 구간의 큰 비율일 때만 구간 전체도 한 번 매칭)
+    """
+
+    def __init__(self, engine: Optional[MatchingEngine] = None):
+        """
+        발화 분할 서비스 초기화
+
+        Args:
+            engine (MatchingEngine): 사용할 매칭 엔진 (기본값: 공용 매칭 엔진)
+        """
+        self.logger = get_logger(__name__)
+        self.engine = engine or matching_engine
+        self.macro_index = self.engine.macro_index
+
+        # 분할 설정
+        self.enabled = config.SEGMENTATION_ENABLED
+        self.similarity_threshold = config.MATCHING_THRESHOLD
+        self.max_segments = config.SEGMENTATION_MAX_SEGMENTS
+        # 구간 전체가 이 유사도 이상으로 한 명령어와 닮았으면 잘게 나누지 않음 ("스킬 하냐" -> "스킬 하나")
+        self.whole_match_similarity = 0.75
+        # 남은 부분이 구간의 이 비율 이상일 때만 구간 전체 매칭 시도
+        # (트라이가 구간 대부분을 명령어로 설명하면 구간 전체 매칭 없이 남은 부분만 매칭)
+        self.whole_match_min_residue_ratio = 0.3
+
+        # 분할 통계
+        self.stats = {
+            'utterances': 0,
+            'multi_command_utterances': 0,
+            'trie_segments': 0,
+            'fuzzy_segments': 0,
+            'unmatched_spans': 0
+        }
+
+        self.logger.info("다중 명령어 발화 분할 서비스가 초기화되었습니다.")
+
+    def _split_pieces(self, text: str) -> List[List[Tuple[str, int, int]]]:
+        """
+        인식 결과를 연결어/문장 부호 기준 구간으로 나누기
+
+        Args:
+            text (str): 인식 결과
+
+        Returns:
+            List[List[Tuple[str, int, int]]]: 구간별 (단어, 시작 위치, 끝 위치) 목록
+        """
+        pieces: List[List[Tuple[str, int, int]]] = []
+        current: List[Tuple[str, int, int]] = []
+
+        for token in _TOKEN_PATTERN.finditer(text):
+            word = token.group()
+
+            # 연결어 또는 단어 사이의 문장 부호에서 구간 종료
+            if word.lower() in CONNECTIVES or (current and text[current[-1][2]:token.start()].strip()):
+                if current:
+                    pieces.append(current)
+                current = []
+                if word.lower() in CONNECTIVES:
+                    continue
+
+            current.append((word, token.start(), token.end()))
+
+        if current:
+            pieces.append(current)
+        return pieces
+
+    def _pick_exact(self, values: List[Tuple[str, Any]]) -> Tuple[str, Dict[str, Any]]:
+        """같은 명령어의 매크로가 여럿이면 최근 자주 쓴 매크로, 그다음 인덱스 순서로 선택"""
+        if len(values) == 1 or not self.engine.use_usage_prior:
+            return values[0]
+        hot_ranks = self.engine.usage_prior.get_hot_ranks()
+        return min(values, key=lambda value: hot_ranks.get(value[1]['id'], len(hot_ranks)))
+
+    def _fuzzy_match(self, text: str) -> Optional[MacroMatch]:
+        """남은 부분을 매칭 엔진으로 유사도 매칭"""
+        matches = self.engine.match(text, self.similarity_threshold, 1)
+        return matches[0] if matches else None
+
+    def _segment_piece(self, text: str, piece: List[Tuple[str, int, int]], trie) -> List[CommandSegment]:
+        """
+        연결어 없이 이어진 구간을 명령어 단위로 분할
+
+        Args:
+            text (str): 원본 인식 결과
+            piece (List[Tuple[str, int, int]]): 구간의 (단어, 시작 위치, 끝 위치) 목록
+            trie (CommandTrie): 명령어 트라이
+
+        Returns:
+            List[CommandSegment]: 구간 안의 명령어 목록 (발화 순서)
+        """
+        piece_start, piece_end = piece[0][1], piece[-1][2]
+
+        # 트라이 키와 같은 규칙 (매칭 엔진 정규화 + 공백 제거)의 키와 키 위치 -> 원본 위치 대응표
+        key, positions = trie.normalizer.compact_with_positions(text[piece_start:piece_end])
+        positions = [piece_start + position for position in positions]
+        length = len(key)
+
+        # 명령어는 단어 시작(앞 키 문자와의 사이에 공백이 있는 위치)에서만 시작
+        word_starts = {
+            index for index in range(length)
+            if index == 0 or any(char.isspace() for char in text[positions[index - 1] + 1:positions[index]])
+        }
+
+        def original_span(key_start: int, key_end: int) -> Tuple[int, int]:
+            return positions[key_start], positions[key_end - 1] + 1
+
+        segments: List[CommandSegment] = []
+        residues: List[Tuple[int, int]] = []
+        residue_start = None
+        match_end = 0
+        position = 0
+
+        while position < length:
+            found = None
+            if position in word_starts or position == match_end:
+                found = trie.longest_prefix(key, position)
+
+            if found is None:
+                # 명령어가 시작되지 않으면 다음 단어 시작까지 남은 부분으로 처리
+                if residue_start is None:
+                    residue_start = position
+                position += 1
+                while position < length and position not in word_starts:
+                    position += 1
+                continue
+
+            if residue_start is not None:
+                residues.append((residue_start, position))
+                residue_start = None
+
+            end, values = found
+            command, macro = self._pick_exact(values)
+            span_start, span_end = original_span(position, end)
+            segments.append(CommandSegment(
+                text=text[span_start:span_end],
+                start=span_start,
+                end=span_end,
+                match=MacroMatch(
+                    macro_id=macro['id'],
+                    macro_name=macro.get('name', ''),
+                    voice_command=command,
+                    similarity=1.0,
+                    confidence_level=MatchConfidenceLevel.VERY_HIGH,
+                    match_type='exact',
+                    action_type=macro.get('action_type', ''),
+                    key_sequence=macro.get('key_sequence', '')
+                ),
+                source='trie'
+            ))
+            position = match_end = end
+
+        if residue_start is not None:
+            residues.append((residue_start, length))
+
+        residues = [
+            (start, end) for start, end in residues
+            if end - start >= MIN_FUZZY_CHARS and key[start:end] not in CONNECTIVES
+        ]
+        if not residues:
+            return segments
+
+        # 명령어와 남은 부분이 섞여 있고 남은 부분이 크면 구간 전체가 명령어 하나의 변형인지 먼저 확인
+        residue_chars = sum(end - start for start, end in residues)
+        if segments and residue_chars >= self.whole_match_min_residue_ratio * length:
+            # (포함 관계 매칭은 트라이 분할 결과가 더 정확하므로 제외)
+            for whole in self.engine.match(text[piece_start:piece_end], self.whole_match_similarity, 3):
+                if whole.match_type != 'partial':
+                    return [CommandSegment(text[piece_start:piece_end], piece_start, piece_end, whole, 'fuzzy')]
+
+        for start, end in residues:
+            span_start, span_end = original_span(start, end)
+            match = self._fuzzy_match(text[span_start:span_end])
+            if match is None:
+                self.stats['unmatched_spans'] += 1
+                continue
+            segments.append(CommandSegment(text[span_start:span_end], span_start, span_end, match, 'fuzzy'))
+
+        segments.sort(key=lambda segment: segment.start)
+        return segments
+
+    def segment(self, text: str) -> List[CommandSegment]:
+        """
+        인식 결과를 실행 순서대로의 명령어 목록으로 분할
+
+        Args:
+            text (str): 음성 인식 결과
+
+        Returns:
+            List[CommandSegment]: 발화 순서의 명령어 구간 목록 (최대 max_segments개, 비활성화 시 빈 목록)
+        """
+        if not self.enabled or not text or not text.strip():
+            return []
+
+        self.stats['utterances'] += 1
+        trie = get_command_trie(self.macro_index.get_snapshot())
+
+        segments: List[CommandSegment] = []
+        for piece in self._split_pieces(text):
+            segments.extend(self._segment_piece(text, piece, trie))
+            if len(segments) >= self.max_segments:
+                segments = segments[:self.max_segments]
+                break
+
+        for segment in segments:
+            self.stats[f'{segment.source}_segments'] += 1
+        if len(segments) > 1:
+            self.stats['multi_command_utterances'] += 1
+
+        return segments
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        분할 통계 반환
+
+        Returns:
+            Dict: 통계 정보
+        """
+        return {
+            **self.stats,
+            'enabled': self.enabled,
+            'max_segments': self.max_segments
+        }
+
+
+# 전역 발화 분할 서비스 인스턴스
+_segmentation_service_instance = None
+
+def get_command_segmentation_service() -> CommandSegmentationService:
+    """
+    발화 분할 서비스 싱글톤 인스턴스 반환
+
+    Returns:
+        CommandSegmentationService: 발화 분할 서비스 인스턴스
+    """
+    global _segmentation_service_instance
+    if _segmentation_service_instance is None:
+        _segmentation_service_instance = CommandSegmentationService()
+    return _segmentation_service_instance
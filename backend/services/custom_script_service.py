@@ -10,6 +10,7 @@ import traceback
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 from backend.database.database_manager import db_manager
+from backend.services.macro_index import macro_index
 from backend.parsers.msl_lexer import MSLLexer
 from backend.parsers.msl_parser import MSLParser
 from backend.parsers.msl_interpreter import MSLInterpreter
@@ -110,6 +111,9 @@ class CustomScriptService:
             conn.commit()
             conn.close()
             
+            # 매크로 정보(is_script)가 바뀌었으므로 매칭 인덱스 무효화
+            macro_index.invalidate("create_script")
+            
             # 캐시에 추가
             self._script_cache[script_id] = {
                 'ast': ast,
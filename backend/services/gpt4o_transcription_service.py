@@ -13,6 +13,10 @@ import websockets
 from typing import Optional, Callable, Dict, Any
 from datetime import datetime
 
+# input_audio_buffer.append 메시지 틀 (오디오 Base64 문자열 앞뒤)
+AUDIO_APPEND_PREFIX = '{"type": "input_audio_buffer.append", "audio": "'
+AUDIO_APPEND_SUFFIX = '"}'
+
 class GPT4oTranscriptionService:
     """websockets 라이브러리를 사용한 GPT-4o 실시간 트랜스크립션 서비스"""
     
@@ -42,6 +46,7 @@ class GPT4oTranscriptionService:
         self.session_id: Optional[str] = None
         self.is_connected = False
         self.transcription_callback: Optional[Callable] = None
+        self._partial_transcripts: Dict[str, str] = {}  # item_id -> 누적된 부분 인식 결과
         self.logger = logging.getLogger(__name__)
         
         # WebSocket 연결 설정
@@ -185,16 +190,31 @@ class GPT4oTranscriptionService:
                 # 음성 입력 종료 감지
                 self.logger.debug("음성 입력 종료 감지됨")
                 
+            elif event_type == "conversation.item.input_audio_transcription.delta":
+                # 부분 트랜스크립션 (선행 매칭용으로 누적 결과 전달)
+                item_id = data.get("item_id")
+                transcript = self._partial_transcripts.get(item_id, "") + data.get("delta", "")
+                self._partial_transcripts[item_id] = transcript
+                
+                if self.transcription_callback and transcript.strip():
+                    await self._dispatch_transcription({
+                        "type": "partial",
+                        "text": transcript,
+                        "item_id": item_id,
+                        "timestamp": datetime.now().isoformat()
+                    })
+                
             elif event_type == "conversation.item.input_audio_transcription.completed":
                 # 트랜스크립션 완료
                 transcript = data.get("transcript", "")
                 item_id = data.get("item_id")
+                self._partial_transcripts.pop(item_id, None)
                 
                 if self.transcription_callback and transcript.strip():
                     # 신뢰도는 완료된 트랜스크립션에 대해 높게 설정
                     confidence = 0.9  # Realtime API에서는 별도 신뢰도 점수를 제공하지 않음
                     
-                    await self.transcription_callback({
+                    await self._dispatch_transcription({
                         "type": "final",
                         "text": transcript,
                         "item_id": item_id,
@@ -204,6 +224,7 @@ class GPT4oTranscriptionService:
                     
             elif event_type == "conversation.item.input_audio_transcription.failed":
                 # 트랜스크립션 실패
+                self._partial_transcripts.pop(data.get("item_id"), None)
                 error_info = data.get("error", {})
                 self.logger.warning(f"트랜스크립션 실패: {error_info}")
                 
@@ -220,26 +241,33 @@ class GPT4oTranscriptionService:
         except Exception as e:
             self.logger.error(f"메시지 처리 오류: {e}")
     
+    async def _dispatch_transcription(self, transcription_data: Dict[str, Any]):
+        """
+        트랜스크립션 콜백 호출 (동기/비동기 콜백 모두 지원)
+        
+        Args:
+            transcription_data (Dict): 트랜스크립션 결과 데이터
+        """
+        result = self.transcription_callback(transcription_data)
+        if asyncio.iscoroutine(result):
+            await result
+    
     async def send_audio_chunk(self, audio_data: bytes):
         """
         실시간 오디오 데이터 전송
         
         Args:
-            audio_data (bytes): PCM16 형식의 오디오 데이터 (24kHz)
+            audio_data (bytes): PCM16 형식의 오디오 데이터 (24kHz, bytes 또는 memoryview)
         """
         if not self.is_connected or not self.websocket:
             raise ConnectionError("트랜스크립션 서비스에 연결되지 않음")
         
         try:
             # 오디오 데이터를 Base64로 인코딩
-            audio_base64 = base64.b64encode(audio_data).decode('utf-8')
-            
-            message = {
-                "type": "input_audio_buffer.append",
-                "audio": audio_base64
-            }
+            audio_base64 = base64.b64encode(audio_data).decode('ascii')
             
-            await self.websocket.send(json.dumps(message))
+            # Base64 문자는 JSON 이스케이프가 필요 없으므로 json.dumps 없이 메시지 조립
+            await self.websocket.send(AUDIO_APPEND_PREFIX + audio_base64 + AUDIO_APPEND_SUFFIX)
             
         except Exception as e:
             self.logger.error(f"오디오 전송 실패: {e}")
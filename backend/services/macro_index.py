@@ -0,0 +1,331 @@
+"""
+VoiceMacro Pro - 매크로 인덱스 서비스
+음성 매칭 핫패스에서 사용하는 프로세스 전역 인메모리 매크로 인덱스 (버전 관리)
+"""
+
+import time
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from backend.utils.common_utils import get_logger
+from backend.utils.phonetic_similarity import to_jamo
+from backend.utils.text_normalizer import TextNormalizer, get_text_normalizer
+
+
+@dataclass(frozen=True)
+class MacroIndexEntry:
+    """매칭 대상 매크로 한 개에 대한 인덱스 항목"""
+    position: int              # 스냅샷 내 순서 (이름 오름차순, 동점 정렬 기준)
+    macro: Dict[str, Any]      # macro_service.get_all_macros() 형식의 원본 딕셔너리
+    voice_command: str         # 원본 음성 명령어
+    command_normalized: str    # 정규화된 음성 명령어 (소문자, 불용어/특수문자 제거, 공백 정리)
+    command_tokens: FrozenSet[str]  # 정규화된 명령어의 공백 기준 단어 집합
+    command_jamo: str          # 음운 유사도 계산용 자모 분해 결과
+
+
+class MacroIndexSnapshot:
+    """
+    특정 버전의 매크로 인덱스 스냅샷 (읽기 전용)
+
+    스냅샷은 생성 후 변경되지 않으므로 락 없이 여러 스레드에서 읽을 수 있습니다.
+    매크로가 변경되면 새 스냅샷이 만들어지고 이전 스냅샷은 그대로 버려집니다.
+    """
+
+    def __init__(self, version: int, macros: List[Dict[str, Any]],
+                 normalizer: Optional[TextNormalizer] = None):
+        """
+        스냅샷 생성
+
+        Args:
+            version (int): 인덱스 버전
+            macros (List[Dict]): 매크로 목록 (이름 오름차순)
+            normalizer (TextNormalizer): 음성 명령어 정규화기 (기본값: 모든 언어 공유 정규화기)
+        """
+        self.version = version
+        self.built_at = time.time()
+        self.macros: Tuple[Dict[str, Any], ...] = tuple(macros)
+
+        normalizer = self.normalizer = normalizer or get_text_normalizer()
+
+        entries = []
+        for macro in self.macros:
+            voice_command = macro.get('voice_command') or ''
+            if not voice_command:
+                continue
+
+            # 매칭 시에는 입력만 정규화하면 되도록 명령어는 여기서 한 번만 정규화
+            command_normalized, command_tokens = normalizer.normalize_with_tokens(voice_command)
+            if not command_normalized:
+                # 불용어/특수문자만으로 된 명령어는 소문자화만 적용
+                command_normalized = voice_command.lower().strip()
+                command_tokens = frozenset(command_normalized.split())
+
+            entries.append(MacroIndexEntry(
+                position=len(entries),
+                macro=macro,
+                voice_command=voice_command,
+                command_normalized=command_normalized,
+                command_tokens=command_tokens,
+                command_jamo=to_jamo(command_normalized)
+            ))
+
+        self.entries: Tuple[MacroIndexEntry, ...] = tuple(entries)
+        self.by_id: Dict[int, Dict[str, Any]] = {macro['id']: macro for macro in self.macros}
+
+        # 버전별 파생 데이터 (n-gram 색인 등) 캐시
+        self._artifacts: Dict[str, Any] = {}
+        self._artifact_lock = threading.Lock()
+
+    def get_artifact(self, key: str, builder: Callable[['MacroIndexSnapshot'], Any]) -> Any:
+        """
+        스냅샷에서 파생되는 데이터를 한 번만 만들어 캐시하고 반환
+
+        Args:
+            key (str): 파생 데이터 이름
+            builder (Callable): 스냅샷을 받아 파생 데이터를 만드는 함수
+
+        Returns:
+            Any: 캐시된 파생 데이터
+        """
+        artifact = self._artifacts.get(key)
+        if artifact is not None:
+            return artifact
+
+        with self._artifact_lock:
+            artifact = self._artifacts.get(key)
+            if artifact is None:
+                artifact = builder(self)
+                self._artifacts[key] = artifact
+        return artifact
+
+    def __len__(self) -> int:
+        return len(self.macros)
+
+
+class MacroIndex:
+    """
+    프로세스 전역 매크로 인덱스 클래스
+    - 매크로 목록을 메모리에 보관하여 매 발화마다의 DB 조회 제거
+    - MacroService의 생성/수정/삭제/복사 시 무효화되어 버전 증가
+    - 다음 조회 시점에 한 번만 다시 로드 (지연 재구축)
+    - 프리셋 적용 시 해당 매크로만 담은 스냅샷을 미리 만들어 원자적으로 교체 (범위 지정)
+    """
+
+    def __init__(self, loader: Optional[Callable[[], List[Dict[str, Any]]]] = None):
+        """
+        매크로 인덱스 초기화
+
+        Args:
+            loader (Callable): 매크로 목록을 반환하는 함수 (기본값: macro_service.get_all_macros)
+        """
+        self.logger = get_logger(__name__)
+        self._loader = loader
+        self._lock = threading.RLock()
+        self._version = 0
+        self._snapshot: Optional[MacroIndexSnapshot] = None
+
+        # 매칭 범위 (None이면 전체 매크로, 아니면 해당 ID만)
+        self._scope: Optional[FrozenSet[int]] = None
+        self._scope_name = ""
+        self._scope_request = 0
+
+        # 새 스냅샷 교체 전에 파생 데이터를 미리 만드는 함수들 (n-gram 색인 등)
+        self._warmers: List[Callable[[MacroIndexSnapshot], Any]] = []
+
+        # 인덱스 통계
+        self.stats = {
+            'rebuilds': 0,
+            'invalidations': 0,
+            'scope_swaps': 0,
+            'last_build_ms': 0.0
+        }
+
+    @property
+    def version(self) -> int:
+        """현재 인덱스 버전"""
+        return self._version
+
+    def _load_macros(self) -> List[Dict[str, Any]]:
+        """로더를 통해 매크로 목록 조회"""
+        if self._loader is not None:
+            return self._loader()
+
+        # 순환 import 방지를 위해 지연 import
+        from backend.services.macro_service import macro_service
+        return macro_service.get_all_macros()
+
+    @staticmethod
+    def _filter_scope(macros: List[Dict[str, Any]], scope: Optional[FrozenSet[int]]) -> List[Dict[str, Any]]:
+        """매칭 범위에 포함된 매크로만 반환 (순서 유지)"""
+        if scope is None:
+            return macros
+        return [macro for macro in macros if macro.get('id') in scope]
+
+    @property
+    def scope_name(self) -> str:
+        """현재 매칭 범위 이름 (전체 매크로면 빈 문자열)"""
+        return self._scope_name
+
+    def register_warmer(self, warmer: Callable[[MacroIndexSnapshot], Any]):
+        """
+        범위 교체 전에 새 스냅샷에서 호출할 준비 함수 등록
+
+        Args:
+            warmer (Callable): 스냅샷을 받아 파생 데이터(get_artifact)를 만드는 함수
+        """
+        if warmer not in self._warmers:
+            self._warmers.append(warmer)
+
+    def _warm_up(self, snapshot: MacroIndexSnapshot):
+        """등록된 준비 함수로 스냅샷 파생 데이터 미리 생성"""
+        for warmer in self._warmers:
+            try:
+                warmer(snapshot)
+            except Exception as e:
+                self.logger.warning(f"매크로 인덱스 준비 함수 실패: {e}")
+
+    def set_scope(self, macro_ids: Optional[Iterable[int]], name: str = "",
+                  background: bool = False) -> bool:
+        """
+        매칭 범위 설정 (프리셋 적용/해제)
+
+        새 범위의 스냅샷과 파생 데이터를 모두 만든 뒤 한 번에 교체하므로,
+        준비 중에도 매칭은 이전 스냅샷으로 계속 동작합니다.
+
+        Args:
+            macro_ids (Optional[Iterable[int]]): 매칭할 매크로 ID 목록 (None이면 전체 매크로)
+            name (str): 범위 이름 (로그/통계용, 예: 프리셋 이름)
+            background (bool): True면 별도 스레드에서 준비 후 교체하고 즉시 반환
+
+        Returns:
+            bool: 교체 성공 여부 (background면 준비 시작 여부)
+        """
+        scope = frozenset(macro_ids) if macro_ids is not None else None
+
+        with self._lock:
+            self._scope_request += 1
+            request = self._scope_request
+
+        if background:
+            threading.Thread(
+                target=self._swap_scope, args=(scope, name, request),
+                name="MacroIndexScopeSwap", daemon=True
+            ).start()
+            return True
+
+        return self._swap_scope(scope, name, request)
+
+    def _swap_scope(self, scope: Optional[FrozenSet[int]], name: str, request: int) -> bool:
+        """범위 스냅샷을 준비하고 가장 최근 요청이면 원자적으로 교체"""
+        try:
+            while True:
+                start_time = time.perf_counter()
+                base_version = self._version
+
+                # 잠금 밖에서 로드/구축/준비 (그동안 매칭은 기존 스냅샷 사용)
+                snapshot = MacroIndexSnapshot(base_version + 1, self._filter_scope(self._load_macros(), scope))
+                self._warm_up(snapshot)
+
+                with self._lock:
+                    # 더 최근 범위 요청이 있으면 이 결과는 버림
+                    if request != self._scope_request:
+                        return False
+
+                    # 준비 중에 매크로가 바뀌었으면 다시 구축
+                    if self._version != base_version:
+                        continue
+
+                    self._version = snapshot.version
+                    self._scope = scope
+                    self._scope_name = name
+                    self._snapshot = snapshot
+
+                    elapsed_ms = (time.perf_counter() - start_time) * 1000
+                    self.stats['rebuilds'] += 1
+                    self.stats['scope_swaps'] += 1
+                    self.stats['last_build_ms'] = elapsed_ms
+
+                self.logger.info(f"매크로 인덱스 범위 교체: v{snapshot.version} "
+                                 f"'{name or '전체'}' {len(snapshot)}개, {elapsed_ms:.1f}ms")
+                return True
+
+        except Exception as e:
+            self.logger.error(f"매크로 인덱스 범위 교체 실패: {e}")
+            return False
+
+    def invalidate(self, reason: str = ""):
+        """
+        인덱스 무효화 (매크로 변경 시 호출)
+
+        Args:
+            reason (str): 무효화 사유 (로그용)
+        """
+        with self._lock:
+            self._version += 1
+            self._snapshot = None
+            self.stats['invalidations'] += 1
+
+        self.logger.debug(f"매크로 인덱스 무효화: v{self._version} ({reason})")
+
+    def get_snapshot(self) -> MacroIndexSnapshot:
+        """
+        현재 버전의 인덱스 스냅샷 반환 (필요 시 재구축)
+
+        Returns:
+            MacroIndexSnapshot: 인덱스 스냅샷
+        """
+        snapshot = self._snapshot
+        if snapshot is not None:
+            return snapshot
+
+        with self._lock:
+            if self._snapshot is None:
+                start_time = time.perf_counter()
+                version = self._version
+                self._snapshot = MacroIndexSnapshot(version, self._filter_scope(self._load_macros(), self._scope))
+
+                elapsed_ms = (time.perf_counter() - start_time) * 1000
+                self.stats['rebuilds'] += 1
+                self.stats['last_build_ms'] = elapsed_ms
+                self.logger.info(f"매크로 인덱스 구축 완료: v{version}, "
+                                 f"{len(self._snapshot)}개, {elapsed_ms:.1f}ms")
+            return self._snapshot
+
+    def get_macros(self) -> Tuple[Dict[str, Any], ...]:
+        """
+        인덱스에 있는 모든 매크로 반환 (DB 조회 없음)
+
+        반환되는 딕셔너리는 인덱스와 공유되므로 수정하지 마세요.
+
+        Returns:
+            Tuple[Dict]: 매크로 목록 (이름 오름차순)
+        """
+        return self.get_snapshot().macros
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        인덱스 상태 정보 반환
+
+        Returns:
+            Dict: 인덱스 상태 정보
+        """
+        snapshot = self._snapshot
+        return {
+            'version': self._version,
+            'is_built': snapshot is not None,
+            'macro_count': len(snapshot) if snapshot else 0,
+            'entry_count': len(snapshot.entries) if snapshot else 0,
+            'scope': {
+                'name': self._scope_name,
+                'macro_ids': len(self._scope) if self._scope is not None else None
+            },
+            'rebuilds': self.stats['rebuilds'],
+            'invalidations': self.stats['invalidations'],
+            'scope_swaps': self.stats['scope_swaps'],
+            'last_build_ms': self.stats['last_build_ms']
+        }
+
+
+# 전역 매크로 인덱스 인스턴스
+macro_index = MacroIndex()
@@ -1,53 +1,41 @@
 """
 VoiceMacro Pro - 매크로 명령어 매칭 서비스
 음성 인식 결과를 등록된 매크로 명령어와 매칭하는 고급 기능 제공
+(유사도 계산/후보 선별/캐시는 공용 매칭 엔진(matching_engine)이 담당)
 """
 
 import time
-from typing import Dict, List, Optional, Tuple, Any
-from dataclasses import dataclass
-from enum import Enum
-from difflib import SequenceMatcher
+from typing import Dict, List, Optional, Sequence, Any
 
 from backend.utils.common_utils import get_logger
-from backend.services.macro_service import macro_service
-
-
-class MatchConfidenceLevel(Enum):
-    """매칭 신뢰도 레벨 열거형"""
-    VERY_HIGH = "very_high"  # 0.9 이상
-    HIGH = "high"           # 0.8-0.9
-    MEDIUM = "medium"       # 0.7-0.8
-    LOW = "low"            # 0.6-0.7
-    VERY_LOW = "very_low"   # 0.6 미만
-
-
-@dataclass
-class MacroMatch:
-    """매크로 매칭 결과 데이터 클래스"""
-    macro_id: int
-    macro_name: str
-    voice_command: str
-    similarity: float
-    confidence_level: MatchConfidenceLevel
-    match_type: str  # 'exact', 'partial', 'synonym', 'fuzzy'
-    action_type: str
-    key_sequence: str
+from backend.services.macro_index import MacroIndex
+from backend.services.matching_engine import (
+    MatchingEngine, MacroMatch, MatchConfidenceLevel, matching_engine
+)
 
 
 class MacroMatchingService:
     """
     매크로 명령어 매칭 서비스 클래스
-    - 유사도 기반 매크로 검색
+    - 유사도 기반 매크로 검색 (공용 매칭 엔진 사용)
     - 부분 일치 및 동의어 처리
     - 확신도 표시
     - 매칭 히스토리 관리
     """
     
-    def __init__(self):
-        """매크로 매칭 서비스 초기화"""
+    def __init__(self, index: Optional[MacroIndex] = None):
+        """
+        매크로 매칭 서비스 초기화
+        
+        Args:
+            index (MacroIndex): 매칭에 사용할 매크로 인덱스 (기본값: 전역 인덱스, 전역 엔진 공유)
+        """
         self.logger = get_logger(__name__)
         
+        # 공용 매칭 엔진 (별도 인덱스를 쓰는 경우에만 전용 엔진 생성)
+        self.engine = matching_engine if index is None else MatchingEngine(index)
+        self.macro_index = self.engine.macro_index
+        
         # 매칭 설정
         self.similarity_threshold = 0.6  # 기본 유사도 임계값
         self.max_results = 5  # 최대 결과 수
@@ -67,37 +55,13 @@ class MacroMatchingService:
             'failed_matches': 0
         }
         
-        # 동의어 사전 (확장된 버전)
-        self.synonyms = {
-            # 기본 게임 액션
-            '공격': ['어택', '때리기', '치기', '타격', '공격하기', 'attack'],
-            '방어': ['가드', '막기', '디펜스', '방어하기', 'defend', 'guard'],
-            '스킬': ['기술', '능력', '마법', '스킬사용', 'skill', 'magic'],
-            '아이템': ['아템', '물건', '도구', '아이템사용', 'item', 'use'],
-            '점프': ['뛰기', '뛰어오르기', '껑충', '점프하기', 'jump'],
-            '달리기': ['뛰기', '러닝', '빠르게', '달리기시작', 'run', 'sprint'],
-            '이동': ['움직이기', '가기', '무브', 'move', 'go'],
-            '멈춤': ['정지', '스톱', '그만', 'stop', 'halt'],
-            
-            # 게임 UI 액션
-            '인벤토리': ['가방', '아이템창', '인벤', '창고', 'inventory', 'bag'],
-            '설정': ['옵션', '세팅', '환경설정', 'settings', 'options'],
-            '저장': ['세이브', '보존', '게임저장', 'save'],
-            '로드': ['불러오기', '로딩', '게임로딩', 'load'],
-            '종료': ['나가기', '끝내기', '게임종료', 'quit', 'exit'],
-            '일시정지': ['멈춤', '정지', '잠깐', 'pause'],
-            '계속': ['재개', '다시', '계속하기', 'continue', 'resume'],
-            
-            # 숫자 및 순서
-            '하나': ['1', '첫번째', 'one', 'first'],
-            '둘': ['2', '두번째', 'two', 'second'],
-            '셋': ['3', '세번째', 'three', 'third'],
-            '넷': ['4', '네번째', 'four', 'fourth'],
-            '다섯': ['5', '다섯번째', 'five', 'fifth']
-        }
-        
         self.logger.info("매크로 매칭 서비스가 초기화되었습니다.")
     
+    @property
+    def synonyms(self) -> Dict[str, List[str]]:
+        """매칭 엔진의 동의어 사전"""
+        return self.engine.synonyms
+    
     def set_similarity_threshold(self, threshold: float) -> bool:
         """
         유사도 임계값 설정
@@ -116,117 +80,17 @@ class MacroMatchingService:
             self.logger.error(f"유효하지 않은 임계값입니다: {threshold}")
             return False
     
-    def _calculate_similarity(self, text1: str, text2: str) -> float:
-        """
-        두 텍스트 간의 유사도 계산
-        
-        Args:
-            text1 (str): 첫 번째 텍스트
-            text2 (str): 두 번째 텍스트
-            
-        Returns:
-            float: 유사도 점수 (0.0-1.0)
-        """
-        if not text1 or not text2:
-            return 0.0
-        
-        # 기본 문자열 유사도
-        basic_similarity = SequenceMatcher(None, text1.lower(), text2.lower()).ratio()
-        
-        # 단어 기반 유사도 (공백으로 분리)
-        words1 = set(text1.lower().split())
-        words2 = set(text2.lower().split())
-        
-        if words1 and words2:
-            word_similarity = len(words1.intersection(words2)) / len(words1.union(words2))
-        else:
-            word_similarity = 0.0
-        
-        # 가중 평균 (문자열 70%, 단어 30%)
-        return basic_similarity * 0.7 + word_similarity * 0.3
-    
-    def _check_synonyms(self, input_text: str, target_text: str) -> Tuple[bool, float]:
-        """
-        동의어 매칭 확인
-        
-        Args:
-            input_text (str): 입력 텍스트
-            target_text (str): 대상 텍스트
-            
-        Returns:
-            Tuple[bool, float]: (매칭 여부, 유사도)
-        """
-        input_lower = input_text.lower().strip()
-        target_lower = target_text.lower().strip()
-        
-        # 동의어 사전에서 확인
-        for main_word, synonym_list in self.synonyms.items():
-            # 1. input이 main_word이고 target이 동의어인 경우
-            if input_lower == main_word and any(syn in target_lower for syn in synonym_list):
-                return True, 0.95
-            
-            # 2. input이 동의어이고 target이 main_word인 경우
-            if any(syn == input_lower for syn in synonym_list) and main_word in target_lower:
-                return True, 0.95
-            
-            # 3. 둘 다 같은 main_word의 동의어인 경우
-            if (any(syn == input_lower for syn in synonym_list) and 
-                any(syn in target_lower for syn in synonym_list)):
-                return True, 0.90
-        
-        return False, 0.0
-    
-    def _get_confidence_level(self, similarity: float) -> MatchConfidenceLevel:
-        """
-        유사도를 신뢰도 레벨로 변환
-        
-        Args:
-            similarity (float): 유사도 점수
-            
-        Returns:
-            MatchConfidenceLevel: 신뢰도 레벨
-        """
-        if similarity >= 0.9:
-            return MatchConfidenceLevel.VERY_HIGH
-        elif similarity >= 0.8:
-            return MatchConfidenceLevel.HIGH
-        elif similarity >= 0.7:
-            return MatchConfidenceLevel.MEDIUM
-        elif similarity >= 0.6:
-            return MatchConfidenceLevel.LOW
-        else:
-            return MatchConfidenceLevel.VERY_LOW
-    
-    def _determine_match_type(self, input_text: str, target_text: str, similarity: float) -> str:
+    def set_string_scorer(self, scorer: str) -> bool:
         """
-        매칭 타입 결정
+        문자열 유사도 계산기 설정
         
         Args:
-            input_text (str): 입력 텍스트
-            target_text (str): 대상 텍스트
-            similarity (float): 유사도
+            scorer (str): 'sequence' (SequenceMatcher) 또는 'levenshtein' (비트 병렬 편집 거리)
             
         Returns:
-            str: 매칭 타입
+            bool: 설정 성공 여부
         """
-        input_lower = input_text.lower().strip()
-        target_lower = target_text.lower().strip()
-        
-        # 정확한 매칭
-        if input_lower == target_lower:
-            return 'exact'
-        
-        # 동의어 매칭
-        is_synonym, _ = self._check_synonyms(input_text, target_text)
-        if is_synonym:
-            return 'synonym'
-        
-        # 부분 매칭
-        if input_lower in target_lower or target_lower in input_lower:
-            return 'partial'
-        
-        # 퍼지 매칭
-        return 'fuzzy'
+        return self.engine.set_string_scorer(scorer)
     
     def find_matching_macros(self, input_text: str, include_disabled: bool = False) -> List[MacroMatch]:
         """
@@ -245,56 +109,11 @@ class MacroMatchingService:
             if not input_text or not input_text.strip():
                 return []
             
-            # 데이터베이스에서 모든 매크로 가져오기
-            all_macros = macro_service.get_all_macros()
-            
-            if not all_macros:
+            if not self.macro_index.get_snapshot().entries:
                 self.logger.warning("데이터베이스에 매크로가 없습니다.")
                 return []
             
-            matches = []
-            input_clean = input_text.strip()
-            
-            for macro in all_macros:
-                voice_command = macro.get('voice_command', '')
-                
-                if not voice_command:
-                    continue
-                
-                # 기본 유사도 계산
-                similarity = self._calculate_similarity(input_clean, voice_command)
-                
-                # 동의어 매칭 확인
-                is_synonym, synonym_similarity = self._check_synonyms(input_clean, voice_command)
-                if is_synonym:
-                    similarity = max(similarity, synonym_similarity)
-                
-                # 임계값 확인
-                if similarity < self.similarity_threshold:
-                    continue
-                
-                # 매칭 타입 결정
-                match_type = self._determine_match_type(input_clean, voice_command, similarity)
-                
-                # MacroMatch 객체 생성
-                macro_match = MacroMatch(
-                    macro_id=macro['id'],
-                    macro_name=macro.get('name', ''),
-                    voice_command=voice_command,
-                    similarity=similarity,
-                    confidence_level=self._get_confidence_level(similarity),
-                    match_type=match_type,
-                    action_type=macro.get('action_type', ''),
-                    key_sequence=macro.get('key_sequence', '')
-                )
-                
-                matches.append(macro_match)
-            
-            # 유사도 순으로 정렬
-            matches.sort(key=lambda x: x.similarity, reverse=True)
-            
-            # 최대 결과 수로 제한
-            matches = matches[:self.max_results]
+            matches = self.engine.match(input_text, self.similarity_threshold, self.max_results)
             
             # 통계 업데이트
             self._update_stats(input_text, matches)
@@ -310,6 +129,26 @@ class MacroMatchingService:
             self.logger.error(f"매크로 매칭 중 오류: {e}")
             return []
     
+    def match_batch(self, texts: Sequence[str], threshold: Optional[float] = None,
+                    max_results: Optional[int] = None) -> List[List[MacroMatch]]:
+        """
+        여러 입력 텍스트를 한 번에 매칭 (로그 재생, 임계값 튜닝용)
+        
+        입력마다 find_matching_macros와 같은 결과를 반환하지만
+        매칭 통계와 히스토리에는 기록하지 않습니다.
+        
+        Args:
+            texts (Sequence[str]): 입력 텍스트 목록
+            threshold (float): 유사도 임계값 (기본값: 현재 설정값)
+            max_results (int): 입력별 최대 결과 수 (기본값: 현재 설정값)
+            
+        Returns:
+            List[List[MacroMatch]]: 입력 순서대로 매칭 결과 목록
+        """
+        threshold = self.similarity_threshold if threshold is None else threshold
+        max_results = self.max_results if max_results is None else max_results
+        return self.engine.match_batch(texts, threshold, max_results)
+    
     def get_best_match(self, input_text: str) -> Optional[MacroMatch]:
         """
         가장 좋은 매칭 결과 하나만 반환
@@ -372,6 +211,7 @@ class MacroMatchingService:
             Dict: 통계 정보
         """
         total = self.stats['total_matches']
+        engine_stats = self.engine.get_stats()
         
         return {
             'total_matches': total,
@@ -387,8 +227,11 @@ class MacroMatchingService:
             'settings': {
                 'similarity_threshold': self.similarity_threshold,
                 'max_results': self.max_results,
-                'synonyms_count': len(self.synonyms)
+                **engine_stats['settings']
             },
+            'match_cache': engine_stats['match_cache'],
+            'macro_index': engine_stats['macro_index'],
+            'usage_prior': engine_stats['usage_prior'],
             'history_size': len(self.match_history)
         }
     
@@ -420,22 +263,7 @@ class MacroMatchingService:
         Returns:
             bool: 추가 성공 여부
         """
-        try:
-            if main_word in self.synonyms:
-                # 기존 동의어에 추가
-                self.synonyms[main_word].extend(synonyms)
-                # 중복 제거
-                self.synonyms[main_word] = list(set(self.synonyms[main_word]))
-            else:
-                # 새로운 항목 생성
-                self.synonyms[main_word] = synonyms
-            
-            self.logger.info(f"동의어 추가 완료: {main_word} <- {synonyms}")
-            return True
-            
-        except Exception as e:
-            self.logger.error(f"동의어 추가 실패: {e}")
-            return False
+        return self.engine.add_synonym(main_word, synonyms)
 
 
 # 전역 매크로 매칭 서비스 인스턴스
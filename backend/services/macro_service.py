@@ -2,6 +2,8 @@ import json
 from datetime import datetime
 from typing import List, Dict, Optional
 from backend.database.database_manager import db_manager
+from backend.services.macro_index import macro_index
+from backend.services.usage_prior import usage_prior
 
 class MacroService:
     """
@@ -37,6 +39,9 @@ class MacroService:
         
         macro_id = self.db.execute_query(query, (name, voice_command, action_type, key_sequence, settings_json))
         
+        # 매칭용 매크로 인덱스 무효화
+        macro_index.invalidate("create_macro")
+        
         # 로그 남기기
         self._log_action("INFO", f"새 매크로 생성: {name}", macro_id)
         
@@ -181,6 +186,9 @@ class MacroService:
         
         self.db.execute_query(query, tuple(params))
         
+        # 매칭용 매크로 인덱스 무효화
+        macro_index.invalidate("update_macro")
+        
         # 로그 남기기
         self._log_action("INFO", f"매크로 수정: {existing_macro['name']}", macro_id)
         
@@ -247,6 +255,9 @@ class MacroService:
         query = "DELETE FROM macros WHERE id = ?"
         self.db.execute_query(query, (macro_id,))
         
+        # 매칭용 매크로 인덱스 무효화
+        macro_index.invalidate("delete_macro")
+        
         # 로그 남기기
         if script_rows:
             self._log_action("INFO", f"매크로 삭제 (스크립트 포함): {macro['name']}", macro_id)
@@ -263,6 +274,9 @@ class MacroService:
         """
         query = "UPDATE macros SET usage_count = usage_count + 1 WHERE id = ?"
         self.db.execute_query(query, (macro_id,))
+        
+        # 매칭 우선순위용 인메모리 사용 빈도 갱신
+        usage_prior.record(macro_id)
     
     def _log_action(self, level: str, message: str, macro_id: int = None):
         """
@@ -0,0 +1,1116 @@
+"""
+VoiceMacro Pro - 매칭 엔진
+음성 명령어 매칭의 공용 엔진 (인메모리 매크로 인덱스 기반 후보 선별, 유사도 계산, 결과 캐시)
+MacroMatchingService, WhisperService, VoiceAnalysisService, Socket.IO 실시간 경로가 모두 이 엔진을 사용합니다.
+"""
+
+import time
+import heapq
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Sequence, Set, Tuple, Any
+from dataclasses import dataclass
+from enum import Enum
+from difflib import SequenceMatcher
+
+from backend.utils.common_utils import get_logger
+from backend.utils.config import config
+from backend.utils.aho_corasick import AhoCorasickAutomaton
+from backend.utils.ngram_index import NGramIndex
+from backend.utils.tfidf_index import TfidfIndex
+from backend.utils.text_normalizer import TextNormalizer, get_text_normalizer
+from backend.utils.edit_distance import levenshtein_ratio, length_ratio_upper_bound
+from backend.utils.phonetic_similarity import (
+    to_jamo, phonetic_similarity_jamo, jamo_similarity_upper_bound
+)
+from backend.services.macro_index import MacroIndex, MacroIndexEntry, MacroIndexSnapshot, macro_index
+from backend.services.usage_prior import UsagePrior, usage_prior
+
+# 문자열 유사도 계산기 ('sequence': difflib.SequenceMatcher, 'levenshtein': 비트 병렬 편집 거리,
+# 'tfidf': 자모 n-gram TF-IDF 코사인 유사도 - 쌍별 비교 없이 행렬-벡터 곱 한 번으로 전체 매칭)
+STRING_SCORERS = ('sequence', 'levenshtein', 'tfidf')
+
+
+class MatchConfidenceLevel(Enum):
+    """매칭 신뢰도 레벨 열거형"""
+    VERY_HIGH = "very_high"  # 0.9 이상
+    HIGH = "high"           # 0.8-0.9
+    MEDIUM = "medium"       # 0.7-0.8
+    LOW = "low"            # 0.6-0.7
+    VERY_LOW = "very_low"   # 0.6 미만
+
+
+@dataclass
+class MacroMatch:
+    """매크로 매칭 결과 데이터 클래스"""
+    macro_id: int
+    macro_name: str
+    voice_command: str
+    similarity: float
+    confidence_level: MatchConfidenceLevel
+    match_type: str  # 'exact', 'partial', 'synonym', 'fuzzy'
+    action_type: str
+    key_sequence: str
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        JSON 응답용 딕셔너리로 변환
+        
+        Returns:
+            Dict: 매칭 결과 딕셔너리
+        """
+        return {
+            'macro_id': self.macro_id,
+            'macro_name': self.macro_name,
+            'voice_command': self.voice_command,
+            'similarity': self.similarity,
+            'confidence_level': self.confidence_level.value,
+            'match_type': self.match_type,
+            'action_type': self.action_type,
+            'key_sequence': self.key_sequence
+        }
+
+
+class MatchingEngine:
+    """
+    공용 매칭 엔진 클래스
+    - 매크로 인덱스 스냅샷별로 n-gram 역색인, 동의어/명령어 오토마톤을 한 번만 구성
+    - 후보 선별 후 정확한 유사도 계산 (문자열 70% + 단어 30%, 동의어, 부분 일치)
+    - 매칭 결과 LRU 캐시
+    - 사용 빈도 상위 매크로 우선 확인 및 동점 순위 결정
+    - 임시 명령어 목록(매크로가 아닌 문자열 목록) 매칭 지원
+    """
+    
+    def __init__(self, index: Optional[MacroIndex] = None,
+                 synonyms: Optional[Dict[str, List[str]]] = None,
+                 usage: Optional[UsagePrior] = None,
+                 normalizer: Optional[TextNormalizer] = None):
+        """
+        매칭 엔진 초기화
+        
+        Args:
+            index (MacroIndex): 매칭에 사용할 매크로 인덱스 (기본값: 전역 인덱스)
+            synonyms (Dict[str, List[str]]): 동의어 사전 (기본값: 게임 명령어 동의어 사전)
+            usage (UsagePrior): 매크로 사용 빈도 테이블 (기본값: 전역 테이블)
+            normalizer (TextNormalizer): 입력/임시 명령어 정규화기 (기본값: 모든 언어 공유 정규화기)
+        """
+        self.logger = get_logger(__name__)
+        
+        # 인메모리 매크로 인덱스 (매 발화마다 DB를 조회하지 않음)
+        self.macro_index = index or macro_index
+        
+        # 텍스트 정규화기 (인덱스의 명령어는 이미 정규화되어 있으므로 입력만 정규화)
+        self.normalizer = normalizer or get_text_normalizer()
+        
+        # 문자열 유사도 계산기 (A/B 비교용으로 전환 가능)
+        self.string_scorer = config.MATCHING_SCORER if config.MATCHING_SCORER in STRING_SCORERS else 'sequence'
+        
+        # 자모 기반 음운 유사도 사용 여부 (문자열 유사도 대신 더 높은 값 사용)
+        self.use_phonetic_similarity = True
+        
+        # n-gram 역색인 후보 선별 설정
+        self.use_ngram_pruning = True
+        self.ngram_min_index_size = 64  # 매크로가 이보다 적으면 전체 스캔
+        
+        # TF-IDF 계산기의 자모 n-gram 길이
+        self.tfidf_ngram = config.TFIDF_NGRAM
+        
+        # 한쪽이 다른 쪽을 포함하는 부분 일치의 최소 유사도 (0이면 사용 안 함)
+        # 포함된 쪽이 partial_match_min_length 글자보다 짧으면 길이 비율만큼 낮춤 ('어' -> '방어' 방지)
+        self.partial_match_similarity = 0.8
+        self.partial_match_min_length = 2
+        
+        # 사용 빈도 사전 정보 (상위 매크로 결과가 max_results개 모두 이 유사도 이상이면 전체 후보 확인 생략,
+        # 상위 매크로 밖의 명령어도 동의어(0.95)/부분 일치(0.8)/혼합 점수로 1.0 미만까지 올 수 있으므로 1.0 미만은 1.0으로 취급)
+        self.usage_prior = usage or usage_prior
+        self.use_usage_prior = config.USAGE_PRIOR_ENABLED
+        self.usage_fast_path_similarity = config.USAGE_FAST_PATH_SIMILARITY
+        self.usage_stats = {'fast_path_hits': 0, 'fast_path_misses': 0}
+        
+        # 동의어 사전 (확장된 버전)
+        self.synonyms = synonyms if synonyms is not None else {
+            # 기본 게임 액션
+            '공격': ['어택', '때리기', '치기', '타격', '공격하기', 'attack'],
+            '방어': ['가드', '막기', '디펜스', '방어하기', 'defend', 'guard'],
+            '스킬': ['기술', '능력', '마법', '스킬사용', 'skill', 'magic'],
+            '아이템': ['아템', '물건', '도구', '아이템사용', 'item', 'use'],
+            '점프': ['뛰기', '뛰어오르기', '껑충', '점프하기', 'jump'],
+            '달리기': ['뛰기', '러닝', '빠르게', '달리기시작', 'run', 'sprint'],
+            '이동': ['움직이기', '가기', '무브', 'move', 'go'],
+            '멈춤': ['정지', '스톱', '그만', 'stop', 'halt'],
+            
+            # 게임 UI 액션
+            '인벤토리': ['가방', '아이템창', '인벤', '창고', 'inventory', 'bag'],
+            '설정': ['옵션', '세팅', '환경설정', 'settings', 'options'],
+            '저장': ['세이브', '보존', '게임저장', 'save'],
+            '로드': ['불러오기', '로딩', '게임로딩', 'load'],
+            '종료': ['나가기', '끝내기', '게임종료', 'quit', 'exit'],
+            '일시정지': ['멈춤', '정지', '잠깐', 'pause'],
+            '계속': ['재개', '다시', '계속하기', 'continue', 'resume'],
+            
+            # 숫자 및 순서
+            '하나': ['1', '첫번째', 'one', 'first'],
+            '둘': ['2', '두번째', 'two', 'second'],
+            '셋': ['3', '세번째', 'three', 'third'],
+            '넷': ['4', '네번째', 'four', 'fourth'],
+            '다섯': ['5', '다섯번째', 'five', 'fifth']
+        }
+        
+        # 매칭 결과 LRU 캐시 (정규화된 입력, 설정, 인덱스/동의어 버전 기준)
+        self.match_cache_size = 512
+        self._match_cache: "OrderedDict[Tuple, Tuple[MacroMatch, ...]]" = OrderedDict()
+        self._match_cache_lock = threading.Lock()
+        self._match_cache_version = -1
+        self.cache_stats = {'hits': 0, 'misses': 0}
+        
+        # 임시 명령어 목록별 스냅샷 (VoiceAnalysisService 등)
+        self._command_snapshots: "OrderedDict[Tuple[str, ...], MacroIndexSnapshot]" = OrderedDict()
+        self._command_snapshot_lock = threading.Lock()
+        
+        # 동의어 오토마톤 (add_synonym 시 재구성)
+        self._synonym_version = 0
+        self._compile_synonyms()
+        
+        self.logger.info("매칭 엔진이 초기화되었습니다.")
+    
+    def set_string_scorer(self, scorer: str) -> bool:
+        """
+        문자열 유사도 계산기 설정
+        
+        Args:
+            scorer (str): 'sequence' (SequenceMatcher), 'levenshtein' (비트 병렬 편집 거리)
+                          또는 'tfidf' (n-gram TF-IDF 코사인 유사도)
+            
+        Returns:
+            bool: 설정 성공 여부
+        """
+        if scorer not in STRING_SCORERS:
+            self.logger.error(f"지원하지 않는 문자열 유사도 계산기입니다: {scorer}")
+            return False
+        
+        self.string_scorer = scorer
+        self.logger.info(f"문자열 유사도 계산기가 {scorer}로 설정되었습니다.")
+        return True
+    
+    def _calculate_similarity(self, text1: str, text2: str) -> float:
+        """
+        두 텍스트 간의 유사도 계산
+        
+        Args:
+            text1 (str): 첫 번째 텍스트
+            text2 (str): 두 번째 텍스트
+            
+        Returns:
+            float: 유사도 점수 (0.0-1.0)
+        """
+        if not text1 or not text2:
+            return 0.0
+        
+        text1_lower = text1.lower()
+        text2_lower = text2.lower()
+        return self._calculate_similarity_parts(
+            text1_lower, set(text1_lower.split()),
+            text2_lower, set(text2_lower.split()),
+            to_jamo(text1_lower), to_jamo(text2_lower)
+        )
+    
+    def _calculate_similarity_parts(self, text1_lower: str, words1: set,
+                                    text2_lower: str, words2: set,
+                                    jamo1: str = "", jamo2: str = "",
+                                    min_similarity: float = 0.0) -> float:
+        """
+        미리 소문자화/분리된 텍스트로 유사도 계산 (인덱스 항목용)
+        
+        Args:
+            text1_lower (str): 소문자화된 첫 번째 텍스트
+            words1 (set): 첫 번째 텍스트의 단어 집합
+            text2_lower (str): 소문자화된 두 번째 텍스트
+            words2 (set): 두 번째 텍스트의 단어 집합
+            jamo1 (str): 첫 번째 텍스트의 자모 분해 결과 (음운 유사도용)
+            jamo2 (str): 두 번째 텍스트의 자모 분해 결과 (음운 유사도용)
+            min_similarity (float): 이 값에 못 미치는 것이 확실하면 정확한 계산을 생략하고
+                                    min_similarity 미만의 상한값 반환
+            
+        Returns:
+            float: 유사도 점수 (0.0-1.0)
+        """
+        # 단어 기반 유사도 (공백으로 분리)
+        if words1 and words2:
+            word_similarity = len(words1.intersection(words2)) / len(words1.union(words2))
+        else:
+            word_similarity = 0.0
+        
+        # 길이만으로 구한 문자열 유사도 상한 (real_quick_ratio 방식)
+        length1, length2 = len(text1_lower), len(text2_lower)
+        if self.string_scorer == 'levenshtein':
+            string_bound = length_ratio_upper_bound(length1, length2)
+        else:
+            string_bound = 2.0 * min(length1, length2) / (length1 + length2) if length1 + length2 else 1.0
+        
+        use_phonetic = self.use_phonetic_similarity and bool(jamo1) and bool(jamo2)
+        phonetic_bound = jamo_similarity_upper_bound(jamo1, jamo2) if use_phonetic else 0.0
+        
+        # 상한으로도 임계값에 못 미치면 정확한 계산 없이 조기 제외
+        best_bound = max(string_bound, phonetic_bound)
+        if best_bound * 0.7 + word_similarity * 0.3 < min_similarity:
+            return best_bound * 0.7 + word_similarity * 0.3
+        
+        # 문자열 유사도가 넘어야 하는 최소값 (편집 거리 계산 조기 중단용)
+        min_string_similarity = (min_similarity - word_similarity * 0.3) / 0.7 - 1e-9
+        
+        # 기본 문자열 유사도
+        if self.string_scorer == 'levenshtein':
+            basic_similarity = levenshtein_ratio(text1_lower, text2_lower, min_string_similarity)
+        else:
+            basic_similarity = SequenceMatcher(None, text1_lower, text2_lower).ratio()
+        
+        # 자모 단위 음운 유사도 (ㅓ/ㅗ, ㄱ/ㅋ 같은 오인식에 관대)
+        # 길이 차이로 구한 상한이 결과를 바꿀 수 없으면 편집 거리 계산 생략
+        if use_phonetic:
+            if (phonetic_bound > basic_similarity and
+                    phonetic_bound * 0.7 + word_similarity * 0.3 >= min_similarity):
+                basic_similarity = max(basic_similarity, phonetic_similarity_jamo(jamo1, jamo2))
+        
+        # 가중 평균 (문자열 70%, 단어 30%)
+        return basic_similarity * 0.7 + word_similarity * 0.3
+    
+    def _check_synonyms(self, input_normalized: str, target_normalized: str) -> Tuple[bool, float]:
+        """
+        동의어 매칭 확인
+        
+        Args:
+            input_normalized (str): 정규화된 입력 텍스트
+            target_normalized (str): 정규화된 대상 텍스트
+            
+        Returns:
+            Tuple[bool, float]: (매칭 여부, 유사도)
+        """
+        # 입력이 속한 동의어 그룹 (역방향 조회, 사전 순회 없음)
+        main_groups = self._main_word_groups.get(input_normalized, ())
+        synonym_groups = self._synonym_word_groups.get(input_normalized, ())
+        if not main_groups and not synonym_groups:
+            return False, 0.0
+        
+        target_main_hits, target_synonym_hits = self._get_target_synonym_hits(target_normalized)
+        
+        # 사전 순서대로 첫 번째로 성립하는 규칙 적용
+        for group in sorted(set(main_groups) | set(synonym_groups)):
+            # 1. input이 main_word이고 target이 동의어인 경우
+            if group in main_groups and group in target_synonym_hits:
+                return True, 0.95
+            
+            # 2. input이 동의어이고 target이 main_word인 경우
+            if group in synonym_groups and group in target_main_hits:
+                return True, 0.95
+            
+            # 3. 둘 다 같은 main_word의 동의어인 경우
+            if group in synonym_groups and group in target_synonym_hits:
+                return True, 0.90
+        
+        return False, 0.0
+    
+    def _compile_synonyms(self):
+        """
+        동의어 사전을 Aho-Corasick 오토마톤과 역방향 조회 테이블로 컴파일
+        
+        - 모든 대표어/동의어를 하나의 오토마톤 패턴으로 등록
+        - 단어 -> 동의어 그룹 번호 역방향 조회 테이블 구성
+        """
+        groups = list(self.synonyms.items())
+        
+        patterns: List[str] = []
+        pattern_ids: Dict[str, int] = {}
+        pattern_roles: List[List[Tuple[int, bool]]] = []
+        main_word_groups: Dict[str, List[int]] = {}
+        synonym_word_groups: Dict[str, List[int]] = {}
+        
+        def register(word: str, group: int, is_main: bool):
+            pattern_id = pattern_ids.get(word)
+            if pattern_id is None:
+                pattern_id = len(patterns)
+                pattern_ids[word] = pattern_id
+                patterns.append(word)
+                pattern_roles.append([])
+            pattern_roles[pattern_id].append((group, is_main))
+        
+        for group, (main_word, synonym_list) in enumerate(groups):
+            register(main_word, group, True)
+            main_word_groups.setdefault(main_word, []).append(group)
+            
+            for synonym in synonym_list:
+                register(synonym, group, False)
+                groups_for_word = synonym_word_groups.setdefault(synonym, [])
+                if group not in groups_for_word:
+                    groups_for_word.append(group)
+        
+        self._synonym_automaton = AhoCorasickAutomaton(patterns)
+        self._synonym_pattern_roles = pattern_roles
+        self._main_word_groups = main_word_groups
+        self._synonym_word_groups = synonym_word_groups
+        self._synonym_hit_cache: Dict[str, Tuple[frozenset, frozenset]] = {}
+        self._synonym_version += 1
+        
+        # 동의어가 바뀌면 이전 매칭 결과는 더 이상 유효하지 않음
+        self.clear_match_cache()
+    
+    def _get_target_synonym_hits(self, target_lower: str) -> Tuple[frozenset, frozenset]:
+        """
+        대상 텍스트에 부분 문자열로 등장하는 동의어 그룹 조회 (오토마톤 1회 탐색)
+        
+        Args:
+            target_lower (str): 소문자화된 대상 텍스트
+            
+        Returns:
+            Tuple[frozenset, frozenset]: (대표어가 등장한 그룹, 동의어가 등장한 그룹)
+        """
+        cached = self._synonym_hit_cache.get(target_lower)
+        if cached is not None:
+            return cached
+        
+        main_hits = set()
+        synonym_hits = set()
+        for pattern_id in self._synonym_automaton.find_all(target_lower):
+            for group, is_main in self._synonym_pattern_roles[pattern_id]:
+                if is_main:
+                    main_hits.add(group)
+                else:
+                    synonym_hits.add(group)
+        
+        hits = (frozenset(main_hits), frozenset(synonym_hits))
+        
+        # 캐시는 등록된 음성 명령어 수준으로 유지
+        if len(self._synonym_hit_cache) >= 100000:
+            self._synonym_hit_cache.clear()
+        self._synonym_hit_cache[target_lower] = hits
+        return hits
+    
+    def _get_ngram_index(self, snapshot: MacroIndexSnapshot) -> NGramIndex:
+        """인덱스 스냅샷의 n-gram 역색인 반환 (버전별로 한 번만 생성)"""
+        return snapshot.get_artifact(
+            'ngram_index',
+            lambda snap: NGramIndex([entry.command_normalized for entry in snap.entries])
+        )
+    
+    def _get_tfidf_index(self, snapshot: MacroIndexSnapshot) -> TfidfIndex:
+        """인덱스 스냅샷의 n-gram TF-IDF 색인 반환 (버전별로 한 번만 생성)"""
+        return snapshot.get_artifact(
+            f'tfidf_index:{self.tfidf_ngram}',
+            lambda snap: TfidfIndex([entry.command_normalized for entry in snap.entries], self.tfidf_ngram)
+        )
+    
+    def _get_synonym_candidates(self, snapshot: MacroIndexSnapshot, input_lower: str) -> Set[int]:
+        """
+        동의어 매칭이 가능한 후보 위치 집합 반환
+        
+        _check_synonyms가 참이 될 수 있는 대상(입력이 속한 동의어 그룹의 단어를
+        부분 문자열로 포함하는 명령어)만 모읍니다.
+        
+        Args:
+            snapshot (MacroIndexSnapshot): 인덱스 스냅샷
+            input_lower (str): 정규화된 입력 텍스트
+            
+        Returns:
+            Set[int]: 후보 위치 집합
+        """
+        main_groups = self._main_word_groups.get(input_lower, ())
+        synonym_groups = self._synonym_word_groups.get(input_lower, ())
+        if not main_groups and not synonym_groups:
+            return set()
+        
+        # 그룹별 등장 위치는 (스냅샷 버전, 동의어 버전)마다 한 번만 계산
+        main_postings, synonym_postings = snapshot.get_artifact(
+            f'synonym_postings:{self._synonym_version}',
+            self._build_synonym_postings
+        )
+        
+        positions = set()
+        for group in main_groups:
+            positions.update(synonym_postings.get(group, ()))
+        for group in synonym_groups:
+            positions.update(main_postings.get(group, ()))
+            positions.update(synonym_postings.get(group, ()))
+        
+        return positions
+    
+    def _build_synonym_postings(self, snapshot: MacroIndexSnapshot) -> Tuple[Dict[int, List[int]], Dict[int, List[int]]]:
+        """
+        스냅샷의 모든 명령어를 오토마톤으로 한 번씩 탐색하여 그룹별 등장 위치 구성
+        
+        Args:
+            snapshot (MacroIndexSnapshot): 인덱스 스냅샷
+            
+        Returns:
+            Tuple[Dict, Dict]: (그룹 -> 대표어 등장 위치, 그룹 -> 동의어 등장 위치)
+        """
+        main_postings: Dict[int, List[int]] = {}
+        synonym_postings: Dict[int, List[int]] = {}
+        
+        for entry in snapshot.entries:
+            main_hits, synonym_hits = self._get_target_synonym_hits(entry.command_normalized)
+            for group in main_hits:
+                main_postings.setdefault(group, []).append(entry.position)
+            for group in synonym_hits:
+                synonym_postings.setdefault(group, []).append(entry.position)
+        
+        return main_postings, synonym_postings
+    
+    def _use_pruning(self, snapshot: MacroIndexSnapshot, threshold: float) -> bool:
+        """n-gram 후보 선별 사용 여부"""
+        return (self.use_ngram_pruning and
+                len(snapshot.entries) >= self.ngram_min_index_size and
+                threshold > 0.0)
+    
+    def _select_candidates(self, snapshot: MacroIndexSnapshot, input_lower: str,
+                           threshold: float) -> Sequence[MacroIndexEntry]:
+        """
+        n-gram 역색인으로 유사도 계산 대상 후보 선별
+        
+        문자열 70% + 단어 30% 점수가 임계값을 넘을 수 있을 만큼 n-gram이 겹치는 명령어만 남기며
+        (단어가 겹치는 명령어는 그 단어 유사도만큼 낮아진 하한 적용), 동의어/부분 일치가
+        가능한 명령어는 항상 후보에 포함됩니다.
+        
+        Args:
+            snapshot (MacroIndexSnapshot): 인덱스 스냅샷
+            input_lower (str): 정규화된 입력 텍스트
+            threshold (float): 유사도 임계값
+            
+        Returns:
+            Sequence[MacroIndexEntry]: 후보 항목 목록 (원래 순서 유지)
+        """
+        entries = snapshot.entries
+        if not self._use_pruning(snapshot, threshold):
+            return entries
+        
+        positions = self._get_ngram_index(snapshot).candidates(
+            input_lower, threshold, self.string_scorer, self.use_phonetic_similarity, word_weight=0.3
+        )
+        positions.update(self._get_synonym_candidates(snapshot, input_lower))
+        positions.update(self._get_partial_candidates(snapshot, input_lower, threshold))
+        
+        return [entries[position] for position in sorted(positions)]
+    
+    def _get_partial_candidates(self, snapshot: MacroIndexSnapshot, input_lower: str,
+                                threshold: float) -> Set[int]:
+        """
+        부분 일치(한쪽이 다른 쪽을 포함)가 성립하는 후보 위치 집합 반환
+        
+        - 입력에 포함된 명령어: 명령어 오토마톤으로 입력을 한 번 탐색
+        - 입력을 포함하는 명령어: 입력의 문자별 등장 위치 교집합 후 확인
+        
+        Args:
+            snapshot (MacroIndexSnapshot): 인덱스 스냅샷
+            input_lower (str): 정규화된 입력 텍스트
+            threshold (float): 유사도 임계값
+            
+        Returns:
+            Set[int]: 후보 위치 집합
+        """
+        if not input_lower or self.partial_match_similarity < threshold:
+            return set()
+        
+        # 입력에 포함된 명령어 (오토마톤 패턴 번호가 곧 위치)
+        positions = self._get_command_automaton(snapshot).find_all(input_lower)
+        
+        # 입력을 포함하는 명령어 (등장 위치가 적은 문자부터 교집합)
+        char_postings = self._get_char_postings(snapshot)
+        postings = sorted(
+            (char_postings.get(char, ()) for char in set(input_lower) if not char.isspace()),
+            key=len
+        )
+        if postings and postings[0]:
+            containing = set(postings[0])
+            for posting in postings[1:]:
+                containing.intersection_update(posting)
+                if not containing:
+                    break
+            
+            entries = snapshot.entries
+            positions.update(position for position in containing
+                             if input_lower in entries[position].command_normalized)
+        
+        return positions
+    
+    def _get_command_automaton(self, snapshot: MacroIndexSnapshot) -> AhoCorasickAutomaton:
+        """인덱스 스냅샷의 명령어 오토마톤 반환 (버전별로 한 번만 생성)"""
+        return snapshot.get_artifact(
+            'command_automaton',
+            lambda snap: AhoCorasickAutomaton([entry.command_normalized for entry in snap.entries])
+        )
+    
+    def _get_char_postings(self, snapshot: MacroIndexSnapshot) -> Dict[str, List[int]]:
+        """인덱스 스냅샷의 문자 -> 명령어 위치 역색인 반환 (버전별로 한 번만 생성)"""
+        def build(snap: MacroIndexSnapshot) -> Dict[str, List[int]]:
+            postings: Dict[str, List[int]] = {}
+            for entry in snap.entries:
+                for char in set(entry.command_normalized):
+                    postings.setdefault(char, []).append(entry.position)
+            return postings
+        
+        return snapshot.get_artifact('char_postings', build)
+    
+    def _get_confidence_level(self, similarity: float) -> MatchConfidenceLevel:
+        """
+        유사도를 신뢰도 레벨로 변환
+        
+        Args:
+            similarity (float): 유사도 점수
+            
+        Returns:
+            MatchConfidenceLevel: 신뢰도 레벨
+        """
+        if similarity >= 0.9:
+            return MatchConfidenceLevel.VERY_HIGH
+        elif similarity >= 0.8:
+            return MatchConfidenceLevel.HIGH
+        elif similarity >= 0.7:
+            return MatchConfidenceLevel.MEDIUM
+        elif similarity >= 0.6:
+            return MatchConfidenceLevel.LOW
+        else:
+            return MatchConfidenceLevel.VERY_LOW
+    
+    def _determine_match_type(self, input_normalized: str, target_normalized: str, similarity: float) -> str:
+        """
+        매칭 타입 결정
+        
+        Args:
+            input_normalized (str): 정규화된 입력 텍스트
+            target_normalized (str): 정규화된 대상 텍스트
+            similarity (float): 유사도
+            
+        Returns:
+            str: 매칭 타입
+        """
+        # 정확한 매칭
+        if input_normalized == target_normalized:
+            return 'exact'
+        
+        # 동의어 매칭
+        is_synonym, _ = self._check_synonyms(input_normalized, target_normalized)
+        if is_synonym:
+            return 'synonym'
+        
+        # 부분 매칭
+        if input_normalized in target_normalized or target_normalized in input_normalized:
+            return 'partial'
+        
+        # 퍼지 매칭
+        return 'fuzzy'
+    
+    def _normalize_input(self, text: str) -> str:
+        """
+        입력 텍스트를 인덱스의 명령어와 같은 규칙으로 정규화
+        
+        Args:
+            text (str): 입력 텍스트
+            
+        Returns:
+            str: 정규화된 텍스트 (불용어/특수문자만 있는 발화('어', 'um')는 빈 문자열 - 매칭하지 않음)
+        """
+        if not text or not text.strip():
+            return ""
+        return self.normalizer.normalize(text)
+    
+    def _get_cache_key(self, input_lower: str, threshold: float, max_results: int,
+                       index_version: int) -> Tuple:
+        """매칭 결과에 영향을 주는 입력/설정/버전으로 캐시 키 생성"""
+        usage_version = self.usage_prior.version if self.use_usage_prior else -1
+        return (input_lower, threshold, max_results, index_version, self._synonym_version,
+                self.string_scorer, self.tfidf_ngram, self.use_phonetic_similarity, self.partial_match_similarity,
+                self.partial_match_min_length, usage_version, self.usage_fast_path_similarity)
+    
+    def _get_cached_matches(self, cache_key: Tuple, index_version: int) -> Optional[List[MacroMatch]]:
+        """
+        캐시된 매칭 결과 조회
+        
+        Args:
+            cache_key (Tuple): 캐시 키
+            index_version (int): 현재 매크로 인덱스 버전
+            
+        Returns:
+            Optional[List[MacroMatch]]: 캐시된 결과 (없으면 None)
+        """
+        with self._match_cache_lock:
+            # 매크로가 바뀌었으면 이전 버전 결과를 모두 버림
+            if index_version != self._match_cache_version:
+                self._match_cache.clear()
+                self._match_cache_version = index_version
+            
+            cached = self._match_cache.get(cache_key)
+            if cached is None:
+                self.cache_stats['misses'] += 1
+                return None
+            
+            self._match_cache.move_to_end(cache_key)
+            self.cache_stats['hits'] += 1
+            return list(cached)
+    
+    def _store_cached_matches(self, cache_key: Tuple, matches: List[MacroMatch]):
+        """매칭 결과를 캐시에 저장 (가장 오래 사용하지 않은 항목부터 제거)"""
+        if self.match_cache_size <= 0:
+            return
+        
+        with self._match_cache_lock:
+            self._match_cache[cache_key] = tuple(matches)
+            self._match_cache.move_to_end(cache_key)
+            while len(self._match_cache) > self.match_cache_size:
+                self._match_cache.popitem(last=False)
+    
+    def clear_match_cache(self):
+        """매칭 결과 캐시 초기화"""
+        with self._match_cache_lock:
+            self._match_cache.clear()
+    
+    def _score_candidates(self, input_normalized: str, candidates: Sequence[MacroIndexEntry],
+                          threshold: float, max_results: int,
+                          hot_ranks: Optional[Dict[int, int]] = None) -> List[MacroMatch]:
+        """
+        후보 항목들의 정확한 유사도를 계산하고 상위 max_results개만 정렬하여 반환
+        
+        크기 max_results의 최소 힙으로 현재 k번째 점수를 유지하고, 유사도 상한이
+        그 점수에 못 미치는 후보는 정확한 계산 없이 건너뜁니다. MacroMatch 객체는
+        최종 상위 후보에 대해서만 생성합니다.
+        
+        Args:
+            input_normalized (str): 정규화된 입력 텍스트
+            candidates (Sequence[MacroIndexEntry]): 유사도를 계산할 후보 항목 (원래 순서)
+            threshold (float): 유사도 임계값
+            max_results (int): 최대 결과 수
+            hot_ranks (Dict[int, int]): 사용 빈도 상위 매크로 ID별 순위 (동점 순위 결정용)
+            
+        Returns:
+            List[MacroMatch]: 유사도 내림차순 매칭 결과 (동점은 사용 빈도 순위, 후보 순서)
+        """
+        if max_results <= 0:
+            return []
+        
+        input_words = set(input_normalized.split())
+        input_jamo = to_jamo(input_normalized)
+        hot_ranks = hot_ranks or {}
+        unranked = len(hot_ranks)
+        
+        # (유사도, -사용 순위, -후보 순서, 항목) 최소 힙: 동점이면 덜 쓰인/나중 후보가 먼저 밀려남
+        top: List[Tuple[float, int, int, MacroIndexEntry]] = []
+        
+        for order, entry in enumerate(candidates):
+            # 상위 k개가 찼으면 k번째 점수 이상이어야 함 (동점은 순위로 결정)
+            cutoff = top[0][0] if len(top) >= max_results else threshold
+            
+            # 동의어/부분 일치 점수 (정확한 유사도 계산 전에 확인하는 값싼 하한)
+            bonus = self._get_bonus_similarity(input_normalized, entry)
+            
+            # 기본 유사도 (상한이 cutoff/동의어 점수에 못 미치면 정확한 계산 생략)
+            similarity = self._calculate_similarity_parts(
+                input_normalized, input_words, entry.command_normalized, entry.command_tokens,
+                input_jamo, entry.command_jamo,
+                min_similarity=max(threshold, cutoff, bonus)
+            )
+            similarity = max(similarity, bonus)
+            
+            # 임계값 확인
+            if similarity < threshold:
+                continue
+            
+            item = (similarity, -hot_ranks.get(entry.macro['id'], unranked), -order, entry)
+            if len(top) < max_results:
+                heapq.heappush(top, item)
+            elif item[:3] > top[0][:3]:
+                heapq.heapreplace(top, item)
+        
+        # 살아남은 후보만 MacroMatch로 변환 (유사도 내림차순, 동점은 사용 순위/후보 순서)
+        top.sort(key=lambda item: (-item[0], -item[1], -item[2]))
+        
+        return [self._make_match(input_normalized, entry, similarity) for similarity, _, _, entry in top]
+    
+    def _get_bonus_similarity(self, input_normalized: str, entry: MacroIndexEntry) -> float:
+        """
+        동의어/부분 일치로 보장되는 최소 유사도 반환
+        
+        Args:
+            input_normalized (str): 정규화된 입력 텍스트
+            entry (MacroIndexEntry): 비교할 인덱스 항목
+            
+        Returns:
+            float: 동의어 유사도 또는 부분 일치 유사도 (해당 없으면 0.0)
+        """
+        bonus = 0.0
+        command = entry.command_normalized
+        is_synonym, synonym_similarity = self._check_synonyms(input_normalized, command)
+        if is_synonym:
+            bonus = synonym_similarity
+        if (bonus < self.partial_match_similarity and command and
+                (command in input_normalized or input_normalized in command)):
+            # 한두 글자 조각('공', 't')이 긴 명령어에 포함되는 것만으로는 부분 일치로 보지 않음
+            shorter, longer = sorted((len(command), len(input_normalized)))
+            partial = self.partial_match_similarity
+            if shorter < self.partial_match_min_length:
+                partial *= shorter / longer
+            bonus = max(bonus, partial)
+        return bonus
+    
+    def _make_match(self, input_normalized: str, entry: MacroIndexEntry, similarity: float) -> MacroMatch:
+        """인덱스 항목과 유사도로 매칭 결과 생성"""
+        macro = entry.macro
+        return MacroMatch(
+            macro_id=macro['id'],
+            macro_name=macro.get('name', ''),
+            voice_command=entry.voice_command,
+            similarity=similarity,
+            confidence_level=self._get_confidence_level(similarity),
+            match_type=self._determine_match_type(input_normalized, entry.command_normalized, similarity),
+            action_type=macro.get('action_type', ''),
+            key_sequence=macro.get('key_sequence', '')
+        )
+    
+    def _match_tfidf(self, snapshot: MacroIndexSnapshot, input_normalized: str, threshold: float,
+                     max_results: int, hot_ranks: Optional[Dict[int, int]] = None) -> List[MacroMatch]:
+        """
+        TF-IDF 코사인 유사도로 전체 명령어를 한 번에 매칭
+        
+        입력 벡터와 색인 행렬의 곱 한 번으로 모든 명령어 점수를 구하고, 동의어/부분 일치가
+        가능한 후보만 해당 점수로 올린 뒤 argpartition으로 상위 후보를 고릅니다.
+        
+        Args:
+            snapshot (MacroIndexSnapshot): 인덱스 스냅샷
+            input_normalized (str): 정규화된 입력 텍스트
+            threshold (float): 유사도 임계값
+            max_results (int): 최대 결과 수
+            hot_ranks (Dict[int, int]): 사용 빈도 상위 매크로 ID별 순위 (동점 순위 결정용)
+            
+        Returns:
+            List[MacroMatch]: 유사도 내림차순 매칭 결과 (동점은 사용 빈도 순위, 인덱스 순서)
+        """
+        if max_results <= 0:
+            return []
+        
+        index = self._get_tfidf_index(snapshot)
+        scores = index.scores(input_normalized)
+        
+        entries = snapshot.entries
+        bonus_positions = self._get_synonym_candidates(snapshot, input_normalized)
+        bonus_positions.update(self._get_partial_candidates(snapshot, input_normalized, threshold))
+        for position in bonus_positions:
+            bonus = self._get_bonus_similarity(input_normalized, entries[position])
+            if bonus > scores[position]:
+                scores[position] = bonus
+        
+        hot_ranks = hot_ranks or {}
+        unranked = len(hot_ranks)
+        ranked = index.top_k(input_normalized, max_results, threshold, scores)
+        ranked.sort(key=lambda item: (-item[1], hot_ranks.get(entries[item[0]].macro['id'], unranked), item[0]))
+        
+        return [self._make_match(input_normalized, entries[position], similarity)
+                for position, similarity in ranked[:max_results]]
+    
+    def warm_up(self, snapshot: MacroIndexSnapshot):
+        """
+        스냅샷의 매칭용 파생 데이터를 미리 생성 (범위 교체 직후 첫 매칭 지연 제거)
+        
+        Args:
+            snapshot (MacroIndexSnapshot): 준비할 인덱스 스냅샷
+        """
+        if self.string_scorer == 'tfidf':
+            self._get_tfidf_index(snapshot)
+        if self.use_ngram_pruning and len(snapshot.entries) >= self.ngram_min_index_size:
+            self._get_ngram_index(snapshot)
+            snapshot.get_artifact(f'synonym_postings:{self._synonym_version}', self._build_synonym_postings)
+            self._get_command_automaton(snapshot)
+            self._get_char_postings(snapshot)
+        snapshot.get_artifact(
+            'entries_by_id', lambda snap: {entry.macro['id']: entry for entry in snap.entries}
+        )
+    
+    def _get_hot_ranks(self) -> Dict[int, int]:
+        """사용 빈도 상위 매크로 ID별 순위 반환 (사용 안 함이면 빈 딕셔너리)"""
+        return self.usage_prior.get_hot_ranks() if self.use_usage_prior else {}
+    
+    def _match_hot(self, snapshot: MacroIndexSnapshot, input_normalized: str, threshold: float,
+                   max_results: int, hot_ranks: Dict[int, int]) -> Optional[List[MacroMatch]]:
+        """
+        사용 빈도 상위 매크로만 먼저 매칭 (빠른 경로)
+        
+        상위 매크로 결과가 max_results개를 모두 채우고 마지막 결과까지 정확히 일치(1.0)하면
+        전체 후보를 확인하지 않고 그대로 반환합니다. 다른 매크로는 1.0을 넘을 수 없고 동점이면
+        사용 빈도 순위가 앞서므로 전체 후보를 확인한 결과와 같습니다. 그 밖에는 None을 반환하여
+        (상위 매크로가 포함된) 전체 후보를 확인하게 합니다.
+        
+        Args:
+            snapshot (MacroIndexSnapshot): 인덱스 스냅샷
+            input_normalized (str): 정규화된 입력 텍스트
+            threshold (float): 유사도 임계값
+            max_results (int): 최대 결과 수
+            hot_ranks (Dict[int, int]): 사용 빈도 상위 매크로 ID별 순위
+            
+        Returns:
+            Optional[List[MacroMatch]]: 빠른 경로로 확정된 결과 (확정하지 못하면 None)
+        """
+        if not hot_ranks:
+            return None
+        
+        entries_by_id = snapshot.get_artifact(
+            'entries_by_id', lambda snap: {entry.macro['id']: entry for entry in snap.entries}
+        )
+        hot_entries = [entries_by_id[macro_id] for macro_id in hot_ranks if macro_id in entries_by_id]
+        if not hot_entries:
+            return None
+        
+        hot_entries.sort(key=lambda entry: entry.position)
+        matches = self._score_candidates(input_normalized, hot_entries, threshold, max_results, hot_ranks)
+        
+        fast_path_similarity = max(self.usage_fast_path_similarity, 1.0)
+        if len(matches) == max_results and matches[-1].similarity >= fast_path_similarity:
+            self.usage_stats['fast_path_hits'] += 1
+            return matches
+        
+        self.usage_stats['fast_path_misses'] += 1
+        return None
+    
+    def match(self, input_text: str, threshold: float, max_results: int) -> List[MacroMatch]:
+        """
+        입력 텍스트와 매칭되는 매크로 찾기 (결과 캐시 사용)
+        
+        Args:
+            input_text (str): 입력 텍스트
+            threshold (float): 유사도 임계값
+            max_results (int): 최대 결과 수
+            
+        Returns:
+            List[MacroMatch]: 유사도 내림차순 매칭 결과
+        """
+        input_normalized = self._normalize_input(input_text)
+        if not input_normalized:
+            return []
+        
+        # 인메모리 인덱스에서 매크로 가져오기 (DB 조회 없음)
+        snapshot = self.macro_index.get_snapshot()
+        if not snapshot.entries:
+            return []
+        
+        # 같은 명령어가 반복되면 캐시된 결과 사용 (정규화 후 같은 입력도 캐시 적중)
+        cache_key = self._get_cache_key(input_normalized, threshold, max_results, snapshot.version)
+        matches = self._get_cached_matches(cache_key, snapshot.version)
+        
+        if matches is None and self.string_scorer == 'tfidf':
+            # TF-IDF 계산기는 행렬-벡터 곱 한 번으로 전체 명령어를 매칭
+            matches = self._match_tfidf(snapshot, input_normalized, threshold, max_results, self._get_hot_ranks())
+            self._store_cached_matches(cache_key, matches)
+        
+        if matches is None:
+            # 자주 쓰는 매크로로 확정되면 전체 후보 확인 생략
+            hot_ranks = self._get_hot_ranks()
+            matches = self._match_hot(snapshot, input_normalized, threshold, max_results, hot_ranks)
+            
+            if matches is None:
+                # n-gram 역색인으로 후보만 선별하여 유사도 계산
+                matches = self._score_candidates(
+                    input_normalized, self._select_candidates(snapshot, input_normalized, threshold),
+                    threshold, max_results, hot_ranks
+                )
+            self._store_cached_matches(cache_key, matches)
+        
+        return matches
+    
+    def match_batch(self, texts: Sequence[str], threshold: float,
+                    max_results: int) -> List[List[MacroMatch]]:
+        """
+        여러 입력 텍스트를 한 번에 매칭 (로그 재생, 임계값 튜닝용)
+        
+        모든 입력의 n-gram 후보를 행렬 곱 한 번으로 선별한 뒤, 입력별 후보만
+        정확한 유사도로 다시 계산합니다. 입력마다 match와 같은 결과를 반환합니다.
+        
+        Args:
+            texts (Sequence[str]): 입력 텍스트 목록
+            threshold (float): 유사도 임계값
+            max_results (int): 입력별 최대 결과 수
+            
+        Returns:
+            List[List[MacroMatch]]: 입력 순서대로 매칭 결과 목록
+        """
+        start_time = time.time()
+        results: List[List[MacroMatch]] = [[] for _ in texts]
+        
+        try:
+            snapshot = self.macro_index.get_snapshot()
+            if not snapshot.entries:
+                return results
+            
+            # 정규화 후 같은 입력은 한 번만 계산
+            positions_by_text: Dict[str, List[int]] = {}
+            for position, text in enumerate(texts):
+                text_normalized = self._normalize_input(text)
+                if text_normalized:
+                    positions_by_text.setdefault(text_normalized, []).append(position)
+            
+            unique_texts = list(positions_by_text)
+            
+            if self.string_scorer == 'tfidf':
+                hot_ranks = self._get_hot_ranks()
+                for text_normalized, positions in positions_by_text.items():
+                    matches = self._match_tfidf(snapshot, text_normalized, threshold, max_results, hot_ranks)
+                    for position in positions:
+                        results[position] = list(matches)
+                return results
+            
+            candidate_positions = None
+            if self._use_pruning(snapshot, threshold):
+                candidate_positions = self._get_ngram_index(snapshot).batch_candidates(
+                    unique_texts, threshold, self.string_scorer, self.use_phonetic_similarity, word_weight=0.3
+                )
+            
+            entries = snapshot.entries
+            hot_ranks = self._get_hot_ranks()
+            for index, text_normalized in enumerate(unique_texts):
+                matches = self._match_hot(snapshot, text_normalized, threshold, max_results, hot_ranks)
+                if matches is not None:
+                    for position in positions_by_text[text_normalized]:
+                        results[position] = list(matches)
+                    continue
+                
+                if candidate_positions is None:
+                    candidates = entries
+                else:
+                    positions = candidate_positions[index]
+                    positions.update(self._get_synonym_candidates(snapshot, text_normalized))
+                    positions.update(self._get_partial_candidates(snapshot, text_normalized, threshold))
+                    candidates = [entries[position] for position in sorted(positions)]
+                
+                matches = self._score_candidates(text_normalized, candidates, threshold, max_results, hot_ranks)
+                for position in positions_by_text[text_normalized]:
+                    results[position] = list(matches)
+            
+            self.logger.info(f"배치 매칭 완료: 입력={len(texts)}개 (고유 {len(unique_texts)}개), "
+                             f"소요시간={time.time()-start_time:.3f}초")
+            return results
+            
+        except Exception as e:
+            self.logger.error(f"배치 매칭 중 오류: {e}")
+            return results
+    
+    def _get_command_snapshot(self, commands: Sequence[str]) -> MacroIndexSnapshot:
+        """
+        임시 명령어 목록용 스냅샷 반환 (최근 사용한 목록 16개까지 재사용)
+        
+        Args:
+            commands (Sequence[str]): 명령어 목록
+            
+        Returns:
+            MacroIndexSnapshot: 명령어 위치를 매크로 ID로 사용하는 스냅샷
+        """
+        key = tuple(commands)
+        with self._command_snapshot_lock:
+            snapshot = self._command_snapshots.get(key)
+            if snapshot is not None:
+                self._command_snapshots.move_to_end(key)
+                return snapshot
+        
+        snapshot = MacroIndexSnapshot(-1, [
+            {'id': position, 'name': command, 'voice_command': command,
+             'action_type': '', 'key_sequence': ''}
+            for position, command in enumerate(commands)
+        ], self.normalizer)
+        
+        with self._command_snapshot_lock:
+            self._command_snapshots[key] = snapshot
+            while len(self._command_snapshots) > 16:
+                self._command_snapshots.popitem(last=False)
+        return snapshot
+    
+    def match_commands(self, input_text: str, commands: Sequence[str],
+                       threshold: float, max_results: int) -> List[MacroMatch]:
+        """
+        입력 텍스트를 매크로가 아닌 임의의 명령어 목록과 매칭
+        
+        결과의 macro_id는 commands 안에서의 위치입니다. 결과 캐시는 사용하지 않습니다.
+        
+        Args:
+            input_text (str): 입력 텍스트
+            commands (Sequence[str]): 명령어 목록
+            threshold (float): 유사도 임계값
+            max_results (int): 최대 결과 수
+            
+        Returns:
+            List[MacroMatch]: 유사도 내림차순 매칭 결과
+        """
+        input_normalized = self._normalize_input(input_text)
+        if not input_normalized or not commands:
+            return []
+        
+        snapshot = self._get_command_snapshot(commands)
+        if self.string_scorer == 'tfidf':
+            return self._match_tfidf(snapshot, input_normalized, threshold, max_results)
+        return self._score_candidates(
+            input_normalized, self._select_candidates(snapshot, input_normalized, threshold),
+            threshold, max_results
+        )
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        엔진 설정 및 캐시 통계 반환
+        
+        Returns:
+            Dict: 엔진 상태 정보
+        """
+        hits = self.cache_stats['hits']
+        lookups = hits + self.cache_stats['misses']
+        return {
+            'settings': {
+                'synonyms_count': len(self.synonyms),
+                'use_phonetic_similarity': self.use_phonetic_similarity,
+                'string_scorer': self.string_scorer,
+                'tfidf_ngram': self.tfidf_ngram,
+                'partial_match_similarity': self.partial_match_similarity,
+                'partial_match_min_length': self.partial_match_min_length
+            },
+            'match_cache': {
+                'size': len(self._match_cache),
+                'max_size': self.match_cache_size,
+                'hits': hits,
+                'misses': self.cache_stats['misses'],
+                'hit_rate': (hits / lookups * 100) if lookups > 0 else 0.0
+            },
+            'macro_index': self.macro_index.get_stats(),
+            'usage_prior': {
+                **self.usage_prior.get_stats(),
+                'enabled': self.use_usage_prior,
+                'fast_path_similarity': self.usage_fast_path_similarity,
+                **self.usage_stats
+            }
+        }
+    
+    def add_synonym(self, main_word: str, synonyms: List[str]) -> bool:
+        """
+        동의어 추가
+        
+        Args:
+            main_word (str): 메인 단어
+            synonyms (List[str]): 동의어 목록
+            
+        Returns:
+            bool: 추가 성공 여부
+        """
+        try:
+            if main_word in self.synonyms:
+                # 기존 동의어에 추가
+                self.synonyms[main_word].extend(synonyms)
+                # 중복 제거
+                self.synonyms[main_word] = list(set(self.synonyms[main_word]))
+            else:
+                # 새로운 항목 생성
+                self.synonyms[main_word] = synonyms
+            
+            # 동의어 오토마톤 재구성
+            self._compile_synonyms()
+            
+            self.logger.info(f"동의어 추가 완료: {main_word} <- {synonyms}")
+            return True
+            
+        except Exception as e:
+            self.logger.error(f"동의어 추가 실패: {e}")
+            return False
+
+
+# 전역 매칭 엔진 인스턴스 (전역 매크로 인덱스 사용)
+matching_engine = MatchingEngine()
+
+# 프리셋 적용 시 새 범위의 스냅샷을 교체 전에 미리 준비
+macro_index.register_warmer(matching_engine.warm_up)
@@ -3,6 +3,7 @@ import os
 from datetime import datetime
 from typing import List, Dict, Optional, Union
 from backend.database.database_manager import db_manager
+from backend.services.macro_index import macro_index
 
 class PresetService:
     """
@@ -15,6 +16,9 @@ class PresetService:
         """프리셋 서비스 초기화"""
         self.presets_folder = "presets"
         self._ensure_presets_folder()
+        
+        # 현재 적용된 프리셋 ID (None이면 전체 매크로로 매칭)
+        self.active_preset_id: Optional[int] = None
     
     def _ensure_presets_folder(self):
         """프리셋 저장용 폴더가 없으면 생성하는 함수"""
@@ -190,6 +194,11 @@ class PresetService:
         update_values.append(preset_id)
         
         db_manager.execute_query(query, tuple(update_values))
+        
+        # 적용 중인 프리셋의 매크로 구성이 바뀌면 매칭 범위도 다시 준비
+        if macro_ids is not None and preset_id == self.active_preset_id:
+            self.apply_preset(preset_id, background=True)
+        
         return True
     
     def delete_preset(self, preset_id: int, hard_delete: bool = False) -> bool:
@@ -208,6 +217,10 @@ class PresetService:
         if not existing_preset:
             return False
         
+        # 적용 중인 프리셋이면 전체 매크로 매칭으로 복귀
+        if preset_id == self.active_preset_id:
+            self.clear_applied_preset()
+        
         if hard_delete:
             # 완전 삭제
             query = "DELETE FROM presets WHERE id = ?"
@@ -270,12 +283,15 @@ class PresetService:
         self.update_preset(preset_id, is_favorite=new_favorite_status)
         return new_favorite_status
     
-    def apply_preset(self, preset_id: int) -> bool:
+    def apply_preset(self, preset_id: int, background: bool = False) -> bool:
         """
-        프리셋을 적용하는 함수 (현재는 활성화만 처리, 향후 확장 가능)
+        프리셋을 적용하는 함수
+        음성 매칭 범위를 프리셋의 매크로로 제한합니다. 프리셋 매크로만 담은 매칭 인덱스를
+        미리 만든 뒤 한 번에 교체하므로, 준비 중에도 이전 범위로 매칭이 계속됩니다.
         
         Args:
             preset_id (int): 적용할 프리셋 ID
+            background (bool): True면 인덱스 준비를 백그라운드에서 진행하고 바로 반환
             
         Returns:
             bool: 적용 성공 여부
@@ -284,11 +300,36 @@ class PresetService:
         if not preset:
             return False
         
-        # 향후 프리셋 적용 로직 구현
-        # 예: 매크로 활성화/비활성화, 설정 적용 등
+        if not macro_index.set_scope(preset['macro_ids'], preset['name'], background=background):
+            return False
         
+        self.active_preset_id = preset_id
         return True
     
+    def clear_applied_preset(self) -> bool:
+        """
+        적용된 프리셋을 해제하고 전체 매크로로 매칭하도록 되돌리는 함수
+        
+        Returns:
+            bool: 해제 성공 여부
+        """
+        if not macro_index.set_scope(None):
+            return False
+        
+        self.active_preset_id = None
+        return True
+    
+    def get_active_preset(self) -> Optional[Dict]:
+        """
+        현재 적용된 프리셋을 반환하는 함수
+        
+        Returns:
+            Dict: 프리셋 정보 또는 None (전체 매크로로 매칭 중)
+        """
+        if self.active_preset_id is None:
+            return None
+        return self.get_preset_by_id(self.active_preset_id)
+    
     def export_preset_to_json(self, preset_id: int, file_path: str = None) -> str:
         """
         프리셋을 JSON 파일로 내보내는 함수
@@ -590,6 +631,9 @@ class PresetService:
                 )
                 macro_ids.append(new_macro_id)
         
+        # 새 매크로가 추가되었을 수 있으므로 매칭 인덱스 무효화
+        macro_index.invalidate("import_preset")
+        
         return macro_ids
 
 # 프리셋 서비스 인스턴스 생성
@@ -0,0 +1,241 @@
+"""
+VoiceMacro Pro - 선행(추측) 매칭 서비스
+부분 인식 결과가 명령어 하나로만 완성될 때 최종 인식 전에 매크로를 미리 예약(또는 조기 실행)하고,
+최종 인식 결과가 도착하면 확정/취소합니다.
+"""
+
+import time
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from backend.utils.common_utils import get_logger
+from backend.utils.config import config
+from backend.utils.command_trie import CommandTrie, get_command_trie
+from backend.services.macro_index import MacroIndex, MacroIndexSnapshot, macro_index
+
+# 예약에 필요한 최소 접두사 길이 (정규화된 문자 수)
+MIN_PREFIX_CHARS = 2
+
+
+@dataclass
+class SpeculativeArm:
+    """세션별로 예약된 매크로 정보"""
+    macro: Dict[str, Any]    # 예약된 매크로 (인덱스 원본 딕셔너리)
+    voice_command: str       # 예약된 음성 명령어
+    prefix: str              # 예약 근거가 된 부분 인식 결과
+    confidence: float        # 명령어 중 부분 인식 결과가 차지하는 비율 (0.0-1.0)
+    armed_at: float          # 예약 시각 (time.time())
+    fired: bool = False      # 최종 결과 전에 이미 실행했는지 여부
+
+    @property
+    def macro_id(self) -> int:
+        """예약된 매크로 ID"""
+        return self.macro['id']
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        이벤트 전송용 딕셔너리로 변환
+
+        Returns:
+            Dict: 예약 정보
+        """
+        return {
+            'macro_id': self.macro_id,
+            'macro_name': self.macro.get('name', ''),
+            'voice_command': self.voice_command,
+            'prefix': self.prefix,
+            'confidence': self.confidence,
+            'fired': self.fired
+        }
+
+
+class SpeculativeMatchingService:
+    """
+    선행 매칭 서비스 클래스
+    - 매크로 인덱스 스냅샷별 명령어 접두사 트라이 사용
+    - 부분 인식 결과가 명령어 하나로만 완성되면 예약 ('armed')
+    - 설정 시 접두사 비율이 충분하면 최종 결과 전에 실행 ('fire')
+    - 최종 결과의 매크로와 비교하여 확정 ('confirmed') 또는 취소 ('cancelled')
+    """
+
+    def __init__(self, index: Optional[MacroIndex] = None):
+        """
+        선행 매칭 서비스 초기화
+
+        Args:
+            index (MacroIndex): 사용할 매크로 인덱스 (기본값: 전역 인덱스)
+        """
+        self.logger = get_logger(__name__)
+        self.macro_index = index or macro_index
+
+        # 선행 매칭 설정
+        self.enabled = config.SPECULATIVE_MATCHING_ENABLED
+        self.early_fire = config.SPECULATIVE_EARLY_FIRE
+        self.arm_ratio = config.SPECULATIVE_ARM_RATIO
+        self.fire_ratio = config.SPECULATIVE_FIRE_RATIO
+        self.arm_timeout = 5.0  # 최종 결과 없이 이 시간(초)이 지난 예약은 무시
+
+        # 세션별 예약 상태
+        self._arms: Dict[str, SpeculativeArm] = {}
+        self._lock = threading.Lock()
+
+        # 선행 매칭 통계
+        self.stats = {
+            'partials': 0,
+            'armed': 0,
+            'fired': 0,
+            'confirmed': 0,
+            'cancelled': 0
+        }
+
+        self.logger.info("선행 매칭 서비스가 초기화되었습니다.")
+
+    def _get_trie(self, snapshot: MacroIndexSnapshot) -> CommandTrie:
+        """인덱스 스냅샷의 명령어 트라이 반환 (버전별로 한 번만 생성)"""
+        return get_command_trie(snapshot)
+
+    def _get_live_arm(self, session_key: str) -> Optional[SpeculativeArm]:
+        """만료되지 않은 세션 예약 반환 (만료된 예약은 제거, 잠금 보유 상태에서 호출)"""
+        arm = self._arms.get(session_key)
+        if arm is not None and time.time() - arm.armed_at > self.arm_timeout:
+            del self._arms[session_key]
+            return None
+        return arm
+
+    def on_partial(self, session_key: str, partial_text: str) -> Dict[str, Any]:
+        """
+        부분 인식 결과 처리
+
+        Args:
+            session_key (str): 세션 식별자 (클라이언트 ID 등)
+            partial_text (str): 지금까지의 부분 인식 결과
+
+        Returns:
+            Dict: {'action': 'none' | 'armed' | 'fire', 'arm': 예약 정보 딕셔너리 또는 None}
+                  'fire'이면 호출자가 매크로를 즉시 실행해야 합니다.
+        """
+        if not self.enabled:
+            return {'action': 'none', 'arm': None}
+
+        # 트라이 키와 같은 규칙 (매칭 엔진 정규화 + 공백 제거)으로 부분 인식 결과 정규화
+        trie = self._get_trie(self.macro_index.get_snapshot())
+        if len(trie.normalize_key(partial_text)) < MIN_PREFIX_CHARS:
+            return {'action': 'none', 'arm': None}
+
+        completion = trie.unique_completion(partial_text)
+
+        with self._lock:
+            self.stats['partials'] += 1
+            arm = self._get_live_arm(session_key)
+
+            if completion is None or completion[2] < self.arm_ratio:
+                # 더 이상 하나로 좁혀지지 않아도 기존 예약은 최종 결과에서 판단
+                return {'action': 'none', 'arm': arm.to_dict() if arm else None}
+
+            voice_command, macro, confidence = completion
+
+            if arm is None or arm.macro_id != macro['id']:
+                # 이미 실행된 예약은 최종 결과가 올 때까지 바꾸지 않음
+                if arm is not None and arm.fired:
+                    return {'action': 'none', 'arm': arm.to_dict()}
+
+                arm = SpeculativeArm(
+                    macro=macro,
+                    voice_command=voice_command,
+                    prefix=partial_text,
+                    confidence=confidence,
+                    armed_at=time.time()
+                )
+                self._arms[session_key] = arm
+                self.stats['armed'] += 1
+                action = 'armed'
+            else:
+                arm.prefix = partial_text
+                arm.confidence = confidence
+                action = 'none'
+
+            if self.early_fire and not arm.fired and confidence >= self.fire_ratio:
+                arm.fired = True
+                self.stats['fired'] += 1
+                action = 'fire'
+
+            return {'action': action, 'arm': arm.to_dict()}
+
+    def on_final(self, session_key: str, matched_macro_id: Optional[int]) -> Dict[str, Any]:
+        """
+        최종 인식 결과로 예약 확정/취소
+
+        Args:
+            session_key (str): 세션 식별자
+            matched_macro_id (Optional[int]): 최종 결과로 매칭된 매크로 ID (없으면 None)
+
+        Returns:
+            Dict: {'action': 'none' | 'confirmed' | 'cancelled', 'arm': 예약 정보 딕셔너리 또는 None}
+                  'confirmed'이면서 arm['fired']가 True이면 이미 실행되었으므로 다시 실행하지 않습니다.
+                  'cancelled'이면서 arm['fired']가 True이면 잘못 실행된 매크로를 중지해야 합니다.
+        """
+        with self._lock:
+            arm = self._get_live_arm(session_key)
+            self._arms.pop(session_key, None)
+            if arm is None:
+                return {'action': 'none', 'arm': None}
+
+            if matched_macro_id is not None and arm.macro_id == matched_macro_id:
+                self.stats['confirmed'] += 1
+                action = 'confirmed'
+            else:
+                self.stats['cancelled'] += 1
+                action = 'cancelled'
+
+        self.logger.debug(f"선행 매칭 {action}: '{arm.voice_command}' "
+                          f"(접두사='{arm.prefix}', 실행={'예' if arm.fired else '아니오'})")
+        return {'action': action, 'arm': arm.to_dict()}
+
+    def clear_session(self, session_key: str):
+        """
+        세션의 예약 상태 제거 (연결 종료 시)
+
+        Args:
+            session_key (str): 세션 식별자
+        """
+        with self._lock:
+            self._arms.pop(session_key, None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        선행 매칭 통계 반환
+
+        Returns:
+            Dict: 통계 정보
+        """
+        resolved = self.stats['confirmed'] + self.stats['cancelled']
+        return {
+            **self.stats,
+            'pending': len(self._arms),
+            'precision': (self.stats['confirmed'] / resolved * 100) if resolved > 0 else 0.0,
+            'settings': {
+                'enabled': self.enabled,
+                'early_fire': self.early_fire,
+                'arm_ratio': self.arm_ratio,
+                'fire_ratio': self.fire_ratio
+            }
+        }
+
+
+# 전역 선행 매칭 서비스 인스턴스
+_speculative_service_instance = None
+
+def get_speculative_matching_service() -> SpeculativeMatchingService:
+    """
+    선행 매칭 서비스 싱글톤 인스턴스 반환
+
+    Returns:
+        SpeculativeMatchingService: 선행 매칭 서비스 인스턴스
+    """
+    global _speculative_service_instance
+    if _speculative_service_instance is None:
+        _speculative_service_instance = SpeculativeMatchingService()
+        # 프리셋 적용 시 새 범위의 명령어 트라이도 미리 준비
+        macro_index.register_warmer(_speculative_service_instance._get_trie)
+    return _speculative_service_instance
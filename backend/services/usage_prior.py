@@ -0,0 +1,149 @@
+"""
+VoiceMacro Pro - 매크로 사용 빈도 사전 정보 (usage prior)
+매크로 실행 시점을 지수 감쇠 카운터로 메모리에 유지하여, 매칭에서 자주/최근 사용한
+매크로를 먼저 확인하고 동점 순위를 정하는 데 사용합니다.
+"""
+
+import math
+import time
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+from backend.utils.common_utils import get_logger
+from backend.utils.config import config
+
+
+class UsagePrior:
+    """
+    지수 감쇠 사용 빈도 테이블 클래스
+    - 실행할 때마다 점수 +1, 반감기(half_life)마다 점수가 절반으로 감소
+    - 점수는 마지막 기록 시점 기준으로 저장하고 조회 시 감쇠 적용 (지연 감쇠)
+    - 모든 점수가 같은 비율로 감쇠하므로 순위는 기록 시에만 바뀜
+      -> 상위 매크로 순위(hot_ids)는 기록 시 한 번만 다시 계산
+    """
+
+    def __init__(self, half_life: Optional[float] = None, hot_size: Optional[int] = None):
+        """
+        사용 빈도 테이블 초기화
+
+        Args:
+            half_life (float): 점수 반감기 (초, 기본값: config.USAGE_PRIOR_HALF_LIFE)
+            hot_size (int): 먼저 확인할 상위 매크로 수 (기본값: config.USAGE_PRIOR_HOT_SIZE)
+        """
+        self.logger = get_logger(__name__)
+        self.half_life = half_life if half_life is not None else config.USAGE_PRIOR_HALF_LIFE
+        self.hot_size = hot_size if hot_size is not None else config.USAGE_PRIOR_HOT_SIZE
+
+        # 매크로 ID -> (점수, 기록 시각)
+        self._scores: Dict[int, Tuple[float, float]] = {}
+        self._lock = threading.Lock()
+
+        # 상위 매크로 순위 (바뀔 때마다 버전 증가, 매칭 결과 캐시 키에 사용)
+        self._hot_ids: Tuple[int, ...] = ()
+        self._hot_ranks: Dict[int, int] = {}
+        self._version = 0
+        self.records = 0
+
+    @property
+    def version(self) -> int:
+        """상위 매크로 순위 버전"""
+        return self._version
+
+    def _decayed(self, score: float, recorded_at: float, now: float) -> float:
+        """기록 시점 점수를 현재 시점으로 감쇠"""
+        if self.half_life <= 0:
+            return score
+        return score * math.pow(0.5, max(0.0, now - recorded_at) / self.half_life)
+
+    def record(self, macro_id: int, now: Optional[float] = None):
+        """
+        매크로 실행 기록 (점수 +1)
+
+        Args:
+            macro_id (int): 실행된 매크로 ID
+            now (float): 기록 시각 (기본값: time.time())
+        """
+        now = time.time() if now is None else now
+
+        with self._lock:
+            previous = self._scores.get(macro_id)
+            score = self._decayed(*previous, now) if previous else 0.0
+            self._scores[macro_id] = (score + 1.0, now)
+            self.records += 1
+
+            # 같은 시각 기준으로 상위 순위 다시 계산
+            ranked = sorted(self._scores,
+                            key=lambda key: self._decayed(*self._scores[key], now),
+                            reverse=True)
+            hot_ids = tuple(ranked[:self.hot_size])
+            if hot_ids != self._hot_ids:
+                self._hot_ids = hot_ids
+                self._hot_ranks = {hot_id: rank for rank, hot_id in enumerate(hot_ids)}
+                self._version += 1
+
+    def score(self, macro_id: int, now: Optional[float] = None) -> float:
+        """
+        현재 감쇠된 사용 점수 반환
+
+        Args:
+            macro_id (int): 매크로 ID
+            now (float): 조회 시각 (기본값: time.time())
+
+        Returns:
+            float: 사용 점수 (기록이 없으면 0.0)
+        """
+        entry = self._scores.get(macro_id)
+        if entry is None:
+            return 0.0
+        return self._decayed(*entry, time.time() if now is None else now)
+
+    def get_hot_ids(self) -> Tuple[int, ...]:
+        """
+        사용 점수 상위 매크로 ID 반환
+
+        Returns:
+            Tuple[int, ...]: 점수 내림차순 매크로 ID (최대 hot_size개)
+        """
+        return self._hot_ids
+
+    def get_hot_ranks(self) -> Dict[int, int]:
+        """
+        상위 매크로 ID -> 순위(0부터) 반환 (동점 순위 결정용, 수정하지 마세요)
+
+        Returns:
+            Dict[int, int]: 매크로 ID별 순위
+        """
+        return self._hot_ranks
+
+    def clear(self):
+        """사용 빈도 초기화"""
+        with self._lock:
+            self._scores.clear()
+            if self._hot_ids:
+                self._hot_ids = ()
+                self._hot_ranks = {}
+                self._version += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        사용 빈도 통계 반환
+
+        Returns:
+            Dict: 통계 정보
+        """
+        now = time.time()
+        return {
+            'tracked_macros': len(self._scores),
+            'records': self.records,
+            'half_life': self.half_life,
+            'hot_size': self.hot_size,
+            'hot_macros': [
+                {'macro_id': macro_id, 'score': round(self.score(macro_id, now), 3)}
+                for macro_id in self._hot_ids
+            ],
+            'version': self._version
+        }
+
+
+# 전역 사용 빈도 테이블 인스턴스
+usage_prior = UsagePrior()
@@ -0,0 +1,322 @@
+"""
+VoiceMacro Pro - 발화 조립 서비스
+Socket.IO로 조각조각 들어오는 클라이언트 PCM16 오디오를 세션별로 이어 붙이고,
+음성 구간 끝(VAD), 최대 길이, 최대 대기 시간 기준으로 발화를 나누어
+발화 하나당 트랜스크립션 작업 하나를 만들 수 있게 합니다.
+"""
+
+import time
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from backend.utils.common_utils import get_logger
+from backend.utils.config import Config
+from backend.utils.voice_activity_detector import VoiceActivityDetector
+
+
+@dataclass
+class Utterance:
+    """트랜스크립션할 발화 하나"""
+    client_id: str        # 클라이언트 세션 ID
+    audio: bytes          # PCM16 모노 오디오
+    sample_rate: int      # 샘플레이트 (Hz)
+    reason: str           # 'speech_end' | 'max_length' | 'max_latency' | 'flush'
+    started_at: float     # 첫 오디오가 들어온 시각 (time.monotonic())
+
+    @property
+    def duration(self) -> float:
+        """발화 길이 (초)"""
+        return len(self.audio) / 2 / self.sample_rate
+
+
+class UtteranceAssembler:
+    """
+    클라이언트 세션 하나의 발화 조립 클래스
+    - VAD가 넘겨준 음성 구간(앞쪽 패딩 포함)만 버퍼에 모음 (VAD를 끄면 모든 오디오)
+    - 음성 구간이 끝나면 발화 완료, 최대 길이를 넘으면 그 자리에서 잘라 다음 발화로 이어감
+    - 마지막 오디오 이후 최대 대기 시간이 지나면 poll()이 남은 발화를 내보냄 (클라이언트가 전송을 멈춘 경우)
+    """
+
+    def __init__(self, client_id: str, sample_rate: int, max_latency_ms: int,
+                 max_utterance_seconds: float, use_vad: bool = True):
+        """
+        발화 조립기 생성
+
+        Args:
+            client_id (str): 클라이언트 세션 ID
+            sample_rate (int): PCM16 샘플레이트 (Hz)
+            max_latency_ms (int): 마지막 오디오 이후 발화를 붙잡아 둘 최대 시간 (ms)
+            max_utterance_seconds (float): 발화 하나의 최대 길이 (초)
+            use_vad (bool): VAD로 음성 구간만 모을지 여부
+        """
+        self.client_id = client_id
+        self.sample_rate = sample_rate
+        self.max_latency = max_latency_ms / 1000
+        self.max_bytes = max(2, int(max_utterance_seconds * sample_rate)) * 2
+
+        self.vad = VoiceActivityDetector(sample_rate, dtype=np.int16) if use_vad else None
+        self._buffer = bytearray()
+        self._started_at: Optional[float] = None
+        self._last_audio_at = 0.0
+
+    @property
+    def is_speech(self) -> bool:
+        """현재 음성 구간 안인지 여부 (VAD를 끄면 모인 오디오가 있는지)"""
+        return self.vad.is_speech if self.vad else bool(self._buffer)
+
+    @property
+    def buffered_seconds(self) -> float:
+        """아직 내보내지 않은 오디오 길이 (초)"""
+        return len(self._buffer) / 2 / self.sample_rate
+
+    def _emit(self, reason: str, utterances: List[Utterance]) -> None:
+        """모인 오디오를 발화로 내보내고 버퍼 비우기"""
+        if self._buffer:
+            utterances.append(Utterance(self.client_id, bytes(self._buffer), self.sample_rate,
+                                        reason, self._started_at))
+            self._buffer.clear()
+        self._started_at = None
+
+    def _append(self, audio: np.ndarray, now: float, utterances: List[Utterance]) -> None:
+        """오디오를 버퍼에 추가 (최대 길이에 닿으면 잘라서 발화로 내보냄)"""
+        data = memoryview(np.ascontiguousarray(audio, dtype='<i2')).cast('B')
+        while len(data):
+            if self._started_at is None:
+                self._started_at = now
+            room = self.max_bytes - len(self._buffer)
+            self._buffer += data[:room]
+            data = data[room:]
+            if len(self._buffer) >= self.max_bytes:
+                self._emit('max_length', utterances)
+
+    def push(self, pcm: bytes, now: Optional[float] = None) -> List[Utterance]:
+        """
+        PCM16 오디오 조각 추가
+
+        Args:
+            pcm (bytes): PCM16 리틀 엔디언 모노 오디오 (bytes, bytearray, memoryview)
+            now (float): 현재 시각 (time.monotonic(), 테스트용)
+
+        Returns:
+            List[Utterance]: 이번 조각으로 완성된 발화 목록 (발화 순서)
+        """
+        now = time.monotonic() if now is None else now
+        samples = np.frombuffer(pcm, dtype='<i2', count=len(pcm) // 2)
+        utterances: List[Utterance] = []
+
+        if self.vad is None:
+            audio, segment_ends = samples, []
+        else:
+            result = self.vad.process(samples)
+            audio, segment_ends = result.audio, result.segment_ends
+
+        if len(audio):
+            self._last_audio_at = now
+
+        # 음성 구간이 끝난 위치마다 발화 완료
+        offset = 0
+        for end in segment_ends:
+            self._append(audio[offset:end], now, utterances)
+            self._emit('speech_end', utterances)
+            offset = end
+        self._append(audio[offset:], now, utterances)
+
+        return utterances
+
+    def poll(self, now: Optional[float] = None) -> List[Utterance]:
+        """
+        최대 대기 시간이 지난 발화 내보내기
+
+        Args:
+            now (float): 현재 시각 (time.monotonic())
+
+        Returns:
+            List[Utterance]: 내보낸 발화 목록 (없으면 빈 목록)
+        """
+        now = time.monotonic() if now is None else now
+        utterances: List[Utterance] = []
+        if self._buffer and now - self._last_audio_at >= self.max_latency:
+            self._emit('max_latency', utterances)
+        return utterances
+
+    def flush(self) -> List[Utterance]:
+        """
+        남은 오디오를 모두 발화로 내보내기 (녹음 중지 시)
+
+        Returns:
+            List[Utterance]: 내보낸 발화 목록
+        """
+        utterances: List[Utterance] = []
+        self._emit('flush', utterances)
+        return utterances
+
+
+class UtteranceAssemblerService:
+    """
+    발화 조립 서비스 클래스
+    - 클라이언트 세션별 UtteranceAssembler 관리 (첫 오디오에서 생성)
+    - 너무 짧은 발화는 버리고, 발화 이유별 개수와 길이 통계 집계
+    """
+
+    def __init__(self, sample_rate: Optional[int] = None):
+        """
+        발화 조립 서비스 초기화
+
+        Args:
+            sample_rate (int): 클라이언트 PCM16 샘플레이트 (기본값: Config.CLIENT_AUDIO_SAMPLE_RATE)
+        """
+        self.logger = get_logger(__name__)
+
+        # 발화 조립 설정
+        self.sample_rate = sample_rate or Config.CLIENT_AUDIO_SAMPLE_RATE
+        self.use_vad = Config.VAD_ENABLED
+        self.max_latency_ms = Config.UTTERANCE_MAX_LATENCY_MS
+        self.max_utterance_seconds = Config.UTTERANCE_MAX_SECONDS
+        self.min_utterance_seconds = Config.UTTERANCE_MIN_SECONDS
+
+        # 세션별 조립기
+        self._assemblers: Dict[str, UtteranceAssembler] = {}
+        self._lock = threading.Lock()
+
+        # 조립 통계
+        self.stats = {
+            'chunks': 0,
+            'utterances': 0,
+            'dropped_short': 0,
+            'speech_end': 0,
+            'max_length': 0,
+            'max_latency': 0,
+            'flush': 0,
+            'audio_seconds': 0.0
+        }
+
+        self.logger.info("발화 조립 서비스가 초기화되었습니다.")
+
+    def _get_assembler(self, client_id: str) -> UtteranceAssembler:
+        """세션 조립기 반환 (없으면 생성, 잠금 안에서 호출)"""
+        assembler = self._assemblers.get(client_id)
+        if assembler is None:
+            assembler = UtteranceAssembler(client_id, self.sample_rate, self.max_latency_ms,
+                                           self.max_utterance_seconds, self.use_vad)
+            self._assemblers[client_id] = assembler
+        return assembler
+
+    def _accept(self, utterances: List[Utterance]) -> List[Utterance]:
+        """너무 짧은 발화를 거르고 통계 갱신 (잠금 안에서 호출)"""
+        accepted = []
+        for utterance in utterances:
+            if utterance.duration < self.min_utterance_seconds:
+                self.stats['dropped_short'] += 1
+                continue
+            self.stats['utterances'] += 1
+            self.stats[utterance.reason] += 1
+            self.stats['audio_seconds'] += utterance.duration
+            accepted.append(utterance)
+        return accepted
+
+    def push(self, client_id: str, pcm: bytes) -> List[Utterance]:
+        """
+        클라이언트 오디오 조각 추가
+
+        Args:
+            client_id (str): 클라이언트 세션 ID
+            pcm (bytes): PCM16 오디오 조각
+
+        Returns:
+            List[Utterance]: 완성된 발화 목록 (트랜스크립션할 순서)
+        """
+        with self._lock:
+            self.stats['chunks'] += 1
+            return self._accept(self._get_assembler(client_id).push(pcm))
+
+    def collect_expired(self) -> List[Utterance]:
+        """
+        모든 세션에서 최대 대기 시간이 지난 발화 모으기 (주기적으로 호출)
+
+        Returns:
+            List[Utterance]: 내보낸 발화 목록
+        """
+        now = time.monotonic()
+        with self._lock:
+            utterances = []
+            for assembler in self._assemblers.values():
+                utterances.extend(assembler.poll(now))
+            return self._accept(utterances)
+
+    def flush(self, client_id: str) -> List[Utterance]:
+        """
+        세션의 남은 오디오를 발화로 내보내기 (녹음 중지 시)
+
+        Args:
+            client_id (str): 클라이언트 세션 ID
+
+        Returns:
+            List[Utterance]: 내보낸 발화 목록
+        """
+        with self._lock:
+            assembler = self._assemblers.pop(client_id, None)
+            return self._accept(assembler.flush()) if assembler else []
+
+    def is_speech(self, client_id: str) -> bool:
+        """
+        세션이 현재 음성 구간 안인지 여부
+
+        Args:
+            client_id (str): 클라이언트 세션 ID
+
+        Returns:
+            bool: 음성 구간 여부
+        """
+        with self._lock:
+            assembler = self._assemblers.get(client_id)
+            return assembler.is_speech if assembler else False
+
+    def clear_session(self, client_id: str):
+        """
+        세션의 조립 상태 삭제 (남은 오디오는 버림)
+
+        Args:
+            client_id (str): 클라이언트 세션 ID
+        """
+        with self._lock:
+            self._assemblers.pop(client_id, None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        발화 조립 통계 반환
+
+        Returns:
+            Dict: 통계 정보
+        """
+        with self._lock:
+            return {
+                **self.stats,
+                'sessions': len(self._assemblers),
+                'buffered_seconds': sum(assembler.buffered_seconds for assembler in self._assemblers.values()),
+                'settings': {
+                    'sample_rate': self.sample_rate,
+                    'use_vad': self.use_vad,
+                    'max_latency_ms': self.max_latency_ms,
+                    'max_utterance_seconds': self.max_utterance_seconds,
+                    'min_utterance_seconds': self.min_utterance_seconds
+                }
+            }
+
+
+# 전역 발화 조립 서비스 인스턴스
+_utterance_assembler_instance = None
+
+def get_utterance_assembler_service() -> UtteranceAssemblerService:
+    """
+    발화 조립 서비스 싱글톤 인스턴스 반환
+
+    Returns:
+        UtteranceAssemblerService: 발화 조립 서비스 인스턴스
+    """
+    global _utterance_assembler_instance
+    if _utterance_assembler_instance is None:
+        _utterance_assembler_instance = UtteranceAssemblerService()
+    return _utterance_assembler_instance
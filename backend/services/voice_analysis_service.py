@@ -3,12 +3,12 @@ VoiceMacro Pro - 음성 분석 서비스
 음성을 텍스트로 변환하고 매크로 명령어와 매칭하는 기능 제공
 """
 
-import re
 import time
 import random
 from typing import Dict, List, Optional, Tuple
-from difflib import SequenceMatcher
 from backend.utils.common_utils import get_logger, sanitize_string
+from backend.utils.text_normalizer import TextNormalizer, get_text_normalizer
+from backend.services.matching_engine import MatchingEngine
 
 
 class VoiceAnalysisService:
@@ -28,6 +28,9 @@ class VoiceAnalysisService:
         self.supported_languages = ['ko', 'en']
         self.current_language = 'ko'  # 기본값: 한국어
         
+        # 자모 기반 음운 유사도 사용 여부
+        self.use_phonetic_similarity = True
+        
         # 시뮬레이션용 샘플 음성 명령어들
         self.sample_commands = {
             'ko': [
@@ -42,12 +45,8 @@ class VoiceAnalysisService:
             ]
         }
         
-        # 노이즈 제거를 위한 패턴들
-        self.noise_patterns = [
-            r'\b(음|어|아|그|저|그거|이거)\b',  # 한국어 불용어
-            r'\b(um|uh|ah|er|like|you know)\b',  # 영어 불용어
-            r'[^\w\s]',  # 특수문자 제거
-        ]
+        # 노이즈(언어별 불용어, 특수문자) 제거는 미리 컴파일된 공용 정규화기 사용
+        # (backend.utils.text_normalizer.FILLER_WORDS)
         
                  # 동의어 사전
         self.synonyms = {
@@ -92,6 +91,9 @@ class VoiceAnalysisService:
             }
         }
         
+        # 언어별 매칭 엔진 (동의어 사전이 언어마다 다름)
+        self._matching_engines: Dict[str, MatchingEngine] = {}
+        
         self.logger.info("음성 분석 서비스가 초기화되었습니다.")
     
     def set_language(self, language: str) -> bool:
@@ -112,9 +114,13 @@ class VoiceAnalysisService:
         self.logger.info(f"음성 인식 언어가 {language}로 설정되었습니다.")
         return True
     
+    def _get_normalizer(self) -> TextNormalizer:
+        """현재 언어의 텍스트 정규화기 반환"""
+        return get_text_normalizer(self.current_language)
+    
     def _clean_text(self, text: str) -> str:
         """
-        텍스트에서 노이즈 제거
+        텍스트에서 노이즈 제거 (현재 언어의 불용어, 특수문자, 연속 공백)
         
         Args:
             text (str): 정리할 텍스트
@@ -122,20 +128,7 @@ class VoiceAnalysisService:
         Returns:
             str: 정리된 텍스트
         """
-        if not text:
-            return ""
-        
-        # 기본 정리
-        cleaned = text.lower().strip()
-        
-        # 노이즈 패턴 제거
-        for pattern in self.noise_patterns:
-            cleaned = re.sub(pattern, '', cleaned, flags=re.IGNORECASE)
-        
-        # 연속된 공백 제거
-        cleaned = re.sub(r'\s+', ' ', cleaned).strip()
-        
-        return cleaned
+        return self._get_normalizer().normalize(text)
     
     def analyze_audio_simulation(self, audio_data: List[float], duration: float) -> Dict:
         """
@@ -235,40 +228,30 @@ class VoiceAnalysisService:
         if not text or not commands:
             return []
         
-        similarities = []
-        cleaned_text = self._clean_text(text)
+        # 공용 매칭 엔진으로 유사도 계산 (결과의 macro_id는 명령어 위치)
+        # 입력과 명령어 정규화는 엔진이 담당 (같은 명령어 목록은 정규화 결과 재사용)
+        engine = self._get_matching_engine(self.current_language)
+        engine.use_phonetic_similarity = self.use_phonetic_similarity
+        matches = engine.match_commands(text, commands, threshold, len(commands))
         
-        for command in commands:
-            cleaned_command = self._clean_text(command)
-            
-            # 기본 유사도 계산
-            similarity = SequenceMatcher(None, cleaned_text, cleaned_command).ratio()
-            
-            # 동의어 체크 (양방향)
-            synonyms = self.synonyms.get(self.current_language, {})
-            
-            # 1. cleaned_command가 키인 경우
-            if cleaned_command in synonyms:
-                for synonym in synonyms[cleaned_command]:
-                    synonym_similarity = SequenceMatcher(None, cleaned_text, synonym).ratio()
-                    similarity = max(similarity, synonym_similarity)
-            
-            # 2. cleaned_text가 어떤 키의 동의어인 경우
-            for main_word, synonym_list in synonyms.items():
-                if cleaned_text in synonym_list:
-                    main_similarity = SequenceMatcher(None, main_word, cleaned_command).ratio()
-                    similarity = max(similarity, main_similarity)
-            
-            # 부분 일치 체크
-            if cleaned_command in cleaned_text or cleaned_text in cleaned_command:
-                similarity = max(similarity, 0.8)
-            
-            if similarity >= threshold:
-                similarities.append((command, similarity))
+        return [(commands[match.macro_id], match.similarity) for match in matches]
+    
+    def _get_matching_engine(self, language: str) -> MatchingEngine:
+        """
+        언어별 동의어 사전/정규화기를 사용하는 매칭 엔진 반환 (언어별로 한 번만 생성)
         
-        # 유사도 순으로 정렬
-        similarities.sort(key=lambda x: x[1], reverse=True)
-        return similarities
+        Args:
+            language (str): 언어 코드
+            
+        Returns:
+            MatchingEngine: 매칭 엔진
+        """
+        engine = self._matching_engines.get(language)
+        if engine is None:
+            engine = MatchingEngine(synonyms=self.synonyms.get(language, {}),
+                                    normalizer=get_text_normalizer(language))
+            self._matching_engines[language] = engine
+        return engine
     
     def match_macro_commands(self, recognized_text: str, macro_commands: List[str]) -> Dict:
         """
@@ -382,7 +365,7 @@ class VoiceAnalysisService:
                 lang: len(synonyms) 
                 for lang, synonyms in self.synonyms.items()
             },
-            'noise_patterns_count': len(self.noise_patterns)
+            'noise_patterns_count': self._get_normalizer().pattern_count
         }
 
 
@@ -5,7 +5,6 @@ VoiceMacro Pro - 음성 인식 서비스
 
 import threading
 import time
-import queue
 import numpy as np
 import sounddevice as sd
 import asyncio
@@ -14,6 +13,9 @@ import logging
 from backend.utils.common_utils import get_logger
 from backend.services.gpt4o_transcription_service import GPT4oTranscriptionService
 from backend.utils.config import Config
+from backend.utils.audio_ring_buffer import AudioRingBuffer
+from backend.utils.pcm_encoder import Pcm16Encoder
+from backend.utils.voice_activity_detector import VoiceActivityDetector
 
 
 class VoiceRecognitionService:
@@ -38,7 +40,16 @@ class VoiceRecognitionService:
         # 녹음 상태 관리
         self.is_recording = False
         self.recording_thread = None
-        self.audio_queue = queue.Queue()
+        self.audio_buffer = AudioRingBuffer(Config.AUDIO_BUFFER_SECONDS, self.sample_rate)
+        
+        # 로컬 음성 구간 검출 (음성 구간과 앞쪽 패딩만 GPT-4o로 전송)
+        self.vad = VoiceActivityDetector(self.sample_rate) if Config.VAD_ENABLED else None
+        
+        # GPT-4o 업링크용 PCM16 변환 슬롯 (음성 시작 블록은 패딩만큼 길어짐)
+        max_uplink_frames = self.chunk_size
+        if self.vad:
+            max_uplink_frames += self.vad.padding_samples + self.vad.frame_length
+        self.pcm_encoder = Pcm16Encoder(max_uplink_frames)
         
         # 마이크 관리
         self.current_device_id = None
@@ -57,6 +68,7 @@ class VoiceRecognitionService:
         self.audio_level_callback: Optional[Callable[[float], None]] = None
         self.recording_status_callback: Optional[Callable[[bool], None]] = None
         self.transcription_callback: Optional[Callable[[Dict], None]] = None
+        self.partial_transcription_callback: Optional[Callable[[Dict], None]] = None
         
         # 초기화
         self._initialize_audio_devices()
@@ -130,9 +142,20 @@ class VoiceRecognitionService:
                     self.logger.warning(f"낮은 신뢰도로 인한 무시: {confidence:.2f} < {self.confidence_threshold}")
                     
             elif transcription_data["type"] == "partial":
-                # 부분 트랜스크립션은 로그만 기록
+                # 부분 트랜스크립션은 선행 매칭용 콜백으로 전달 (최종 결과 대기 없음)
                 self.logger.debug(f"부분 인식: {transcription_data['text']}")
                 
+                if self.partial_transcription_callback:
+                    try:
+                        self.partial_transcription_callback({
+                            "transcript": transcription_data["text"].strip(),
+                            "item_id": transcription_data.get("item_id"),
+                            "timestamp": transcription_data["timestamp"],
+                            "partial": True
+                        })
+                    except Exception as e:
+                        self.logger.error(f"부분 트랜스크립션 콜백 실행 오류: {e}")
+                
         except Exception as e:
             self.logger.error(f"트랜스크립션 결과 처리 오류: {e}")
     
@@ -146,6 +169,16 @@ class VoiceRecognitionService:
         self.transcription_callback = callback
         self.logger.debug("트랜스크립션 콜백 함수가 설정되었습니다.")
     
+    def set_partial_transcription_callback(self, callback: Callable[[Dict], None]):
+        """
+        부분 트랜스크립션 결과 콜백 함수 설정 (선행 매칭용)
+        
+        Args:
+            callback (Callable[[Dict], None]): 부분 인식 결과를 받을 콜백 함수
+        """
+        self.partial_transcription_callback = callback
+        self.logger.debug("부분 트랜스크립션 콜백 함수가 설정되었습니다.")
+    
     def _initialize_audio_devices(self):
         """사용 가능한 오디오 장치 초기화 (안전한 방법)"""
         try:
@@ -320,46 +353,75 @@ class VoiceRecognitionService:
         if status:
             self.logger.warning(f"오디오 입력 상태 경고: {status}")
         
-        # 오디오 데이터를 큐에 추가
-        audio_data = indata.copy()
+        # 첫 채널 뷰 (indata는 콜백이 끝나면 재사용되므로 링 버퍼에 바로 복사)
+        audio_data = indata[:, 0]
         
-        # GPT-4o 서비스로 오디오 데이터 전송
+        # GPT-4o 서비스로 오디오 데이터 전송 (VAD 사용 시 음성 구간만)
         if self.gpt4o_enabled and self.gpt4o_service and self.gpt4o_service.is_connected:
-            self._send_audio_to_gpt4o(audio_data)
-        
-        # 음성 레벨 계산 (RMS)
-        if self.audio_level_callback:
-            rms = np.sqrt(np.mean(audio_data ** 2))
+            if self.vad is None:
+                self._send_audio_to_gpt4o(audio_data)
+            else:
+                vad_result = self.vad.process(audio_data)
+                if len(vad_result.audio):
+                    self._send_audio_to_gpt4o(vad_result.audio)
+                if vad_result.speech_ended:
+                    # 서버 VAD의 무음 대기 없이 바로 발화 종료 알림
+                    self._commit_gpt4o_audio()
+        
+        # 음성 레벨 계산 (RMS, 제곱 배열을 만들지 않도록 내적 사용)
+        if self.audio_level_callback and frames:
+            rms = float(np.sqrt(np.dot(audio_data, audio_data) / frames))
             # 0.0 ~ 1.0 범위로 정규화
             level = min(1.0, rms * 10)  # 감도 조절
             self.audio_level_callback(level)
         
-        # 오디오 데이터 저장
-        if not self.audio_queue.full():
-            self.audio_queue.put(audio_data)
+        # 오디오 데이터 저장 (미리 할당한 링 버퍼에 복사, 할당 없음)
+        self.audio_buffer.write(audio_data)
     
     def _send_audio_to_gpt4o(self, audio_data):
         """
         오디오 데이터를 GPT-4o 서비스로 전송
         
         Args:
-            audio_data: 오디오 데이터 (numpy array, float32)
+            audio_data: 오디오 데이터 (1차원 numpy array, float32)
         """
         try:
-            # float32 numpy array를 int16 PCM으로 변환
-            # GPT-4o는 PCM16 형식을 요구함
-            audio_int16 = (audio_data.flatten() * 32767).astype(np.int16)
-            audio_bytes = audio_int16.tobytes()
+            # float32를 미리 할당한 슬롯에 PCM16으로 변환 (GPT-4o는 PCM16 형식을 요구함)
+            # Base64/JSON 인코딩은 콜백이 아닌 이벤트 루프 스레드에서 수행
+            slot, audio_bytes = self.pcm_encoder.encode(audio_data)
             
-            # 비동기적으로 오디오 전송
+            # 비동기적으로 오디오 전송 (전송이 끝나면 슬롯 반납)
             if self.event_loop and not self.event_loop.is_closed():
                 asyncio.run_coroutine_threadsafe(
-                    self.gpt4o_service.send_audio_chunk(audio_bytes),
+                    self._send_pcm_block(slot, audio_bytes),
                     self.event_loop
                 )
+            else:
+                self.pcm_encoder.release(slot)
         except Exception as e:
             self.logger.error(f"GPT-4o 오디오 전송 오류: {e}")
     
+    def _commit_gpt4o_audio(self):
+        """음성 구간이 끝났을 때 GPT-4o 오디오 버퍼 커밋 (트랜스크립션 시작)"""
+        if self.event_loop and not self.event_loop.is_closed():
+            asyncio.run_coroutine_threadsafe(
+                self.gpt4o_service.commit_audio_buffer(),
+                self.event_loop
+            )
+    
+    async def _send_pcm_block(self, slot: int, audio_bytes):
+        """
+        PCM16 블록 전송 후 인코더 슬롯 반납 (이벤트 루프에서 실행)
+        
+        Args:
+            slot (int): 인코더 슬롯 번호
+            audio_bytes: PCM16 바이트 뷰
+        """
+        try:
+            await self.gpt4o_service.send_audio_chunk(audio_bytes)
+        finally:
+            self.pcm_encoder.release(slot)
+    
     def start_recording(self) -> bool:
         """
         실시간 녹음 시작 - GPT-4o 트랜스크립션 연결 포함
@@ -397,9 +459,10 @@ class VoiceRecognitionService:
                     except Exception as e:
                         self.logger.warning(f"GPT-4o 연결 타임아웃: {e} - 기본 모드로 계속")
             
-            # 오디오 큐 초기화
-            while not self.audio_queue.empty():
-                self.audio_queue.get()
+            # 오디오 버퍼 초기화 (스트림 시작 전이므로 생산자 없음)
+            self.audio_buffer.reset()
+            if self.vad:
+                self.vad.reset()
             
             # 녹음 시작
             self.is_recording = True
@@ -486,7 +549,10 @@ class VoiceRecognitionService:
             'sample_rate': self.sample_rate,
             'channels': self.channels,
             'available_devices_count': len(self.available_devices),
-            'queue_size': self.audio_queue.qsize()
+            'queue_size': self.audio_buffer.available // self.chunk_size,  # 읽지 않은 블록 수
+            'audio_buffer': self.audio_buffer.get_stats(),
+            'pcm_encoder': self.pcm_encoder.get_stats(),
+            'vad': self.vad.get_stats() if self.vad else None
         }
     
     def get_audio_data(self, duration_seconds: float = 1.0) -> Optional[np.ndarray]:
@@ -503,44 +569,29 @@ class VoiceRecognitionService:
             self.logger.warning("녹음이 진행 중이지 않습니다.")
             return None
         
-        # 필요한 프레임 수 계산
-        required_frames = int(duration_seconds * self.sample_rate)
-        audio_chunks = []
-        total_frames = 0
-        
-        # 큐에서 오디오 데이터 수집
-        start_time = time.time()
-        timeout = duration_seconds + 1.0  # 타임아웃 설정
-        
-        while total_frames < required_frames:
-            try:
-                # 타임아웃 체크
-                if time.time() - start_time > timeout:
-                    self.logger.warning("오디오 데이터 수집 타임아웃")
-                    break
-                
-                # 큐에서 데이터 가져오기 (0.1초 대기)
-                chunk = self.audio_queue.get(timeout=0.1)
-                audio_chunks.append(chunk)
-                total_frames += len(chunk)
-                
-            except queue.Empty:
-                # 큐가 비어있으면 잠시 대기
-                time.sleep(0.01)
-                continue
-        
-        if not audio_chunks:
+        # 링 버퍼에서 오디오 데이터 수집 (모일 때까지 대기, 타임아웃이면 모인 만큼)
+        audio_data = self.audio_buffer.read_seconds(duration_seconds, timeout=duration_seconds + 1.0)
+        if audio_data is None:
             return None
         
-        # 오디오 청크들을 하나로 합치기
-        audio_data = np.concatenate(audio_chunks, axis=0)
-        
-        # 요청된 길이만큼 자르기
-        if len(audio_data) > required_frames:
-            audio_data = audio_data[:required_frames]
+        required_frames = int(duration_seconds * self.sample_rate)
+        if len(audio_data) < required_frames:
+            self.logger.warning("오디오 데이터 수집 타임아웃")
         
         self.logger.debug(f"{len(audio_data)} 프레임의 오디오 데이터 수집 완료")
-        return audio_data.flatten()  # 1차원 배열로 변환
+        return audio_data.copy()  # 호출자가 보관하므로 버퍼가 덮어쓰기 전에 복사
+    
+    def get_recent_audio(self, duration_seconds: float = 1.0) -> np.ndarray:
+        """
+        가장 최근 오디오 데이터 반환 (읽기 위치를 바꾸지 않는 복사 없는 뷰)
+        
+        Args:
+            duration_seconds (float): 오디오 길이 (초)
+            
+        Returns:
+            np.ndarray: 최근 오디오의 읽기 전용 뷰 (링 버퍼가 한 바퀴 돌면 덮어쓰임)
+        """
+        return self.audio_buffer.latest(duration_seconds)
     
     def test_microphone(self) -> Dict:
         """
@@ -5,18 +5,17 @@ VoiceMacro Pro - OpenAI Whisper 음성 인식 서비스
 
 import os
 import io
-import wave
-import tempfile
 import numpy as np
 from typing import Optional, List, Dict, Tuple
 from openai import OpenAI
-from difflib import SequenceMatcher
 import logging
 from datetime import datetime
 
 from backend.utils.config import config
 from backend.utils.common_utils import get_logger
-from backend.services.macro_service import macro_service
+from backend.utils.pcm_encoder import encode_wav, float_to_pcm16
+from backend.utils.resampler import resample
+from backend.services.matching_engine import matching_engine
 
 
 class WhisperService:
@@ -48,68 +47,32 @@ class WhisperService:
         self.sample_rate = config.SAMPLE_RATE
         self.channels = config.AUDIO_CHANNELS
         
-        # 매크로 캐시 (성능 최적화용)
-        self._macro_cache = []
-        self._cache_last_updated = None
+        # 공용 매칭 엔진 (인메모리 매크로 인덱스, 결과 캐시 공유)
+        self.matching_engine = matching_engine
         
         self.logger.info("Whisper 서비스가 초기화되었습니다.")
     
-    def _save_audio_to_file(self, audio_data: np.ndarray) -> str:
+    def _encode_audio(self, audio_data: np.ndarray, sample_rate: int) -> io.BytesIO:
         """
-        numpy 오디오 데이터를 임시 WAV 파일로 저장
+        numpy 오디오 데이터를 Whisper 샘플레이트의 메모리 WAV 파일로 변환
         
         Args:
             audio_data (np.ndarray): 오디오 데이터 배열
+            sample_rate (int): 오디오 데이터의 실제 샘플레이트 (Hz)
             
         Returns:
-            str: 저장된 임시 파일 경로
+            io.BytesIO: WAV 파일 객체
         """
-        try:
-            # 임시 파일 생성
-            temp_file = tempfile.NamedTemporaryFile(
-                suffix='.wav', 
-                dir=config.TEMP_AUDIO_DIR, 
-                delete=False
-            )
-            
-            # numpy 배열을 int16으로 변환 (WAV 포맷용)
-            # sounddevice는 float32 (-1.0 ~ 1.0) 범위로 제공
-            audio_int16 = (audio_data * 32767).astype(np.int16)
-            
-            # WAV 파일로 저장
-            with wave.open(temp_file.name, 'wb') as wav_file:
-                wav_file.setnchannels(self.channels)  # 모노
-                wav_file.setsampwidth(2)  # 16-bit
-                wav_file.setframerate(self.sample_rate)  # 16kHz
-                wav_file.writeframes(audio_int16.tobytes())
-            
-            self.logger.debug(f"오디오 파일 저장 완료: {temp_file.name}")
-            return temp_file.name
-            
-        except Exception as e:
-            self.logger.error(f"오디오 파일 저장 실패: {e}")
-            raise
+        # sounddevice는 float32 (-1.0 ~ 1.0) 범위로 제공
+        audio_data = resample(audio_data, sample_rate, self.sample_rate)
+        return encode_wav(float_to_pcm16(audio_data), self.sample_rate, self.channels)
     
-    def _cleanup_temp_file(self, file_path: str):
+    def _transcribe_wav(self, wav_file: io.BytesIO) -> Optional[str]:
         """
-        임시 파일 정리
+        메모리 WAV 파일을 OpenAI Whisper API로 텍스트로 변환
         
         Args:
-            file_path (str): 삭제할 파일 경로
-        """
-        try:
-            if os.path.exists(file_path):
-                os.remove(file_path)
-                self.logger.debug(f"임시 파일 삭제 완료: {file_path}")
-        except Exception as e:
-            self.logger.warning(f"임시 파일 삭제 실패: {e}")
-    
-    def transcribe_audio(self, audio_data: np.ndarray) -> Optional[str]:
-        """
-        오디오 데이터를 OpenAI Whisper API로 텍스트로 변환
-        
-        Args:
-            audio_data (np.ndarray): 오디오 데이터 배열
+            wav_file (io.BytesIO): name 속성이 있는 WAV 파일 객체
             
         Returns:
             Optional[str]: 변환된 텍스트, 실패 시 None
@@ -118,25 +81,20 @@ class WhisperService:
             self.logger.error("OpenAI 클라이언트가 초기화되지 않았습니다.")
             return None
         
-        temp_file_path = None
         try:
-            # 오디오 데이터를 파일로 저장
-            temp_file_path = self._save_audio_to_file(audio_data)
-            
             # 파일 크기 확인 (OpenAI는 25MB 제한)
-            file_size_mb = os.path.getsize(temp_file_path) / (1024 * 1024)
+            file_size_mb = len(wav_file.getvalue()) / (1024 * 1024)
             if file_size_mb > config.VOICE_RECOGNITION_MAX_FILE_SIZE:
                 self.logger.error(f"오디오 파일이 너무 큽니다: {file_size_mb:.1f}MB")
                 return None
             
             # OpenAI Whisper API 호출
-            with open(temp_file_path, 'rb') as audio_file:
-                response = self.client.audio.transcriptions.create(
-                    model=self.model,
-                    file=audio_file,
-                    language=self.language,
-                    response_format="text"
-                )
+            response = self.client.audio.transcriptions.create(
+                model=self.model,
+                file=wav_file,
+                language=self.language,
+                response_format="text"
+            )
             
             # 응답에서 텍스트 추출
             transcribed_text = response.strip()
@@ -151,54 +109,40 @@ class WhisperService:
         except Exception as e:
             self.logger.error(f"Whisper API 호출 실패: {e}")
             return None
-        
-        finally:
-            # 임시 파일 정리
-            if temp_file_path:
-                self._cleanup_temp_file(temp_file_path)
     
-    def _update_macro_cache(self):
+    def transcribe_audio(self, audio_data: np.ndarray, sample_rate: Optional[int] = None) -> Optional[str]:
         """
-        매크로 캐시 업데이트 (성능 최적화)
+        오디오 데이터를 OpenAI Whisper API로 텍스트로 변환
+        
+        Args:
+            audio_data (np.ndarray): 오디오 데이터 배열
+            sample_rate (int): 오디오 데이터의 샘플레이트 (기본값: Whisper 샘플레이트)
+            
+        Returns:
+            Optional[str]: 변환된 텍스트, 실패 시 None
         """
         try:
-            # 5분마다 캐시 갱신
-            now = datetime.now()
-            if (self._cache_last_updated is None or 
-                (now - self._cache_last_updated).seconds > 300):
-                
-                self._macro_cache = macro_service.get_all_macros()
-                self._cache_last_updated = now
-                self.logger.debug(f"매크로 캐시 갱신 완료: {len(self._macro_cache)}개")
-                
+            wav_file = self._encode_audio(audio_data, sample_rate or self.sample_rate)
         except Exception as e:
-            self.logger.error(f"매크로 캐시 갱신 실패: {e}")
+            self.logger.error(f"오디오 변환 실패: {e}")
+            return None
+        
+        return self._transcribe_wav(wav_file)
     
-    def _calculate_similarity(self, text1: str, text2: str) -> float:
+    def transcribe_pcm16(self, pcm: bytes, sample_rate: int) -> Optional[str]:
         """
-        두 텍스트 간의 유사도 계산
+        PCM16 모노 오디오를 OpenAI Whisper API로 텍스트로 변환 (Socket.IO 클라이언트 오디오용)
         
         Args:
-            text1 (str): 첫 번째 텍스트
-            text2 (str): 두 번째 텍스트
+            pcm (bytes): PCM16 리틀 엔디언 모노 오디오
+            sample_rate (int): 샘플레이트 (Hz)
             
         Returns:
-            float: 유사도 (0.0 ~ 1.0)
+            Optional[str]: 변환된 텍스트, 실패 시 None
         """
-        # 공백 제거 및 소문자 변환
-        clean_text1 = text1.strip().lower()
-        clean_text2 = text2.strip().lower()
-        
-        # SequenceMatcher를 사용한 유사도 계산
-        similarity = SequenceMatcher(None, clean_text1, clean_text2).ratio()
-        
-        # 완전 일치나 부분 일치 보너스
-        if clean_text1 == clean_text2:
-            similarity = 1.0
-        elif clean_text1 in clean_text2 or clean_text2 in clean_text1:
-            similarity = max(similarity, 0.8)
-        
-        return similarity
+        # Whisper 샘플레이트로 변환하여 업로드 크기도 줄임
+        samples = np.frombuffer(pcm, dtype='<i2', count=len(pcm) // 2)
+        return self._transcribe_wav(encode_wav(resample(samples, sample_rate, self.sample_rate), self.sample_rate))
     
     def find_matching_macros(self, recognized_text: str) -> List[Dict]:
         """
@@ -214,39 +158,27 @@ class WhisperService:
             return []
         
         try:
-            # 매크로 캐시 업데이트
-            self._update_macro_cache()
-            
-            matches = []
             recognized_text = recognized_text.strip()
             
-            # 각 매크로와 유사도 계산
-            for macro in self._macro_cache:
-                if not macro.get('voice_command'):
-                    continue
-                
-                voice_command = macro['voice_command']
-                similarity = self._calculate_similarity(recognized_text, voice_command)
-                
-                # 임계값 이상인 경우만 추가
-                if similarity >= config.MATCHING_THRESHOLD:
-                    match_result = {
-                        'macro_id': macro['id'],
-                        'macro_name': macro['name'],
-                        'voice_command': voice_command,
-                        'action_type': macro['action_type'],
-                        'key_sequence': macro['key_sequence'],
-                        'similarity': similarity,
-                        'confidence': similarity * 100,  # 퍼센트로 변환
-                        'settings': macro.get('settings', {})
-                    }
-                    matches.append(match_result)
-            
-            # 유사도 순으로 정렬 (높은 순)
-            matches.sort(key=lambda x: x['similarity'], reverse=True)
+            # 공용 매칭 엔진으로 매칭 (임계값/최대 개수는 Whisper 설정 사용)
+            engine_matches = self.matching_engine.match(
+                recognized_text, config.MATCHING_THRESHOLD, config.MAX_MATCH_RESULTS
+            )
+            macros_by_id = self.matching_engine.macro_index.get_snapshot().by_id
             
-            # 최대 결과 개수 제한
-            matches = matches[:config.MAX_MATCH_RESULTS]
+            matches = []
+            for match in engine_matches:
+                macro = macros_by_id.get(match.macro_id, {})
+                matches.append({
+                    'macro_id': match.macro_id,
+                    'macro_name': match.macro_name,
+                    'voice_command': match.voice_command,
+                    'action_type': match.action_type,
+                    'key_sequence': match.key_sequence,
+                    'similarity': match.similarity,
+                    'confidence': match.similarity * 100,  # 퍼센트로 변환
+                    'settings': macro.get('settings', {})
+                })
             
             self.logger.info(f"매크로 매칭 완료: '{recognized_text}' -> {len(matches)}개 매칭")
             
@@ -256,13 +188,14 @@ class WhisperService:
             self.logger.error(f"매크로 매칭 실패: {e}")
             return []
     
-    def process_voice_command(self, audio_data: np.ndarray) -> Dict:
+    def process_voice_command(self, audio_data: np.ndarray, sample_rate: Optional[int] = None) -> Dict:
         """
         음성 명령 전체 처리 파이프라인
         오디오 -> 텍스트 변환 -> 매크로 매칭
         
         Args:
             audio_data (np.ndarray): 오디오 데이터
+            sample_rate (int): 오디오 데이터의 샘플레이트 (기본값: Whisper 샘플레이트)
             
         Returns:
             Dict: 처리 결과
@@ -280,7 +213,7 @@ class WhisperService:
         try:
             # 1단계: 음성-텍스트 변환
             self.logger.info("음성 인식 시작...")
-            recognized_text = self.transcribe_audio(audio_data)
+            recognized_text = self.transcribe_audio(audio_data, sample_rate)
             
             if not recognized_text:
                 result['error'] = '음성 인식에 실패했습니다.'
@@ -322,8 +255,8 @@ class WhisperService:
             'sample_rate': self.sample_rate,
             'temp_dir': config.TEMP_AUDIO_DIR,
             'temp_dir_exists': os.path.exists(config.TEMP_AUDIO_DIR),
-            'macro_cache_size': len(self._macro_cache),
-            'cache_last_updated': self._cache_last_updated.isoformat() if self._cache_last_updated else None
+            'macro_cache_size': self.matching_engine.macro_index.get_stats()['macro_count'],
+            'matching_engine': self.matching_engine.get_stats()
         }
 
 
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+VoiceMacro Pro - 오디오 콜백 마이크로 벤치마크 스크립트
+녹음 콜백이 블록(기본 100ms, 24kHz)마다 하는 작업(레벨 계산, 버퍼 저장, PCM16 변환)과
+업링크 메시지 조립의 블록당 CPU 시간(p50/p99)과 할당량을 기존 경로와 비교하고 JSON 리포트를 저장합니다.
+
+사용법:
+    python -m backend.tests.benchmark_audio_callback
+    python -m backend.tests.benchmark_audio_callback --blocks 5000 --output report.json
+"""
+
+import sys
+import json
+import time
+import queue
+import base64
+import argparse
+import platform
+import tracemalloc
+from datetime import datetime
+from typing import Any, Callable, Dict, Sequence
+
+import numpy as np
+
+from backend.utils.config import Config
+from backend.utils.audio_ring_buffer import AudioRingBuffer
+from backend.utils.pcm_encoder import Pcm16Encoder
+from backend.services.gpt4o_transcription_service import AUDIO_APPEND_PREFIX, AUDIO_APPEND_SUFFIX
+
+SAMPLE_RATE = 24000
+DEFAULT_BLOCKS = 2000
+DEFAULT_OUTPUT = 'benchmark_audio_callback_report.json'
+
+
+def _percentile(sorted_values: Sequence[float], percent: float) -> float:
+    """정렬된 값 목록의 백분위수 (최근접 순위 방식)"""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, int(round(percent / 100 * len(sorted_values))) - 1))
+    return sorted_values[rank]
+
+
+def generate_blocks(count: int, block_frames: int, seed: int = 1) -> np.ndarray:
+    """
+    sounddevice 콜백 형식((frames, 1) float32)의 합성 오디오 블록 생성
+
+    Args:
+        count (int): 서로 다른 블록 수 (측정 시 순환 사용)
+        block_frames (int): 블록당 프레임 수
+        seed (int): 난수 시드
+
+    Returns:
+        np.ndarray: (count, frames, 1) float32 배열
+    """
+    rng = np.random.default_rng(seed)
+    return (rng.standard_normal((count, block_frames, 1)) * 0.2).astype(np.float32)
+
+
+def make_legacy_callback() -> Callable[[np.ndarray], Any]:
+    """기존 콜백 경로: 블록 복사 -> 제곱 평균 레벨 -> flatten/astype/tobytes 변환 -> 큐 저장"""
+    audio_queue = queue.Queue()
+
+    def callback(indata: np.ndarray):
+        audio_data = indata.copy()
+        audio_bytes = (audio_data.flatten() * 32767).astype(np.int16).tobytes()
+        level = min(1.0, np.sqrt(np.mean(audio_data ** 2)) * 10)
+        if not audio_queue.full():
+            audio_queue.put(audio_data)
+        if audio_queue.qsize() > 100:
+            audio_queue.get_nowait()
+        return audio_bytes, level
+
+    return callback
+
+
+def make_current_callback(block_frames: int) -> Callable[[np.ndarray], Any]:
+    """현재 콜백 경로: 첫 채널 뷰 -> 내적 레벨 -> 링 버퍼 저장 -> PCM16 슬롯 변환"""
+    ring = AudioRingBuffer(Config.AUDIO_BUFFER_SECONDS, SAMPLE_RATE)
+    encoder = Pcm16Encoder(block_frames)
+
+    def callback(indata: np.ndarray):
+        audio_data = indata[:, 0]
+        slot, audio_bytes = encoder.encode(audio_data)
+        level = min(1.0, float(np.sqrt(np.dot(audio_data, audio_data) / len(audio_data))) * 10)
+        ring.write(audio_data)
+        encoder.release(slot)  # 측정에서는 전송이 바로 끝난 것으로 간주
+        return audio_bytes, level
+
+    return callback
+
+
+def legacy_message(audio_bytes) -> str:
+    """기존 업링크 메시지 조립 (Base64 + json.dumps)"""
+    return json.dumps({"type": "input_audio_buffer.append", "audio": base64.b64encode(audio_bytes).decode('utf-8')})
+
+
+def current_message(audio_bytes) -> str:
+    """현재 업링크 메시지 조립 (Base64 + 고정 메시지 틀)"""
+    return AUDIO_APPEND_PREFIX + base64.b64encode(audio_bytes).decode('ascii') + AUDIO_APPEND_SUFFIX
+
+
+def measure(name: str, blocks: np.ndarray, count: int, step: Callable[[np.ndarray], Any],
+            block_ms: float) -> Dict[str, Any]:
+    """
+    블록마다 step을 실행하며 스레드 CPU 시간과 할당량 측정
+
+    Args:
+        name (str): 경로 이름
+        blocks (np.ndarray): 입력 블록 목록 (순환 사용)
+        count (int): 측정할 블록 수
+        step (Callable): 블록 하나를 처리하는 함수
+        block_ms (float): 블록 길이 (ms, 콜백 시간 예산)
+
+    Returns:
+        Dict: 측정 결과
+    """
+    for index in range(min(50, count)):
+        step(blocks[index % len(blocks)])
+
+    cpu_times = []
+    for index in range(count):
+        block = blocks[index % len(blocks)]
+        start = time.thread_time_ns()
+        step(block)
+        cpu_times.append((time.thread_time_ns() - start) / 1000)
+
+    # 할당량은 시간 측정과 분리하여 측정 (tracemalloc 자체 비용 제외)
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    base_current, _ = tracemalloc.get_traced_memory()
+    for index in range(min(200, count)):
+        step(blocks[index % len(blocks)])
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    cpu_times.sort()
+    mean_us = sum(cpu_times) / len(cpu_times) if cpu_times else 0.0
+    return {
+        'path': name,
+        'blocks': count,
+        'mean_us': mean_us,
+        'p50_us': _percentile(cpu_times, 50),
+        'p99_us': _percentile(cpu_times, 99),
+        'max_us': cpu_times[-1] if cpu_times else 0.0,
+        'budget_percent': mean_us / (block_ms * 1000) * 100 if block_ms else 0.0,
+        'peak_alloc_bytes': max(0, peak - base_current)
+    }
+
+
+def print_report(results: Sequence[Dict[str, Any]], block_frames: int, block_ms: float):
+    """측정 결과 표 출력"""
+    print(f"\n🎚️ 블록 {block_frames}프레임 ({block_ms:.0f}ms)")
+    print(f"   {'경로':<28}{'p50(us)':>10}{'p99(us)':>10}{'평균(us)':>10}{'예산(%)':>10}{'최대 할당(B)':>14}")
+    for result in results:
+        print(f"   {result['path']:<28}{result['p50_us']:>10.1f}{result['p99_us']:>10.1f}{result['mean_us']:>10.1f}"
+              f"{result['budget_percent']:>10.3f}{result['peak_alloc_bytes']:>14,}")
+
+
+def main(argv: Sequence[str] = ()):
+    """메인 벤치마크 함수"""
+    parser = argparse.ArgumentParser(description='VoiceMacro Pro 오디오 콜백 벤치마크')
+    parser.add_argument('--blocks', type=int, default=DEFAULT_BLOCKS, help='측정할 블록 수')
+    parser.add_argument('--block-ms', type=int, default=Config.GPT4O_BUFFER_SIZE_MS, help='블록 길이 (ms)')
+    parser.add_argument('--output', default=DEFAULT_OUTPUT, help='JSON 리포트 저장 경로')
+    args = parser.parse_args(list(argv))
+
+    block_frames = int(args.block_ms * SAMPLE_RATE / 1000)
+    blocks = generate_blocks(32, block_frames)
+
+    print("⏱️ === 오디오 콜백 벤치마크 ===")
+    print(f"   샘플레이트: {SAMPLE_RATE}Hz, 블록: {args.blocks}개")
+
+    legacy_callback = make_legacy_callback()
+    current_callback = make_current_callback(block_frames)
+    pcm_block = current_callback(blocks[0])[0]
+
+    results = [
+        measure('callback_legacy', blocks, args.blocks, legacy_callback, args.block_ms),
+        measure('callback_current', blocks, args.blocks, current_callback, args.block_ms),
+        measure('uplink_message_legacy', blocks, args.blocks, lambda _: legacy_message(pcm_block), args.block_ms),
+        measure('uplink_message_current', blocks, args.blocks, lambda _: current_message(pcm_block), args.block_ms)
+    ]
+    print_report(results, block_frames, args.block_ms)
+
+    # 두 경로의 변환 결과가 같은지 확인
+    identical = bytes(current_callback(blocks[1])[0]) == legacy_callback(blocks[1])[0]
+    print(f"\n   PCM16 변환 결과 일치: {'예' if identical else '아니오'}")
+
+    report = {
+        'benchmark': 'audio_callback',
+        'generated_at': datetime.now().isoformat(),
+        'environment': {
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'processor': platform.processor()
+        },
+        'settings': {
+            'sample_rate': SAMPLE_RATE,
+            'block_ms': args.block_ms,
+            'block_frames': block_frames,
+            'blocks': args.blocks
+        },
+        'pcm16_identical': identical,
+        'results': results
+    }
+
+    with open(args.output, 'w', encoding='utf-8') as report_file:
+        json.dump(report, report_file, ensure_ascii=False, indent=2)
+
+    print(f"\n💾 리포트 저장: {args.output}")
+    return True
+
+
+if __name__ == "__main__":
+    try:
+        success = main(sys.argv[1:])
+        sys.exit(0 if success else 1)
+    except KeyboardInterrupt:
+        print("\n⚠️ 벤치마크가 중단되었습니다.")
+        sys.exit(1)
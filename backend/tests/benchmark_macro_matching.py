@@ -0,0 +1,431 @@
+#!/usr/bin/env python3
+"""
+VoiceMacro Pro - 매크로 매칭 마이크로 벤치마크 스크립트
+한국어/영어 합성 매크로 목록(10 ~ 100,000개)과 잡음이 섞인 인식 결과로
+각 매칭 경로의 지연 시간(p50/p99)과 처리량을 측정하고 JSON 리포트를 저장합니다.
+
+사용법:
+    python -m backend.tests.benchmark_macro_matching
+    python -m backend.tests.benchmark_macro_matching --sizes 10,1000 --queries 200 --output report.json
+"""
+
+import sys
+import json
+import time
+import random
+import logging
+import argparse
+import platform
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Sequence
+
+from backend.utils.config import config
+from backend.services.macro_index import MacroIndex
+from backend.services.macro_matching_service import MacroMatchingService
+from backend.services.speculative_matching_service import SpeculativeMatchingService
+from backend.services.usage_prior import UsagePrior
+from backend.services.voice_analysis_service import VoiceAnalysisService
+
+DEFAULT_SIZES = (10, 100, 1000, 10000, 100000)
+DEFAULT_QUERIES = 200
+DEFAULT_OUTPUT = 'benchmark_macro_matching_report.json'
+
+# 이보다 큰 매크로 목록에서는 명령어 목록 매칭(VoiceAnalysisService) 측정 생략
+MAX_COMMAND_LIST_SIZE = 10000
+
+# 합성 명령어 재료
+KO_NOUNS = ['공격', '방어', '스킬', '포션', '점프', '달리기', '가방', '인벤토리', '지도', '퀘스트',
+            '무기', '방패', '마법', '화살', '궁극기', '회복', '버프', '탈것', '소환', '귀환']
+KO_VERBS = ['', '사용', '열기', '닫기', '하기', '시작', '중지', '바꾸기', '마시기', '발사', '하나', '둘', '셋']
+EN_NOUNS = ['attack', 'jump', 'skill', 'potion', 'map', 'heal', 'dash', 'reload', 'sprint', 'shield']
+EN_VERBS = ['', 'one', 'two', 'three', 'on', 'off', 'now', 'up']
+FILLERS = ['음', '어', '그', '좀', 'um', 'uh']
+SUFFIXES = ['요', '해', '해줘', '이야', ' 좀']
+
+# 음성 인식에서 자주 혼동되는 자모 (초성/중성 인덱스)
+CONFUSABLE_CHOSEONG = {0: 15, 15: 0, 3: 16, 16: 3, 7: 17, 17: 7, 12: 14, 14: 12}   # ㄱ/ㅋ, ㄷ/ㅌ, ㅂ/ㅍ, ㅈ/ㅊ
+CONFUSABLE_JUNGSEONG = {4: 8, 8: 4, 1: 5, 5: 1, 13: 18, 18: 13}                  # ㅓ/ㅗ, ㅐ/ㅔ, ㅜ/ㅡ
+
+
+def generate_macros(count: int, seed: int = 1) -> List[Dict[str, Any]]:
+    """
+    한국어/영어 혼합 합성 매크로 목록 생성
+
+    Args:
+        count (int): 매크로 수
+        seed (int): 난수 시드
+
+    Returns:
+        List[Dict]: macro_service.get_all_macros() 형식의 매크로 목록 (이름 오름차순)
+    """
+    rnd = random.Random(seed)
+    macros = []
+    seen = set()
+
+    while len(macros) < count:
+        if rnd.random() < 0.7:
+            parts = [rnd.choice(KO_NOUNS), rnd.choice(KO_VERBS)]
+        else:
+            parts = [rnd.choice(EN_NOUNS), rnd.choice(EN_VERBS)]
+        if rnd.random() < 0.3:
+            parts.append(str(rnd.randint(1, 99)))
+
+        voice_command = ' '.join(part for part in parts if part)
+        if voice_command in seen:
+            voice_command = f"{voice_command} {len(macros)}"
+        seen.add(voice_command)
+
+        macro_id = len(macros) + 1
+        macros.append({
+            'id': macro_id,
+            'name': f'매크로 {macro_id:06d}',
+            'voice_command': voice_command,
+            'action_type': 'combo',
+            'key_sequence': 'Q',
+            'settings': {},
+            'usage_count': 0
+        })
+
+    return macros
+
+
+def _confuse_syllable(char: str, rnd: random.Random) -> str:
+    """한글 음절의 초성 또는 중성을 혼동하기 쉬운 자모로 변경"""
+    code = ord(char) - 0xAC00
+    if not 0 <= code < 11172:
+        return char
+
+    choseong, rest = divmod(code, 21 * 28)
+    jungseong, jongseong = divmod(rest, 28)
+    if rnd.random() < 0.5 and choseong in CONFUSABLE_CHOSEONG:
+        choseong = CONFUSABLE_CHOSEONG[choseong]
+    elif jungseong in CONFUSABLE_JUNGSEONG:
+        jungseong = CONFUSABLE_JUNGSEONG[jungseong]
+    return chr(0xAC00 + (choseong * 21 + jungseong) * 28 + jongseong)
+
+
+def generate_transcripts(macros: Sequence[Dict[str, Any]], count: int, seed: int = 2) -> List[str]:
+    """
+    잡음이 섞인 음성 인식 결과 생성
+
+    정확한 명령어, 끝 글자 누락, 어미/불용어 추가, 띄어쓰기 변화,
+    자모 혼동(ㅓ/ㅗ, ㄱ/ㅋ 등), 등록되지 않은 문장을 섞습니다.
+
+    Args:
+        macros (Sequence[Dict]): 매크로 목록
+        count (int): 생성할 인식 결과 수
+        seed (int): 난수 시드
+
+    Returns:
+        List[str]: 인식 결과 목록
+    """
+    rnd = random.Random(seed)
+    transcripts = []
+
+    while len(transcripts) < count:
+        command = rnd.choice(macros)['voice_command']
+        roll = rnd.random()
+
+        if roll < 0.25:
+            transcript = command
+        elif roll < 0.40:
+            transcript = command[:max(1, len(command) - 1)]
+        elif roll < 0.55:
+            transcript = command + rnd.choice(SUFFIXES)
+        elif roll < 0.65:
+            transcript = f"{rnd.choice(FILLERS)} {command}"
+        elif roll < 0.75:
+            transcript = command.replace(' ', '') if ' ' in command else ' '.join(command)
+        elif roll < 0.90:
+            chars = list(command)
+            position = rnd.randrange(len(chars))
+            chars[position] = _confuse_syllable(chars[position], rnd)
+            transcript = ''.join(chars)
+        else:
+            transcript = rnd.choice(['알 수 없는 명령어', '오늘 날씨 어때', 'hello there', '음'])
+
+        transcripts.append(transcript)
+
+    return transcripts
+
+
+def _percentile(sorted_values: Sequence[float], percent: float) -> float:
+    """정렬된 값 목록의 백분위수 (최근접 순위 방식)"""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, int(round(percent / 100 * len(sorted_values))) - 1))
+    return sorted_values[rank]
+
+
+def measure(name: str, corpus_size: int, transcripts: Sequence[str],
+            matcher: Callable[[str], Any]) -> Dict[str, Any]:
+    """
+    인식 결과 하나씩 매칭하며 지연 시간 측정
+
+    Args:
+        name (str): 매칭 경로 이름
+        corpus_size (int): 매크로 수
+        transcripts (Sequence[str]): 인식 결과 목록
+        matcher (Callable): 인식 결과를 받아 매칭 결과를 반환하는 함수
+
+    Returns:
+        Dict: 측정 결과
+    """
+    latencies = []
+    matched = 0
+
+    total_start = time.perf_counter()
+    for transcript in transcripts:
+        start_time = time.perf_counter()
+        result = matcher(transcript)
+        latencies.append((time.perf_counter() - start_time) * 1000)
+        if result:
+            matched += 1
+    total_seconds = time.perf_counter() - total_start
+
+    latencies.sort()
+    return {
+        'matcher': name,
+        'corpus_size': corpus_size,
+        'queries': len(transcripts),
+        'matched': matched,
+        'mean_ms': sum(latencies) / len(latencies) if latencies else 0.0,
+        'p50_ms': _percentile(latencies, 50),
+        'p90_ms': _percentile(latencies, 90),
+        'p99_ms': _percentile(latencies, 99),
+        'max_ms': latencies[-1] if latencies else 0.0,
+        'throughput_qps': len(transcripts) / total_seconds if total_seconds > 0 else 0.0
+    }
+
+
+def measure_batch(name: str, corpus_size: int, transcripts: Sequence[str],
+                  batch_matcher: Callable[[Sequence[str]], List[Any]]) -> Dict[str, Any]:
+    """
+    인식 결과 전체를 한 번에 매칭하며 처리량 측정 (p50/p99는 입력당 평균값)
+
+    Args:
+        name (str): 매칭 경로 이름
+        corpus_size (int): 매크로 수
+        transcripts (Sequence[str]): 인식 결과 목록
+        batch_matcher (Callable): 인식 결과 목록을 받아 결과 목록을 반환하는 함수
+
+    Returns:
+        Dict: 측정 결과
+    """
+    start_time = time.perf_counter()
+    results = batch_matcher(transcripts)
+    total_seconds = time.perf_counter() - start_time
+
+    mean_ms = total_seconds * 1000 / len(transcripts) if transcripts else 0.0
+    return {
+        'matcher': name,
+        'corpus_size': corpus_size,
+        'queries': len(transcripts),
+        'matched': sum(1 for result in results if result),
+        'mean_ms': mean_ms,
+        'p50_ms': mean_ms,
+        'p90_ms': mean_ms,
+        'p99_ms': mean_ms,
+        'max_ms': mean_ms,
+        'throughput_qps': len(transcripts) / total_seconds if total_seconds > 0 else 0.0
+    }
+
+
+def measure_agreement(reference: Sequence[Sequence[Any]], candidate: Sequence[Sequence[Any]]) -> Dict[str, float]:
+    """
+    두 매칭 경로 결과의 일치율 계산
+
+    Args:
+        reference (Sequence[Sequence]): 기준 경로의 입력별 매칭 결과 (MacroMatch 목록)
+        candidate (Sequence[Sequence]): 비교 경로의 입력별 매칭 결과 (MacroMatch 목록)
+
+    Returns:
+        Dict: {'top1': 최고 결과 일치율, 'matched': 매칭 여부 일치율, 'overlap': 결과 집합 평균 Jaccard}
+    """
+    if not reference:
+        return {'top1': 0.0, 'matched': 0.0, 'overlap': 0.0}
+
+    top1 = matched = overlap = 0.0
+    for expected, actual in zip(reference, candidate):
+        expected_ids = [match.macro_id for match in expected]
+        actual_ids = [match.macro_id for match in actual]
+        top1 += expected_ids[:1] == actual_ids[:1]
+        matched += bool(expected_ids) == bool(actual_ids)
+        union = set(expected_ids) | set(actual_ids)
+        overlap += len(set(expected_ids) & set(actual_ids)) / len(union) if union else 1.0
+
+    return {
+        'top1': top1 / len(reference),
+        'matched': matched / len(reference),
+        'overlap': overlap / len(reference)
+    }
+
+
+def run_corpus(corpus_size: int, query_count: int) -> Dict[str, Any]:
+    """
+    매크로 수 하나에 대해 모든 매칭 경로 측정
+
+    Args:
+        corpus_size (int): 매크로 수
+        query_count (int): 인식 결과 수
+
+    Returns:
+        Dict: {'corpus_size', 'index_build_ms', 'results'}
+    """
+    macros = generate_macros(corpus_size)
+    transcripts = generate_transcripts(macros, query_count)
+
+    index = MacroIndex(loader=lambda: macros)
+    start_time = time.perf_counter()
+    snapshot = index.get_snapshot()
+    index_build_ms = (time.perf_counter() - start_time) * 1000
+
+    matching_service = MacroMatchingService(index)
+    engine = matching_service.engine
+
+    # 인덱스 파생 데이터(n-gram 색인, 오토마톤)는 첫 매칭에서 만들어지므로 미리 준비
+    warmup_start = time.perf_counter()
+    engine.match(transcripts[0], matching_service.similarity_threshold, matching_service.max_results)
+    warmup_ms = (time.perf_counter() - warmup_start) * 1000
+
+    results = []
+
+    # REST 경로 (결과 캐시 없이 / 반복 명령어 캐시 적중)
+    engine.match_cache_size = 0
+    results.append(measure('macro_matching_service', corpus_size, transcripts,
+                           matching_service.find_matching_macros))
+    engine.match_cache_size = 512
+    engine.clear_match_cache()
+    matching_service.find_matching_macros(transcripts[0])
+    results.append(measure('macro_matching_service_cached', corpus_size, [transcripts[0]] * len(transcripts),
+                           matching_service.find_matching_macros))
+
+    # 게임 세션처럼 소수의 매크로가 반복되는 경우 (사용 빈도 빠른 경로)
+    engine.match_cache_size = 0
+    engine.usage_prior = UsagePrior()
+    hot_macros = macros[:5]
+    for macro in hot_macros:
+        engine.usage_prior.record(macro['id'])
+    session_transcripts = generate_transcripts(hot_macros, len(transcripts) * 4 // 5) + \
+        transcripts[:len(transcripts) // 5]
+    random.Random(3).shuffle(session_transcripts)
+    results.append(measure('macro_matching_service_hot_session', corpus_size, session_transcripts,
+                           matching_service.find_matching_macros))
+    engine.usage_prior.clear()
+    
+    # Whisper 경로 임계값/최대 개수로 같은 엔진 사용
+    engine.clear_match_cache()
+    engine.match_cache_size = 0
+    results.append(measure('whisper_threshold', corpus_size, transcripts,
+                           lambda text: engine.match(text, config.MATCHING_THRESHOLD, config.MAX_MATCH_RESULTS)))
+
+    # TF-IDF 계산기 (행렬-벡터 곱 한 번) - 속도와 현재 계산기 결과와의 일치율
+    threshold, max_results = matching_service.similarity_threshold, matching_service.max_results
+    reference = [engine.match(text, threshold, max_results) for text in transcripts]
+    scorer = engine.string_scorer
+    engine.set_string_scorer('tfidf')
+    engine.warm_up(snapshot)
+    tfidf_result = measure('tfidf_scorer', corpus_size, transcripts,
+                           lambda text: engine.match(text, threshold, max_results))
+    tfidf_result['agreement'] = measure_agreement(
+        reference, [engine.match(text, threshold, max_results) for text in transcripts]
+    )
+    tfidf_result['agreement']['reference_scorer'] = scorer
+    results.append(tfidf_result)
+    engine.set_string_scorer(scorer)
+    
+    # 배치 매칭 (로그 재생)
+    results.append(measure_batch('match_batch', corpus_size, transcripts, matching_service.match_batch))
+
+    # 부분 인식 결과 선행 매칭 (접두사 트라이)
+    speculative_service = SpeculativeMatchingService(index)
+    speculative_service.arm_timeout = 0.0
+    results.append(measure('speculative_partial', corpus_size, transcripts,
+                           lambda text: speculative_service.on_partial('benchmark', text)['action'] != 'none'))
+
+    # 임의 명령어 목록 매칭 (VoiceAnalysisService)
+    if corpus_size <= MAX_COMMAND_LIST_SIZE:
+        voice_analysis = VoiceAnalysisService()
+        commands = [macro['voice_command'] for macro in macros]
+        voice_analysis.find_similar_commands(transcripts[0], commands)
+        results.append(measure('voice_analysis', corpus_size, transcripts,
+                               lambda text: voice_analysis.find_similar_commands(text, commands)))
+
+    return {
+        'corpus_size': corpus_size,
+        'entry_count': len(snapshot.entries),
+        'matching_settings': matching_service.get_matching_stats()['settings'],
+        'index_build_ms': index_build_ms,
+        'warmup_ms': warmup_ms,
+        'results': results
+    }
+
+
+def print_report(corpus_report: Dict[str, Any]):
+    """측정 결과 표 출력"""
+    print(f"\n📚 매크로 {corpus_report['corpus_size']:,}개 "
+          f"(인덱스 구축 {corpus_report['index_build_ms']:.1f}ms, 첫 매칭 {corpus_report['warmup_ms']:.1f}ms)")
+    print(f"   {'매칭 경로':<36}{'p50(ms)':>10}{'p99(ms)':>10}{'평균(ms)':>10}{'처리량(q/s)':>14}{'매칭':>8}")
+    for result in corpus_report['results']:
+        print(f"   {result['matcher']:<36}{result['p50_ms']:>10.3f}{result['p99_ms']:>10.3f}"
+              f"{result['mean_ms']:>10.3f}{result['throughput_qps']:>14.1f}"
+              f"{result['matched']:>5}/{result['queries']}")
+        if 'agreement' in result:
+            agreement = result['agreement']
+            print(f"   {'':<36}{agreement['reference_scorer']} 대비 일치율: 최고 결과 {agreement['top1']:.1%}, "
+                  f"매칭 여부 {agreement['matched']:.1%}, 결과 집합 {agreement['overlap']:.1%}")
+
+
+def main(argv: Sequence[str] = ()):
+    """메인 벤치마크 함수"""
+    parser = argparse.ArgumentParser(description='VoiceMacro Pro 매크로 매칭 벤치마크')
+    parser.add_argument('--sizes', default=','.join(str(size) for size in DEFAULT_SIZES),
+                        help='쉼표로 구분한 매크로 수 목록')
+    parser.add_argument('--queries', type=int, default=DEFAULT_QUERIES, help='매크로 수별 인식 결과 수')
+    parser.add_argument('--output', default=DEFAULT_OUTPUT, help='JSON 리포트 저장 경로')
+    args = parser.parse_args(list(argv))
+
+    # 매 매칭마다 남는 INFO 로그는 측정을 왜곡하므로 끔
+    logging.disable(logging.INFO)
+
+    sizes = [int(size) for size in args.sizes.split(',') if size.strip()]
+    print("⏱️ === 매크로 매칭 벤치마크 ===")
+    print(f"   매크로 수: {sizes}, 인식 결과: {args.queries}개")
+
+    corpora = []
+    for corpus_size in sizes:
+        corpus_report = run_corpus(corpus_size, args.queries)
+        print_report(corpus_report)
+        corpora.append(corpus_report)
+
+    report = {
+        'benchmark': 'macro_matching',
+        'generated_at': datetime.now().isoformat(),
+        'environment': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'processor': platform.processor()
+        },
+        'settings': {
+            'sizes': sizes,
+            'queries': args.queries,
+            'whisper_threshold': config.MATCHING_THRESHOLD,
+            'whisper_max_results': config.MAX_MATCH_RESULTS
+        },
+        'corpora': corpora
+    }
+
+    with open(args.output, 'w', encoding='utf-8') as report_file:
+        json.dump(report, report_file, ensure_ascii=False, indent=2)
+
+    print(f"\n💾 리포트 저장: {args.output}")
+    return True
+
+
+if __name__ == "__main__":
+    try:
+        success = main(sys.argv[1:])
+        sys.exit(0 if success else 1)
+    except KeyboardInterrupt:
+        print("\n⚠️ 벤치마크가 중단되었습니다.")
+        sys.exit(1)
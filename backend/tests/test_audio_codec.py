@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+VoiceMacro Pro - 업링크 오디오 코덱 테스트 스크립트
+μ-law/IMA-ADPCM 디코딩 정확도(샘플 단위 기준 구현과 비교), 압축률, 청크 독립성, 코덱 협상 테스트
+"""
+
+import sys
+import time
+import numpy as np
+from backend.utils.audio_codec import (
+    IMA_HEADER, IMA_INDEX_TABLE, IMA_STEP_TABLE, MULAW_DECODE_TABLE,
+    ImaAdpcmEncoder, decode_audio, decode_ima_adpcm, decode_mulaw, encode_mulaw, negotiate_codec
+)
+
+SAMPLE_RATE = 24000
+
+
+def _speech_like(seconds: float = 1.0) -> np.ndarray:
+    """음성 대용 PCM16 신호 (기본음 + 배음 + 잡음)"""
+    rng = np.random.default_rng(0)
+    t = np.arange(int(SAMPLE_RATE * seconds)) / SAMPLE_RATE
+    signal = 0.4 * np.sin(2 * np.pi * 180 * t) + 0.15 * np.sin(2 * np.pi * 540 * t)
+    return (signal * 32767 + rng.normal(0, 300, len(t))).astype(np.int16)
+
+
+def _snr_db(reference: np.ndarray, decoded: np.ndarray) -> float:
+    """신호 대 잡음비 (dB)"""
+    reference = reference.astype(np.float64)
+    noise = reference - decoded.astype(np.float64)
+    return 10 * np.log10(np.mean(reference ** 2) / np.mean(noise ** 2))
+
+
+def _reference_ima_decode(chunk: bytes) -> np.ndarray:
+    """샘플 단위로 반복하는 IMA-ADPCM 기준 디코더"""
+    predictor, index = IMA_HEADER.unpack_from(chunk)
+    step_table, index_table = IMA_STEP_TABLE.tolist(), IMA_INDEX_TABLE.tolist()
+    output = []
+    for byte in chunk[IMA_HEADER.size:]:
+        for code in (byte & 0x0F, byte >> 4):
+            step = step_table[index]
+            delta = step >> 3
+            if code & 4:
+                delta += step
+            if code & 2:
+                delta += step >> 1
+            if code & 1:
+                delta += step >> 2
+            predictor = max(-32768, min(32767, predictor - delta if code & 8 else predictor + delta))
+            index = max(0, min(88, index + index_table[code]))
+            output.append(predictor)
+    return np.array(output, dtype=np.int16)
+
+
+def test_mulaw():
+    """μ-law 인코딩/디코딩 테스트"""
+    print("📉 === μ-law 테스트 ===")
+
+    pcm = _speech_like()
+    encoded = encode_mulaw(pcm)
+    assert len(encoded) == len(pcm)  # 2:1
+
+    decoded = decode_mulaw(encoded)
+    assert decoded.dtype == np.int16
+    snr = _snr_db(pcm, decoded)
+    assert snr > 30, snr
+
+    # 모든 값에서 양자화 오차는 구간 폭 이내, 디코딩 값은 다시 같은 코드로 인코딩
+    every_value = np.arange(-32768, 32768).astype(np.int16)
+    assert np.abs(decode_mulaw(encode_mulaw(every_value)).astype(int) - every_value).max() <= 1024
+    assert np.array_equal(decode_mulaw(encode_mulaw(MULAW_DECODE_TABLE)), MULAW_DECODE_TABLE)
+    print(f"   SNR: {snr:.1f}dB")
+    print("✅ μ-law 확인")
+
+
+def test_ima_adpcm():
+    """IMA-ADPCM 벡터 디코딩 정확도와 청크 독립성 테스트"""
+    print("\n🗜️ === IMA-ADPCM 테스트 ===")
+
+    pcm = _speech_like()
+    encoder = ImaAdpcmEncoder()
+    chunks = [encoder.encode(pcm[start:start + 2400]) for start in range(0, len(pcm), 2400)]
+    assert all(len(chunk) == IMA_HEADER.size + 1200 for chunk in chunks)  # 4:1 + 헤더
+
+    decoded = np.concatenate([decode_ima_adpcm(chunk) for chunk in chunks])
+    reference = np.concatenate([_reference_ima_decode(chunk) for chunk in chunks])
+    assert np.array_equal(decoded, reference)
+    snr = _snr_db(pcm, decoded)
+    assert snr > 25, snr
+
+    # 임의 코드와 극단적인 시작 상태에서도 기준 구현과 같음 (예측값/스텝 범위 제한 포함)
+    rng = np.random.default_rng(1)
+    for predictor, index in [(32767, 88), (-32768, 88), (0, 0)]:
+        chunk = IMA_HEADER.pack(predictor, index) + rng.integers(0, 256, 4000, dtype=np.uint8).tobytes()
+        assert np.array_equal(decode_ima_adpcm(chunk), _reference_ima_decode(chunk))
+
+    # 청크마다 시작 상태가 있어 중간 청크가 빠져도 다음 청크는 그대로 디코딩
+    assert np.array_equal(decode_ima_adpcm(chunks[5]), decoded[5 * 2400:6 * 2400])
+
+    for bad in (b'\x00\x00', IMA_HEADER.pack(0, 89) + b'\x00'):
+        try:
+            decode_ima_adpcm(bad)
+            raise AssertionError("잘못된 청크가 허용됨")
+        except ValueError:
+            pass
+
+    start_time = time.perf_counter()
+    for chunk in chunks:
+        decode_ima_adpcm(chunk)
+    elapsed_us = (time.perf_counter() - start_time) / len(chunks) * 1e6
+    print(f"   SNR: {snr:.1f}dB, 100ms 청크 디코딩: {elapsed_us:.0f}µs")
+    print("✅ IMA-ADPCM 확인")
+
+
+def test_decode_audio_and_negotiation():
+    """코덱별 디코딩 진입점과 코덱 협상 테스트"""
+    print("\n🤝 === 디코딩/협상 테스트 ===")
+
+    pcm = _speech_like(0.1)
+    raw = pcm.tobytes()
+    view = decode_audio(raw, 'pcm16')
+    assert np.array_equal(view, pcm) and not view.flags.owndata  # 받은 버퍼를 그대로 사용
+    assert np.array_equal(decode_audio(encode_mulaw(pcm), 'mulaw'), decode_mulaw(encode_mulaw(pcm)))
+    assert len(decode_audio(ImaAdpcmEncoder().encode(pcm), 'ima_adpcm')) == len(pcm)
+
+    for data, codec in ((raw[:-1], 'pcm16'), (raw, 'opus')):
+        try:
+            decode_audio(data, codec)
+            raise AssertionError(f"잘못된 입력이 허용됨: {codec}")
+        except ValueError:
+            pass
+
+    server = ['ima_adpcm', 'mulaw', 'pcm16']
+    assert negotiate_codec(['pcm16', 'mulaw', 'ima_adpcm'], server) == 'ima_adpcm'
+    assert negotiate_codec(['MULAW', 'pcm16'], server) == 'mulaw'
+    assert negotiate_codec(['mulaw'], ['pcm16']) == 'pcm16'
+    assert negotiate_codec(None, server) == 'pcm16'
+    assert negotiate_codec(['opus'], server) == 'pcm16'
+    print("✅ 디코딩/협상 확인")
+
+
+def main():
+    """메인 테스트 함수"""
+    test_mulaw()
+    test_ima_adpcm()
+    test_decode_audio_and_negotiation()
+    print("\n🎉 오디오 코덱 테스트 완료!")
+    return True
+
+
+if __name__ == "__main__":
+    try:
+        success = main()
+        sys.exit(0 if success else 1)
+    except AssertionError as e:
+        print(f"\n❌ 테스트 실패: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+VoiceMacro Pro - 바이너리 오디오 프레임 테스트 스크립트
+프레임 헤더 해석, 복사 없는 오디오 뷰, 잘못된 프레임 거부, 시퀀스 손실/순서 뒤바뀜 검출 테스트
+"""
+
+import sys
+import numpy as np
+from backend.utils.audio_frame import (
+    AUDIO_FRAME_HEADER, SEQUENCE_MODULUS, FrameSequenceTracker, pack_audio_frame, parse_audio_frame
+)
+
+
+def test_parse_frames():
+    """바이너리/딕셔너리 프레임 해석 테스트"""
+    print("📦 === 프레임 해석 테스트 ===")
+
+    pcm = np.arange(-240, 240, dtype='<i2').tobytes()
+    packed = pack_audio_frame(7, 24000, pcm)
+    assert len(packed) == AUDIO_FRAME_HEADER.size + len(pcm)
+
+    frame = parse_audio_frame(packed)
+    assert (frame.sequence, frame.sample_rate, frame.format) == (7, 24000, 'pcm16')
+    assert frame.audio == pcm
+    assert frame.audio.obj is packed  # 받은 버퍼를 그대로 가리킴 (복사 없음)
+
+    frame = parse_audio_frame({'seq': 8, 'sample_rate': 24000, 'format': 'pcm16', 'audio': pcm})
+    assert frame.sequence == 8 and frame.audio.obj is pcm
+
+    # 잘못된 프레임은 ValueError
+    bad_frames = [
+        b'VM',                                                          # 헤더보다 짧음
+        b'XX' + packed[2:],                                             # 매직 불일치
+        pack_audio_frame(1, 24000, pcm)[:-1],                           # PCM16 홀수 길이
+        pack_audio_frame(1, 0, pcm),                                    # 샘플레이트 0
+        pack_audio_frame(1, 100003, pcm),                               # 지원하지 않는 샘플레이트
+        pack_audio_frame(1, (1 << 32) - 1, pcm),                        # u32 최댓값
+        AUDIO_FRAME_HEADER.pack(b'VM', 1, 99, 1, 24000) + pcm,          # 모르는 형식
+        {'seq': 1, 'sample_rate': 24000, 'audio': 'base64 문자열'},     # 바이너리가 아님
+        {'sample_rate': 24000, 'audio': pcm},                           # 시퀀스 없음
+        'audio'
+    ]
+    for bad in bad_frames:
+        try:
+            parse_audio_frame(bad)
+            raise AssertionError(f"잘못된 프레임이 허용됨: {bad!r:.40}")
+        except ValueError:
+            pass
+    print("✅ 프레임 해석 확인")
+
+
+def test_sequence_tracking():
+    """시퀀스 손실/순서 뒤바뀜/중복 검출 테스트"""
+    print("\n🔢 === 시퀀스 추적 테스트 ===")
+
+    tracker = FrameSequenceTracker()
+    statuses = [tracker.track(seq) for seq in [0, 1, 2, 5, 3, 6, 3, 6, 7]]
+    assert statuses == ['ok', 'ok', 'ok', 'gap', 'late', 'ok', 'duplicate', 'duplicate', 'ok'], statuses
+
+    stats = tracker.get_stats()
+    assert stats['lost'] == 1 and stats['reordered'] == 1 and stats['duplicates'] == 2
+    assert stats['next_sequence'] == 8
+    print(f"   통계: {stats}")
+
+    # u32 시퀀스가 한 바퀴 돌아도 순서대로 판정
+    tracker = FrameSequenceTracker()
+    last = SEQUENCE_MODULUS - 1
+    assert [tracker.track(seq) for seq in [last - 1, last, 0, 2, 1]] == ['ok', 'ok', 'ok', 'gap', 'late']
+    assert tracker.stats['lost'] == 0
+
+    # 손실이 기억 범위를 넘으면 최근 번호만 늦은 도착으로 인정
+    tracker = FrameSequenceTracker(max_missing=4)
+    tracker.track(0)
+    assert tracker.track(10) == 'gap' and tracker.stats['lost'] == 9
+    assert tracker.track(9) == 'late' and tracker.track(2) == 'duplicate'
+
+    # 새 녹음은 새 시퀀스로 시작
+    tracker.reset()
+    assert tracker.track(0) == 'ok' and tracker.track(1) == 'ok'
+    print("✅ 시퀀스 추적 확인")
+
+
+def main():
+    """메인 테스트 함수"""
+    test_parse_frames()
+    test_sequence_tracking()
+    print("\n🎉 오디오 프레임 테스트 완료!")
+    return True
+
+
+if __name__ == "__main__":
+    try:
+        success = main()
+        sys.exit(0 if success else 1)
+    except AssertionError as e:
+        print(f"\n❌ 테스트 실패: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+VoiceMacro Pro - 클라이언트별 작업 실행기 테스트 스크립트
+클라이언트 안 처리 순서, 클라이언트 간 공정성, 큐 넘침 정책(drop_oldest/coalesce), 통계 테스트
+"""
+
+import sys
+import time
+import threading
+from backend.services.client_task_executor import ClientTaskExecutor
+
+
+def _wait_idle(executor: ClientTaskExecutor, timeout: float = 5.0):
+    """대기/실행 중인 작업이 모두 끝날 때까지 대기"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        stats = executor.get_stats()
+        if stats['queued'] == 0 and stats['in_flight'] == 0:
+            return stats
+        time.sleep(0.01)
+    raise AssertionError(f"작업이 끝나지 않음: {executor.get_stats()}")
+
+
+def test_ordering_and_fairness():
+    """클라이언트 안에서는 제출 순서, 클라이언트 사이에서는 돌아가며 처리하는지 테스트"""
+    print("🔀 === 순서/공정성 테스트 ===")
+
+    results = []
+    lock = threading.Lock()
+
+    def handler(client_id, payload):
+        time.sleep(0.005)
+        with lock:
+            results.append((client_id, payload))
+
+    executor = ClientTaskExecutor('test', handler, workers=2, max_in_flight_per_client=1, max_queue_per_client=100)
+    for index in range(20):
+        executor.submit('busy', index)
+    executor.submit('quiet', 0)
+
+    stats = _wait_idle(executor)
+    executor.shutdown(timeout=1.0)
+
+    busy = [payload for client_id, payload in results if client_id == 'busy']
+    assert busy == list(range(20)), busy
+    # 다른 클라이언트가 20개를 쌓아도 조용한 클라이언트는 앞쪽에서 처리됨
+    assert [client_id for client_id, _ in results].index('quiet') < 3
+    assert stats['completed'] == 21 and stats['dropped'] == 0 and stats['clients'] == 0
+    print(f"   평균 대기: {stats['avg_wait_ms']:.1f}ms, 최대 대기: {stats['max_wait_ms']:.1f}ms")
+    print("✅ 순서/공정성 확인")
+
+
+def test_overflow_policies():
+    """큐가 넘쳤을 때 drop_oldest/coalesce 정책 테스트"""
+    print("\n🚰 === 큐 넘침 정책 테스트 ===")
+
+    gate = threading.Event()
+    started = threading.Event()
+    processed = []
+
+    def handler(client_id, payload):
+        started.set()
+        gate.wait(5.0)
+        processed.append(payload)
+
+    # drop_oldest: 실행 중 작업 1개 + 대기 2개만 남고 나머지는 오래된 순으로 버림
+    executor = ClientTaskExecutor('drop', handler, workers=1, max_queue_per_client=2, overflow_policy='drop_oldest')
+    executor.submit('a', 0)
+    assert started.wait(5.0)
+    for index in range(1, 6):
+        assert executor.submit('a', index)
+    assert executor.get_stats()['queued'] == 2
+    gate.set()
+    stats = _wait_idle(executor)
+    executor.shutdown(timeout=1.0)
+    assert processed == [0, 4, 5], processed
+    assert stats['dropped'] == 3 and stats['max_queue_depth'] == 2
+    print(f"   drop_oldest 처리: {processed}")
+
+    # coalesce: 넘친 작업을 마지막 대기 작업에 합침
+    gate.clear()
+    started.clear()
+    processed.clear()
+    executor = ClientTaskExecutor('coalesce', handler, workers=1, max_queue_per_client=2,
+                                  overflow_policy='coalesce', merge=lambda queued, new: queued + new)
+    executor.submit('a', b'0')
+    assert started.wait(5.0)
+    assert executor.submit('a', b'1') and executor.submit('a', b'2')
+    assert not executor.submit('a', b'3') and not executor.submit('a', b'4')
+    gate.set()
+    stats = _wait_idle(executor)
+    executor.shutdown(timeout=1.0)
+    assert processed == [b'0', b'1', b'234'], processed
+    assert stats['coalesced'] == 2 and stats['dropped'] == 0 and stats['completed'] == 3
+    print(f"   coalesce 처리: {processed}")
+
+    try:
+        ClientTaskExecutor('bad', handler, overflow_policy='newest')
+        raise AssertionError("지원하지 않는 정책이 허용됨")
+    except ValueError:
+        pass
+    print("✅ 큐 넘침 정책 확인")
+
+
+def test_failures_and_clear():
+    """처리 오류 집계와 클라이언트 대기 작업 정리 테스트"""
+    print("\n🧹 === 오류/정리 테스트 ===")
+
+    gate = threading.Event()
+    started = threading.Event()
+
+    def handler(client_id, payload):
+        if payload == 'fail':
+            raise RuntimeError("처리 실패")
+        started.set()
+        gate.wait(5.0)
+
+    executor = ClientTaskExecutor('clear', handler, workers=1, max_queue_per_client=10)
+    executor.submit('a', 'fail')
+    executor.submit('a', 'block')
+    assert started.wait(5.0)
+    for _ in range(3):
+        executor.submit('a', 'later')
+
+    assert executor.clear_client('a') == 3
+    gate.set()
+    stats = _wait_idle(executor)
+    executor.shutdown(timeout=1.0)
+    assert stats['failed'] == 1 and stats['completed'] == 1 and stats['dropped'] == 3
+    assert stats['clients'] == 0
+    print(f"   통계: {stats}")
+
+    # 실행 대기 중(작업 스레드가 아직 꺼내지 않은) 클라이언트를 정리해도 작업 스레드는 계속 동작
+    gate.clear()
+    started.clear()
+    processed = []
+
+    def recording_handler(client_id, payload):
+        if payload == 'block':
+            started.set()
+            gate.wait(5.0)
+        processed.append((client_id, payload))
+
+    executor = ClientTaskExecutor('clear-ready', recording_handler, workers=1, max_queue_per_client=10)
+    executor.submit('a', 'block')
+    assert started.wait(5.0)
+    executor.submit('b', 'queued')
+    assert executor.clear_client('b') == 1
+    gate.set()
+    executor.submit('c', 'later')
+    stats = _wait_idle(executor)
+    executor.shutdown(timeout=1.0)
+    assert processed == [('a', 'block'), ('c', 'later')], processed
+    assert not any(thread.is_alive() for thread in executor._threads)
+    assert stats['completed'] == 2 and stats['failed'] == 0 and stats['dropped'] == 1
+    print("✅ 오류/정리 확인")
+
+
+def main():
+    """메인 테스트 함수"""
+    test_ordering_and_fairness()
+    test_overflow_policies()
+    test_failures_and_clear()
+    print("\n🎉 작업 실행기 테스트 완료!")
+    return True
+
+
+if __name__ == "__main__":
+    try:
+        success = main()
+        sys.exit(0 if success else 1)
+    except AssertionError as e:
+        print(f"\n❌ 테스트 실패: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
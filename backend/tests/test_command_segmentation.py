@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+VoiceMacro Pro - 다중 명령어 발화 분할 테스트 스크립트
+트라이 최장 일치 분할, 연결어/문장 부호/불용어 처리, 남은 부분 유사도 매칭 테스트
+"""
+
+import sys
+from backend.services.macro_index import MacroIndex
+from backend.services.matching_engine import MatchingEngine
+from backend.services.command_segmentation_service import CommandSegmentationService
+from backend.utils.command_trie import CommandTrie
+
+
+def _create_service():
+    """테스트 매크로로 분할 서비스 생성"""
+    macros = [
+        {'id': 1, 'name': '공격', 'voice_command': '공격', 'action_type': 'combo', 'key_sequence': 'Q'},
+        {'id': 2, 'name': '점프', 'voice_command': '점프', 'action_type': 'combo', 'key_sequence': 'Space'},
+        {'id': 3, 'name': '포션', 'voice_command': '포션', 'action_type': 'combo', 'key_sequence': 'R'},
+        {'id': 4, 'name': '포션 마시기', 'voice_command': '포션 마시기', 'action_type': 'combo', 'key_sequence': 'R,R'},
+        {'id': 5, 'name': '스킬 하나', 'voice_command': '스킬 하나', 'action_type': 'combo', 'key_sequence': '1'},
+        {'id': 6, 'name': '스킬', 'voice_command': '스킬', 'action_type': 'combo', 'key_sequence': 'E'},
+        {'id': 7, 'name': '방어', 'voice_command': 'guard up', 'action_type': 'combo', 'key_sequence': 'G'},
+        {'id': 8, 'name': '회복', 'voice_command': '음, 회복!', 'action_type': 'combo', 'key_sequence': 'H'},
+    ]
+    service = CommandSegmentationService(MatchingEngine(MacroIndex(loader=lambda: macros)))
+    service.similarity_threshold = 0.6
+    return service
+
+
+def _ids(service, text):
+    """분할 결과의 매크로 ID 목록"""
+    return [segment.match.macro_id for segment in service.segment(text)]
+
+
+def test_longest_prefix():
+    """트라이 최장 접두사 검색 테스트"""
+    print("🌲 === 최장 접두사 테스트 ===")
+
+    trie = CommandTrie([('포션', 3), ('포션 마시기', 4)])
+    assert trie.longest_prefix('포션마시기점프')[0] == 5
+    assert trie.longest_prefix('포션마시점프')[0] == 2
+    assert trie.longest_prefix('점프포션', 2)[1] == [('포션', 3)]
+    assert trie.longest_prefix('점프') is None
+    print("✅ 최장 접두사 확인")
+
+
+def test_segmentation():
+    """연결어/문장 부호/연속 명령어 분할 테스트"""
+    print("\n🧩 === 발화 분할 테스트 ===")
+
+    service = _create_service()
+    cases = [
+        ('공격 그리고 점프 그리고 포션', [1, 2, 3]),
+        ('공격, 점프. 포션 마시기', [1, 2, 4]),
+        ('공격 점프', [1, 2]),
+        ('공격해 그다음에 점프', [1, 2]),
+        ('포션 마시기 그리고 스킬 하나', [4, 5]),
+        ('GUARD UP and then 공격', [7, 1]),
+        ('공격', [1]),
+        ('그리고', []),
+    ]
+    for text, expected in cases:
+        segments = service.segment(text)
+        print(f"   '{text}' -> {[(s.text, s.match.macro_name, s.source) for s in segments]}")
+        assert [segment.match.macro_id for segment in segments] == expected, text
+
+    # 구간 위치는 원본 텍스트 기준
+    segment = service.segment('공격 그리고  포션 마시기')[1]
+    assert (segment.start, segment.end, segment.text) == (8, 14, '포션 마시기')
+
+    # 명령어와 인식 결과 모두 매칭 엔진과 같은 정규화 (불용어/특수문자 제거) 후 트라이 일치
+    segments = service.segment('그거 공격 회복~ 점프')
+    assert [(s.match.macro_id, s.source) for s in segments] == [(1, 'trie'), (8, 'trie'), (2, 'trie')], segments
+    assert [s.text for s in segments] == ['공격', '회복', '점프']
+    print("✅ 발화 분할 확인")
+
+
+def test_fuzzy_fallback():
+    """남은 부분 유사도 매칭 테스트"""
+    print("\n🔍 === 유사도 매칭 테스트 ===")
+
+    service = _create_service()
+
+    # 오인식된 명령어는 매칭 엔진으로 보정
+    segments = service.segment('공격 그리고 점브')
+    assert [s.match.macro_id for s in segments] == [1, 2]
+    assert [s.source for s in segments] == ['trie', 'fuzzy']
+
+    # 구간 전체가 긴 명령어와 닮았으면 짧은 명령어로 나누지 않음
+    assert _ids(service, '스킬 하냐') == [5]
+
+    # 남은 부분이 작으면 구간 전체 매칭 없이 남은 부분만 매칭 (매칭 엔진 호출 1회)
+    engine_match = service.engine.match
+    calls = []
+    service.engine.match = lambda text, *args: calls.append(text) or engine_match(text, *args)
+    assert _ids(service, '포션 마시기 점브') == [4, 2]
+    assert calls == ['점브'], calls
+    service.engine.match = engine_match
+
+    # 매칭되지 않는 부분은 버림
+    assert _ids(service, '공격 그리고 아무말') == [1]
+    assert service.get_stats()['unmatched_spans'] >= 1
+
+    # 최대 명령어 수 제한
+    service.max_segments = 2
+    assert _ids(service, '공격 점프 포션') == [1, 2]
+
+    # 비활성화하면 분할하지 않음
+    service.enabled = False
+    assert service.segment('공격 점프') == []
+    print(f"   통계: {service.get_stats()}")
+    print("✅ 유사도 매칭 확인")
+
+
+def main():
+    """메인 테스트 함수"""
+    test_longest_prefix()
+    test_segmentation()
+    test_fuzzy_fallback()
+    print("\n🎉 다중 명령어 발화 분할 테스트 완료!")
+    return True
+
+
+if __name__ == "__main__":
+    try:
+        success = main()
+        sys.exit(0 if success else 1)
+    except AssertionError as e:
+        print(f"\n❌ 테스트 실패: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+VoiceMacro Pro - 비트 병렬 편집 거리 테스트 스크립트
+Levenshtein 거리 계산, 조기 제외, 문자열 유사도 계산기 전환 테스트
+"""
+
+import sys
+import random
+from backend.utils.edit_distance import levenshtein_distance, levenshtein_ratio
+from backend.services.macro_index import MacroIndex
+from backend.services.macro_matching_service import MacroMatchingService
+
+
+def _reference_distance(text1: str, text2: str) -> int:
+    """검증용 동적 계획법 편집 거리"""
+    previous = list(range(len(text2) + 1))
+    for i, char1 in enumerate(text1, 1):
+        current = [i]
+        for j, char2 in enumerate(text2, 1):
+            current.append(min(previous[j - 1] + (char1 != char2), previous[j] + 1, current[j - 1] + 1))
+        previous = current
+    return previous[-1]
+
+
+def test_levenshtein_distance():
+    """비트 병렬 편집 거리 정확성 테스트"""
+    print("📏 === 편집 거리 테스트 ===")
+
+    assert levenshtein_distance('kitten', 'sitting') == 3
+    assert levenshtein_distance('', '공격') == 2
+    assert levenshtein_distance('스킬 하나', '스킬 하나') == 0
+
+    rng = random.Random(42)
+    alphabet = 'ab공격스킬 '
+    for _ in range(2000):
+        text1 = ''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 10)))
+        text2 = ''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 10)))
+        expected = _reference_distance(text1, text2)
+        assert levenshtein_distance(text1, text2) == expected, (text1, text2)
+
+        # 상한을 넘으면 max_distance + 1 반환
+        max_distance = rng.randint(0, 6)
+        bounded = levenshtein_distance(text1, text2, max_distance)
+        assert bounded == (expected if expected <= max_distance else max_distance + 1)
+    print("✅ 동적 계획법 결과와 일치")
+
+
+def test_early_rejection():
+    """길이 상한 조기 제외 테스트"""
+    print("\n⏩ === 조기 제외 테스트 ===")
+
+    assert levenshtein_ratio('공격', '공격하기') == 0.5
+    # 임계값 미만이 확실하면 임계값 미만의 값만 보장
+    assert levenshtein_ratio('공격', '공격하기', min_ratio=0.8) < 0.8
+    assert levenshtein_ratio('공격하기', '공격하지', min_ratio=0.7) == 0.75
+    print("✅ 조기 제외 결과 일치")
+
+
+def test_scorer_switch():
+    """문자열 유사도 계산기 전환 테스트"""
+    print("\n🔀 === 계산기 전환 테스트 ===")
+
+    macros = [
+        {'id': 1, 'name': '공격', 'voice_command': '공격하기', 'action_type': 'combo', 'key_sequence': 'Q'},
+        {'id': 2, 'name': '방어', 'voice_command': '방어하기', 'action_type': 'combo', 'key_sequence': 'E'},
+    ]
+    matching_service = MacroMatchingService(MacroIndex(loader=lambda: macros))
+    matching_service.engine.use_phonetic_similarity = False
+    matching_service.set_similarity_threshold(0.5)
+
+    for scorer in ('sequence', 'levenshtein'):
+        assert matching_service.set_string_scorer(scorer)
+        results = matching_service.find_matching_macros('공격하지')
+        print(f"   {scorer}: {[(match.macro_id, round(match.similarity, 3)) for match in results]}")
+        assert results and results[0].macro_id == 1
+
+    assert not matching_service.set_string_scorer('unknown')
+    assert matching_service.get_matching_stats()['settings']['string_scorer'] == 'levenshtein'
+    print("✅ 계산기 전환 성공")
+
+
+def main():
+    """메인 테스트 함수"""
+    test_levenshtein_distance()
+    test_early_rejection()
+    test_scorer_switch()
+    print("\n🎉 편집 거리 테스트 완료!")
+    return True
+
+
+if __name__ == "__main__":
+    try:
+        success = main()
+        sys.exit(0 if success else 1)
+    except AssertionError as e:
+        print(f"\n❌ 테스트 실패: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
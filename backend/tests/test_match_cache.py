@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+VoiceMacro Pro - 매칭 결과 캐시 테스트 스크립트
+반복 명령어 캐시 적중, LRU 제거, 매크로/동의어 변경 시 무효화 테스트
+"""
+
+import sys
+import time
+from backend.services.macro_index import MacroIndex
+from backend.services.macro_matching_service import MacroMatchingService
+
+
+def _create_service():
+    """테스트용 매크로 목록으로 매칭 서비스 생성"""
+    macros = [
+        {'id': 1, 'name': '공격', 'voice_command': '공격', 'action_type': 'combo', 'key_sequence': 'Q'},
+        {'id': 2, 'name': '스킬 하나', 'voice_command': '스킬 하나', 'action_type': 'combo', 'key_sequence': '1'},
+    ]
+    index = MacroIndex(loader=lambda: list(macros))
+    return MacroMatchingService(index), index, macros
+
+
+def test_cache_hits():
+    """반복 명령어 캐시 적중 테스트"""
+    print("⚡ === 캐시 적중 테스트 ===")
+
+    matching_service, _, _ = _create_service()
+
+    first = matching_service.find_matching_macros('공격')
+    start_time = time.perf_counter()
+    second = matching_service.find_matching_macros('  공격 ')
+    elapsed_us = (time.perf_counter() - start_time) * 1000000
+
+    assert [m.macro_id for m in first] == [m.macro_id for m in second] == [1]
+    cache_stats = matching_service.get_matching_stats()['match_cache']
+    print(f"   캐시 적중 소요시간: {elapsed_us:.0f}us, 통계: {cache_stats}")
+    assert cache_stats['hits'] == 1 and cache_stats['misses'] == 1
+
+    # 임계값이 바뀌면 다른 키
+    matching_service.set_similarity_threshold(0.9)
+    matching_service.find_matching_macros('공격')
+    assert matching_service.get_matching_stats()['match_cache']['misses'] == 2
+    print("✅ 캐시 적중 확인")
+
+
+def test_lru_eviction():
+    """LRU 크기 제한 테스트"""
+    print("\n🗑️ === LRU 제거 테스트 ===")
+
+    matching_service, _, _ = _create_service()
+    matching_service.engine.match_cache_size = 2
+
+    for text in ['공격', '스킬', '하나']:
+        matching_service.find_matching_macros(text)
+    assert matching_service.get_matching_stats()['match_cache']['size'] == 2
+
+    # 가장 오래된 '공격'은 제거되어 다시 계산
+    matching_service.find_matching_macros('공격')
+    assert matching_service.get_matching_stats()['match_cache']['hits'] == 0
+    print("✅ LRU 제거 확인")
+
+
+def test_invalidation():
+    """매크로/동의어 변경 시 무효화 테스트"""
+    print("\n♻️ === 캐시 무효화 테스트 ===")
+
+    matching_service, index, macros = _create_service()
+
+    assert matching_service.find_matching_macros('포션') == []
+
+    # 매크로 추가 -> 인덱스 버전 증가 -> 새 결과
+    macros.append({'id': 3, 'name': '포션', 'voice_command': '포션', 'action_type': 'combo', 'key_sequence': 'R'})
+    index.invalidate("test")
+    assert [m.macro_id for m in matching_service.find_matching_macros('포션')] == [3]
+
+    # 동의어 추가 -> 캐시 초기화
+    assert matching_service.find_matching_macros('물약') == []
+    matching_service.add_synonym('포션', ['물약'])
+    assert [m.macro_id for m in matching_service.find_matching_macros('물약')] == [3]
+    print("✅ 캐시 무효화 확인")
+
+
+def main():
+    """메인 테스트 함수"""
+    test_cache_hits()
+    test_lru_eviction()
+    test_invalidation()
+    print("\n🎉 매칭 결과 캐시 테스트 완료!")
+    return True
+
+
+if __name__ == "__main__":
+    try:
+        success = main()
+        sys.exit(0 if success else 1)
+    except AssertionError as e:
+        print(f"\n❌ 테스트 실패: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
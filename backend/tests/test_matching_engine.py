@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+"""
+VoiceMacro Pro - 공용 매칭 엔진 테스트 스크립트
+부분 일치 후보 선별, 후보 선별과 전체 스캔 결과 일치, 큰 목록의 후보 수, 상위 k개 힙과 전체 정렬 결과 일치,
+임의 명령어 목록 매칭, 서비스 간 결과 일관성, TF-IDF 계산기 테스트
+"""
+
+import sys
+import math
+from backend.utils.phonetic_similarity import to_jamo
+from backend.utils.tfidf_index import TfidfIndex, tfidf_grams
+from backend.services.macro_index import MacroIndex
+from backend.services.matching_engine import MatchingEngine
+from backend.services.macro_matching_service import MacroMatchingService
+from backend.services.voice_analysis_service import VoiceAnalysisService
+from backend.tests.benchmark_macro_matching import generate_macros, generate_transcripts
+
+
+def _create_macros(count: int):
+    """후보 선별이 동작하도록 충분히 많은 테스트 매크로 생성"""
+    macros = [
+        {'id': 1, 'name': '포션', 'voice_command': '포션 마시기', 'action_type': 'combo', 'key_sequence': 'R'},
+        {'id': 2, 'name': '공격', 'voice_command': '공격', 'action_type': 'combo', 'key_sequence': 'Q'},
+    ]
+    for number in range(count):
+        macros.append({'id': 100 + number, 'name': f'매크로 {number}', 'voice_command': f'커맨드 {number}번',
+                       'action_type': 'combo', 'key_sequence': 'F1'})
+    return macros
+
+
+def test_partial_match():
+    """부분 일치 (한쪽이 다른 쪽을 포함) 테스트"""
+    print("🧩 === 부분 일치 테스트 ===")
+
+    engine = MatchingEngine(MacroIndex(loader=lambda: _create_macros(100)))
+    assert engine._use_pruning(engine.macro_index.get_snapshot(), 0.6)
+
+    # 입력이 명령어를 포함 / 명령어가 입력을 포함
+    for text, expected_id in [('지금 바로 공격 시작', 2), ('포션', 1)]:
+        matches = engine.match(text, 0.6, 5)
+        print(f"   '{text}' -> {[(m.voice_command, round(m.similarity, 2)) for m in matches]}")
+        assert matches and matches[0].macro_id == expected_id
+        assert matches[0].similarity >= engine.partial_match_similarity
+
+    # 후보 선별 결과는 전체 스캔과 같아야 함
+    engine.use_ngram_pruning = False
+    full_scan = [m.macro_id for m in engine.match('지금 바로 공격 시작', 0.6, 5)]
+    engine.use_ngram_pruning = True
+    assert full_scan == [m.macro_id for m in engine.match('지금 바로 공격 시작', 0.6, 5)]
+
+    # 한 글자 조각은 명령어에 포함되어도 부분 일치 점수를 받지 않음
+    engine = MatchingEngine(MacroIndex(loader=lambda: _create_macros(100) + [
+        {'id': 3, 'name': '방어', 'voice_command': '방어', 'action_type': 'combo', 'key_sequence': 'E'},
+        {'id': 4, 'name': '인벤토리', 'voice_command': '아이템창 열기', 'action_type': 'combo', 'key_sequence': 'I'},
+        {'id': 5, 'name': '스킬', 'voice_command': '스킬 사용', 'action_type': 'combo', 'key_sequence': 'W'},
+        {'id': 6, 'name': 'attack', 'voice_command': 'attack', 'action_type': 'combo', 'key_sequence': 'A'},
+    ]))
+    for text in ['어', '아', 't', '공', '스', '포']:
+        matches = engine.match(text, 0.6, 5)
+        assert matches == [], (text, [(m.voice_command, m.similarity) for m in matches])
+    assert engine.match('방어', 0.6, 1)[0].macro_id == 3
+    assert engine.match('스킬', 0.6, 1)[0].macro_id == 5
+    print("   한 글자 입력 -> 매칭 없음")
+
+    # 불용어만 있는 발화는 낮은 임계값에서도 어떤 경로로도 매칭되지 않음
+    for text in ['어', '아', '음', 'um', '어, 음...']:
+        assert engine._normalize_input(text) == ""
+        assert engine.match(text, 0.3, 5) == []
+        assert engine.match_commands(text, ['방어', '아이템창 열기'], 0.3, 5) == []
+    assert engine.match_batch(['어', '방어', 'um'], 0.3, 5)[0::2] == [[], []]
+    print("   불용어만 있는 발화 -> 매칭 없음")
+
+    # 부분 일치를 끄면 긴 입력은 매칭되지 않음
+    engine.partial_match_similarity = 0.0
+    assert engine.match('지금 바로 공격 시작', 0.6, 5) == []
+    print("✅ 부분 일치 확인")
+
+
+def _match_all(engine: MatchingEngine, texts, threshold: float):
+    """입력별 (매크로 ID, 유사도) 결과 목록"""
+    return [[(m.macro_id, m.similarity) for m in engine.match(text, threshold, 5)] for text in texts]
+
+
+def test_pruning_matches_full_scan():
+    """n-gram 후보 선별 결과가 전체 스캔과 같은지 임의 매크로 목록으로 테스트"""
+    print("\n🔍 === 후보 선별/전체 스캔 일치 테스트 ===")
+
+    macros = generate_macros(300, seed=5)
+    transcripts = generate_transcripts(macros, 80, seed=6)
+    engine = MatchingEngine(MacroIndex(loader=lambda: macros))
+    engine.use_usage_prior = False
+    engine.match_cache_size = 0
+
+    for scorer in ('sequence', 'levenshtein'):
+        engine.set_string_scorer(scorer)
+        for threshold in (0.3, 0.4, 0.5, 0.6, 0.7):
+            engine.use_ngram_pruning = False
+            full_scan = _match_all(engine, transcripts, threshold)
+            engine.use_ngram_pruning = True
+            assert _match_all(engine, transcripts, threshold) == full_scan, (scorer, threshold)
+            print(f"   {scorer} @ {threshold}: 매칭 {sum(1 for matches in full_scan if matches)}/{len(transcripts)}개 일치")
+    print("✅ 후보 선별/전체 스캔 일치 확인")
+
+
+def test_candidate_counts():
+    """큰 매크로 목록에서 후보 수가 실제로 임계값을 넘는 매크로 수에 가까운지 테스트"""
+    print("\n📏 === 후보 수/전체 스캔 비교 테스트 ===")
+
+    macros = generate_macros(10000, seed=11)
+    transcripts = generate_transcripts(macros, 30, seed=12)
+    engine = MatchingEngine(MacroIndex(loader=lambda: macros))
+    engine.use_usage_prior = False
+    engine.match_cache_size = 0
+    snapshot = engine.macro_index.get_snapshot()
+    threshold = 0.6
+
+    for scorer in ('sequence', 'levenshtein'):
+        engine.set_string_scorer(scorer)
+        selected_total = qualifying_total = 0
+        for text in transcripts:
+            engine.use_ngram_pruning = False
+            full_scan = engine.match(text, threshold, len(macros))
+            engine.use_ngram_pruning = True
+            candidate_ids = {entry.macro['id']
+                             for entry in engine._select_candidates(snapshot, engine._normalize_input(text), threshold)}
+            assert {match.macro_id for match in full_scan} <= candidate_ids, text
+            assert engine.match(text, threshold, len(macros)) == full_scan, text
+            selected_total += len(candidate_ids)
+            qualifying_total += len(full_scan)
+
+        # 단어가 겹치는 명령어도 하한을 적용하므로 후보는 임계값을 넘는 매크로 수의 몇 배 이내
+        print(f"   {scorer}: 입력당 후보 {selected_total / len(transcripts):.0f}개, "
+              f"임계값 이상 {qualifying_total / len(transcripts):.0f}개 (전체 {len(macros)}개)")
+        assert selected_total <= 3 * qualifying_total + 10 * len(transcripts), (selected_total, qualifying_total)
+    print("✅ 후보 수 확인")
+
+
+def test_batch_matches_full_scan():
+    """배치 매칭 결과가 입력별 전체 스캔과 같은지 임의 매크로 목록으로 테스트"""
+    print("\n📦 === 배치 매칭/전체 스캔 일치 테스트 ===")
+
+    macros = generate_macros(300, seed=5)
+    transcripts = generate_transcripts(macros, 80, seed=7)
+    engine = MatchingEngine(MacroIndex(loader=lambda: macros))
+    engine.use_usage_prior = False
+    engine.match_cache_size = 0
+
+    for scorer in ('sequence', 'levenshtein'):
+        engine.set_string_scorer(scorer)
+        for threshold in (0.3, 0.4, 0.6):
+            engine.use_ngram_pruning = False
+            full_scan = _match_all(engine, transcripts, threshold)
+            engine.use_ngram_pruning = True
+            batch = [[(m.macro_id, m.similarity) for m in matches]
+                     for matches in engine.match_batch(transcripts, threshold, 5)]
+            assert batch == full_scan, (scorer, threshold)
+            print(f"   {scorer} @ {threshold}: {len(transcripts)}개 일치")
+    print("✅ 배치 매칭/전체 스캔 일치 확인")
+
+
+def test_top_k_matches_full_sort():
+    """상위 k개 힙 + 상한 조기 제외 결과가 모든 매크로의 정확한 점수를 정렬한 결과와 같은지 테스트"""
+    print("\n🏆 === 상위 k개/전체 정렬 일치 테스트 ===")
+
+    macros = generate_macros(300, seed=5)
+    transcripts = generate_transcripts(macros, 80, seed=8)
+    engine = MatchingEngine(MacroIndex(loader=lambda: macros))
+    engine.use_usage_prior = False
+    engine.match_cache_size = 0
+    entries = engine.macro_index.get_snapshot().entries
+
+    for scorer in ('sequence', 'levenshtein'):
+        engine.set_string_scorer(scorer)
+
+        # 기준: 모든 항목의 정확한 점수 (조기 제외 없음)
+        exact_scores = []
+        for text in transcripts:
+            text_normalized = engine._normalize_input(text)
+            words, jamo = set(text_normalized.split()), to_jamo(text_normalized)
+            exact_scores.append([
+                max(engine._calculate_similarity_parts(text_normalized, words, entry.command_normalized,
+                                                       entry.command_tokens, jamo, entry.command_jamo),
+                    engine._get_bonus_similarity(text_normalized, entry))
+                if text_normalized else 0.0
+                for entry in entries
+            ])
+
+        for threshold in (0.3, 0.4, 0.5, 0.6):
+            for max_results in (1, 5):
+                for text, scores in zip(transcripts, exact_scores):
+                    ranked = sorted((position for position, score in enumerate(scores) if score >= threshold),
+                                    key=lambda position: -scores[position])[:max_results]
+                    expected = [(entries[position].macro['id'], scores[position]) for position in ranked]
+                    actual = [(m.macro_id, m.similarity) for m in engine.match(text, threshold, max_results)]
+                    assert actual == expected, (scorer, threshold, max_results, text)
+        print(f"   {scorer}: 임계값 0.3-0.6, 최대 결과 1/5개 모두 일치")
+    print("✅ 상위 k개/전체 정렬 일치 확인")
+
+
+def test_match_commands():
+    """임의 명령어 목록 매칭 테스트"""
+    print("\n📋 === 명령어 목록 매칭 테스트 ===")
+
+    engine = MatchingEngine(MacroIndex(loader=lambda: []))
+    commands = ['공격', '방어', '스킬 하나', '공격']
+
+    matches = engine.match_commands('공격', commands, 0.6, len(commands))
+    assert [m.macro_id for m in matches] == [0, 3]
+    assert engine.match_commands('', commands, 0.6, 5) == []
+
+    # VoiceAnalysisService도 같은 엔진으로 매칭
+    voice_analysis = VoiceAnalysisService()
+    similar = voice_analysis.find_similar_commands('공격!', commands)
+    print(f"   '공격!' -> {similar}")
+    assert similar[0] == ('공격', 1.0)
+    assert voice_analysis.find_similar_commands('때리기', ['공격'])[0][0] == '공격'
+    print("✅ 명령어 목록 매칭 확인")
+
+
+def test_shared_engine():
+    """서비스가 엔진 결과를 그대로 사용하는지 테스트"""
+    print("\n🔗 === 엔진 공유 테스트 ===")
+
+    macros = _create_macros(10)
+    matching_service = MacroMatchingService(MacroIndex(loader=lambda: macros))
+    engine = matching_service.engine
+
+    for text in ['공격', '포션', '커맨드 3번', '없는 명령어']:
+        service_ids = [m.macro_id for m in matching_service.find_matching_macros(text)]
+        engine_ids = [m.macro_id for m in engine.match(text, matching_service.similarity_threshold,
+                                                       matching_service.max_results)]
+        assert service_ids == engine_ids, text
+
+    # 엔진 캐시를 공유하므로 같은 입력은 캐시 적중
+    assert matching_service.get_matching_stats()['match_cache']['hits'] >= 4
+    print("✅ 엔진 공유 확인")
+
+
+def test_tfidf_scorer():
+    """TF-IDF 계산기 테스트"""
+    print("\n📐 === TF-IDF 계산기 테스트 ===")
+
+    # 희소 행렬-벡터 곱 결과는 직접 계산한 코사인 유사도와 같아야 함
+    texts = ['공격', '포션 마시기', '스킬 하나', 'attack now', '공격 하기']
+    index = TfidfIndex(texts)
+    for query in ['공격', '포션마시기', '스킬 하냐', 'atack now', '알 수 없음']:
+        grams = [tfidf_grams(text) for text in texts + [query]]
+        document_frequency = {}
+        for gram_counts in grams[:-1]:
+            for gram in gram_counts:
+                document_frequency[gram] = document_frequency.get(gram, 0) + 1
+
+        def vector(gram_counts):
+            weights = {gram: (1 + math.log(count)) * (math.log((1 + len(texts)) / (1 + document_frequency.get(gram, 0))) + 1)
+                       for gram, count in gram_counts.items()}
+            norm = math.sqrt(sum(weight * weight for weight in weights.values()))
+            return {gram: weight / norm for gram, weight in weights.items()}
+
+        query_vector = vector(grams[-1])
+        scores = index.scores(query)
+        for position, gram_counts in enumerate(grams[:-1]):
+            document_vector = vector(gram_counts)
+            expected = sum(weight * document_vector.get(gram, 0.0) for gram, weight in query_vector.items())
+            assert abs(scores[position] - expected) < 1e-9, (query, position)
+
+    assert [position for position, _ in index.top_k('공격', 2)] == [0, 4]
+    assert index.top_k('알 수 없음', 3) == []
+
+    # 엔진에서 계산기로 선택 (동의어/부분 일치 점수 유지)
+    engine = MatchingEngine(MacroIndex(loader=lambda: _create_macros(100)))
+    assert engine.set_string_scorer('tfidf')
+    assert engine.match('포션 마시기', 0.6, 5)[0].macro_id == 1
+    assert engine.match('커맨드 7 번', 0.6, 1)[0].macro_id == 107
+    assert engine.match('지금 바로 공격 시작', 0.6, 5)[0].similarity == engine.partial_match_similarity
+    assert engine.match('때리기', 0.6, 5)[0].macro_id == 2
+    assert [m.macro_id for m in engine.match_commands('공격', ['방어', '공격'], 0.6, 5)] == [1]
+    assert [[m.macro_id for m in result][:1] for result in engine.match_batch(['포션 마시기', '공격'], 0.6, 5)] == [[1], [2]]
+    print(f"   색인: {engine._get_tfidf_index(engine.macro_index.get_snapshot()).get_stats()}")
+    print("✅ TF-IDF 계산기 확인")
+
+
+def main():
+    """메인 테스트 함수"""
+    test_partial_match()
+    test_pruning_matches_full_scan()
+    test_candidate_counts()
+    test_batch_matches_full_scan()
+    test_top_k_matches_full_sort()
+    test_match_commands()
+    test_shared_engine()
+    test_tfidf_scorer()
+    print("\n🎉 공용 매칭 엔진 테스트 완료!")
+    return True
+
+
+if __name__ == "__main__":
+    try:
+        success = main()
+        sys.exit(0 if success else 1)
+    except AssertionError as e:
+        print(f"\n❌ 테스트 실패: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+VoiceMacro Pro - 자모 n-gram 역색인 테스트 스크립트
+한글 자모 분해, n-gram 생성, 후보 선별 기능, 후보 선별 하한의 정확성 테스트
+"""
+
+import sys
+import random
+import backend.utils.ngram_index as ngram_index
+from difflib import SequenceMatcher
+from backend.utils.hangul_utils import decompose_hangul, text_ngrams
+from backend.utils.ngram_index import NGramIndex, phonetic_ngrams
+from backend.utils.edit_distance import levenshtein_ratio
+from backend.utils.phonetic_similarity import to_jamo, phonetic_similarity_jamo
+
+
+def test_decompose_hangul():
+    """한글 자모 분해 테스트"""
+    print("🔤 === 한글 자모 분해 테스트 ===")
+
+    assert decompose_hangul('공격') == 'ㄱㅗㅇㄱㅕㄱ'
+    assert decompose_hangul('가') == 'ㄱㅏ'
+    assert decompose_hangul('skill 1') == 'skill 1'
+    assert decompose_hangul('') == ''
+    print("✅ 자모 분해 결과 일치")
+
+
+def test_text_ngrams():
+    """단어 경계 n-gram 생성 테스트"""
+    print("\n🧩 === n-gram 생성 테스트 ===")
+
+    # 한 글자 단어도 최소 한 개의 n-gram을 가져야 함
+    assert len(text_ngrams('1')) == 1
+    # 공백으로 나뉜 단어는 서로 n-gram을 공유하지 않음
+    assert text_ngrams('스킬 하나') == text_ngrams('스킬') | text_ngrams('하나')
+
+    # 후보 선별용 n-gram은 띄어쓰기와 혼동 자모(ㄱ/ㅋ, ㅓ/ㅗ, ㅐ/ㅔ) 차이를 무시
+    assert phonetic_ngrams('스킬 하나') == phonetic_ngrams('스킬하나')
+    assert phonetic_ngrams('공격') == phonetic_ngrams('콩걱')
+    assert phonetic_ngrams('개') == phonetic_ngrams('게')
+    assert phonetic_ngrams('') == set()
+    print("✅ n-gram 생성 결과 일치")
+
+
+def test_candidates():
+    """후보 선별 테스트"""
+    print("\n🎯 === 후보 선별 테스트 ===")
+
+    commands = ['공격', '스킬 사용', '포션 마시기', '가방 열기', '점프하기', 'attack', '스킬 사용 후 포션 마시고 점프']
+    index = NGramIndex(commands)
+
+    # 단어가 겹치면 단어 유사도만큼 문자열 하한이 낮아지지만, 낮아진 하한도 넘어야 후보
+    assert index.candidates('스킬', 0.5 / 0.7) == set()  # 단어 유사도 없이 0.7 * 문자열 >= 0.5
+    assert index.candidates('스킬', 0.5, word_weight=0.3) == {1}  # 실제 0.55
+    assert index.candidates('스킬', 0.6, word_weight=0.3) == set()
+    assert index.candidates('스킬 사용해', 0.7 / 0.7) == set()
+    assert index.candidates('스킬 사용해', 0.7, word_weight=0.3) == {1}  # 실제 0.736
+    # 단어가 겹치는 긴 명령어도 하한을 넘지 못하면 제외
+    assert index.candidates('포션 마시기 점프', 0.5, word_weight=0.3) == {2, 6}
+    assert index.candidates('포션 마시기 점프', 0.6, word_weight=0.3) == {2}
+    # 자모 한 개만 다른 오인식도 후보로 선별
+    assert 2 in index.candidates('포선 마시기', 0.857)
+    assert 5 in index.candidates('atack', 0.857)
+    # 공유 n-gram이 하한에 못 미치면 후보가 아님
+    assert index.candidates('방어', 0.857) == set()
+    assert index.candidates('포션 마시기 시작', 0.75) == {2}  # 실제 0.8
+    assert index.candidates('포션 마시기 시작', 0.857) == set()
+    # 길이가 같아도 공유 글자가 모자라면 제외 ('공격'과 문자열 유사도 0.5)
+    assert index.candidates('공방', 0.5, phonetic=False) == {0}
+    assert index.candidates('공방', 0.6, phonetic=False) == set()
+    # 넘을 수 없는 유사도면 단어가 겹쳐도 후보 없음
+    assert index.candidates('스킬 써', 1.2) == set()
+    assert index.candidates('스킬 써', 1.2, word_weight=0.3) == set()
+
+    stats = index.get_stats()
+    print(f"✅ 색인 통계: {stats}")
+    assert stats['documents'] == len(commands)
+
+
+def test_batch_candidates():
+    """행렬 곱 배치 후보 선별 테스트"""
+    print("\n📦 === 배치 후보 선별 테스트 ===")
+
+    commands = ['공격', '스킬 사용', '포션 마시기', '가방 열기', '점프하기', 'attack']
+    index = NGramIndex(commands)
+    texts = ['스킬', '포선 마시기', 'atack', '방어', '', '점프 하기']
+
+    for min_similarity in (0.43, 0.57, 0.71, 0.857, 1.0):
+        for scorer in ('sequence', 'levenshtein'):
+            for phonetic in (True, False):
+                for word_weight in (0.0, 0.3):
+                    batch = index.batch_candidates(texts, min_similarity, scorer, phonetic, word_weight)
+                    assert batch == [index.candidates(text, min_similarity, scorer, phonetic, word_weight)
+                                     for text in texts]
+
+    # 행렬 크기 상한이 작아 입력을 여러 묶음으로 나눠도 결과는 같음 (입력 행 수도 상한 적용)
+    expected = index.batch_candidates(texts, 0.5, word_weight=0.3)
+    original_cells = ngram_index.MAX_BATCH_MATRIX_CELLS
+    try:
+        for cells in (len(commands), 2 * len(commands), 8 * len(commands)):
+            ngram_index.MAX_BATCH_MATRIX_CELLS = cells
+            assert index.batch_candidates(texts, 0.5, word_weight=0.3) == expected, cells
+    finally:
+        ngram_index.MAX_BATCH_MATRIX_CELLS = original_cells
+    print("✅ 단건 후보 선별 결과와 일치")
+
+
+def _random_word(rnd: random.Random) -> str:
+    """혼동 자모가 자주 나오도록 고른 음절/영문으로 만든 임의 단어"""
+    syllables = '가카까개게거고구그기나라마바파아하사싸자차타다공격방어스킬포션점프'
+    if rnd.random() < 0.2:
+        return ''.join(rnd.choice('abcdeklmnost') for _ in range(rnd.randint(1, 6)))
+    return ''.join(rnd.choice(syllables) for _ in range(rnd.randint(1, 4)))
+
+
+def test_candidate_bound():
+    """후보 선별 하한 테스트: 유사도(단어 유사도를 섞은 점수 포함)가 최소값 이상인 문서는 절대 빠지지 않음"""
+    print("\n🛡️ === 후보 선별 하한 테스트 ===")
+
+    rnd = random.Random(7)
+    documents = [' '.join(_random_word(rnd) for _ in range(rnd.randint(1, 3))) for _ in range(300)]
+    queries = []
+    for _ in range(200):
+        words = list(rnd.choice(documents))
+        for _ in range(rnd.randint(0, 3)):
+            position = rnd.randrange(len(words) + 1)
+            action = rnd.random()
+            if action < 0.4 and position < len(words):
+                words[position] = rnd.choice('가카개게고구그ab ')
+            elif action < 0.7:
+                words.insert(position, rnd.choice('가카개게고구그ab'))
+            elif position < len(words):
+                del words[position]
+        queries.append(''.join(words).strip() or '가')
+
+    index = NGramIndex(documents)
+    jamo_documents = [to_jamo(document) for document in documents]
+    scorers = {
+        'sequence': lambda text1, text2: SequenceMatcher(None, text1, text2).ratio(),
+        'levenshtein': levenshtein_ratio,
+    }
+
+    pruned = checked = 0
+    for word_weight, thresholds in ((0.0, (0.43, 0.57, 0.71, 0.857)), (0.3, (0.4, 0.6))):
+        for min_similarity in thresholds:
+            for scorer, string_similarity in scorers.items():
+                for phonetic in (True, False):
+                    for query in queries:
+                        candidates = index.candidates(query, min_similarity, scorer, phonetic, word_weight)
+                        query_jamo, query_words = to_jamo(query), set(query.split())
+                        for position, document in enumerate(documents):
+                            if position in candidates:
+                                continue
+                            similarity = string_similarity(query, document)
+                            if phonetic:
+                                similarity = max(similarity,
+                                                 phonetic_similarity_jamo(query_jamo, jamo_documents[position]))
+                            if word_weight:
+                                document_words = set(document.split())
+                                jaccard = len(query_words & document_words) / len(query_words | document_words)
+                                similarity = (1 - word_weight) * similarity + word_weight * jaccard
+                            assert similarity < min_similarity, (query, document, scorer, phonetic, similarity)
+                            pruned += 1
+                        checked += len(documents)
+    print(f"   제외된 쌍 {pruned}/{checked}개 모두 최소 유사도 미만")
+    assert pruned > checked // 4
+    print("✅ 후보 선별 하한 확인")
+
+
+def main():
+    """메인 테스트 함수"""
+    test_decompose_hangul()
+    test_text_ngrams()
+    test_candidates()
+    test_batch_candidates()
+    test_candidate_bound()
+    print("\n🎉 n-gram 역색인 테스트 완료!")
+    return True
+
+
+if __name__ == "__main__":
+    try:
+        success = main()
+        sys.exit(0 if success else 1)
+    except AssertionError as e:
+        print(f"\n❌ 테스트 실패: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
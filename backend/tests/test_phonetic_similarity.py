@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+VoiceMacro Pro - 음운 유사도 테스트 스크립트
+자모 가중 편집 거리와 오인식 보정 매칭 테스트
+"""
+
+import sys
+from backend.utils.phonetic_similarity import (
+    to_jamo, jamo_edit_distance, jamo_similarity_upper_bound, phonetic_similarity
+)
+from backend.services.macro_index import MacroIndex
+from backend.services.macro_matching_service import MacroMatchingService
+
+
+def test_jamo_edit_distance():
+    """자모 가중 편집 거리 테스트"""
+    print("🔤 === 자모 편집 거리 테스트 ===")
+
+    assert to_jamo('스킬 하나') == 'ㅅㅡㅋㅣㄹㅎㅏㄴㅏ'
+    assert jamo_edit_distance('ㄱㅗㅇ', 'ㄱㅗㅇ') == 0.0
+    # 혼동 자모 치환은 일반 치환보다 저렴해야 함
+    assert jamo_edit_distance(to_jamo('공격'), to_jamo('공걱')) < 1.0
+    assert jamo_edit_distance(to_jamo('캐'), to_jamo('케')) < jamo_edit_distance(to_jamo('가'), to_jamo('나'))
+    # 상한은 실제 유사도보다 작을 수 없음
+    for text1, text2 in [('공격', '공걱'), ('점프', '점프하기'), ('포션', '방어')]:
+        jamo1, jamo2 = to_jamo(text1), to_jamo(text2)
+        assert jamo_similarity_upper_bound(jamo1, jamo2) >= phonetic_similarity(text1, text2)
+    print("✅ 편집 거리 결과 일치")
+
+
+def test_phonetic_matching():
+    """오인식된 명령어 매칭 테스트"""
+    print("\n🎙️ === 오인식 보정 매칭 테스트 ===")
+
+    macros = [
+        {'id': 1, 'name': '공격', 'voice_command': '공격', 'action_type': 'combo', 'key_sequence': 'Q'},
+        {'id': 2, 'name': '방어', 'voice_command': '방어', 'action_type': 'combo', 'key_sequence': 'E'},
+    ]
+    matching_service = MacroMatchingService(MacroIndex(loader=lambda: macros))
+
+    matching_service.engine.use_phonetic_similarity = False
+    plain_score = matching_service.engine._calculate_similarity('공걱', '공격')
+    matching_service.engine.use_phonetic_similarity = True
+    phonetic_score = matching_service.engine._calculate_similarity('공걱', '공격')
+    print(f"   '공걱' vs '공격': {plain_score:.3f} -> {phonetic_score:.3f}")
+    assert phonetic_score > plain_score
+
+    results = matching_service.find_matching_macros('공걱')
+    assert results and results[0].macro_id == 1
+    print("✅ 오인식 명령어 매칭 성공")
+
+
+def main():
+    """메인 테스트 함수"""
+    test_jamo_edit_distance()
+    test_phonetic_matching()
+    print("\n🎉 음운 유사도 테스트 완료!")
+    return True
+
+
+if __name__ == "__main__":
+    try:
+        success = main()
+        sys.exit(0 if success else 1)
+    except AssertionError as e:
+        print(f"\n❌ 테스트 실패: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+VoiceMacro Pro - 프리셋 매칭 범위 테스트 스크립트
+범위 지정 스냅샷 교체, 교체 전 파생 데이터 준비, 매크로 변경과의 경합 테스트
+"""
+
+import sys
+import time
+from backend.services.macro_index import MacroIndex
+from backend.services.matching_engine import MatchingEngine
+
+
+def _create_macros():
+    """게임 두 개로 나뉜 테스트 매크로 목록"""
+    macros = []
+    for number in range(80):
+        macros.append({'id': number + 1, 'name': f'A {number:02d}', 'voice_command': f'공격 {number}번',
+                       'action_type': 'combo', 'key_sequence': 'Q'})
+        macros.append({'id': number + 101, 'name': f'B {number:02d}', 'voice_command': f'공격 {number}번 발사',
+                       'action_type': 'combo', 'key_sequence': 'W'})
+    return macros
+
+
+def test_scope_swap():
+    """범위 교체 테스트"""
+    print("🎮 === 범위 교체 테스트 ===")
+
+    macros = _create_macros()
+    index = MacroIndex(loader=lambda: list(macros))
+    engine = MatchingEngine(index)
+    index.register_warmer(engine.warm_up)
+
+    assert len(index.get_snapshot()) == 160
+    assert {m.macro_id for m in engine.match('공격 3번', 0.6, 5)} & set(range(101, 181))
+
+    # 게임 A 프리셋 적용: 후보가 프리셋 크기로 줄어듦
+    version = index.version
+    assert index.set_scope(range(1, 81), 'Game A')
+    snapshot = index.get_snapshot()
+    assert len(snapshot) == 80 and index.version == version + 1
+    assert all(m.macro_id <= 80 for m in engine.match('공격 3번', 0.6, 5))
+
+    # 교체 전에 n-gram 색인 등이 준비되어 있어야 함
+    assert 'ngram_index' in snapshot._artifacts and 'entries_by_id' in snapshot._artifacts
+
+    # 범위 해제
+    assert index.set_scope(None)
+    assert len(index.get_snapshot()) == 160
+    print(f"   통계: {index.get_stats()}")
+    print("✅ 범위 교체 확인")
+
+
+def test_invalidation_keeps_scope():
+    """매크로 변경 후에도 범위 유지 테스트"""
+    print("\n♻️ === 범위 유지 테스트 ===")
+
+    macros = _create_macros()
+    index = MacroIndex(loader=lambda: list(macros))
+    index.set_scope([1, 2, 999], 'Game A')
+    assert [m['id'] for m in index.get_macros()] == [1, 2]
+
+    # 범위에 포함된 ID로 매크로 추가
+    macros.append({'id': 999, 'name': 'A 새 매크로', 'voice_command': '포션',
+                   'action_type': 'combo', 'key_sequence': 'R'})
+    index.invalidate("test")
+    assert [m['id'] for m in index.get_macros()] == [1, 2, 999]
+    print("✅ 범위 유지 확인")
+
+
+def test_background_swap():
+    """백그라운드 교체 및 최신 요청 우선 테스트"""
+    print("\n⏳ === 백그라운드 교체 테스트 ===")
+
+    macros = _create_macros()
+
+    def slow_loader():
+        time.sleep(0.05)
+        return list(macros)
+
+    index = MacroIndex(loader=slow_loader)
+    old_snapshot = index.get_snapshot()
+
+    # 준비 중에는 기존 스냅샷으로 매칭 계속
+    assert index.set_scope(range(1, 81), 'Game A', background=True)
+    assert index.set_scope(range(101, 181), 'Game B', background=True)
+    assert index.get_snapshot() is old_snapshot
+
+    deadline = time.time() + 2.0
+    while index.scope_name != 'Game B' and time.time() < deadline:
+        time.sleep(0.01)
+    time.sleep(0.1)
+
+    # 나중 요청(Game B)이 최종 범위
+    assert index.scope_name == 'Game B'
+    assert {m['id'] for m in index.get_macros()} == set(range(101, 181))
+    print("✅ 백그라운드 교체 확인")
+
+
+def main():
+    """메인 테스트 함수"""
+    test_scope_swap()
+    test_invalidation_keeps_scope()
+    test_background_swap()
+    print("\n🎉 프리셋 매칭 범위 테스트 완료!")
+    return True
+
+
+if __name__ == "__main__":
+    try:
+        success = main()
+        sys.exit(0 if success else 1)
+    except AssertionError as e:
+        print(f"\n❌ 테스트 실패: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
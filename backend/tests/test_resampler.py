@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+VoiceMacro Pro - 폴리페이즈 리샘플러 테스트 스크립트
+변환 정확도/길이, 앨리어싱 억제, 블록 단위 스트리밍, 필터 뱅크 캐시, 비율 제한, PCM16 출력 테스트
+"""
+
+import sys
+import time
+import numpy as np
+from backend.utils.resampler import Resampler, polyphase_filter_bank, resample
+
+RATE_PAIRS = [(24000, 16000), (16000, 24000), (48000, 16000), (44100, 16000)]
+
+
+def _tone(frequency: float, rate: int, seconds: float = 1.0) -> np.ndarray:
+    """사인파 신호"""
+    return np.sin(2 * np.pi * frequency * np.arange(int(rate * seconds)) / rate).astype(np.float32)
+
+
+def test_accuracy():
+    """통과 대역 정확도, 출력 길이, 앨리어싱 억제 테스트"""
+    print("🎚️ === 변환 정확도 테스트 ===")
+
+    for src_rate, dst_rate in RATE_PAIRS:
+        output = resample(_tone(440, src_rate), src_rate, dst_rate)
+        assert output.dtype == np.float32 and len(output) == dst_rate
+
+        # 필터 지연을 보정하므로 출력은 같은 시각의 사인파와 일치 (양끝 과도 구간 제외)
+        error = np.abs(output - _tone(440, dst_rate))[200:-200].max()
+        assert error < 2e-3, (src_rate, dst_rate, error)
+        print(f"   {src_rate} -> {dst_rate}Hz: 최대 오차 {error:.5f}")
+
+    # 16kHz의 나이퀴스트(8kHz)를 넘는 성분은 걸러짐
+    aliased = resample(_tone(10000, 24000), 24000, 16000)
+    assert np.abs(aliased[200:-200]).max() < 0.01
+
+    # 같은 샘플레이트는 그대로 통과
+    signal = _tone(440, 16000)
+    assert np.array_equal(resample(signal, 16000, 16000), signal)
+    print("✅ 변환 정확도 확인")
+
+
+def test_streaming():
+    """블록 크기와 무관한 스트리밍 결과와 PCM16 출력 테스트"""
+    print("\n🧱 === 스트리밍 테스트 ===")
+
+    rng = np.random.default_rng(0)
+    signal = rng.uniform(-0.5, 0.5, 24000).astype(np.float32)
+
+    for src_rate, dst_rate in RATE_PAIRS[:3]:
+        reference = resample(signal, src_rate, dst_rate)
+        resampler = Resampler(src_rate, dst_rate)
+        blocks, position = [], 0
+        for size in rng.integers(1, 3000, 100).tolist():
+            blocks.append(resampler.process(signal[position:position + size]))
+            position += size
+        blocks.append(resampler.process(signal[position:]))
+        blocks.append(resampler.flush())
+
+        streamed = np.concatenate(blocks)
+        assert len(streamed) == len(reference)
+        assert np.abs(streamed - reference).max() < 1e-5
+        assert resampler.flush().size == 0
+
+    # PCM16 입력은 반올림/범위 제한된 PCM16으로 출력
+    pcm = (_tone(440, 24000) * 32767).astype(np.int16)
+    converted = resample(pcm, 24000, 16000)
+    assert converted.dtype == np.int16 and len(converted) == 16000
+    reference = np.clip(np.rint(resample(pcm.astype(np.float32), 24000, 16000)), -32768, 32767)
+    assert np.array_equal(converted, reference.astype(np.int16))
+
+    resampler = Resampler(24000, 16000, np.int16)
+    resampler.process(pcm)
+    resampler.reset()
+    assert resampler.get_stats()['input_samples'] == 0
+    print("✅ 스트리밍 확인")
+
+
+def test_filter_cache():
+    """샘플레이트 쌍별 필터 뱅크 캐시, 변환 비율 제한, 처리 속도 테스트"""
+    print("\n🗄️ === 필터 뱅크 캐시 테스트 ===")
+
+    up, down, bank, delay = polyphase_filter_bank(24000, 16000)
+    assert (up, down) == (2, 3) and bank.shape[0] == 2 and not bank.flags.writeable
+    assert Resampler(24000, 16000)._bank is bank  # 같은 샘플레이트 쌍은 같은 뱅크 공유
+
+    # 각 위상의 탭 합은 1 (직류 이득 보존)
+    assert np.allclose(bank.sum(axis=1), 1.0, atol=1e-3)
+
+    # 약분되지 않는 샘플레이트는 거대한 필터를 만들지 않고 거부
+    for src_rate, dst_rate in ((100003, 16000), ((1 << 32) - 1, 16000), (16000, 100003)):
+        try:
+            Resampler(src_rate, dst_rate)
+            raise AssertionError(f"변환 비율이 너무 큰 샘플레이트가 허용됨: {src_rate} -> {dst_rate}")
+        except ValueError:
+            pass
+    assert polyphase_filter_bank(44100, 16000)[:2] == (160, 441)
+
+    signal = np.random.default_rng(1).standard_normal(24000 * 10).astype(np.float32)
+    start_time = time.perf_counter()
+    resample(signal, 24000, 16000)
+    elapsed_ms = (time.perf_counter() - start_time) * 1000
+    print(f"   10초 오디오 24k -> 16k 변환: {elapsed_ms:.1f}ms")
+    print("✅ 필터 뱅크 캐시 확인")
+
+
+def main():
+    """메인 테스트 함수"""
+    test_accuracy()
+    test_streaming()
+    test_filter_cache()
+    print("\n🎉 리샘플러 테스트 완료!")
+    return True
+
+
+if __name__ == "__main__":
+    try:
+        success = main()
+        sys.exit(0 if success else 1)
+    except AssertionError as e:
+        print(f"\n❌ 테스트 실패: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
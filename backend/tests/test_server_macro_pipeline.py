@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+VoiceMacro Pro - 서버 매크로 실행 파이프라인 테스트 스크립트
+다중 명령어 순서 실행, 사용 횟수 기록, 부분 인식 결과 전달 테스트
+(서버 모듈의 서비스 객체를 테스트용 객체로 바꿔 실제 키 입력 없이 실행)
+"""
+
+import sys
+import asyncio
+import logging
+from datetime import datetime
+from types import SimpleNamespace
+import backend.api.server as server
+from backend.services.voice_service import VoiceRecognitionService
+from backend.services.command_segmentation_service import CommandSegment
+from backend.services.matching_engine import MacroMatch, MatchConfidenceLevel
+
+
+MACROS = {
+    1: {'id': 1, 'name': '공격', 'voice_command': '공격', 'action_type': 'combo', 'key_sequence': 'Q', 'settings': '{}'},
+    2: {'id': 2, 'name': '점프', 'voice_command': '점프', 'action_type': 'combo', 'key_sequence': 'Space', 'settings': '{}'},
+}
+
+
+class FakeSocketIO:
+    """emit 호출을 기록하는 Socket.IO 대체 객체"""
+
+    def __init__(self):
+        self.events = []
+
+    def emit(self, event, data=None, room=None):
+        self.events.append((event, data, room))
+
+
+class FakeMacroService:
+    """매크로 조회와 사용 횟수 기록만 하는 매크로 서비스 대체 객체"""
+
+    def __init__(self):
+        self.usage = []
+
+    def get_macro_by_id(self, macro_id):
+        return MACROS.get(macro_id)
+
+    def increment_usage_count(self, macro_id):
+        self.usage.append(macro_id)
+        return True
+
+
+class FakeExecutionService:
+    """비동기 execute_macro 인터페이스를 그대로 따르는 실행 서비스 대체 객체"""
+
+    def __init__(self, fail_ids=()):
+        self.executed = []
+        self.fail_ids = set(fail_ids)
+
+    async def execute_macro(self, macro_data):
+        assert isinstance(macro_data, dict), macro_data
+        self.executed.append(macro_data['id'])
+        return macro_data['id'] not in self.fail_ids
+
+
+class ImmediateExecutor:
+    """제출된 작업을 바로 실행하는 매크로 실행기 대체 객체"""
+
+    def submit(self, client_id, task):
+        task()
+        return True
+
+
+class RecordingSpeculation:
+    """부분 인식 결과를 기록하는 선행 매칭 서비스 대체 객체"""
+
+    def __init__(self):
+        self.partials = []
+
+    def on_partial(self, client_id, text):
+        self.partials.append((client_id, text))
+        return {'action': 'none', 'arm': None}
+
+
+def _segment(macro_id: int, start: int) -> CommandSegment:
+    """테스트용 명령어 구간 생성"""
+    macro = MACROS[macro_id]
+    match = MacroMatch(macro_id=macro_id, macro_name=macro['name'], voice_command=macro['voice_command'],
+                       similarity=1.0, confidence_level=MatchConfidenceLevel.VERY_HIGH, match_type='exact',
+                       action_type=macro['action_type'], key_sequence=macro['key_sequence'])
+    return CommandSegment(text=macro['voice_command'], start=start, end=start + 2, match=match, source='trie')
+
+
+def _patch_server(execution_service: FakeExecutionService):
+    """서버 모듈의 서비스 객체를 테스트용 객체로 교체 (원래 객체 반환)"""
+    original = {name: getattr(server, name) for name in
+                ('socketio', 'macro_service', 'macro_execution_service', 'macro_executor', 'macro_index')}
+    server.socketio = FakeSocketIO()
+    server.macro_service = FakeMacroService()
+    server.macro_execution_service = execution_service
+    server.macro_executor = ImmediateExecutor()
+    server.macro_index = SimpleNamespace(get_snapshot=lambda: SimpleNamespace(by_id=MACROS))
+    return original
+
+
+def _restore_server(original):
+    """교체한 서버 모듈 객체 복원"""
+    for name, value in original.items():
+        setattr(server, name, value)
+
+
+def test_sequence_success():
+    """두 구간 다중 명령어 순서 실행 테스트"""
+    print("🧩 === 다중 명령어 실행 테스트 ===")
+
+    execution_service = FakeExecutionService()
+    original = _patch_server(execution_service)
+    try:
+        server.execute_macro_sequence('client', [_segment(1, 0), _segment(2, 3)], '공격 점프', 0.9)
+
+        # 두 매크로 모두 매크로 정보(딕셔너리)로 순서대로 실행되고 사용 횟수 기록
+        assert execution_service.executed == [1, 2], execution_service.executed
+        assert server.macro_service.usage == [1, 2], server.macro_service.usage
+
+        events = [(event, data.get('macro_id')) for event, data, _ in server.socketio.events]
+        assert events == [
+            ('macro_sequence_matched', None),
+            ('macro_execution_started', 1), ('macro_execution_completed', 1),
+            ('macro_execution_started', 2), ('macro_execution_completed', 2),
+        ], events
+        assert all(room == 'client' for _, _, room in server.socketio.events)
+    finally:
+        _restore_server(original)
+    print("✅ 다중 명령어 실행 확인")
+
+
+def test_sequence_failure():
+    """앞 매크로 실패 시 중단 테스트"""
+    print("\n🛑 === 다중 명령어 실패 테스트 ===")
+
+    execution_service = FakeExecutionService(fail_ids=[1])
+    original = _patch_server(execution_service)
+    try:
+        server.execute_macro_sequence('client', [_segment(1, 0), _segment(2, 3)], '공격 점프', 0.9)
+
+        # 실패한 매크로 뒤는 실행하지 않고 사용 횟수도 기록하지 않음
+        assert execution_service.executed == [1]
+        assert server.macro_service.usage == []
+        assert [event for event, _, _ in server.socketio.events][-1] == 'macro_execution_failed'
+    finally:
+        _restore_server(original)
+    print("✅ 다중 명령어 실패 확인")
+
+
+def test_partial_reaches_speculation():
+    """음성 인식 서비스 부분 인식 결과 전달 테스트"""
+    print("\n⏳ === 부분 인식 결과 전달 테스트 ===")
+
+    # 마이크 장치/GPT-4o 초기화 없이 콜백 처리 부분만 사용
+    voice_service = VoiceRecognitionService.__new__(VoiceRecognitionService)
+    voice_service.logger = logging.getLogger(__name__)
+    voice_service.confidence_threshold = 0.7
+    voice_service.transcription_callback = None
+    voice_service.partial_transcription_callback = None
+
+    speculation = RecordingSpeculation()
+    original = _patch_server(FakeExecutionService())
+    original_speculation = server.get_speculative_matching_service
+    server.get_speculative_matching_service = lambda: speculation
+    try:
+        # 녹음 시작 경로에서 등록하는 콜백 연결
+        server.register_voice_service_callbacks(voice_service)
+        asyncio.run(voice_service._handle_transcription_result({
+            'type': 'partial',
+            'text': ' 공격 ',
+            'item_id': 'item_1',
+            'timestamp': datetime.now().isoformat()
+        }))
+
+        assert speculation.partials == [(server.LOCAL_VOICE_SESSION_ID, '공격')], speculation.partials
+        assert [event for event, _, _ in server.socketio.events] == ['transcription_result']
+    finally:
+        server.get_speculative_matching_service = original_speculation
+        _restore_server(original)
+    print("✅ 부분 인식 결과 전달 확인")
+
+
+def main():
+    """메인 테스트 함수"""
+    test_sequence_success()
+    test_sequence_failure()
+    test_partial_reaches_speculation()
+    print("\n🎉 서버 매크로 실행 파이프라인 테스트 완료!")
+    return True
+
+
+if __name__ == "__main__":
+    try:
+        success = main()
+        sys.exit(0 if success else 1)
+    except AssertionError as e:
+        print(f"\n❌ 테스트 실패: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
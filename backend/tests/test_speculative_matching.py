@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+VoiceMacro Pro - 선행 매칭 테스트 스크립트
+명령어 접두사 트라이(정규화 키)와 부분 인식 기반 예약/확정/취소 테스트
+"""
+
+import sys
+from backend.utils.command_trie import CommandTrie, get_command_trie
+from backend.services.macro_index import MacroIndex
+from backend.services.speculative_matching_service import SpeculativeMatchingService
+
+
+MACROS = [
+    {'id': 1, 'name': '공격', 'voice_command': '공격', 'action_type': 'combo', 'key_sequence': 'Q'},
+    {'id': 2, 'name': '공격 스킬', 'voice_command': '공격 스킬', 'action_type': 'combo', 'key_sequence': 'W'},
+    {'id': 3, 'name': '포션 사용', 'voice_command': '포션 사용', 'action_type': 'combo', 'key_sequence': 'R'},
+    {'id': 4, 'name': '방어 자세', 'voice_command': '방어 자세', 'action_type': 'combo', 'key_sequence': 'E'},
+]
+
+
+def test_command_trie():
+    """접두사 트라이 테스트"""
+    print("🌳 === 명령어 트라이 테스트 ===")
+
+    trie = CommandTrie((macro['voice_command'], macro['id']) for macro in MACROS)
+
+    assert len(trie) == 4
+    assert trie.count_completions('공') == 2
+    # '공격'은 '공격 스킬'의 접두사이기도 하므로 유일하지 않음
+    assert trie.unique_completion('공격') is None
+    # 띄어쓰기가 달라도 같은 명령어로 인식
+    assert trie.unique_completion('공격스') == ('공격 스킬', 2, 3 / 4)
+    assert trie.unique_completion('포션 사용') == ('포션 사용', 3, 1.0)
+    assert trie.unique_completion('회복') is None
+    assert [value for _, value in trie.complete('공')] == [1, 2]
+    print("✅ 트라이 검색 결과 일치")
+
+
+def test_arm_and_confirm():
+    """예약 후 확정 테스트"""
+    print("\n⏳ === 예약/확정 테스트 ===")
+
+    service = SpeculativeMatchingService(MacroIndex(loader=lambda: MACROS))
+    service.early_fire = False
+
+    assert service.on_partial('client', '포')['action'] == 'none'   # 너무 짧음
+    result = service.on_partial('client', '포션')
+    assert result['action'] == 'armed' and result['arm']['macro_id'] == 3
+    assert service.on_partial('client', '포션 사')['action'] == 'none'  # 같은 매크로 유지
+
+    final = service.on_final('client', 3)
+    assert final['action'] == 'confirmed' and not final['arm']['fired']
+    assert service.on_final('client', 3)['action'] == 'none'
+    print("✅ 예약 확정 확인")
+
+
+def test_early_fire_and_cancel():
+    """조기 실행 및 취소 테스트"""
+    print("\n⚡ === 조기 실행/취소 테스트 ===")
+
+    service = SpeculativeMatchingService(MacroIndex(loader=lambda: MACROS))
+    service.early_fire = True
+    service.fire_ratio = 1.0
+
+    assert service.on_partial('client', '방어')['action'] == 'armed'
+    result = service.on_partial('client', '방어 자세')
+    assert result['action'] == 'fire' and result['arm']['fired']
+
+    # 최종 결과가 다른 매크로면 취소 (호출자가 실행 중지)
+    final = service.on_final('client', 1)
+    assert final['action'] == 'cancelled' and final['arm']['fired']
+
+    stats = service.get_stats()
+    print(f"   통계: {stats}")
+    assert stats['fired'] == 1 and stats['cancelled'] == 1 and stats['pending'] == 0
+    print("✅ 조기 실행/취소 확인")
+
+
+def test_normalized_keys():
+    """매칭 엔진과 같은 정규화 규칙의 트라이 키 테스트"""
+    print("\n🔤 === 정규화 키 테스트 ===")
+
+    macros = MACROS + [
+        {'id': 5, 'name': '파이어볼', 'voice_command': '파이어볼!', 'action_type': 'combo', 'key_sequence': 'F'},
+        {'id': 6, 'name': '힐', 'voice_command': '그거 힐 줘', 'action_type': 'combo', 'key_sequence': 'H'},
+    ]
+    index = MacroIndex(loader=lambda: macros)
+
+    # 트라이 키는 인덱스의 정규화된 명령어에서 공백만 제거한 값
+    trie = get_command_trie(index.get_snapshot())
+    assert trie.longest_prefix('파이어볼')[1][0][0] == '파이어볼!'
+    assert trie.longest_prefix('힐줘')[1][0][0] == '그거 힐 줘'
+
+    # 부분 인식 결과도 같은 규칙으로 정규화 (불용어/특수문자 무시)
+    service = SpeculativeMatchingService(index)
+    service.early_fire = False
+    result = service.on_partial('client', '음, 파이어')
+    assert result['action'] == 'armed' and result['arm']['macro_id'] == 5
+    assert result['arm']['confidence'] == 3 / 4
+    result = service.on_partial('other', '힐 줘?')
+    assert result['action'] == 'armed' and result['arm']['macro_id'] == 6
+    assert service.on_partial('third', '음 공')['action'] == 'none'  # 불용어 제외하면 너무 짧음
+    print("✅ 정규화 키 확인")
+
+
+def main():
+    """메인 테스트 함수"""
+    test_command_trie()
+    test_arm_and_confirm()
+    test_early_fire_and_cancel()
+    test_normalized_keys()
+    print("\n🎉 선행 매칭 테스트 완료!")
+    return True
+
+
+if __name__ == "__main__":
+    try:
+        success = main()
+        sys.exit(0 if success else 1)
+    except AssertionError as e:
+        print(f"\n❌ 테스트 실패: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
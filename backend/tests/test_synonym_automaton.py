@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+VoiceMacro Pro - 동의어 오토마톤 테스트 스크립트
+Aho-Corasick 다중 패턴 검색과 컴파일된 동의어 매칭 테스트
+"""
+
+import sys
+from backend.utils.aho_corasick import AhoCorasickAutomaton
+from backend.services.macro_index import MacroIndex
+from backend.services.macro_matching_service import MacroMatchingService
+
+
+def test_automaton_matches():
+    """다중 패턴 검색 테스트"""
+    print("🔎 === Aho-Corasick 검색 테스트 ===")
+
+    automaton = AhoCorasickAutomaton(['공격', '격', '공격하기', 'he', 'she', 'hers'])
+
+    assert automaton.find_all('공격하기') == {0, 1, 2}
+    assert automaton.find_all('ushers') == {3, 4, 5}
+    assert automaton.find_all('방어') == set()
+    assert list(automaton.iter_matches('she')) == [(3, 4), (3, 3)]
+    print("✅ 패턴 검색 결과 일치")
+
+
+def test_compiled_synonyms():
+    """컴파일된 동의어 매칭 테스트"""
+    print("\n🔄 === 동의어 오토마톤 매칭 테스트 ===")
+
+    matching_service = MacroMatchingService(MacroIndex(loader=lambda: []))
+
+    # 1. 대표어 입력 -> 동의어를 포함한 명령어
+    assert matching_service.engine._check_synonyms('공격', '어택 하기') == (True, 0.95)
+    # 2. 동의어 입력 -> 대표어를 포함한 명령어
+    assert matching_service.engine._check_synonyms('가드', '방어 자세') == (True, 0.95)
+    # 3. 같은 그룹의 동의어끼리
+    assert matching_service.engine._check_synonyms('뛰기', '껑충 뛰기') == (True, 0.90)
+    assert matching_service.engine._check_synonyms('가방', '인벤 열기') == (True, 0.90)
+    # 동의어 사전에 없는 입력
+    assert matching_service.engine._check_synonyms('포션', '물약 마시기') == (False, 0.0)
+
+    # add_synonym 후 오토마톤이 재구성되어야 함
+    assert matching_service.add_synonym('포션', ['물약', 'potion'])
+    assert matching_service.engine._check_synonyms('포션', '물약 마시기') == (True, 0.95)
+    assert matching_service.engine._check_synonyms('물약', '포션 마시기') == (True, 0.95)
+    print("✅ 동의어 매칭 결과 일치")
+
+
+def main():
+    """메인 테스트 함수"""
+    test_automaton_matches()
+    test_compiled_synonyms()
+    print("\n🎉 동의어 오토마톤 테스트 완료!")
+    return True
+
+
+if __name__ == "__main__":
+    try:
+        success = main()
+        sys.exit(0 if success else 1)
+    except AssertionError as e:
+        print(f"\n❌ 테스트 실패: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+VoiceMacro Pro - 텍스트 정규화 테스트 스크립트
+언어별 불용어 제거, 인덱스에 저장된 명령어 정규화 결과, 매칭 경로 공유 테스트
+"""
+
+import sys
+from backend.utils.text_normalizer import TextNormalizer, get_text_normalizer
+from backend.services.macro_index import MacroIndex
+from backend.services.matching_engine import MatchingEngine
+from backend.services.voice_analysis_service import VoiceAnalysisService
+
+
+def test_normalizer():
+    """언어별 불용어/특수문자 제거 테스트"""
+    print("🧹 === 정규화 테스트 ===")
+
+    normalizer = get_text_normalizer()
+    cases = [
+        ('음, 공격!  해줘', '공격 해줘'),
+        ('Um, ATTACK now...', 'attack now'),
+        ('그거 포션 마시기', '포션 마시기'),
+        ('그만', '그만'),  # 단어 일부인 불용어는 유지
+        ('you know jump', 'jump'),
+        ('음 어', ''),
+        ('', ''),
+    ]
+    for text, expected in cases:
+        assert normalizer.normalize(text) == expected, (text, normalizer.normalize(text))
+
+        # 공백 없는 키는 정규화 결과에서 공백만 뺀 것과 같고, 위치는 원본 문자를 가리킴
+        key, positions = normalizer.compact_with_positions(text)
+        assert key == expected.replace(' ', ''), (text, key)
+        assert ''.join(text[position].lower() for position in positions) == key, (text, positions)
+
+    # 언어별 정규화기는 해당 언어 불용어만 제거
+    assert get_text_normalizer('ko').normalize('um 공격') == 'um 공격'
+    assert get_text_normalizer('en').normalize('음 attack') == '음 attack'
+    assert get_text_normalizer('ko') is get_text_normalizer('ko')
+    assert TextNormalizer(['ko']).pattern_count == 2
+
+    assert normalizer.normalize_with_tokens('스킬, 하나!') == ('스킬 하나', frozenset({'스킬', '하나'}))
+    print("✅ 정규화 확인")
+
+
+def test_index_and_engine():
+    """인덱스 정규화 결과와 매칭 엔진 테스트"""
+    print("\n📇 === 인덱스/엔진 테스트 ===")
+
+    macros = [
+        {'id': 1, 'name': '공격', 'voice_command': '공격!', 'action_type': 'combo', 'key_sequence': 'Q'},
+        {'id': 2, 'name': '포션', 'voice_command': 'Potion, Drink', 'action_type': 'combo', 'key_sequence': 'R'},
+        {'id': 3, 'name': '감탄', 'voice_command': '아!', 'action_type': 'combo', 'key_sequence': 'F'},
+    ]
+    engine = MatchingEngine(MacroIndex(loader=lambda: macros))
+    entries = engine.macro_index.get_snapshot().entries
+
+    # 명령어는 인덱스 구축 시 한 번만 정규화
+    assert [entry.command_normalized for entry in entries] == ['공격', 'potion drink', '아!']
+    assert entries[1].command_tokens == frozenset({'potion', 'drink'})
+
+    # 입력만 정규화하면 특수문자/불용어가 섞여도 정확히 일치
+    for text, expected_id in [('음... 공격', 1), ('uh potion drink?', 2), ('공격', 1)]:
+        matches = engine.match(text, 0.6, 5)
+        assert matches and matches[0].macro_id == expected_id, text
+        assert matches[0].match_type == 'exact', text
+
+    # 불용어만 있는 입력은 말버릇으로 보고 매칭하지 않음 (불용어만으로 된 명령어도 마찬가지)
+    assert engine.match('아!', 0.6, 1) == []
+    assert engine.match('음...', 0.3, 5) == []
+
+    # 정규화 후 같은 입력은 캐시 적중
+    hits = engine.cache_stats['hits']
+    engine.match('공격!!', 0.6, 5)
+    assert engine.cache_stats['hits'] == hits + 1
+    print("✅ 인덱스/엔진 확인")
+
+
+def test_voice_analysis():
+    """음성 분석 서비스 정규화 테스트"""
+    print("\n🎙️ === 음성 분석 서비스 테스트 ===")
+
+    voice_analysis = VoiceAnalysisService()
+    commands = ['공격!', '스킬 하나', '포션 마시기']
+
+    assert voice_analysis._clean_text('음, 공격!') == '공격'
+    assert voice_analysis.find_similar_commands('음 공격', commands)[0] == ('공격!', 1.0)
+
+    # 같은 명령어 목록의 정규화 결과는 재사용
+    engine = voice_analysis._get_matching_engine('ko')
+    assert engine._get_command_snapshot(commands) is engine._get_command_snapshot(commands)
+
+    voice_analysis.set_language('en')
+    assert voice_analysis.find_similar_commands('uh, attack', ['attack', 'jump'])[0] == ('attack', 1.0)
+    print(f"   통계: {voice_analysis.get_analysis_stats()['noise_patterns_count']}개 패턴")
+    print("✅ 음성 분석 서비스 확인")
+
+
+def main():
+    """메인 테스트 함수"""
+    test_normalizer()
+    test_index_and_engine()
+    test_voice_analysis()
+    print("\n🎉 텍스트 정규화 테스트 완료!")
+    return True
+
+
+if __name__ == "__main__":
+    try:
+        success = main()
+        sys.exit(0 if success else 1)
+    except AssertionError as e:
+        print(f"\n❌ 테스트 실패: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+VoiceMacro Pro - 사용 빈도 사전 정보 테스트 스크립트
+지수 감쇠 점수, 상위 매크로 순위, 빠른 경로 매칭, 동점 순위 결정 테스트
+"""
+
+import sys
+import time
+from backend.services.macro_index import MacroIndex
+from backend.services.matching_engine import MatchingEngine
+from backend.services.usage_prior import UsagePrior
+
+
+def _create_engine(usage: UsagePrior, second_command: str = '공격'):
+    """후보 선별이 동작하도록 충분히 많은 테스트 매크로로 엔진 생성"""
+    macros = [
+        {'id': 1, 'name': '공격 A', 'voice_command': '공격', 'action_type': 'combo', 'key_sequence': 'Q'},
+        {'id': 2, 'name': '공격 B', 'voice_command': second_command, 'action_type': 'combo', 'key_sequence': 'W'},
+        {'id': 3, 'name': '포션', 'voice_command': '포션 마시기', 'action_type': 'combo', 'key_sequence': 'R'},
+    ]
+    for number in range(100):
+        macros.append({'id': 100 + number, 'name': f'매크로 {number}', 'voice_command': f'커맨드 {number}번',
+                       'action_type': 'combo', 'key_sequence': 'F1'})
+    return MatchingEngine(MacroIndex(loader=lambda: macros), usage=usage)
+
+
+def test_decay():
+    """지수 감쇠 점수 테스트"""
+    print("📉 === 지수 감쇠 테스트 ===")
+
+    usage = UsagePrior(half_life=10.0, hot_size=2)
+    now = time.time()
+    usage.record(1, now)
+    usage.record(1, now)
+    usage.record(2, now)
+
+    assert abs(usage.score(1, now) - 2.0) < 1e-9
+    assert abs(usage.score(1, now + 10.0) - 1.0) < 1e-9
+    assert usage.get_hot_ids() == (1, 2)
+
+    # 최근 기록이 오래된 기록보다 앞설 수 있음
+    version = usage.version
+    usage.record(3, now + 20.0)
+    usage.record(3, now + 20.0)
+    assert usage.get_hot_ids() == (3, 1)
+    assert usage.version > version
+    print(f"   통계: {usage.get_stats()}")
+    print("✅ 지수 감쇠 확인")
+
+
+def test_tie_break():
+    """동점 순위 결정 테스트"""
+    print("\n⚖️ === 동점 순위 테스트 ===")
+
+    usage = UsagePrior(hot_size=4)
+    engine = _create_engine(usage)
+    engine.usage_fast_path_similarity = 2.0  # 빠른 경로 없이 전체 후보 확인
+
+    # 기록이 없으면 이름 순서 (공격 A)
+    assert [m.macro_id for m in engine.match('공격', 0.6, 5)][:2] == [1, 2]
+
+    # 최근 사용한 공격 B가 먼저 (순위가 바뀌면 캐시된 결과도 무효)
+    usage.record(2)
+    assert [m.macro_id for m in engine.match('공격', 0.6, 5)][:2] == [2, 1]
+
+    # 빠른 경로를 켜도 결과 수가 남으면 전체 후보 확인 (정확히 일치하는 공격 A도 포함)
+    engine.usage_fast_path_similarity = 1.0
+    assert [m.macro_id for m in engine.match('공격', 0.6, 5)] == [2, 1]
+    # 1개만 찾으면 자주 쓰는 공격 B의 정확한 일치로 확정 (동점이면 사용 순위가 앞섬)
+    assert [m.macro_id for m in engine.match('공격', 0.6, 1)] == [2]
+    print("✅ 동점 순위 확인")
+
+
+def test_fast_path():
+    """상위 매크로 빠른 경로 테스트"""
+    print("\n⚡ === 빠른 경로 테스트 ===")
+
+    usage = UsagePrior(hot_size=4)
+    engine = _create_engine(usage)
+    engine.match_cache_size = 0
+    usage.record(3)
+
+    # 상위 매크로와 정확히 일치하는 결과로 max_results개를 채우면 빠른 경로
+    assert [m.macro_id for m in engine.match('포션 마시기', 0.6, 1)] == [3]
+    assert engine.usage_stats['fast_path_hits'] == 1
+
+    # 결과 수가 남거나 확신도가 낮으면 전체 후보 확인
+    assert [m.macro_id for m in engine.match('포션 마시기', 0.6, 5)] == [3]
+    matches = engine.match('커맨드 7번', 0.6, 1)
+    assert matches[0].macro_id == 107
+    assert engine.usage_stats['fast_path_misses'] == 2
+
+    # 배치 매칭도 같은 결과
+    assert [[m.macro_id for m in result] for result in engine.match_batch(['포션 마시기', '커맨드 7번'], 0.6, 1)] == \
+        [[3], [m.macro_id for m in matches]]
+
+    # 상위 매크로의 동의어 일치(0.95)로는 확정하지 않음: 정확히 일치하는 다른 매크로가 먼저
+    usage = UsagePrior(hot_size=4)
+    synonym_engine = _create_engine(usage, second_command='어택')
+    usage.record(2)
+    for max_results in (1, 5):
+        matches = synonym_engine.match('공격', 0.6, max_results)
+        assert [(m.macro_id, m.similarity, m.match_type) for m in matches] == \
+            [(1, 1.0, 'exact'), (2, 0.95, 'synonym')][:max_results], matches
+    assert synonym_engine.usage_stats['fast_path_hits'] == 0
+
+    # 사용 안 함이면 빠른 경로 없음
+    engine.use_usage_prior = False
+    engine.match('포션 마시기', 0.6, 1)
+    assert engine.usage_stats['fast_path_hits'] == 2  # 배치에서 1회 추가된 값 그대로
+    print(f"   통계: {engine.get_stats()['usage_prior']}")
+    print("✅ 빠른 경로 확인")
+
+
+def main():
+    """메인 테스트 함수"""
+    test_decay()
+    test_tie_break()
+    test_fast_path()
+    print("\n🎉 사용 빈도 사전 정보 테스트 완료!")
+    return True
+
+
+if __name__ == "__main__":
+    try:
+        success = main()
+        sys.exit(0 if success else 1)
+    except AssertionError as e:
+        print(f"\n❌ 테스트 실패: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
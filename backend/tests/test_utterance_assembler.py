@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+VoiceMacro Pro - 발화 조립 테스트 스크립트
+청크를 이어 붙인 발화 경계(VAD), 최대 길이/대기 시간, 짧은 발화 제외, 세션 분리 테스트
+"""
+
+import sys
+import numpy as np
+from backend.services.utterance_assembler_service import UtteranceAssembler, UtteranceAssemblerService
+
+SAMPLE_RATE = 24000
+
+
+def _pcm(signal: np.ndarray) -> bytes:
+    """float 신호를 PCM16 바이트로 변환"""
+    return (signal * 32767).astype('<i2').tobytes()
+
+
+def _tone(seconds: float) -> np.ndarray:
+    """음성 대용 신호 (기본음 + 배음)"""
+    t = np.arange(int(SAMPLE_RATE * seconds)) / SAMPLE_RATE
+    return 0.3 * np.sin(2 * np.pi * 180 * t) + 0.1 * np.sin(2 * np.pi * 360 * t)
+
+
+def _silence(seconds: float, rng: np.random.Generator) -> np.ndarray:
+    """조용한 배경 잡음"""
+    return rng.standard_normal(int(SAMPLE_RATE * seconds)) * 0.001
+
+
+def _chunks(data: bytes, size: int):
+    """바이트를 일정 크기 조각으로 나누기"""
+    return [data[start:start + size] for start in range(0, len(data), size)]
+
+
+def test_speech_boundaries():
+    """여러 청크에 걸친 발화를 음성 구간 끝에서 하나로 조립하는지 테스트"""
+    print("🧩 === 발화 경계 테스트 ===")
+
+    rng = np.random.default_rng(0)
+    stream = _pcm(np.concatenate([_silence(0.5, rng), _tone(0.6), _silence(0.6, rng),
+                                  _tone(0.4), _silence(0.6, rng)]))
+
+    assembler = UtteranceAssembler('client', SAMPLE_RATE, max_latency_ms=800, max_utterance_seconds=8)
+    utterances = []
+    for chunk in _chunks(stream, 2048):  # 블록 경계와 맞지 않는 청크
+        utterances.extend(assembler.push(chunk, now=0.0))
+
+    assert [u.reason for u in utterances] == ['speech_end', 'speech_end']
+    durations = [round(u.duration, 2) for u in utterances]
+    print(f"   발화 길이: {durations}")
+    assert durations == [1.1, 0.9]  # 패딩 0.2 + 음성 + 행오버 0.3
+    assert not assembler.is_speech
+    print("✅ 발화 경계 확인")
+
+
+def test_limits():
+    """최대 길이/최대 대기 시간/녹음 중지 테스트"""
+    print("\n⏳ === 길이/대기 시간 테스트 ===")
+
+    # 최대 길이에서 잘라 다음 발화로 이어감
+    assembler = UtteranceAssembler('client', SAMPLE_RATE, max_latency_ms=800, max_utterance_seconds=1.0)
+    utterances = []
+    for chunk in _chunks(_pcm(_tone(2.5)), 4800):
+        utterances.extend(assembler.push(chunk, now=0.0))
+    assert [u.reason for u in utterances] == ['max_length', 'max_length']
+    assert all(u.duration == 1.0 for u in utterances)
+
+    # 클라이언트가 전송을 멈추면 최대 대기 시간 뒤 남은 발화를 내보냄
+    assert assembler.poll(now=0.5) == []
+    expired = assembler.poll(now=0.9)
+    assert [u.reason for u in expired] == ['max_latency']
+
+    # 녹음 중지 시 남은 오디오 내보내기 (VAD 없이)
+    assembler = UtteranceAssembler('client', SAMPLE_RATE, max_latency_ms=800, max_utterance_seconds=8, use_vad=False)
+    assert assembler.push(_pcm(_tone(0.3)), now=0.0) == []
+    flushed = assembler.flush()
+    assert [u.reason for u in flushed] == ['flush'] and round(flushed[0].duration, 2) == 0.3
+    print("✅ 길이/대기 시간 확인")
+
+
+def test_service_sessions():
+    """세션 분리와 짧은 발화 제외 테스트"""
+    print("\n👥 === 세션 테스트 ===")
+
+    rng = np.random.default_rng(1)
+    service = UtteranceAssemblerService(SAMPLE_RATE)
+    service.use_vad = True
+    speech = _pcm(np.concatenate([_tone(0.5), _silence(0.5, rng)]))
+    click = _pcm(np.concatenate([_tone(0.04), _silence(0.5, rng)]))
+    service.min_utterance_seconds = 0.6  # 행오버가 대부분인 짧은 소리는 버림
+
+    first = [u for chunk in _chunks(speech, 4800) for u in service.push('a', chunk)]
+    second = [u for chunk in _chunks(click, 4800) for u in service.push('b', chunk)]
+    assert [u.client_id for u in first] == ['a']
+    assert second == []
+
+    stats = service.get_stats()
+    assert stats['sessions'] == 2 and stats['dropped_short'] == 1 and stats['speech_end'] == 1
+    print(f"   통계: {stats}")
+
+    service.clear_session('a')
+    assert service.flush('a') == []
+    assert service.get_stats()['sessions'] == 1
+    print("✅ 세션 확인")
+
+
+def main():
+    """메인 테스트 함수"""
+    test_speech_boundaries()
+    test_limits()
+    test_service_sessions()
+    print("\n🎉 발화 조립 테스트 완료!")
+    return True
+
+
+if __name__ == "__main__":
+    try:
+        success = main()
+        sys.exit(0 if success else 1)
+    except AssertionError as e:
+        print(f"\n❌ 테스트 실패: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+VoiceMacro Pro - 음성 구간 검출(VAD) 테스트 스크립트
+음성 구간 표시, 앞쪽 패딩/행오버, 블록 크기와 무관한 판정, 잡음 제외 테스트
+"""
+
+import sys
+import numpy as np
+from backend.utils.voice_activity_detector import VoiceActivityDetector
+
+SAMPLE_RATE = 16000
+
+
+def _tone(seconds: float) -> np.ndarray:
+    """음성 대용 신호 (기본음 + 배음)"""
+    t = np.arange(int(SAMPLE_RATE * seconds)) / SAMPLE_RATE
+    return (0.3 * np.sin(2 * np.pi * 180 * t) + 0.1 * np.sin(2 * np.pi * 360 * t)).astype(np.float32)
+
+
+def _silence(seconds: float, rng: np.random.Generator) -> np.ndarray:
+    """조용한 배경 잡음"""
+    return (rng.standard_normal(int(SAMPLE_RATE * seconds)) * 0.001).astype(np.float32)
+
+
+def _signal() -> np.ndarray:
+    """무음 1초 - 음성 0.5초 - 무음 1초 - 음성 0.3초 - 무음 0.8초"""
+    rng = np.random.default_rng(0)
+    return np.concatenate([_silence(1.0, rng), _tone(0.5), _silence(1.0, rng), _tone(0.3), _silence(0.8, rng)])
+
+
+def _run(signal: np.ndarray, block_sizes, detector: VoiceActivityDetector):
+    """블록 크기 목록대로 나누어 판정하고 전달된 오디오와 구간 목록 반환"""
+    forwarded, segments, position = [], [], 0
+    for size in block_sizes:
+        result = detector.process(signal[position:position + size])
+        assert len(result.segment_ends) == len(result.segments)
+        assert all(end <= len(result.audio) for end in result.segment_ends)
+        forwarded.append(np.array(result.audio))
+        segments.extend(result.segments)
+        position += size
+    return np.concatenate(forwarded), segments
+
+
+def test_segments():
+    """음성 구간 표시와 패딩/행오버 테스트"""
+    print("🗣️ === 음성 구간 테스트 ===")
+
+    signal = _signal()
+    detector = VoiceActivityDetector(SAMPLE_RATE, frame_ms=20, onset_ms=40, hangover_ms=300, padding_ms=200)
+    forwarded, segments = _run(signal, [1600] * (len(signal) // 1600 + 1), detector)
+
+    assert segments == [(1.0, 1.5), (2.5, 2.8)], segments
+
+    # 첫 구간: 패딩 0.2 + 음성 0.5 + 행오버 0.3, 둘째 구간: 0.2 + 0.3 + 0.3
+    assert len(forwarded) == int(SAMPLE_RATE * 1.8)
+    assert np.array_equal(forwarded[:int(SAMPLE_RATE * 1.0)], signal[int(SAMPLE_RATE * 0.8):int(SAMPLE_RATE * 1.8)])
+
+    stats = detector.get_stats()
+    assert stats['segments'] == 2 and not stats['is_speech']
+    print(f"   구간: {segments}, 전달 비율: {stats['forwarded_ratio']:.1%}")
+
+    # 한 블록 안에서 끝나고 다시 시작한 구간은 끝 위치로 나눌 수 있음
+    detector.reset()
+    result = detector.process(signal)
+    assert result.segment_ends == [int(SAMPLE_RATE * 1.0), int(SAMPLE_RATE * 1.8)]
+    print("✅ 음성 구간 확인")
+
+
+def test_block_sizes():
+    """블록 크기와 무관한 판정 테스트"""
+    print("\n🧱 === 블록 크기 테스트 ===")
+
+    signal = _signal()
+    reference, reference_segments = _run(signal, [len(signal)], VoiceActivityDetector(SAMPLE_RATE))
+
+    rng = np.random.default_rng(1)
+    sizes = rng.integers(1, 3000, 200).tolist()
+    forwarded, segments = _run(signal, sizes, VoiceActivityDetector(SAMPLE_RATE))
+
+    assert segments == reference_segments
+    assert np.array_equal(forwarded, reference)
+
+    # 패딩이 직전 구간과 겹치면 이미 보낸 오디오는 다시 보내지 않음
+    close = np.concatenate([_tone(0.3), _silence(0.35, rng), _tone(0.3), _silence(0.5, rng)])
+    detector = VoiceActivityDetector(SAMPLE_RATE, hangover_ms=300, padding_ms=200)
+    forwarded, segments = _run(close, [800] * (len(close) // 800 + 1), detector)
+    assert len(segments) == 2
+    assert len(forwarded) <= len(close)
+    print("✅ 블록 크기 확인")
+
+
+def test_noise_and_pcm16():
+    """잡음 제외와 PCM16 입력 테스트"""
+    print("\n📻 === 잡음/PCM16 테스트 ===")
+
+    rng = np.random.default_rng(2)
+
+    # 영교차율이 높은 백색 잡음은 음성이 아님
+    noise = (rng.standard_normal(SAMPLE_RATE * 2) * 0.2).astype(np.float32)
+    detector = VoiceActivityDetector(SAMPLE_RATE)
+    assert len(detector.process(noise).audio) == 0
+    assert detector.get_stats()['speech_frames'] == 0
+
+    # PCM16 입력은 같은 자료형으로 전달
+    pcm = (_signal() * 32767).astype(np.int16)
+    detector = VoiceActivityDetector(SAMPLE_RATE, dtype=np.int16)
+    forwarded, segments = _run(pcm, [2400] * (len(pcm) // 2400 + 1), detector)
+    assert forwarded.dtype == np.int16
+    assert segments == [(1.0, 1.5), (2.5, 2.8)]
+
+    detector.reset()
+    assert not detector.is_speech
+    print("✅ 잡음/PCM16 확인")
+
+
+def main():
+    """메인 테스트 함수"""
+    test_segments()
+    test_block_sizes()
+    test_noise_and_pcm16()
+    print("\n🎉 음성 구간 검출 테스트 완료!")
+    return True
+
+
+if __name__ == "__main__":
+    try:
+        success = main()
+        sys.exit(0 if success else 1)
+    except AssertionError as e:
+        print(f"\n❌ 테스트 실패: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+VoiceMacro Pro - 메모리 WAV 인코더 테스트 스크립트
+wave 모듈로 만든 파일과의 동일성, 입력 형식, 파일 객체 속성 테스트
+"""
+
+import io
+import sys
+import wave
+import numpy as np
+from backend.utils.pcm_encoder import encode_wav, float_to_pcm16
+
+
+def _wave_reference(pcm: bytes, sample_rate: int, channels: int) -> bytes:
+    """wave 모듈로 만든 WAV 바이트 (비교 기준)"""
+    buffer = io.BytesIO()
+    with wave.open(buffer, 'wb') as wav_file:
+        wav_file.setnchannels(channels)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(sample_rate)
+        wav_file.writeframes(pcm)
+    return buffer.getvalue()
+
+
+def test_matches_wave_module():
+    """wave 모듈과 같은 바이트를 만드는지 테스트"""
+    print("🎵 === WAV 형식 테스트 ===")
+
+    rng = np.random.default_rng(0)
+    pcm = float_to_pcm16(rng.uniform(-1.0, 1.0, 24000).astype(np.float32))
+
+    for sample_rate, channels in [(24000, 1), (16000, 1), (48000, 2)]:
+        wav_file = encode_wav(pcm, sample_rate, channels)
+        assert wav_file.getvalue() == _wave_reference(pcm, sample_rate, channels)
+
+        with wave.open(wav_file, 'rb') as reader:
+            assert reader.getframerate() == sample_rate and reader.getnchannels() == channels
+            assert reader.readframes(reader.getnframes()) == pcm
+
+    print(f"   크기: {len(encode_wav(pcm, 24000).getvalue())} bytes (헤더 44 + 데이터 {len(pcm)})")
+    print("✅ WAV 형식 확인")
+
+
+def test_inputs_and_file_object():
+    """입력 형식과 업로드용 파일 객체 속성 테스트"""
+    print("\n📦 === 입력/파일 객체 테스트 ===")
+
+    samples = np.array([0, 1, -1, 32767, -32768], dtype='<i2')
+    expected = encode_wav(samples.tobytes(), 16000).getvalue()
+
+    for pcm in (bytearray(samples.tobytes()), memoryview(samples.tobytes()), samples):
+        assert encode_wav(pcm, 16000).getvalue() == expected
+
+    wav_file = encode_wav(b'', 16000, name='utterance.wav')
+    assert wav_file.name == 'utterance.wav' and wav_file.tell() == 0
+    assert len(wav_file.getvalue()) == 44
+
+    # 범위를 넘는 float는 잘라서 변환 (부호가 뒤집히지 않음)
+    assert np.frombuffer(float_to_pcm16(np.array([1.5, -1.5])), dtype='<i2').tolist() == [32767, -32768]
+    print("✅ 입력/파일 객체 확인")
+
+
+def main():
+    """메인 테스트 함수"""
+    test_matches_wave_module()
+    test_inputs_and_file_object()
+    print("\n🎉 WAV 인코더 테스트 완료!")
+    return True
+
+
+if __name__ == "__main__":
+    try:
+        success = main()
+        sys.exit(0 if success else 1)
+    except AssertionError as e:
+        print(f"\n❌ 테스트 실패: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
@@ -0,0 +1,103 @@
+"""
+VoiceMacro Pro - Aho-Corasick 다중 패턴 검색 모듈
+여러 단어(동의어 등)를 텍스트 한 번의 선형 탐색으로 모두 찾는 오토마톤을 제공합니다.
+"""
+
+from collections import deque
+from typing import Dict, Iterator, List, Sequence, Set, Tuple
+
+
+class AhoCorasickAutomaton:
+    """
+    Aho-Corasick 다중 패턴 검색 오토마톤 클래스
+    - 패턴 목록으로 트라이와 실패 링크를 한 번 구성
+    - 텍스트 길이에 비례하는 시간으로 모든 패턴 출현 위치 검색
+    """
+
+    def __init__(self, patterns: Sequence[str]):
+        """
+        오토마톤 생성
+
+        Args:
+            patterns (Sequence[str]): 검색할 패턴 목록 (위치가 곧 패턴 번호, 빈 문자열은 무시)
+        """
+        self.patterns = list(patterns)
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[int]] = [[]]
+
+        for pattern_id, pattern in enumerate(self.patterns):
+            if pattern:
+                self._add_pattern(pattern, pattern_id)
+
+        self._build_failure_links()
+
+    def _add_pattern(self, pattern: str, pattern_id: int):
+        """트라이에 패턴 추가"""
+        state = 0
+        for char in pattern:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+                self._goto[state][char] = next_state
+            state = next_state
+        self._output[state].append(pattern_id)
+
+    def _build_failure_links(self):
+        """너비 우선 탐색으로 실패 링크와 출력 집합 구성"""
+        queue = deque(self._goto[0].values())
+
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[next_state] = target if target != next_state else 0
+
+                # 실패 링크 쪽에서 끝나는 패턴도 함께 출력
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int]]:
+        """
+        텍스트에서 모든 패턴 출현 위치를 순서대로 반환
+
+        Args:
+            text (str): 검색할 텍스트
+
+        Yields:
+            Tuple[int, int]: (패턴이 끝나는 위치(미포함), 패턴 번호)
+        """
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        state = 0
+
+        for index, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+
+            for pattern_id in output[state]:
+                yield index + 1, pattern_id
+
+    def find_all(self, text: str) -> Set[int]:
+        """
+        텍스트에 한 번 이상 등장하는 패턴 번호 집합 반환
+
+        Args:
+            text (str): 검색할 텍스트
+
+        Returns:
+            Set[int]: 등장한 패턴 번호 집합
+        """
+        return {pattern_id for _, pattern_id in self.iter_matches(text)}
+
+    def __len__(self) -> int:
+        return len(self.patterns)
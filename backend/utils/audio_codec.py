@@ -0,0 +1,250 @@
+"""
+VoiceMacro Pro - 업링크 오디오 코덱 모듈
+클라이언트가 보내는 16-bit PCM을 μ-law(2:1) 또는 IMA-ADPCM(4:1)으로 줄여 받을 수 있게 하고,
+서버 쪽 디코딩은 NumPy 벡터 연산으로 처리합니다.
+
+코덱별 데이터 형식:
+    pcm16     : PCM16 리틀 엔디언 모노
+    mulaw     : G.711 μ-law, 샘플당 1바이트
+    ima_adpcm : 청크 헤더 4바이트 (시작 예측값 int16 LE, 시작 스텝 인덱스 u8, 예약 u8)
+                + 샘플당 4비트 코드 (바이트마다 낮은 니블이 먼저)
+                청크마다 시작 상태가 있어 청크가 빠져도 다음 청크는 그대로 디코딩됩니다.
+"""
+
+import struct
+from typing import Any, Iterable, Optional, Sequence
+
+import numpy as np
+
+AUDIO_CODECS = ('pcm16', 'mulaw', 'ima_adpcm')
+
+# G.711 μ-law 상수
+MULAW_BIAS = 0x84
+MULAW_CLIP = 32635
+
+# IMA-ADPCM 표준 테이블
+IMA_INDEX_TABLE = np.array([-1, -1, -1, -1, 2, 4, 6, 8] * 2, dtype=np.int64)
+IMA_STEP_TABLE = np.array([
+    7, 8, 9, 10, 11, 12, 13, 14, 16, 17, 19, 21, 23, 25, 28, 31, 34, 37, 41, 45,
+    50, 55, 60, 66, 73, 80, 88, 97, 107, 118, 130, 143, 157, 173, 190, 209, 230, 253, 279, 307,
+    337, 371, 408, 449, 494, 544, 598, 658, 724, 796, 876, 963, 1060, 1166, 1282, 1411, 1552, 1707, 1878, 2066,
+    2272, 2499, 2749, 3024, 3327, 3660, 4026, 4428, 4871, 5358, 5894, 6484, 7132, 7845, 8630, 9493, 10442, 11487,
+    12635, 13899, 15289, 16818, 18500, 20350, 22385, 24623, 27086, 29794, 32767
+], dtype=np.int64)
+IMA_MAX_INDEX = len(IMA_STEP_TABLE) - 1
+IMA_HEADER = struct.Struct('<hBx')
+
+
+def _build_mulaw_table() -> np.ndarray:
+    """μ-law 바이트 256개의 PCM16 디코딩 테이블"""
+    codes = ~np.arange(256, dtype=np.int64) & 0xFF
+    exponent = (codes >> 4) & 0x07
+    mantissa = codes & 0x0F
+    magnitude = (((mantissa << 3) + MULAW_BIAS) << exponent) - MULAW_BIAS
+    table = np.where(codes & 0x80, -magnitude, magnitude).astype(np.int16)
+    table.setflags(write=False)
+    return table
+
+
+MULAW_DECODE_TABLE = _build_mulaw_table()
+
+
+def encode_mulaw(samples: np.ndarray) -> bytes:
+    """
+    PCM16 오디오를 μ-law로 인코딩 (클라이언트 구현/테스트용)
+
+    Args:
+        samples (np.ndarray): PCM16 정수 샘플
+
+    Returns:
+        bytes: 샘플당 1바이트 μ-law 데이터
+    """
+    pcm = np.asarray(samples, dtype=np.int64).reshape(-1)
+    sign = np.where(pcm < 0, 0x80, 0)
+    magnitude = np.minimum(np.abs(pcm), MULAW_CLIP) + MULAW_BIAS
+    exponent = np.frexp(magnitude >> 7)[1].astype(np.int64) - 1  # floor(log2(magnitude >> 7))
+    mantissa = (magnitude >> (exponent + 3)) & 0x0F
+    return (~(sign | (exponent << 4) | mantissa) & 0xFF).astype(np.uint8).tobytes()
+
+
+def decode_mulaw(data: Any) -> np.ndarray:
+    """
+    μ-law 데이터를 PCM16으로 디코딩 (테이블 조회 한 번)
+
+    Args:
+        data (Any): μ-law 바이트 (bytes 호환 객체)
+
+    Returns:
+        np.ndarray: PCM16 샘플 (int16)
+    """
+    return MULAW_DECODE_TABLE[np.frombuffer(data, dtype=np.uint8)]
+
+
+def _clamp_add_scan(start: int, add: np.ndarray, low: int, high: int) -> np.ndarray:
+    """
+    x[n] = clip(x[n-1] + add[n], low, high)의 모든 값을 병렬 누적(prefix scan)으로 계산
+
+    clip(x + a, lo, hi) 꼴의 함수는 합성해도 같은 꼴이므로
+    (a1, lo1, hi1) 다음 (a2, lo2, hi2) = (a1 + a2, clip(lo1 + a2, lo2, hi2), clip(hi1 + a2, lo2, hi2))
+    를 log2(n)번의 배열 연산으로 누적합니다.
+    """
+    count = len(add)
+    offsets = add.astype(np.int64)
+    lows = np.full(count, low, dtype=np.int64)
+    highs = np.full(count, high, dtype=np.int64)
+
+    shift = 1
+    while shift < count:
+        current_offsets, current_lows, current_highs = offsets[shift:], lows[shift:], highs[shift:]
+        combined_lows = np.clip(lows[:-shift] + current_offsets, current_lows, current_highs)
+        combined_highs = np.clip(highs[:-shift] + current_offsets, current_lows, current_highs)
+        combined_offsets = offsets[:-shift] + current_offsets
+        offsets[shift:], lows[shift:], highs[shift:] = combined_offsets, combined_lows, combined_highs
+        shift *= 2
+
+    return np.clip(start + offsets, lows, highs)
+
+
+def decode_ima_adpcm(data: Any) -> np.ndarray:
+    """
+    IMA-ADPCM 청크를 PCM16으로 디코딩 (샘플 단위 반복 없이 벡터 연산)
+
+    Args:
+        data (Any): 헤더가 붙은 IMA-ADPCM 청크 (bytes 호환 객체)
+
+    Returns:
+        np.ndarray: PCM16 샘플 (int16, 바이트당 2샘플)
+
+    Raises:
+        ValueError: 헤더가 없거나 잘못된 청크
+    """
+    view = memoryview(data).cast('B')
+    if view.nbytes < IMA_HEADER.size:
+        raise ValueError(f"IMA-ADPCM 청크가 헤더보다 짧습니다: {view.nbytes} bytes")
+    predictor, index = IMA_HEADER.unpack_from(view)
+    if index > IMA_MAX_INDEX:
+        raise ValueError(f"IMA-ADPCM 스텝 인덱스가 잘못되었습니다: {index}")
+
+    packed = np.frombuffer(view, dtype=np.uint8, offset=IMA_HEADER.size)
+    codes = np.empty(len(packed) * 2, dtype=np.int64)
+    codes[0::2] = packed & 0x0F
+    codes[1::2] = packed >> 4
+    if not len(codes):
+        return np.empty(0, dtype=np.int16)
+
+    # 스텝 인덱스는 코드만으로 정해짐 (샘플 n은 n-1번째까지 반영된 인덱스 사용)
+    indices = np.empty(len(codes), dtype=np.int64)
+    indices[0] = index
+    indices[1:] = _clamp_add_scan(index, IMA_INDEX_TABLE[codes[:-1]], 0, IMA_MAX_INDEX)
+    steps = IMA_STEP_TABLE[indices]
+
+    differences = steps >> 3
+    differences += np.where(codes & 4, steps, 0)
+    differences += np.where(codes & 2, steps >> 1, 0)
+    differences += np.where(codes & 1, steps >> 2, 0)
+    differences = np.where(codes & 8, -differences, differences)
+
+    return _clamp_add_scan(predictor, differences, -32768, 32767).astype(np.int16)
+
+
+class ImaAdpcmEncoder:
+    """
+    IMA-ADPCM 스트리밍 인코더 클래스 (클라이언트 구현/테스트용 기준 구현)
+    - 청크마다 시작 예측값/스텝 인덱스를 헤더에 기록하고 상태는 다음 청크로 이어감
+    - 홀수 길이 청크는 마지막 샘플을 한 번 더 넣어 바이트를 채움
+    """
+
+    def __init__(self):
+        """인코더 생성"""
+        self.predictor = 0
+        self.index = 0
+
+    def encode(self, samples: np.ndarray) -> bytes:
+        """
+        PCM16 청크 인코딩
+
+        Args:
+            samples (np.ndarray): PCM16 정수 샘플
+
+        Returns:
+            bytes: 헤더가 붙은 IMA-ADPCM 청크
+        """
+        pcm = np.asarray(samples, dtype=np.int64).reshape(-1).tolist()
+        if len(pcm) % 2:
+            pcm.append(pcm[-1])
+
+        header = IMA_HEADER.pack(self.predictor, self.index)
+        step_table, index_table = IMA_STEP_TABLE.tolist(), IMA_INDEX_TABLE.tolist()
+        predictor, index = self.predictor, self.index
+        codes = []
+
+        for sample in pcm:
+            step = step_table[index]
+            difference = sample - predictor
+            code = 8 if difference < 0 else 0
+            difference = abs(difference)
+
+            delta = step >> 3
+            if difference >= step:
+                code |= 4
+                difference -= step
+                delta += step
+            if difference >= step >> 1:
+                code |= 2
+                difference -= step >> 1
+                delta += step >> 1
+            if difference >= step >> 2:
+                code |= 1
+                delta += step >> 2
+
+            predictor = max(-32768, min(32767, predictor - delta if code & 8 else predictor + delta))
+            index = max(0, min(IMA_MAX_INDEX, index + index_table[code]))
+            codes.append(code)
+
+        self.predictor, self.index = predictor, index
+        nibbles = np.array(codes, dtype=np.uint8)
+        return header + (nibbles[0::2] | (nibbles[1::2] << 4)).tobytes()
+
+
+def decode_audio(data: Any, codec: str) -> np.ndarray:
+    """
+    업링크 오디오를 PCM16 샘플로 디코딩
+
+    Args:
+        data (Any): 코덱으로 인코딩된 오디오 (bytes 호환 객체)
+        codec (str): 'pcm16' | 'mulaw' | 'ima_adpcm'
+
+    Returns:
+        np.ndarray: PCM16 샘플 (pcm16은 받은 버퍼를 그대로 가리키는 뷰)
+
+    Raises:
+        ValueError: 지원하지 않는 코덱이거나 잘못된 데이터
+    """
+    if codec == 'pcm16':
+        view = memoryview(data).cast('B')
+        if view.nbytes % 2:
+            raise ValueError(f"PCM16 데이터 길이가 홀수입니다: {view.nbytes} bytes")
+        return np.frombuffer(view, dtype='<i2')
+    if codec == 'mulaw':
+        return decode_mulaw(data)
+    if codec == 'ima_adpcm':
+        return decode_ima_adpcm(data)
+    raise ValueError(f"지원하지 않는 오디오 코덱입니다: {codec}")
+
+
+def negotiate_codec(client_codecs: Optional[Iterable[str]], server_codecs: Sequence[str]) -> str:
+    """
+    클라이언트와 서버가 모두 지원하는 코덱 중 서버 우선순위가 가장 높은 코덱 선택
+
+    Args:
+        client_codecs (Iterable[str]): 클라이언트가 지원하는 코덱 목록 (없으면 pcm16만 지원으로 간주)
+        server_codecs (Sequence[str]): 서버가 허용하는 코덱 (우선순위 순)
+
+    Returns:
+        str: 선택된 코덱 (공통 코덱이 없으면 'pcm16')
+    """
+    offered = {codec.strip().lower() for codec in client_codecs or () if isinstance(codec, str)}
+    for codec in server_codecs:
+        if codec in offered and codec in AUDIO_CODECS:
+            return codec
+    return 'pcm16'
@@ -0,0 +1,183 @@
+"""
+VoiceMacro Pro - 바이너리 오디오 프레임 모듈
+Socket.IO audio_frame 이벤트의 바이너리 프레임(헤더 + 오디오)을 복사 없이 해석하고,
+시퀀스 번호로 프레임 손실/순서 뒤바뀜/중복을 검출합니다.
+
+프레임 형식 (리틀 엔디언, 헤더 12바이트):
+    magic(2s) = b'VM' | version(u8) = 1 | format(u8) | sequence(u32) | sample_rate(u32) | 오디오 데이터
+    format 코드: 0 = pcm16, 1 = mulaw, 2 = ima_adpcm (코덱별 데이터 형식은 audio_codec 모듈 참고)
+    sample_rate: SUPPORTED_SAMPLE_RATES 중 하나 (조립 샘플레이트와 다르면 서버가 변환)
+헤더 필드를 딕셔너리로 보내는 형식도 지원합니다:
+    {'seq': int, 'sample_rate': int, 'format': 'pcm16', 'audio': bytes}
+"""
+
+import struct
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict
+
+AUDIO_FRAME_MAGIC = b'VM'
+AUDIO_FRAME_VERSION = 1
+AUDIO_FRAME_HEADER = struct.Struct('<2sBBII')
+
+# 헤더 format 코드 <-> 이름
+AUDIO_FORMATS = {0: 'pcm16', 1: 'mulaw', 2: 'ima_adpcm'}
+AUDIO_FORMAT_CODES = {name: code for code, name in AUDIO_FORMATS.items()}
+
+SEQUENCE_MODULUS = 1 << 32
+
+# 허용하는 캡처 샘플레이트 (리샘플러 필터 크기가 샘플레이트 쌍에 따라 정해지므로 목록으로 제한)
+SUPPORTED_SAMPLE_RATES = (8000, 11025, 16000, 22050, 24000, 32000, 44100, 48000)
+
+
+@dataclass
+class AudioFrame:
+    """해석된 오디오 프레임"""
+    sequence: int         # 프레임 시퀀스 번호 (u32, 한 바퀴 돌면 0부터)
+    sample_rate: int      # 샘플레이트 (Hz)
+    format: str           # 오디오 형식 이름 ('pcm16' | 'mulaw' | 'ima_adpcm')
+    audio: memoryview     # 오디오 데이터 (수신 버퍼를 가리키는 뷰, 복사 없음)
+
+
+def pack_audio_frame(sequence: int, sample_rate: int, audio: Any, format: str = 'pcm16') -> bytes:
+    """
+    오디오 프레임 만들기 (클라이언트 구현/테스트용)
+
+    Args:
+        sequence (int): 시퀀스 번호
+        sample_rate (int): 샘플레이트 (Hz)
+        audio (Any): 오디오 데이터 (bytes 호환 객체)
+        format (str): 오디오 형식 이름
+
+    Returns:
+        bytes: 헤더가 붙은 프레임
+    """
+    header = AUDIO_FRAME_HEADER.pack(AUDIO_FRAME_MAGIC, AUDIO_FRAME_VERSION, AUDIO_FORMAT_CODES[format],
+                                     sequence % SEQUENCE_MODULUS, sample_rate)
+    return b''.join((header, memoryview(audio).cast('B')))
+
+
+def parse_audio_frame(data: Any) -> AudioFrame:
+    """
+    audio_frame 이벤트 데이터 해석
+
+    Args:
+        data (Any): 헤더가 붙은 바이너리 프레임 또는 헤더 필드 딕셔너리
+
+    Returns:
+        AudioFrame: 해석된 프레임 (오디오는 받은 버퍼의 memoryview)
+
+    Raises:
+        ValueError: 형식이 잘못된 프레임
+    """
+    if isinstance(data, dict):
+        try:
+            sequence = int(data['seq'])
+            sample_rate = int(data['sample_rate'])
+            audio_format = data.get('format', 'pcm16')
+            audio = memoryview(data['audio']).cast('B')
+        except (KeyError, TypeError) as e:
+            raise ValueError(f"오디오 프레임 필드가 잘못되었습니다: {e}")
+    else:
+        try:
+            view = memoryview(data).cast('B')
+        except TypeError:
+            raise ValueError(f"바이너리 오디오 프레임이 아닙니다: {type(data).__name__}")
+        if view.nbytes < AUDIO_FRAME_HEADER.size:
+            raise ValueError(f"오디오 프레임이 헤더보다 짧습니다: {view.nbytes} bytes")
+
+        magic, version, format_code, sequence, sample_rate = AUDIO_FRAME_HEADER.unpack_from(view)
+        if magic != AUDIO_FRAME_MAGIC or version != AUDIO_FRAME_VERSION:
+            raise ValueError(f"지원하지 않는 오디오 프레임 헤더입니다: {magic!r} v{version}")
+        audio_format = AUDIO_FORMATS.get(format_code, str(format_code))
+        audio = view[AUDIO_FRAME_HEADER.size:]
+
+    if audio_format not in AUDIO_FORMAT_CODES:
+        raise ValueError(f"지원하지 않는 오디오 형식입니다: {audio_format}")
+    if not 0 <= sequence < SEQUENCE_MODULUS:
+        raise ValueError(f"시퀀스 번호 범위를 벗어났습니다: {sequence}")
+    if sample_rate not in SUPPORTED_SAMPLE_RATES:
+        raise ValueError(f"지원하지 않는 샘플레이트입니다: {sample_rate}")
+    if audio_format == 'pcm16' and audio.nbytes % 2:
+        raise ValueError(f"PCM16 데이터 길이가 홀수입니다: {audio.nbytes} bytes")
+
+    return AudioFrame(sequence, sample_rate, audio_format, audio)
+
+
+class FrameSequenceTracker:
+    """
+    클라이언트 하나의 프레임 시퀀스 추적 클래스
+    - 기대한 번호보다 앞선 프레임이 오면 그 사이 번호를 손실로 기록
+    - 손실로 기록된 번호가 늦게 도착하면 순서 뒤바뀜, 이미 받은 번호면 중복으로 판정
+    - 늦게 온 프레임은 스트림이 이미 지나갔으므로 버리도록 'late'/'duplicate'로 알림
+    - u32 시퀀스가 한 바퀴 도는 것을 고려해 번호 차이는 모듈로 연산으로 비교
+    """
+
+    def __init__(self, max_missing: int = 256):
+        """
+        시퀀스 추적기 생성
+
+        Args:
+            max_missing (int): 늦게 도착할 수 있다고 기억해 둘 손실 번호 수
+        """
+        self.max_missing = max_missing
+        self._expected = None
+        self._missing: 'OrderedDict[int, None]' = OrderedDict()
+
+        # 시퀀스 통계
+        self.stats = {
+            'frames': 0,
+            'lost': 0,          # 아직 도착하지 않은 번호 수 (늦게 도착하면 줄어듦)
+            'reordered': 0,     # 손실로 기록된 뒤 늦게 도착한 프레임 수
+            'duplicates': 0
+        }
+
+    def track(self, sequence: int) -> str:
+        """
+        프레임 시퀀스 번호 기록
+
+        Args:
+            sequence (int): 받은 프레임 번호
+
+        Returns:
+            str: 'ok' (순서대로 도착) | 'gap' (앞 번호 손실) | 'late' (순서 뒤바뀜) | 'duplicate'
+        """
+        self.stats['frames'] += 1
+
+        if self._expected is None:
+            self._expected = (sequence + 1) % SEQUENCE_MODULUS
+            return 'ok'
+
+        ahead = (sequence - self._expected) % SEQUENCE_MODULUS
+        if ahead < SEQUENCE_MODULUS // 2:
+            # 기대 번호이거나 그보다 앞선 번호: 건너뛴 번호는 손실로 기록 (너무 많으면 최근 번호만 기억)
+            for missing in range(self._expected + ahead - min(ahead, self.max_missing), self._expected + ahead):
+                self._missing[missing % SEQUENCE_MODULUS] = None
+            while len(self._missing) > self.max_missing:
+                self._missing.popitem(last=False)
+            self.stats['lost'] += ahead
+            self._expected = (sequence + 1) % SEQUENCE_MODULUS
+            return 'gap' if ahead else 'ok'
+
+        if sequence in self._missing:
+            del self._missing[sequence]
+            self.stats['lost'] -= 1
+            self.stats['reordered'] += 1
+            return 'late'
+
+        self.stats['duplicates'] += 1
+        return 'duplicate'
+
+    def reset(self) -> None:
+        """추적 상태 초기화 (새 녹음 시작 시, 통계는 유지)"""
+        self._expected = None
+        self._missing.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        시퀀스 통계 반환
+
+        Returns:
+            Dict: 받은 프레임/손실/순서 뒤바뀜/중복 수
+        """
+        return {**self.stats, 'next_sequence': self._expected}
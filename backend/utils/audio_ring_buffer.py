@@ -0,0 +1,220 @@
+"""
+VoiceMacro Pro - 오디오 링 버퍼 모듈
+녹음 콜백(생산자 1개)과 오디오 소비자(1개) 사이에서 float32 오디오를
+미리 할당한 배열에 순환 저장합니다. 쓰기에서 메모리를 할당하지 않고,
+읽기는 복사 없는 배열 뷰로 반환합니다.
+"""
+
+import threading
+import time
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+
+class AudioRingBuffer:
+    """
+    단일 생산자/단일 소비자 float32 오디오 링 버퍼 클래스
+    - 같은 샘플을 i와 i + capacity 위치에 두 번 쓰는 미러 배열이므로
+      버퍼 길이 이하의 어느 구간이든 연속된 뷰로 읽을 수 있음 (경계에서 이어 붙이기 없음)
+    - 쓰기/읽기 위치는 누적 프레임 수로 관리하며 각각 한쪽 스레드만 갱신 (잠금 없음)
+    - 소비자가 버퍼 길이 이상 뒤처지면 덮어쓰인 구간을 건너뛰고 오버런으로 집계
+    - 읽기 대기는 폴링 대신 생산자가 목표 위치에 도달했을 때 이벤트로 깨움
+
+    반환되는 뷰는 생산자가 버퍼를 한 바퀴 더 쓰면 덮어쓰이므로
+    오래 보관할 데이터는 호출자가 복사해야 합니다.
+    """
+
+    def __init__(self, capacity_seconds: float, sample_rate: int):
+        """
+        오디오 링 버퍼 생성
+
+        Args:
+            capacity_seconds (float): 버퍼에 보관할 오디오 길이 (초)
+            sample_rate (int): 샘플레이트 (Hz)
+        """
+        self.sample_rate = sample_rate
+        self.capacity = max(1, int(round(capacity_seconds * sample_rate)))
+
+        # 미러 배열 (앞 절반과 뒤 절반이 항상 같은 내용)
+        self._buffer = np.zeros(2 * self.capacity, dtype=np.float32)
+
+        # 누적 위치 (쓰기 위치는 생산자만, 읽기 위치는 소비자만 갱신)
+        self._write_index = 0
+        self._read_index = 0
+
+        # 읽기 대기 (소비자가 기다리는 쓰기 위치에 도달하면 생산자가 이벤트 설정)
+        self._wait_target: Optional[int] = None
+        self._data_event = threading.Event()
+
+        # 버퍼 통계
+        self.overruns = 0           # 소비자가 덮어쓰인 구간을 건너뛴 횟수
+        self.overrun_frames = 0     # 읽지 못하고 덮어쓰인 프레임 수
+        self.oversized_frames = 0   # 버퍼보다 큰 블록에서 앞부분이 버려진 프레임 수
+
+    def _seconds_to_frames(self, seconds: float) -> int:
+        """초를 프레임 수로 변환"""
+        return max(0, int(round(seconds * self.sample_rate)))
+
+    @property
+    def available(self) -> int:
+        """소비자가 아직 읽지 않은 프레임 수 (최대 버퍼 길이)"""
+        return min(self._write_index - self._read_index, self.capacity)
+
+    @property
+    def total_frames(self) -> int:
+        """지금까지 쓰인 누적 프레임 수"""
+        return self._write_index
+
+    def write(self, block: np.ndarray) -> None:
+        """
+        오디오 블록 쓰기 (생산자 전용, 오디오 콜백에서 호출)
+
+        메모리를 할당하지 않도록 미리 할당한 배열에 바로 복사합니다.
+
+        Args:
+            block (np.ndarray): 오디오 블록 ((frames,) 또는 (frames, channels), 다채널이면 첫 채널 사용)
+        """
+        samples = block[:, 0] if block.ndim > 1 else block
+        count = len(samples)
+        if not count:
+            return
+
+        write_index = self._write_index
+        capacity = self.capacity
+
+        # 버퍼보다 긴 블록은 뒷부분만 보관
+        if count > capacity:
+            self.oversized_frames += count - capacity
+            write_index += count - capacity
+            samples = samples[count - capacity:]
+            count = capacity
+
+        start = write_index % capacity
+        first = min(count, capacity - start)
+        self._buffer[start:start + first] = samples[:first]
+        self._buffer[start + capacity:start + capacity + first] = samples[:first]
+
+        rest = count - first
+        if rest:
+            self._buffer[:rest] = samples[first:]
+            self._buffer[capacity:capacity + rest] = samples[first:]
+
+        # 데이터를 모두 쓴 다음 위치 공개
+        self._write_index = write_index + count
+
+        wait_target = self._wait_target
+        if wait_target is not None and self._write_index >= wait_target:
+            self._data_event.set()
+
+    def _view(self, end_index: int, frames: int) -> np.ndarray:
+        """누적 위치 end_index에서 끝나는 frames 길이의 읽기 전용 뷰"""
+        start = (end_index - frames) % self.capacity
+        view = self._buffer[start:start + frames]
+        view.flags.writeable = False
+        return view
+
+    def _skip_overrun(self, write_index: int) -> None:
+        """덮어쓰인 구간을 건너뛰고 오버런 집계 (소비자 전용)"""
+        lag = write_index - self._read_index
+        if lag > self.capacity:
+            self.overruns += 1
+            self.overrun_frames += lag - self.capacity
+            self._read_index = write_index - self.capacity
+
+    def read(self, frames: int, timeout: Optional[float] = None) -> Optional[np.ndarray]:
+        """
+        다음 오디오를 순서대로 읽기 (소비자 전용)
+
+        요청한 프레임이 모일 때까지 이벤트로 대기하며, 타임아웃이면 그때까지 모인 만큼 반환합니다.
+
+        Args:
+            frames (int): 읽을 프레임 수 (최대 버퍼 길이)
+            timeout (float): 최대 대기 시간 (초, None이면 모일 때까지 대기)
+
+        Returns:
+            Optional[np.ndarray]: 읽기 전용 오디오 뷰 (읽을 데이터가 없으면 None)
+        """
+        frames = min(frames, self.capacity)
+        if frames <= 0:
+            return None
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self._write_index - self._read_index < frames:
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                break
+
+            # 목표 위치를 알린 뒤 다시 확인 (그 사이에 쓰인 경우 대기하지 않음)
+            self._data_event.clear()
+            self._wait_target = self._read_index + frames
+            if self._write_index >= self._wait_target:
+                break
+            self._data_event.wait(remaining)
+        self._wait_target = None
+
+        write_index = self._write_index
+        self._skip_overrun(write_index)
+
+        count = min(frames, write_index - self._read_index)
+        if count <= 0:
+            return None
+
+        self._read_index += count
+        return self._view(self._read_index, count)
+
+    def read_seconds(self, seconds: float, timeout: Optional[float] = None) -> Optional[np.ndarray]:
+        """
+        다음 오디오를 초 단위로 읽기 (소비자 전용)
+
+        Args:
+            seconds (float): 읽을 오디오 길이 (초)
+            timeout (float): 최대 대기 시간 (초)
+
+        Returns:
+            Optional[np.ndarray]: 읽기 전용 오디오 뷰 (읽을 데이터가 없으면 None)
+        """
+        return self.read(self._seconds_to_frames(seconds), timeout)
+
+    def latest(self, seconds: float) -> np.ndarray:
+        """
+        가장 최근 오디오의 뷰 반환 (읽기 위치는 바꾸지 않음)
+
+        Args:
+            seconds (float): 오디오 길이 (초, 버퍼 길이와 지금까지 쓰인 길이로 제한)
+
+        Returns:
+            np.ndarray: 최근 오디오의 읽기 전용 뷰 (복사 없음)
+        """
+        write_index = self._write_index
+        frames = min(self._seconds_to_frames(seconds), write_index, self.capacity)
+        return self._view(write_index, frames)
+
+    def discard(self) -> None:
+        """읽지 않은 오디오 버리기 (소비자 전용)"""
+        self._read_index = self._write_index
+
+    def reset(self) -> None:
+        """버퍼 초기화 (생산자가 멈춘 상태에서만 호출)"""
+        self._write_index = 0
+        self._read_index = 0
+        self._wait_target = None
+        self.overruns = 0
+        self.overrun_frames = 0
+        self.oversized_frames = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        버퍼 통계 반환
+
+        Returns:
+            Dict: 버퍼 통계 정보
+        """
+        return {
+            'capacity_seconds': self.capacity / self.sample_rate,
+            'buffered_seconds': round(self.available / self.sample_rate, 3),
+            'total_frames': self._write_index,
+            'overruns': self.overruns,
+            'overrun_frames': self.overrun_frames,
+            'oversized_frames': self.oversized_frames
+        }
@@ -0,0 +1,228 @@
+"""
+VoiceMacro Pro - 음성 명령어 접두사 트라이 모듈
+부분 인식 결과(partial transcript)가 어떤 명령어의 앞부분인지 빠르게 판단하고,
+여러 명령어가 이어진 발화를 가장 긴 명령어 단위로 나누기 위한 트라이를 제공합니다.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from backend.utils.text_normalizer import TextNormalizer, get_text_normalizer
+
+
+def normalize_command_key(text: str, normalizer: Optional[TextNormalizer] = None) -> str:
+    """
+    트라이 키용 명령어 정규화 (매칭 엔진과 같은 정규화 후 모든 공백 제거)
+
+    부분 인식 결과는 띄어쓰기가 자주 달라지므로 공백을 무시하고 비교합니다.
+    불용어/특수문자는 매칭 엔진과 같은 정규화기로 제거하므로 트라이 키와
+    매칭 엔진의 정규화된 명령어가 항상 같은 규칙을 따릅니다.
+
+    Args:
+        text (str): 원본 텍스트
+        normalizer (TextNormalizer): 텍스트 정규화기 (기본값: 모든 언어 공유 정규화기)
+
+    Returns:
+        str: 정규화된 키
+
+    Example:
+        >>> normalize_command_key(' 음, 스킬 하나! ')
+        '스킬하나'
+    """
+    if not text:
+        return ""
+    return ''.join((normalizer or get_text_normalizer()).normalize(text).split())
+
+
+def get_command_trie(snapshot) -> 'CommandTrie':
+    """
+    매크로 인덱스 스냅샷의 명령어 트라이 반환 (버전별로 한 번만 생성, 서비스 간 공유)
+
+    트라이 키는 인덱스 항목의 정규화된 명령어(command_normalized)에서 공백만 제거해 만듭니다.
+
+    Args:
+        snapshot (MacroIndexSnapshot): 매크로 인덱스 스냅샷
+
+    Returns:
+        CommandTrie: (음성 명령어, 매크로) 트라이
+    """
+    def build(snap) -> CommandTrie:
+        trie = CommandTrie(normalizer=snap.normalizer)
+        for entry in snap.entries:
+            trie.insert(entry.voice_command, entry.macro, key=''.join(entry.command_normalized.split()))
+        return trie
+
+    return snapshot.get_artifact('command_trie', build)
+
+
+class _TrieNode:
+    """트라이 노드 (하위 명령어 수를 함께 유지)"""
+
+    __slots__ = ('children', 'values', 'count')
+
+    def __init__(self):
+        self.children: Dict[str, '_TrieNode'] = {}
+        self.values: List[Tuple[str, Any]] = []   # 이 노드에서 끝나는 (원본 명령어, 값)
+        self.count = 0                            # 이 노드 아래에서 끝나는 명령어 수
+
+
+class CommandTrie:
+    """
+    음성 명령어 접두사 트라이 클래스
+    - 정규화된 명령어(공백 제거)를 문자 단위로 저장
+    - 노드마다 하위 명령어 수를 유지하여 접두사가 명령어 하나로만
+      완성되는지 접두사 길이에 비례하는 시간으로 판단
+    """
+
+    def __init__(self, commands: Iterable[Tuple[str, Any]] = (), normalizer: Optional[TextNormalizer] = None):
+        """
+        트라이 생성
+
+        Args:
+            commands (Iterable[Tuple[str, Any]]): (음성 명령어, 연결할 값) 목록
+            normalizer (TextNormalizer): 명령어/접두사 정규화기 (기본값: 모든 언어 공유 정규화기)
+        """
+        self._root = _TrieNode()
+        self.size = 0
+        self.normalizer = normalizer or get_text_normalizer()
+
+        for command, value in commands:
+            self.insert(command, value)
+
+    def normalize_key(self, text: str) -> str:
+        """
+        트라이와 같은 정규화기로 만든 키 반환
+
+        Args:
+            text (str): 원본 텍스트
+
+        Returns:
+            str: 정규화된 키
+        """
+        return normalize_command_key(text, self.normalizer)
+
+    def insert(self, command: str, value: Any, key: Optional[str] = None):
+        """
+        명령어 추가 (빈 명령어는 무시)
+
+        Args:
+            command (str): 음성 명령어 (원본)
+            value (Any): 명령어에 연결할 값 (매크로 등)
+            key (str): 이미 정규화된 키 (없으면 command를 정규화)
+        """
+        if key is None:
+            key = self.normalize_key(command)
+        if not key:
+            return
+
+        node = self._root
+        node.count += 1
+        for char in key:
+            child = node.children.get(char)
+            if child is None:
+                child = _TrieNode()
+                node.children[char] = child
+            node = child
+            node.count += 1
+
+        node.values.append((command, value))
+        self.size += 1
+
+    def _find_node(self, key: str) -> Optional[_TrieNode]:
+        """정규화된 키에 해당하는 노드 검색"""
+        node = self._root
+        for char in key:
+            node = node.children.get(char)
+            if node is None:
+                return None
+        return node
+
+    def count_completions(self, prefix: str) -> int:
+        """
+        접두사로 시작하는 명령어 수 반환
+
+        Args:
+            prefix (str): 접두사 (원본 텍스트)
+
+        Returns:
+            int: 명령어 수
+        """
+        node = self._find_node(self.normalize_key(prefix))
+        return node.count if node else 0
+
+    def complete(self, prefix: str, limit: int = 10) -> List[Tuple[str, Any]]:
+        """
+        접두사로 시작하는 명령어 목록 반환 (짧은 명령어 우선)
+
+        Args:
+            prefix (str): 접두사 (원본 텍스트)
+            limit (int): 최대 반환 개수
+
+        Returns:
+            List[Tuple[str, Any]]: (음성 명령어, 값) 목록
+        """
+        node = self._find_node(self.normalize_key(prefix))
+        if node is None:
+            return []
+
+        results: List[Tuple[str, Any]] = []
+        level = [node]
+        while level and len(results) < limit:
+            next_level = []
+            for current in level:
+                results.extend(current.values)
+                next_level.extend(current.children.values())
+            level = next_level
+
+        return results[:limit]
+
+    def unique_completion(self, prefix: str) -> Optional[Tuple[str, Any, float]]:
+        """
+        접두사가 명령어 하나로만 완성되는 경우 그 명령어 반환
+
+        Args:
+            prefix (str): 접두사 (원본 텍스트)
+
+        Returns:
+            Optional[Tuple[str, Any, float]]: (음성 명령어, 값, 접두사가 차지하는 비율)
+                                              또는 후보가 없거나 여러 개이면 None
+        """
+        key = self.normalize_key(prefix)
+        node = self._find_node(key)
+        if node is None or node.count != 1 or not key:
+            return None
+
+        # 하위 명령어가 하나뿐이므로 자식이 하나인 경로를 따라 내려감
+        depth = len(key)
+        while not node.values:
+            node = next(iter(node.children.values()))
+            depth += 1
+
+        command, value = node.values[0]
+        return command, value, len(key) / depth
+
+    def longest_prefix(self, key: str, start: int = 0) -> Optional[Tuple[int, List[Tuple[str, Any]]]]:
+        """
+        key[start:]의 접두사 중 가장 긴 명령어 검색
+
+        트라이를 한 번만 따라 내려가므로 가장 긴 명령어 길이에 비례하는 시간이 걸립니다.
+
+        Args:
+            key (str): 정규화된 키 (normalize_key 결과)
+            start (int): 검색 시작 위치
+
+        Returns:
+            Optional[Tuple[int, List[Tuple[str, Any]]]]: (명령어가 끝나는 위치, 해당 노드의 (음성 명령어, 값) 목록)
+                                                         또는 일치하는 명령어가 없으면 None
+        """
+        node = self._root
+        found = None
+        for position in range(start, len(key)):
+            node = node.children.get(key[position])
+            if node is None:
+                break
+            if node.values:
+                found = (position + 1, node.values)
+        return found
+
+    def __len__(self) -> int:
+        return self.size
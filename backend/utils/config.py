@@ -34,6 +34,34 @@ class Config:
     SAMPLE_RATE = 16000  # Whisper 권장 샘플레이트
     AUDIO_CHANNELS = 1   # 모노 채널
     AUDIO_FORMAT = 'wav' # 오디오 포맷
+    AUDIO_BUFFER_SECONDS = float(os.getenv('AUDIO_BUFFER_SECONDS', '10'))  # 녹음 링 버퍼 길이 (초)
+    
+    # 로컬 음성 구간 검출(VAD) 설정 - 음성 구간만 트랜스크립션으로 전달
+    VAD_ENABLED = os.getenv('VAD_ENABLED', 'true').lower() == 'true'
+    VAD_FRAME_MS = int(os.getenv('VAD_FRAME_MS', '20'))                  # 판정 프레임 길이
+    VAD_ENERGY_THRESHOLD_DB = float(os.getenv('VAD_ENERGY_THRESHOLD_DB', '-50'))  # 음성 최소 에너지 (dBFS)
+    VAD_NOISE_MARGIN_DB = float(os.getenv('VAD_NOISE_MARGIN_DB', '10'))  # 배경 잡음 대비 최소 에너지 차이
+    VAD_MAX_ZCR = float(os.getenv('VAD_MAX_ZCR', '0.35'))                # 음성으로 볼 최대 영교차율 (잡음 제외)
+    VAD_ONSET_MS = int(os.getenv('VAD_ONSET_MS', '40'))                  # 음성 시작으로 볼 연속 음성 길이
+    VAD_HANGOVER_MS = int(os.getenv('VAD_HANGOVER_MS', '300'))           # 음성 끝 판정 전 유지 시간
+    VAD_PADDING_MS = int(os.getenv('VAD_PADDING_MS', '200'))             # 음성 시작 앞에 함께 보낼 길이
+    
+    # 클라이언트 오디오 발화 조립 설정 (Socket.IO audio_chunk를 발화 단위로 모아 트랜스크립션)
+    CLIENT_AUDIO_SAMPLE_RATE = 24000  # C# 클라이언트(NAudio) PCM16 샘플레이트
+    UTTERANCE_MAX_LATENCY_MS = int(os.getenv('UTTERANCE_MAX_LATENCY_MS', '800'))   # 마지막 오디오 이후 최대 대기 시간
+    UTTERANCE_MAX_SECONDS = float(os.getenv('UTTERANCE_MAX_SECONDS', '8'))         # 발화 하나의 최대 길이
+    UTTERANCE_MIN_SECONDS = float(os.getenv('UTTERANCE_MIN_SECONDS', '0.2'))       # 이보다 짧은 발화는 버림
+    # 클라이언트 업링크 오디오 코덱 (우선순위 순, 연결 시 클라이언트가 지원하는 코덱 중에서 선택)
+    AUDIO_UPLINK_CODECS = [codec.strip() for codec in
+                           os.getenv('AUDIO_UPLINK_CODECS', 'ima_adpcm,mulaw,pcm16').split(',') if codec.strip()]
+    
+    # 클라이언트별 작업 실행기 설정 (트랜스크립션/매크로 실행 스레드 수와 큐 제한)
+    TRANSCRIPTION_WORKERS = int(os.getenv('TRANSCRIPTION_WORKERS', '4'))                          # 트랜스크립션 작업 스레드 수
+    TRANSCRIPTION_MAX_IN_FLIGHT_PER_CLIENT = int(os.getenv('TRANSCRIPTION_MAX_IN_FLIGHT_PER_CLIENT', '1'))  # 클라이언트별 동시 인식 수
+    TRANSCRIPTION_MAX_QUEUE_PER_CLIENT = int(os.getenv('TRANSCRIPTION_MAX_QUEUE_PER_CLIENT', '4'))  # 클라이언트별 대기 발화 수
+    TRANSCRIPTION_OVERFLOW_POLICY = os.getenv('TRANSCRIPTION_OVERFLOW_POLICY', 'coalesce')         # 'coalesce' | 'drop_oldest'
+    MACRO_WORKERS = int(os.getenv('MACRO_WORKERS', '4'))                                          # 매크로 실행 작업 스레드 수
+    MACRO_MAX_QUEUE_PER_CLIENT = int(os.getenv('MACRO_MAX_QUEUE_PER_CLIENT', '8'))                # 클라이언트별 대기 매크로 수
     
     # 파일 저장 설정
     TEMP_AUDIO_DIR = 'temp_audio'
@@ -46,6 +74,24 @@ class Config:
     # 매크로 매칭 설정
     MATCHING_THRESHOLD = 0.7  # 매크로 매칭 최소 유사도
     MAX_MATCH_RESULTS = 5     # 최대 매칭 결과 개수
+    MATCHING_SCORER = os.getenv('MATCHING_SCORER', 'sequence')  # 문자열 유사도 계산기 ('sequence' | 'levenshtein' | 'tfidf')
+    TFIDF_NGRAM = int(os.getenv('TFIDF_NGRAM', '3'))            # TF-IDF 계산기의 자모 n-gram 길이
+    
+    # 부분 인식 기반 선행 매칭 설정
+    SPECULATIVE_MATCHING_ENABLED = os.getenv('SPECULATIVE_MATCHING_ENABLED', 'true').lower() == 'true'
+    SPECULATIVE_EARLY_FIRE = os.getenv('SPECULATIVE_EARLY_FIRE', 'false').lower() == 'true'  # 최종 결과 전 조기 실행
+    SPECULATIVE_ARM_RATIO = float(os.getenv('SPECULATIVE_ARM_RATIO', '0.5'))    # 예약에 필요한 접두사 비율
+    SPECULATIVE_FIRE_RATIO = float(os.getenv('SPECULATIVE_FIRE_RATIO', '1.0'))  # 조기 실행에 필요한 접두사 비율
+    
+    # 다중 명령어 발화 분할 설정 ("공격 그리고 점프" -> 공격, 점프 순서로 실행)
+    SEGMENTATION_ENABLED = os.getenv('SEGMENTATION_ENABLED', 'true').lower() == 'true'
+    SEGMENTATION_MAX_SEGMENTS = int(os.getenv('SEGMENTATION_MAX_SEGMENTS', '5'))  # 한 발화에서 실행할 최대 명령어 수
+    
+    # 사용 빈도 기반 매칭 설정 (자주/최근 실행한 매크로 우선 확인)
+    USAGE_PRIOR_ENABLED = os.getenv('USAGE_PRIOR_ENABLED', 'true').lower() == 'true'
+    USAGE_PRIOR_HALF_LIFE = float(os.getenv('USAGE_PRIOR_HALF_LIFE', '600'))       # 사용 점수 반감기 (초)
+    USAGE_PRIOR_HOT_SIZE = int(os.getenv('USAGE_PRIOR_HOT_SIZE', '8'))             # 먼저 확인할 상위 매크로 수
+    USAGE_FAST_PATH_SIMILARITY = float(os.getenv('USAGE_FAST_PATH_SIMILARITY', '1.0'))  # 상위 매크로만으로 확정할 유사도 (1.0 미만은 1.0)
     
     @classmethod
     def validate_config(cls) -> bool:
@@ -0,0 +1,136 @@
+"""
+VoiceMacro Pro - 비트 병렬 편집 거리 모듈
+Myers/Hyyrö 비트 병렬 알고리즘으로 짧은 명령어 문자열의 Levenshtein 거리를 계산하고,
+정확한 계산 전에 길이 차이만으로 후보를 조기 제외하는 상한 함수를 제공합니다.
+"""
+
+from typing import Dict, Optional
+
+
+def _build_pattern_masks(pattern: str) -> Dict[str, int]:
+    """패턴의 문자별 등장 위치 비트마스크 생성"""
+    masks: Dict[str, int] = {}
+    bit = 1
+    for char in pattern:
+        masks[char] = masks.get(char, 0) | bit
+        bit <<= 1
+    return masks
+
+
+def levenshtein_distance(text1: str, text2: str, max_distance: Optional[int] = None) -> int:
+    """
+    비트 병렬(Myers/Hyyrö) Levenshtein 거리 계산
+
+    짧은 쪽 문자열을 비트 벡터 패턴으로 사용하여 긴 쪽 문자 하나당
+    상수 번의 정수 연산으로 DP 한 열을 갱신합니다.
+
+    Args:
+        text1 (str): 첫 번째 문자열
+        text2 (str): 두 번째 문자열
+        max_distance (int): 이 거리를 넘는 것이 확실하면 계산을 중단하고
+                            max_distance + 1 반환 (None이면 끝까지 계산)
+
+    Returns:
+        int: 편집 거리 (max_distance 초과 시 max_distance + 1)
+
+    Example:
+        >>> levenshtein_distance('kitten', 'sitting')
+        3
+    """
+    if text1 == text2:
+        return 0
+
+    # 짧은 쪽을 패턴(비트 벡터)으로 사용
+    if len(text1) > len(text2):
+        text1, text2 = text2, text1
+
+    pattern_length = len(text1)
+    text_length = len(text2)
+
+    # 길이 차이는 거리의 하한
+    if max_distance is not None and text_length - pattern_length > max_distance:
+        return max_distance + 1
+    if pattern_length == 0:
+        return text_length
+
+    masks = _build_pattern_masks(text1)
+    full_mask = (1 << pattern_length) - 1
+    last_bit = 1 << (pattern_length - 1)
+
+    vertical_positive = full_mask
+    vertical_negative = 0
+    score = pattern_length
+
+    for index, char in enumerate(text2):
+        equal = masks.get(char, 0)
+        x_vertical = equal | vertical_negative
+        x_horizontal = (((equal & vertical_positive) + vertical_positive) ^ vertical_positive) | equal
+        horizontal_positive = (vertical_negative | ~(x_horizontal | vertical_positive)) & full_mask
+        horizontal_negative = vertical_positive & x_horizontal
+
+        if horizontal_positive & last_bit:
+            score += 1
+        elif horizontal_negative & last_bit:
+            score -= 1
+
+        # 남은 문자마다 거리는 최대 1씩만 줄어들 수 있음
+        if max_distance is not None and score - (text_length - index - 1) > max_distance:
+            return max_distance + 1
+
+        horizontal_positive = ((horizontal_positive << 1) | 1) & full_mask
+        horizontal_negative = (horizontal_negative << 1) & full_mask
+        vertical_positive = (horizontal_negative | ~(x_vertical | horizontal_positive)) & full_mask
+        vertical_negative = horizontal_positive & x_vertical
+
+    return score
+
+
+def length_ratio_upper_bound(length1: int, length2: int) -> float:
+    """
+    길이만으로 계산한 Levenshtein 유사도 상한 (real_quick_ratio와 같은 용도)
+
+    Args:
+        length1 (int): 첫 번째 문자열 길이
+        length2 (int): 두 번째 문자열 길이
+
+    Returns:
+        float: 유사도 상한 (0.0-1.0)
+    """
+    longest = max(length1, length2)
+    if longest == 0:
+        return 1.0
+    return min(length1, length2) / longest
+
+
+def levenshtein_ratio(text1: str, text2: str, min_ratio: float = 0.0) -> float:
+    """
+    Levenshtein 거리 기반 정규화 유사도 (1 - 거리 / 긴 문자열 길이)
+
+    Args:
+        text1 (str): 첫 번째 문자열
+        text2 (str): 두 번째 문자열
+        min_ratio (float): 이 값에 못 미치는 것이 확실하면 정확한 계산을 생략하고
+                           min_ratio 미만의 상한값 반환
+
+    Returns:
+        float: 유사도 (0.0-1.0)
+
+    Example:
+        >>> levenshtein_ratio('공격', '공격하기')
+        0.5
+    """
+    longest = max(len(text1), len(text2))
+    if longest == 0:
+        return 1.0
+
+    # 길이 차이 상한으로 조기 제외
+    upper_bound = length_ratio_upper_bound(len(text1), len(text2))
+    if upper_bound < min_ratio:
+        return upper_bound
+
+    max_distance = None
+    if min_ratio > 0.0:
+        max_distance = int((1.0 - min_ratio) * longest + 1e-9)
+
+    distance = levenshtein_distance(text1, text2, max_distance)
+    return 1.0 - distance / longest
@@ -0,0 +1,133 @@
+"""
+VoiceMacro Pro - 한글 처리 유틸리티
+한글 음절을 자모 단위로 분해하고 문자 n-gram을 생성하는 함수들을 제공합니다.
+"""
+
+from typing import List, Set
+
+# ============================================================================
+# 한글 자모 분해
+# ============================================================================
+
+HANGUL_BASE = 0xAC00   # '가'
+HANGUL_LAST = 0xD7A3   # '힣'
+JUNGSEONG_COUNT = 21
+JONGSEONG_COUNT = 28
+
+# 호환용 자모 (초성 19자, 중성 21자, 종성 27자 + 받침 없음)
+CHOSEONG = [
+    'ㄱ', 'ㄲ', 'ㄴ', 'ㄷ', 'ㄸ', 'ㄹ', 'ㅁ', 'ㅂ', 'ㅃ', 'ㅅ',
+    'ㅆ', 'ㅇ', 'ㅈ', 'ㅉ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ'
+]
+JUNGSEONG = [
+    'ㅏ', 'ㅐ', 'ㅑ', 'ㅒ', 'ㅓ', 'ㅔ', 'ㅕ', 'ㅖ', 'ㅗ', 'ㅘ',
+    'ㅙ', 'ㅚ', 'ㅛ', 'ㅜ', 'ㅝ', 'ㅞ', 'ㅟ', 'ㅠ', 'ㅡ', 'ㅢ', 'ㅣ'
+]
+JONGSEONG = [
+    '', 'ㄱ', 'ㄲ', 'ㄳ', 'ㄴ', 'ㄵ', 'ㄶ', 'ㄷ', 'ㄹ', 'ㄺ',
+    'ㄻ', 'ㄼ', 'ㄽ', 'ㄾ', 'ㄿ', 'ㅀ', 'ㅁ', 'ㅂ', 'ㅄ', 'ㅅ',
+    'ㅆ', 'ㅇ', 'ㅈ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ'
+]
+
+# n-gram 생성 시 단어 경계 표시 문자
+WORD_START = '\x02'
+WORD_END = '\x03'
+
+
+def is_hangul_syllable(char: str) -> bool:
+    """
+    완성형 한글 음절인지 확인하는 함수
+
+    Args:
+        char (str): 확인할 문자 (한 글자)
+
+    Returns:
+        bool: 완성형 한글 음절이면 True
+    """
+    return HANGUL_BASE <= ord(char) <= HANGUL_LAST
+
+
+def decompose_syllable(char: str) -> str:
+    """
+    한글 음절 하나를 초성/중성/종성 자모로 분해하는 함수
+
+    Args:
+        char (str): 분해할 문자 (한 글자)
+
+    Returns:
+        str: 자모 문자열 (한글 음절이 아니면 원래 문자)
+
+    Example:
+        >>> decompose_syllable('공')
+        'ㄱㅗㅇ'
+    """
+    code = ord(char) - HANGUL_BASE
+    if code < 0 or code > HANGUL_LAST - HANGUL_BASE:
+        return char
+
+    cho, rest = divmod(code, JUNGSEONG_COUNT * JONGSEONG_COUNT)
+    jung, jong = divmod(rest, JONGSEONG_COUNT)
+    return CHOSEONG[cho] + JUNGSEONG[jung] + JONGSEONG[jong]
+
+
+def decompose_hangul(text: str) -> str:
+    """
+    문자열의 모든 한글 음절을 자모로 분해하는 함수
+    한글이 아닌 문자는 그대로 유지됩니다.
+
+    Args:
+        text (str): 분해할 문자열
+
+    Returns:
+        str: 자모로 분해된 문자열
+
+    Example:
+        >>> decompose_hangul('공격 1')
+        'ㄱㅗㅇㄱㅕㄱ 1'
+    """
+    if not text:
+        return ""
+    return ''.join(decompose_syllable(char) for char in text)
+
+
+# ============================================================================
+# 문자 n-gram
+# ============================================================================
+
+def word_ngrams(word: str, n: int = 3) -> List[str]:
+    """
+    단어 하나의 자모 n-gram 목록을 생성하는 함수
+    단어 앞뒤에 경계 문자를 붙여 짧은 단어도 최소 한 개의 n-gram을 갖습니다.
+
+    Args:
+        word (str): 단어 (소문자화된 상태 권장)
+        n (int): n-gram 길이
+
+    Returns:
+        List[str]: n-gram 목록 (중복 포함)
+    """
+    padded = WORD_START + decompose_hangul(word) + WORD_END
+    if len(padded) <= n:
+        return [padded]
+    return [padded[i:i + n] for i in range(len(padded) - n + 1)]
+
+
+def text_ngrams(text: str, n: int = 3) -> Set[str]:
+    """
+    텍스트의 단어별 자모/라틴 문자 n-gram 집합을 생성하는 함수
+
+    Args:
+        text (str): 텍스트 (소문자화된 상태 권장)
+        n (int): n-gram 길이
+
+    Returns:
+        Set[str]: n-gram 집합
+
+    Example:
+        >>> sorted(text_ngrams('go'))
+        ['\\x02go', 'go\\x03']
+    """
+    grams: Set[str] = set()
+    for word in text.split():
+        grams.update(word_ngrams(word, n))
+    return grams
@@ -0,0 +1,362 @@
+"""
+VoiceMacro Pro - n-gram 역색인 모듈
+음성 명령어의 자모 trigram 역색인으로 퍼지 매칭 후보를 선별합니다.
+
+후보 선별은 q-gram 개수 하한을 사용하므로 임계값을 넘을 수 있는 명령어를 빠뜨리지 않습니다.
+- n-gram은 공백을 뺀 전체 텍스트를 자모로 분해하고 혼동 자모(ㄱ/ㅋ, ㅐ/ㅔ 등)를 묶음 대표로 바꿔 만듦
+- 편집 한 번은 길이 n인 창을 최대 n개까지만 바꾸므로, 편집 거리가 k 이하인 두 텍스트는
+  각자의 n-gram 집합에서 최대 n * k개만 잃음 (음절 하나의 삭제/치환은 연속한 자모 3개 -> 3 + n - 1개,
+  삽입은 그 자리를 걸치는 n - 1개)
+- 최소 유사도로 허용되는 편집 수를 길이에서 구하고, 공유 n-gram 수가 그 하한에 못 미치는 문서만 제외
+- 글자/묶음 대표 자모 중복 집합의 교집합 크기로 일치 글자 수와 편집 수의 한계를 구해
+  길이가 비슷해도 구성 글자가 다른 문서를 제외 (n-gram 하한이 0 이하로 내려가는 짧은 텍스트용)
+- 단어 유사도(Jaccard)를 섞는 점수는 문서마다 실제 공유 단어 수로 Jaccard를 구해
+  문자열 유사도가 넘어야 하는 값을 낮춘 뒤 같은 하한을 적용 (단어가 겹친다고 무조건 후보로 두지 않음)
+"""
+
+from collections import Counter
+from typing import Dict, List, Sequence, Set, Tuple
+
+import numpy as np
+
+from backend.utils.hangul_utils import WORD_START, WORD_END
+from backend.utils.phonetic_similarity import to_jamo, to_jamo_classes
+
+# 배치 후보 선별 시 행렬 한 개의 최대 원소 수 (float32 기준 약 64MB)
+MAX_BATCH_MATRIX_CELLS = 1 << 24
+
+# 한 글자(한글 음절)를 분해한 최대 자모 수
+MAX_JAMO_PER_CHAR = 3
+
+# 허용 편집 수 계산 시 부동소수점 오차 보정값
+_EDIT_EPSILON = 1e-9
+
+
+def phonetic_ngrams(text: str, n: int = 3) -> Set[str]:
+    """
+    후보 선별용 n-gram 집합 생성 (공백 제외, 자모 분해, 혼동 자모 묶음 대표로 변환)
+
+    Args:
+        text (str): 텍스트 (소문자화된 상태)
+        n (int): n-gram 길이
+
+    Returns:
+        Set[str]: n-gram 집합 (빈 텍스트는 빈 집합)
+    """
+    jamo = to_jamo(text)
+    if not jamo:
+        return set()
+
+    padded = WORD_START + to_jamo_classes(jamo) + WORD_END
+    if len(padded) <= n:
+        return {padded}
+    return {padded[i:i + n] for i in range(len(padded) - n + 1)}
+
+
+class NGramIndex:
+    """
+    자모 n-gram 역색인 클래스
+    - 각 텍스트를 혼동 자모 묶음 단위 n-gram 집합으로 변환하여 색인
+    - 입력과 공유하는 n-gram 수가 편집 거리로 구한 하한 이상인 문서만 후보로 선별
+    - 글자/자모 단위 역색인으로 문서별 공유 글자 수를 구해 도달할 수 없는 문서 제외
+    - 단어 단위 역색인으로 문서별 공유 단어 수를 구해 단어 유사도만큼 하한을 낮춤
+    """
+
+    def __init__(self, texts: Sequence[str], n: int = 3):
+        """
+        n-gram 역색인 생성
+
+        Args:
+            texts (Sequence[str]): 색인할 텍스트 목록 (소문자화된 상태, 위치가 곧 문서 번호)
+            n (int): n-gram 길이
+        """
+        self.n = n
+        self.size = len(texts)
+        self.gram_counts: List[int] = []
+
+        gram_postings: Dict[str, List[int]] = {}
+        word_postings: Dict[str, List[int]] = {}
+        word_counts: List[int] = []
+        for position, text in enumerate(texts):
+            grams = phonetic_ngrams(text, n)
+            self.gram_counts.append(len(grams))
+
+            for gram in grams:
+                gram_postings.setdefault(gram, []).append(position)
+
+            words = set(text.split())
+            word_counts.append(len(words))
+            for word in words:
+                word_postings.setdefault(word, []).append(position)
+
+        # 생성 후 읽기 전용이므로 여러 스레드에서 잠금 없이 조회
+        self.gram_postings: Dict[str, np.ndarray] = {
+            gram: np.asarray(postings, dtype=np.int64) for gram, postings in gram_postings.items()
+        }
+        self.word_postings: Dict[str, np.ndarray] = {
+            word: np.asarray(postings, dtype=np.int64) for word, postings in word_postings.items()
+        }
+        self._word_counts = np.asarray(word_counts, dtype=np.float64)
+        self.char_postings = self._count_postings(texts)
+        self.jamo_postings = self._count_postings([to_jamo_classes(to_jamo(text)) for text in texts])
+        self._gram_count_array = np.asarray(self.gram_counts, dtype=np.float64)
+        self._char_lengths = np.asarray([len(text) for text in texts], dtype=np.float64)
+        self._jamo_lengths = np.asarray([len(to_jamo(text)) for text in texts], dtype=np.float64)
+
+    def _count_postings(self, documents: Sequence[str]) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+        """
+        글자(또는 자모)별 (문서 번호 배열, 문서 안 등장 횟수 배열) 역색인 생성
+
+        모든 문서를 이어 붙인 코드 배열에서 (글자, 문서) 쌍의 개수를 한 번에 셉니다.
+        """
+        joined = ''.join(documents)
+        if not joined:
+            return {}
+
+        codes = np.frombuffer(joined.encode('utf-32-le'), dtype=np.uint32)
+        positions = np.repeat(np.arange(len(documents), dtype=np.int64), [len(document) for document in documents])
+        keys, key_ids = np.unique(codes, return_inverse=True)
+        pairs, counts = np.unique(key_ids.astype(np.int64) * len(documents) + positions, return_counts=True)
+        pair_keys, pair_positions = np.divmod(pairs, len(documents))
+
+        boundaries = np.flatnonzero(np.diff(pair_keys)) + 1
+        return {
+            chr(keys[key_id]): (key_positions, key_counts.astype(np.float64))
+            for key_id, key_positions, key_counts in zip(
+                pair_keys[np.r_[0, boundaries]],
+                np.split(pair_positions, boundaries), np.split(counts, boundaries)
+            )
+        }
+
+    def _shared_counts(self, postings: Dict[str, Tuple[np.ndarray, np.ndarray]], text: str) -> np.ndarray:
+        """입력과 문서의 중복 집합(글자 또는 자모) 교집합 크기 (문서별)"""
+        positions, counts = [], []
+        for key, count in Counter(text).items():
+            if key in postings:
+                key_positions, key_counts = postings[key]
+                positions.append(key_positions)
+                counts.append(np.minimum(key_counts, count))
+        if not positions:
+            return np.zeros(self.size)
+        return np.bincount(np.concatenate(positions), weights=np.concatenate(counts), minlength=self.size)
+
+    def _shared_chars(self, text: str) -> np.ndarray:
+        """입력과 공유하는 글자 수 (문서별, 중복 포함)"""
+        return self._shared_counts(self.char_postings, text)
+
+    def _shared_jamo(self, text: str) -> np.ndarray:
+        """입력과 공유하는 묶음 대표 자모 수 (문서별, 중복 포함)"""
+        return self._shared_counts(self.jamo_postings, to_jamo_classes(to_jamo(text)))
+
+    def _required_shared_grams(self, gram_counts: np.ndarray, char_lengths: np.ndarray,
+                               jamo_lengths: np.ndarray, shared_chars: np.ndarray, shared_jamo: np.ndarray,
+                               min_similarity: float, scorer: str, phonetic: bool) -> np.ndarray:
+        """
+        최소 유사도를 넘는 쌍이 반드시 공유하는 n-gram 수 하한 (입력 x 문서로 브로드캐스트)
+
+        - sequence: 비율 2M/(길이 합) >= s 이면 일치 글자 M >= s * 길이 합 / 2,
+          각 텍스트에서 빠진 글자(길이 - M)는 자기 n-gram을 3 + n - 1개, 상대 n-gram을 n - 1개까지 없앰
+          (일치 블록은 같은 글자끼리의 짝이므로 M이 공유 글자 수보다 커야 하면 도달 불가)
+        - levenshtein: 1 - 거리/긴 길이 >= s 이면 편집 글자 수 <= (1 - s) * 긴 길이,
+          편집 하나는 양쪽 n-gram을 3 + n - 1개까지 없앰
+          (긴 쪽에서 공유되지 않은 글자마다 편집이 필요하므로 그 수가 편집 수보다 많으면 도달 불가)
+        - 음운 유사도: 묶음 대표 자모의 단위 편집 수 <= 가중 편집 거리 <= (1 - s) * 긴 자모 길이,
+          자모 편집 하나는 n-gram을 최대 n개 없앰 (공유되지 않은 자모 수로 같은 방식의 도달 불가 판정)
+        문자열/음운 중 하나만 넘어도 되므로 두 하한 중 작은 값을 사용합니다.
+        min_similarity는 문서별(입력 x 문서) 배열일 수 있습니다.
+        """
+        char_cost = MAX_JAMO_PER_CHAR + self.n - 1
+        gap_cost = self.n - 1
+        longest_grams = np.maximum(gram_counts, self._gram_count_array)
+
+        if scorer == 'levenshtein':
+            char_edits = np.floor((1.0 - min_similarity) * np.maximum(char_lengths, self._char_lengths)
+                                  + _EDIT_EPSILON)
+            required = longest_grams - char_cost * char_edits
+            unshared = np.maximum(char_lengths, self._char_lengths) - shared_chars
+            required = np.where(unshared > char_edits, np.inf, required)
+        else:
+            matched = np.ceil(min_similarity * (char_lengths + self._char_lengths) / 2.0 - _EDIT_EPSILON)
+            unmatched = np.maximum(char_lengths - matched, 0.0)
+            document_unmatched = np.maximum(self._char_lengths - matched, 0.0)
+            required = np.maximum(
+                gram_counts - char_cost * unmatched - gap_cost * document_unmatched,
+                self._gram_count_array - char_cost * document_unmatched - gap_cost * unmatched
+            )
+            # 필요한 일치 글자 수가 공유 글자 수보다 많으면 도달할 수 없음
+            required = np.where(matched > shared_chars, np.inf, required)
+
+        if phonetic:
+            jamo_edits = np.floor((1.0 - min_similarity) * np.maximum(jamo_lengths, self._jamo_lengths)
+                                  + _EDIT_EPSILON)
+            unshared_jamo = np.maximum(jamo_lengths, self._jamo_lengths) - shared_jamo
+            phonetic_required = np.where(unshared_jamo > jamo_edits, np.inf, longest_grams - self.n * jamo_edits)
+            has_jamo = (jamo_lengths > 0) & (self._jamo_lengths > 0)
+            required = np.where(has_jamo, np.minimum(required, phonetic_required), required)
+
+        return required
+
+    def _shared_words(self, text: str) -> np.ndarray:
+        """입력과 공유하는 단어 수 (문서별)"""
+        postings = [self.word_postings[word] for word in set(text.split()) if word in self.word_postings]
+        if not postings:
+            return np.zeros(self.size)
+        return np.bincount(np.concatenate(postings), minlength=self.size).astype(np.float64)
+
+    def _min_string_similarity(self, min_similarity: float, word_weight: float,
+                               shared_words: np.ndarray, word_counts: np.ndarray) -> np.ndarray:
+        """
+        점수 (1 - w) * 문자열 유사도 + w * 단어 Jaccard >= min_similarity 에 필요한 최소 문자열/음운 유사도
+
+        Jaccard는 공유 단어 수 / (입력 단어 수 + 문서 단어 수 - 공유 단어 수)로 정확히 계산합니다.
+        """
+        union = word_counts + self._word_counts - shared_words
+        jaccard = np.where(shared_words > 0, shared_words / np.maximum(union, 1.0), 0.0)
+        return (min_similarity - word_weight * jaccard) / (1.0 - word_weight) - _EDIT_EPSILON
+
+    def candidates(self, text: str, min_similarity: float, scorer: str = 'sequence',
+                   phonetic: bool = True, word_weight: float = 0.0) -> Set[int]:
+        """
+        입력 텍스트와 유사도가 min_similarity 이상일 수 있는 문서 번호 집합 반환
+
+        공유 n-gram 수 >= max(입력 n-gram 수, 문서 n-gram 수) - 잃을 수 있는 최대 n-gram 수
+        인 문서가 후보가 됩니다. 하한이므로 유사도가 min_similarity 이상인 문서는 항상 포함됩니다.
+        word_weight가 있으면 유사도는 (1 - w) * 문자열/음운 유사도 + w * 단어 Jaccard이며,
+        단어가 겹치는 문서는 그 Jaccard만큼 낮아진 문자열 유사도로 하한을 계산합니다.
+
+        Args:
+            text (str): 입력 텍스트 (소문자화된 상태)
+            min_similarity (float): 유사도가 넘어야 하는 최소값
+            scorer (str): 문자열 유사도 계산기 ('sequence' | 'levenshtein')
+            phonetic (bool): 자모 음운 유사도 사용 여부
+            word_weight (float): 유사도에서 단어 Jaccard의 비중 (0이면 문자열/음운 유사도만)
+
+        Returns:
+            Set[int]: 후보 문서 번호 집합
+        """
+        grams = phonetic_ngrams(text, self.n)
+        if not grams or not self.size:
+            return set()
+
+        postings = [self.gram_postings[gram] for gram in grams if gram in self.gram_postings]
+        if postings:
+            shared = np.bincount(np.concatenate(postings), minlength=self.size).astype(np.float64)
+        else:
+            shared = np.zeros(self.size)
+
+        if word_weight:
+            min_similarity = self._min_string_similarity(
+                min_similarity, word_weight, self._shared_words(text), np.float64(len(set(text.split())))
+            )
+
+        required = self._required_shared_grams(
+            np.float64(len(grams)), np.float64(len(text)), np.float64(len(to_jamo(text))),
+            self._shared_chars(text), self._shared_jamo(text) if phonetic else 0.0,
+            min_similarity, scorer, phonetic
+        )
+        return set(np.flatnonzero(shared >= required).tolist())
+
+    def batch_candidates(self, texts: Sequence[str], min_similarity: float, scorer: str = 'sequence',
+                         phonetic: bool = True, word_weight: float = 0.0) -> List[Set[int]]:
+        """
+        여러 입력 텍스트의 후보를 n-gram 행렬 곱으로 한 번에 선별
+
+        입력들이 사용하는 n-gram 열만으로 (입력 x n-gram), (n-gram x 문서) 0/1 행렬을 만들고
+        행렬 곱으로 모든 쌍의 공유 n-gram 수를 구합니다. 결과는 입력마다
+        candidates()와 동일합니다.
+
+        Args:
+            texts (Sequence[str]): 입력 텍스트 목록 (소문자화된 상태)
+            min_similarity (float): 유사도가 넘어야 하는 최소값
+            scorer (str): 문자열 유사도 계산기 ('sequence' | 'levenshtein')
+            phonetic (bool): 자모 음운 유사도 사용 여부
+            word_weight (float): 유사도에서 단어 Jaccard의 비중 (0이면 문자열/음운 유사도만)
+
+        Returns:
+            List[Set[int]]: 입력 순서대로 후보 문서 번호 집합
+        """
+        text_grams = [phonetic_ngrams(text, self.n) for text in texts]
+        results: List[Set[int]] = []
+
+        # 문서 행렬과 (입력 x 문서) 결과 행렬 크기가 상한을 넘지 않도록 입력을 묶어서 처리
+        max_vocabulary = max(1, MAX_BATCH_MATRIX_CELLS // max(1, self.size))
+        max_rows = max_vocabulary
+        chunk_start = 0
+        vocabulary: Dict[str, int] = {}
+
+        for position, grams in enumerate(text_grams):
+            known_grams = [gram for gram in grams if gram in self.gram_postings]
+            new_count = sum(1 for gram in known_grams if gram not in vocabulary)
+            if position > chunk_start and (len(vocabulary) + new_count > max_vocabulary or
+                                           position - chunk_start >= max_rows):
+                results.extend(self._score_chunk(
+                    texts[chunk_start:position], text_grams[chunk_start:position], vocabulary,
+                    min_similarity, scorer, phonetic, word_weight
+                ))
+                chunk_start = position
+                vocabulary = {}
+
+            for gram in known_grams:
+                vocabulary.setdefault(gram, len(vocabulary))
+
+        results.extend(self._score_chunk(
+            texts[chunk_start:], text_grams[chunk_start:], vocabulary, min_similarity, scorer, phonetic,
+            word_weight
+        ))
+        return results
+
+    def _score_chunk(self, texts: Sequence[str], text_grams: Sequence[Set[str]], vocabulary: Dict[str, int],
+                     min_similarity: float, scorer: str, phonetic: bool,
+                     word_weight: float) -> List[Set[int]]:
+        """입력 묶음 하나의 공유 n-gram 수를 행렬 곱으로 계산하여 후보 선별"""
+        if not texts:
+            return []
+        if not self.size:
+            return [set() for _ in texts]
+
+        if vocabulary:
+            query_matrix = np.zeros((len(texts), len(vocabulary)), dtype=np.float32)
+            for row, grams in enumerate(text_grams):
+                columns = [vocabulary[gram] for gram in grams if gram in vocabulary]
+                query_matrix[row, columns] = 1.0
+
+            document_matrix = np.zeros((len(vocabulary), self.size), dtype=np.float32)
+            for gram, column in vocabulary.items():
+                document_matrix[column, self.gram_postings[gram]] = 1.0
+
+            # 공유 n-gram 수 (정수 값이므로 float32 곱셈도 정확함)
+            shared = (query_matrix @ document_matrix).astype(np.float64)
+        else:
+            shared = np.zeros((len(texts), self.size))
+
+        if word_weight:
+            min_similarity = self._min_string_similarity(
+                min_similarity, word_weight, np.stack([self._shared_words(text) for text in texts]),
+                np.asarray([len(set(text.split())) for text in texts], dtype=np.float64)[:, None]
+            )
+
+        passed = shared >= self._required_shared_grams(
+            np.asarray([len(grams) for grams in text_grams], dtype=np.float64)[:, None],
+            np.asarray([len(text) for text in texts], dtype=np.float64)[:, None],
+            np.asarray([len(to_jamo(text)) for text in texts], dtype=np.float64)[:, None],
+            np.stack([self._shared_chars(text) for text in texts]),
+            np.stack([self._shared_jamo(text) for text in texts]) if phonetic else 0.0,
+            min_similarity, scorer, phonetic
+        )
+
+        return [set(np.flatnonzero(passed[row]).tolist()) if grams else set()
+                for row, grams in enumerate(text_grams)]
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        색인 통계 반환
+
+        Returns:
+            Dict: 색인 통계 정보
+        """
+        return {
+            'documents': self.size,
+            'unique_grams': len(self.gram_postings),
+            'unique_words': len(self.word_postings),
+            'unique_chars': len(self.char_postings)
+        }
@@ -0,0 +1,140 @@
+"""
+VoiceMacro Pro - PCM16 인코더 모듈
+녹음 콜백의 float32 오디오를 미리 할당한 int16 슬롯에 변환하여
+실시간 업링크(GPT-4o 트랜스크립션)로 복사 없이 넘깁니다.
+Whisper API로 보낼 WAV는 임시 파일 없이 메모리에서 만듭니다.
+"""
+
+import io
+import struct
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+# float32 [-1.0, 1.0] -> int16 변환 배율
+PCM16_SCALE = 32767.0
+
+# PCM16 WAV 헤더 (RIFF/fmt/data 청크, 44바이트)
+WAV_HEADER = struct.Struct('<4sI4s4sIHHIIHH4sI')
+
+
+def float_to_pcm16(samples: np.ndarray) -> bytes:
+    """
+    float32 오디오를 PCM16 바이트로 변환 (일회성 변환용, 매번 새 배열 할당)
+
+    Args:
+        samples (np.ndarray): float 오디오 (-1.0 ~ 1.0)
+
+    Returns:
+        bytes: PCM16 리틀 엔디언 바이트
+    """
+    scaled = np.clip(np.asarray(samples, dtype=np.float32).reshape(-1) * PCM16_SCALE, -32768.0, PCM16_SCALE)
+    return scaled.astype('<i2').tobytes()
+
+
+def encode_wav(pcm: Any, sample_rate: int, channels: int = 1, name: str = 'audio.wav') -> io.BytesIO:
+    """
+    PCM16 오디오를 메모리 WAV 파일로 변환 (헤더와 데이터를 한 번만 복사)
+
+    Args:
+        pcm (Any): PCM16 리틀 엔디언 오디오 (bytes, bytearray, memoryview, int16 배열)
+        sample_rate (int): 샘플레이트 (Hz)
+        channels (int): 채널 수
+        name (str): 파일 이름 (업로드 시 형식 판별용)
+
+    Returns:
+        io.BytesIO: 처음 위치로 되감은 WAV 파일 객체 (name 속성 포함)
+    """
+    data = memoryview(pcm).cast('B')
+    block_align = channels * 2
+    header = WAV_HEADER.pack(b'RIFF', WAV_HEADER.size - 8 + data.nbytes, b'WAVE',
+                             b'fmt ', 16, 1, channels, sample_rate, sample_rate * block_align, block_align, 16,
+                             b'data', data.nbytes)
+
+    wav_file = io.BytesIO(b''.join((header, data)))
+    wav_file.name = name
+    return wav_file
+
+
+class Pcm16Encoder:
+    """
+    할당 없는 float32 -> PCM16 변환 클래스
+    - 배율 적용/범위 제한은 미리 할당한 float32 작업 배열에 np.multiply/np.clip(out=)로 계산
+    - 결과는 슬롯 링(미리 할당한 int16 행렬의 행)에 저장하고 memoryview로 반환
+    - 전송이 끝난 슬롯은 release()로 반납하며, 모든 슬롯이 전송 중이면 새 바이트로 변환(대체 경로)
+    """
+
+    def __init__(self, max_frames: int, slots: int = 16):
+        """
+        PCM16 인코더 생성
+
+        Args:
+            max_frames (int): 블록당 최대 프레임 수 (녹음 블록 크기)
+            slots (int): 동시에 전송 중일 수 있는 블록 수
+        """
+        self.max_frames = max_frames
+        self.slot_count = max(1, slots)
+
+        self._scratch = np.empty(max_frames, dtype=np.float32)
+        self._slots = np.empty((self.slot_count, max_frames), dtype='<i2')
+        self._in_use: List[bool] = [False] * self.slot_count
+        self._next_slot = 0
+
+        # 인코더 통계
+        self.stats = {
+            'encoded_blocks': 0,
+            'fallback_blocks': 0  # 슬롯 부족 또는 블록이 너무 커서 새로 할당한 블록 수
+        }
+
+    def encode(self, samples: np.ndarray) -> Tuple[int, Any]:
+        """
+        float32 오디오 블록을 PCM16으로 변환 (녹음 콜백에서 호출)
+
+        Args:
+            samples (np.ndarray): 1차원 float 오디오 블록 (-1.0 ~ 1.0)
+
+        Returns:
+            Tuple[int, Any]: (슬롯 번호, PCM16 바이트 뷰)
+                             슬롯 번호가 -1이면 대체 경로로 만든 bytes (반납 불필요)
+        """
+        frames = len(samples)
+        slot = self._next_slot
+
+        if frames > self.max_frames or self._in_use[slot]:
+            self.stats['fallback_blocks'] += 1
+            return -1, float_to_pcm16(samples)
+
+        scratch = self._scratch[:frames]
+        np.multiply(samples, PCM16_SCALE, out=scratch)
+        np.clip(scratch, -32768.0, PCM16_SCALE, out=scratch)
+
+        pcm = self._slots[slot, :frames]
+        np.copyto(pcm, scratch, casting='unsafe')
+
+        self._in_use[slot] = True
+        self._next_slot = (slot + 1) % self.slot_count
+        self.stats['encoded_blocks'] += 1
+        return slot, memoryview(pcm).cast('B')
+
+    def release(self, slot: int) -> None:
+        """
+        전송이 끝난 슬롯 반납
+
+        Args:
+            slot (int): encode()가 반환한 슬롯 번호 (-1이면 무시)
+        """
+        if slot >= 0:
+            self._in_use[slot] = False
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        인코더 통계 반환
+
+        Returns:
+            Dict: 인코더 통계 정보
+        """
+        return {
+            **self.stats,
+            'slots': self.slot_count,
+            'slots_in_use': sum(self._in_use)
+        }
@@ -0,0 +1,224 @@
+"""
+VoiceMacro Pro - 자모 기반 음운 유사도 모듈
+한글 음절을 자모로 분해하고, 음성 인식에서 자주 혼동되는 자모(ㅓ/ㅗ, ㄱ/ㅋ 등)의
+치환 비용을 낮춘 가중 편집 거리로 유사도를 계산합니다.
+"""
+
+from functools import lru_cache
+from typing import Dict, Iterable, Tuple
+
+from backend.utils.hangul_utils import decompose_hangul
+
+# ============================================================================
+# 자모 치환 비용 테이블
+# ============================================================================
+
+# (혼동 자모 그룹, 그룹 내 치환 비용)
+CONFUSABLE_JAMO_GROUPS: Tuple[Tuple[str, float], ...] = (
+    # 자음: 평음/격음/경음
+    ('ㄱㅋㄲ', 0.3),
+    ('ㄷㅌㄸ', 0.3),
+    ('ㅂㅍㅃ', 0.3),
+    ('ㅈㅊㅉ', 0.3),
+    ('ㅅㅆ', 0.3),
+    # 자음: 비음/유음, 약한 초성
+    ('ㄴㄹ', 0.5),
+    ('ㄴㅁ', 0.5),
+    ('ㅇㅎ', 0.5),
+    # 모음: 거의 구분되지 않는 쌍
+    ('ㅐㅔ', 0.1),
+    ('ㅒㅖ', 0.1),
+    ('ㅙㅚㅞ', 0.1),
+    ('ㅢㅣ', 0.3),
+    # 모음: 자주 혼동되는 쌍
+    ('ㅓㅗ', 0.3),
+    ('ㅓㅕ', 0.4),
+    ('ㅗㅛ', 0.4),
+    ('ㅜㅠ', 0.4),
+    ('ㅜㅡ', 0.4),
+    ('ㅏㅑ', 0.4),
+    ('ㅗㅜ', 0.5),
+)
+
+INSERT_DELETE_COST = 1.0
+SUBSTITUTION_COST = 1.0
+
+
+def _build_substitution_costs(groups: Iterable[Tuple[str, float]]) -> Dict[Tuple[str, str], float]:
+    """혼동 자모 그룹으로 (자모, 자모) -> 치환 비용 테이블 생성"""
+    costs: Dict[Tuple[str, str], float] = {}
+    for jamo_group, cost in groups:
+        for first in jamo_group:
+            for second in jamo_group:
+                if first != second:
+                    pair = (first, second)
+                    costs[pair] = min(cost, costs.get(pair, SUBSTITUTION_COST))
+    return costs
+
+
+SUBSTITUTION_COSTS = _build_substitution_costs(CONFUSABLE_JAMO_GROUPS)
+
+
+def _build_jamo_classes(costs: Dict[Tuple[str, str], float]) -> Dict[int, str]:
+    """
+    싼 치환 비용으로 이어지는 자모를 한 묶음으로 모은 변환표 생성 (자모 -> 묶음 대표 자모)
+
+    묶음 안의 치환은 비용이 SUBSTITUTION_COST보다 작고 묶음 사이의 치환은 SUBSTITUTION_COST이므로,
+    묶음 대표로 바꾼 문자열의 단위 편집 거리는 음운 가중 편집 거리 이하입니다.
+    """
+    parent: Dict[str, str] = {}
+
+    def find(jamo: str) -> str:
+        while parent.setdefault(jamo, jamo) != jamo:
+            jamo = parent[jamo]
+        return jamo
+
+    for (first, second), cost in costs.items():
+        if cost < SUBSTITUTION_COST:
+            root1, root2 = find(first), find(second)
+            if root1 != root2:
+                parent[max(root1, root2)] = min(root1, root2)
+
+    return str.maketrans({jamo: find(jamo) for jamo in parent if find(jamo) != jamo})
+
+
+JAMO_CLASS_TABLE = _build_jamo_classes(SUBSTITUTION_COSTS)
+
+
+# ============================================================================
+# 음운 유사도
+# ============================================================================
+
+@lru_cache(maxsize=65536)
+def to_jamo(text: str) -> str:
+    """
+    비교용 자모 문자열 생성 (소문자화, 공백 제거 후 자모 분해)
+
+    등록된 음성 명령어처럼 반복해서 비교되는 문자열은 결과가 캐시됩니다.
+
+    Args:
+        text (str): 원본 텍스트
+
+    Returns:
+        str: 자모 문자열
+
+    Example:
+        >>> to_jamo('스킬 하나')
+        'ㅅㅡㅋㅣㄹㅎㅏㄴㅏ'
+    """
+    if not text:
+        return ""
+    return decompose_hangul(''.join(text.lower().split()))
+
+
+def to_jamo_classes(jamo: str) -> str:
+    """
+    자모 문자열의 혼동 자모(ㄱ/ㅋ/ㄲ, ㅐ/ㅔ 등)를 묶음 대표 자모로 변환 (후보 선별용)
+
+    Args:
+        jamo (str): 자모 문자열
+
+    Returns:
+        str: 묶음 대표 자모 문자열
+
+    Example:
+        >>> to_jamo_classes('ㅋㅗㅇ') == to_jamo_classes('ㄱㅓㅇ')
+        True
+    """
+    return jamo.translate(JAMO_CLASS_TABLE)
+
+
+def jamo_edit_distance(jamo1: str, jamo2: str) -> float:
+    """
+    음운 가중치를 적용한 자모 편집 거리 계산
+
+    Args:
+        jamo1 (str): 첫 번째 자모 문자열
+        jamo2 (str): 두 번째 자모 문자열
+
+    Returns:
+        float: 가중 편집 거리
+    """
+    if jamo1 == jamo2:
+        return 0.0
+    if not jamo1:
+        return len(jamo2) * INSERT_DELETE_COST
+    if not jamo2:
+        return len(jamo1) * INSERT_DELETE_COST
+
+    # 짧은 쪽을 열로 사용하여 메모리 사용 최소화
+    if len(jamo1) < len(jamo2):
+        jamo1, jamo2 = jamo2, jamo1
+
+    costs = SUBSTITUTION_COSTS
+    previous = [j * INSERT_DELETE_COST for j in range(len(jamo2) + 1)]
+
+    for i, char1 in enumerate(jamo1, 1):
+        current = [i * INSERT_DELETE_COST]
+        for j, char2 in enumerate(jamo2, 1):
+            if char1 == char2:
+                substitution = previous[j - 1]
+            else:
+                substitution = previous[j - 1] + costs.get((char1, char2), SUBSTITUTION_COST)
+            current.append(min(
+                substitution,
+                previous[j] + INSERT_DELETE_COST,
+                current[j - 1] + INSERT_DELETE_COST
+            ))
+        previous = current
+
+    return previous[-1]
+
+
+def jamo_similarity_upper_bound(jamo1: str, jamo2: str) -> float:
+    """
+    길이 차이만으로 계산한 자모 유사도 상한 (편집 거리 계산 전 조기 제외용)
+
+    Args:
+        jamo1 (str): 첫 번째 자모 문자열
+        jamo2 (str): 두 번째 자모 문자열
+
+    Returns:
+        float: 유사도 상한 (0.0-1.0)
+    """
+    longest = max(len(jamo1), len(jamo2))
+    if longest == 0:
+        return 0.0
+    return 1.0 - abs(len(jamo1) - len(jamo2)) * INSERT_DELETE_COST / longest
+
+
+def phonetic_similarity_jamo(jamo1: str, jamo2: str) -> float:
+    """
+    미리 분해된 자모 문자열 간의 음운 유사도 계산
+
+    Args:
+        jamo1 (str): 첫 번째 자모 문자열
+        jamo2 (str): 두 번째 자모 문자열
+
+    Returns:
+        float: 유사도 (0.0-1.0)
+    """
+    longest = max(len(jamo1), len(jamo2))
+    if longest == 0:
+        return 0.0
+    return max(0.0, 1.0 - jamo_edit_distance(jamo1, jamo2) / longest)
+
+
+def phonetic_similarity(text1: str, text2: str) -> float:
+    """
+    두 텍스트 간의 자모 기반 음운 유사도 계산
+
+    Args:
+        text1 (str): 첫 번째 텍스트
+        text2 (str): 두 번째 텍스트
+
+    Returns:
+        float: 유사도 (0.0-1.0)
+
+    Example:
+        >>> round(phonetic_similarity('공격', '공걱'), 2)
+        0.93
+    """
+    if not text1 or not text2:
+        return 0.0
+    return phonetic_similarity_jamo(to_jamo(text1), to_jamo(text2))
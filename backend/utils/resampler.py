@@ -0,0 +1,215 @@
+"""
+VoiceMacro Pro - 폴리페이즈 리샘플러 모듈
+녹음(24kHz, GPT-4o)과 Whisper(16kHz)처럼 백엔드마다 다른 샘플레이트로
+같은 오디오를 다시 녹음하지 않고 변환합니다.
+- 샘플레이트 쌍마다 Kaiser 창 FIR 필터를 폴리페이즈 뱅크로 나누어 한 번만 만들고 캐시
+- 블록 단위 스트리밍 처리 (블록 경계와 무관하게 한 번에 처리한 것과 같은 결과)
+- 필터 지연을 보정하여 출력 n번째 샘플이 입력 시각 n * src / dst에 맞춰짐
+"""
+
+import math
+from functools import lru_cache
+from typing import Any, Dict, Tuple
+
+import numpy as np
+
+# 필터 설계 값 (scipy.signal.resample_poly와 같은 기준)
+HALF_LENGTH_PER_RATIO = 10   # 필터 반길이 = 10 * max(up, down) (업샘플 기준 샘플)
+KAISER_BETA = 5.0
+# 약분한 비율의 상한 (44100 -> 16000 = 160/441처럼 일반 샘플레이트는 수백 이내,
+# 100003Hz처럼 약분되지 않는 샘플레이트는 필터 길이가 샘플레이트에 비례해 커지므로 거부)
+MAX_RATE_RATIO = 1000
+
+
+@lru_cache(maxsize=32)
+def polyphase_filter_bank(src_rate: int, dst_rate: int) -> Tuple[int, int, np.ndarray, int]:
+    """
+    샘플레이트 쌍의 폴리페이즈 필터 뱅크 (샘플레이트 쌍마다 한 번만 설계)
+
+    Args:
+        src_rate (int): 입력 샘플레이트 (Hz)
+        dst_rate (int): 출력 샘플레이트 (Hz)
+
+    Returns:
+        Tuple: (up, down, bank, delay)
+            - up/down: 약분한 업/다운샘플 비율
+            - bank: (up, 위상당 탭 수) 읽기 전용 float32 배열, 탭은 입력 시간 순서 (오래된 샘플 먼저)
+            - delay: 필터 지연 (업샘플 기준 샘플)
+
+    Raises:
+        ValueError: 약분한 비율이 MAX_RATE_RATIO를 넘는 샘플레이트 쌍
+    """
+    divisor = math.gcd(src_rate, dst_rate)
+    up, down = dst_rate // divisor, src_rate // divisor
+    if max(up, down) > MAX_RATE_RATIO:
+        raise ValueError(f"변환 비율이 너무 큰 샘플레이트입니다: {src_rate} -> {dst_rate} ({up}/{down})")
+
+    half_length = HALF_LENGTH_PER_RATIO * max(up, down)
+    length = 2 * half_length + 1
+    cutoff = 1.0 / max(up, down)  # 업샘플 기준 나이퀴스트 대비 차단 주파수
+
+    n = np.arange(length) - half_length
+    prototype = cutoff * np.sinc(cutoff * n) * np.kaiser(length, KAISER_BETA)
+    prototype *= up / prototype.sum()  # 업샘플로 줄어든 진폭 보정
+
+    taps = -(-length // up)
+    padded = np.zeros(taps * up)
+    padded[:length] = prototype
+
+    # bank[p, j] = h[p + j * up], 입력과 곱하기 쉽도록 탭 순서를 뒤집음
+    bank = padded.reshape(taps, up).T[:, ::-1].astype(np.float32)
+    bank.setflags(write=False)
+    return up, down, bank, half_length
+
+
+class Resampler:
+    """
+    스트리밍 폴리페이즈 리샘플러 클래스
+    - 출력 샘플마다 위상(p)과 입력 위치가 정해지며, 같은 위상의 출력은 한 번의 행렬-벡터 곱으로 계산
+    - 블록 사이에는 필터 길이만큼의 입력 이력만 유지
+    - 녹음이 끝나면 flush()로 필터 지연만큼 남은 출력을 내보냄
+    """
+
+    def __init__(self, src_rate: int, dst_rate: int, dtype: Any = np.float32):
+        """
+        리샘플러 생성
+
+        Args:
+            src_rate (int): 입력 샘플레이트 (Hz)
+            dst_rate (int): 출력 샘플레이트 (Hz)
+            dtype: 출력 자료형 (np.float32 또는 PCM16용 np.int16, 정수는 반올림 후 범위 제한)
+
+        Raises:
+            ValueError: 0 이하이거나 변환 비율이 너무 큰 샘플레이트
+        """
+        if src_rate <= 0 or dst_rate <= 0:
+            raise ValueError(f"샘플레이트가 잘못되었습니다: {src_rate} -> {dst_rate}")
+
+        self.src_rate = src_rate
+        self.dst_rate = dst_rate
+        self.dtype = np.dtype(dtype)
+        self.up, self.down, self._bank, self._delay = polyphase_filter_bank(src_rate, dst_rate)
+        self.taps = self._bank.shape[1]
+        self.reset()
+
+    def reset(self) -> None:
+        """스트림 상태 초기화 (새 녹음 시작 시)"""
+        self._history = np.zeros(self.taps - 1, dtype=np.float32)
+        self._input_count = 0    # 지금까지 받은 입력 샘플 수
+        self._output_count = 0   # 지금까지 내보낸 출력 샘플 수
+        self._flushed = False
+
+    @property
+    def passthrough(self) -> bool:
+        """입력과 출력 샘플레이트가 같아 변환이 필요 없는지 여부"""
+        return self.up == self.down
+
+    def _convert(self, output: np.ndarray) -> np.ndarray:
+        """출력 자료형으로 변환"""
+        if self.dtype.kind in 'iu':
+            info = np.iinfo(self.dtype)
+            np.rint(output, out=output)
+            np.clip(output, info.min, info.max, out=output)
+        return output.astype(self.dtype, copy=False)
+
+    def _run(self, samples: np.ndarray, output_limit: int) -> np.ndarray:
+        """입력 블록을 이력 뒤에 이어 계산 가능한 출력 샘플 계산"""
+        buffer = np.concatenate((self._history, samples))
+        base = self._input_count - (self.taps - 1)  # buffer[0]의 입력 위치
+        self._input_count += len(samples)
+
+        # 출력 n은 업샘플 위치 t = n * down + delay, 입력 위치 t // up까지 필요
+        last_input = self._input_count - 1
+        available = ((last_input + 1) * self.up - 1 - self._delay) // self.down + 1
+        count = max(0, min(available, output_limit) - self._output_count)
+
+        output = np.empty(count, dtype=np.float32)
+        if count:
+            positions = (np.arange(self._output_count, self._output_count + count, dtype=np.int64)
+                         * self.down + self._delay)
+            phases = positions % self.up
+            starts = positions // self.up - (self.taps - 1) - base  # 창 시작 위치 (buffer 기준)
+            windows = np.lib.stride_tricks.sliding_window_view(buffer, self.taps)
+            for phase in range(self.up):
+                selected = phases == phase
+                if self.up == 1 or selected.all():
+                    output[:] = windows[starts] @ self._bank[phase]
+                    break
+                output[selected] = windows[starts[selected]] @ self._bank[phase]
+            self._output_count += count
+
+        self._history = buffer[len(buffer) - (self.taps - 1):].copy()
+        return output
+
+    def process(self, samples: np.ndarray) -> np.ndarray:
+        """
+        입력 블록 변환
+
+        Args:
+            samples (np.ndarray): 1차원 오디오 블록 (float 또는 PCM16 정수값)
+
+        Returns:
+            np.ndarray: 변환된 오디오 (이번 블록까지로 계산 가능한 샘플, 길이는 블록마다 다를 수 있음)
+        """
+        samples = np.asarray(samples).reshape(-1)
+        if self.passthrough:
+            self._input_count += len(samples)
+            self._output_count += len(samples)
+            return self._convert(samples.astype(np.float32))
+
+        return self._convert(self._run(samples.astype(np.float32, copy=False), np.iinfo(np.int64).max))
+
+    def flush(self) -> np.ndarray:
+        """
+        필터 지연 때문에 남은 출력 내보내기 (스트림 끝, 이후 process 전에 reset 필요)
+
+        Returns:
+            np.ndarray: 남은 출력 (전체 출력 길이가 ceil(입력 길이 * dst / src)가 되도록)
+        """
+        if self.passthrough or self._flushed:
+            return np.empty(0, dtype=self.dtype)
+
+        self._flushed = True
+        total = -(-self._input_count * self.up // self.down)
+        padding = np.zeros(self._delay // self.up + self.taps, dtype=np.float32)
+        return self._convert(self._run(padding, total))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        리샘플러 상태 반환
+
+        Returns:
+            Dict: 샘플레이트/비율/탭 수와 입출력 샘플 수
+        """
+        return {
+            'src_rate': self.src_rate,
+            'dst_rate': self.dst_rate,
+            'up': self.up,
+            'down': self.down,
+            'taps_per_phase': self.taps,
+            'input_samples': self._input_count,
+            'output_samples': self._output_count
+        }
+
+
+def resample(samples: np.ndarray, src_rate: int, dst_rate: int, dtype: Any = None) -> np.ndarray:
+    """
+    오디오 전체를 한 번에 변환 (필터 뱅크는 캐시 공유)
+
+    Args:
+        samples (np.ndarray): 1차원 오디오
+        src_rate (int): 입력 샘플레이트 (Hz)
+        dst_rate (int): 출력 샘플레이트 (Hz)
+        dtype: 출력 자료형 (기본값: 입력과 같은 자료형, 정수가 아니면 float32)
+
+    Returns:
+        np.ndarray: ceil(길이 * dst / src) 길이의 변환된 오디오
+    """
+    samples = np.asarray(samples).reshape(-1)
+    if dtype is None:
+        dtype = samples.dtype if samples.dtype.kind in 'iu' else np.float32
+    if src_rate == dst_rate:
+        return samples.astype(dtype)
+
+    resampler = Resampler(src_rate, dst_rate, dtype)
+    return np.concatenate((resampler.process(samples), resampler.flush()))
@@ -0,0 +1,149 @@
+"""
+VoiceMacro Pro - 텍스트 정규화 모듈
+음성 인식 결과와 음성 명령어를 같은 규칙(소문자화, 불용어/특수문자 제거, 공백 정리)으로
+정규화합니다. 정규식은 언어별로 한 번만 컴파일하여 모든 매칭 경로가 공유합니다.
+"""
+
+import re
+from typing import Dict, FrozenSet, List, Optional, Sequence, Tuple
+
+# 언어별 불용어 (말버릇/간투사, 단어 단위로만 제거)
+FILLER_WORDS: Dict[str, Tuple[str, ...]] = {
+    'ko': ('음', '어', '아', '그', '저', '그거', '이거'),
+    'en': ('um', 'uh', 'ah', 'er', 'like', 'you know'),
+}
+
+# 특수문자 / 연속 공백 패턴
+_PUNCTUATION_PATTERN = re.compile(r'[^\w\s]')
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+_WORD_CHAR_PATTERN = re.compile(r'\w')
+
+
+class TextNormalizer:
+    """
+    텍스트 정규화 클래스
+    - 소문자화 -> 불용어 제거 -> 특수문자 제거 -> 연속 공백 정리 순서로 적용
+    - 불용어 정규식은 생성 시 한 번만 컴파일
+    """
+
+    def __init__(self, languages: Sequence[str] = tuple(FILLER_WORDS)):
+        """
+        텍스트 정규화기 생성
+
+        Args:
+            languages (Sequence[str]): 불용어를 제거할 언어 코드 목록 (기본값: 모든 언어)
+        """
+        self.languages: Tuple[str, ...] = tuple(languages)
+
+        # 언어별 불용어 패턴 (긴 단어 먼저 - "그거"가 "그"보다 우선)
+        self._filler_patterns: Tuple[re.Pattern, ...] = tuple(
+            re.compile(r'\b(?:' + '|'.join(
+                re.escape(word) for word in sorted(FILLER_WORDS[language], key=len, reverse=True)
+            ) + r')\b')
+            for language in self.languages if FILLER_WORDS.get(language)
+        )
+
+    @property
+    def pattern_count(self) -> int:
+        """적용하는 정규식 수 (불용어 패턴 + 특수문자 패턴)"""
+        return len(self._filler_patterns) + 1
+
+    def normalize(self, text: str) -> str:
+        """
+        텍스트 정규화
+
+        Args:
+            text (str): 원본 텍스트
+
+        Returns:
+            str: 정규화된 텍스트 (불용어만 있으면 빈 문자열)
+
+        Example:
+            >>> TextNormalizer().normalize('음, 공격!  해줘')
+            '공격 해줘'
+        """
+        if not text:
+            return ""
+
+        normalized = text.lower()
+        for pattern in self._filler_patterns:
+            normalized = pattern.sub('', normalized)
+        normalized = _PUNCTUATION_PATTERN.sub('', normalized)
+
+        return _WHITESPACE_PATTERN.sub(' ', normalized).strip()
+
+    def normalize_with_tokens(self, text: str) -> Tuple[str, FrozenSet[str]]:
+        """
+        텍스트 정규화 후 단어 집합과 함께 반환
+
+        Args:
+            text (str): 원본 텍스트
+
+        Returns:
+            Tuple[str, FrozenSet[str]]: (정규화된 텍스트, 공백 기준 단어 집합)
+        """
+        normalized = self.normalize(text)
+        return normalized, frozenset(normalized.split())
+
+    def compact_with_positions(self, text: str) -> Tuple[str, List[int]]:
+        """
+        공백까지 제거한 정규화 키와 키 문자별 원본 위치 반환
+
+        normalize() 결과에서 공백을 모두 제거한 것과 같은 키를 만들면서,
+        키의 각 문자가 원본 텍스트의 몇 번째 문자에서 왔는지 함께 기록합니다.
+
+        Args:
+            text (str): 원본 텍스트
+
+        Returns:
+            Tuple[str, List[int]]: (공백 없는 정규화 키, 키 문자별 원본 위치)
+
+        Example:
+            >>> TextNormalizer().compact_with_positions('음, 공격!')
+            ('공격', [3, 4])
+        """
+        if not text:
+            return "", []
+
+        # 문자별 소문자화 (소문자가 여러 글자인 문자도 원본 위치 유지)
+        lowered_chars: List[str] = []
+        lowered_positions: List[int] = []
+        for index, char in enumerate(text):
+            for lowered in char.lower():
+                lowered_chars.append(lowered)
+                lowered_positions.append(index)
+        lowered = ''.join(lowered_chars)
+
+        removed = bytearray(len(lowered))
+        for pattern in self._filler_patterns:
+            for match in pattern.finditer(lowered):
+                removed[match.start():match.end()] = b'\x01' * (match.end() - match.start())
+
+        key_chars: List[str] = []
+        positions: List[int] = []
+        for index, char in enumerate(lowered):
+            if not removed[index] and _WORD_CHAR_PATTERN.match(char):
+                key_chars.append(char)
+                positions.append(lowered_positions[index])
+        return ''.join(key_chars), positions
+
+
+# 언어 조합별 공유 정규화기
+_normalizers: Dict[Tuple[str, ...], TextNormalizer] = {}
+
+
+def get_text_normalizer(language: Optional[str] = None) -> TextNormalizer:
+    """
+    언어별 공유 텍스트 정규화기 반환
+
+    Args:
+        language (str): 언어 코드 ('ko', 'en', 없으면 모든 언어의 불용어 제거)
+
+    Returns:
+        TextNormalizer: 텍스트 정규화기
+    """
+    languages = (language,) if language else tuple(FILLER_WORDS)
+    normalizer = _normalizers.get(languages)
+    if normalizer is None:
+        normalizer = _normalizers.setdefault(languages, TextNormalizer(languages))
+    return normalizer
@@ -0,0 +1,180 @@
+"""
+VoiceMacro Pro - 문자 n-gram TF-IDF 색인 모듈
+음성 명령어의 자모/라틴 문자 n-gram TF-IDF 희소 행렬을 만들고,
+입력 벡터와의 코사인 유사도를 희소 행렬-벡터 곱 한 번으로 계산합니다.
+"""
+
+import math
+from collections import Counter
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from backend.utils.hangul_utils import word_ngrams
+
+
+def tfidf_grams(text: str, n: int = 3) -> Counter:
+    """
+    TF-IDF용 n-gram 빈도 계산 (띄어쓰기를 무시하고 전체를 한 단어로 취급)
+
+    Args:
+        text (str): 텍스트 (소문자화된 상태)
+        n (int): n-gram 길이
+
+    Returns:
+        Counter: n-gram별 등장 횟수
+    """
+    joined = ''.join(text.split())
+    if not joined:
+        return Counter()
+    return Counter(word_ngrams(joined, n))
+
+
+class TfidfIndex:
+    """
+    문자 n-gram TF-IDF 색인 클래스
+    - 문서(음성 명령어)별 가중치: (1 + log tf) x idf, 행 단위 L2 정규화
+    - n-gram 열 단위 희소 행렬(CSC: indptr/indices/data 배열)로 저장
+    - 질의는 입력이 가진 n-gram 열만 모아 np.bincount로 행렬-벡터 곱 계산
+    """
+
+    def __init__(self, texts: Sequence[str], n: int = 3):
+        """
+        TF-IDF 색인 생성
+
+        Args:
+            texts (Sequence[str]): 색인할 텍스트 목록 (소문자화된 상태, 위치가 곧 문서 번호)
+            n (int): n-gram 길이
+        """
+        self.n = n
+        self.size = len(texts)
+
+        document_grams = [tfidf_grams(text, n) for text in texts]
+
+        # 문서 빈도와 n-gram 열 번호
+        document_frequency: Counter = Counter()
+        for grams in document_grams:
+            document_frequency.update(grams.keys())
+        self.vocabulary: Dict[str, int] = {gram: column for column, gram in enumerate(document_frequency)}
+
+        # 평활화된 idf (색인에 없는 n-gram은 문서 빈도 0으로 취급)
+        self._missing_idf = math.log(1.0 + self.size) + 1.0
+        self.idf = np.array(
+            [math.log((1.0 + self.size) / (1.0 + document_frequency[gram])) + 1.0 for gram in self.vocabulary],
+            dtype=np.float64
+        )
+
+        # 열별 (문서 번호, 정규화된 가중치) 목록을 CSC 배열로 변환
+        columns: List[List[Tuple[int, float]]] = [[] for _ in self.vocabulary]
+        for position, grams in enumerate(document_grams):
+            weights = [(self.vocabulary[gram], (1.0 + math.log(count)) * self.idf[self.vocabulary[gram]])
+                       for gram, count in grams.items()]
+            norm = math.sqrt(sum(weight * weight for _, weight in weights))
+            for column, weight in weights:
+                columns[column].append((position, weight / norm))
+
+        lengths = np.fromiter((len(column) for column in columns), dtype=np.int64, count=len(columns))
+        self._indptr = np.zeros(len(columns) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=self._indptr[1:])
+        self._indices = np.fromiter((position for column in columns for position, _ in column),
+                                    dtype=np.int32, count=int(self._indptr[-1]))
+        self._data = np.fromiter((weight for column in columns for _, weight in column),
+                                 dtype=np.float64, count=int(self._indptr[-1]))
+
+    def _query_vector(self, text: str) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        입력 텍스트의 정규화된 TF-IDF 벡터 (색인에 있는 열만) 반환
+
+        색인에 없는 n-gram도 벡터 크기(norm)에는 포함하여 잡음이 많은 입력의 점수를 낮춥니다.
+
+        Args:
+            text (str): 입력 텍스트 (소문자화된 상태)
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: (열 번호 배열, 가중치 배열)
+        """
+        columns: List[int] = []
+        weights: List[float] = []
+        norm_squared = 0.0
+
+        for gram, count in tfidf_grams(text, self.n).items():
+            column = self.vocabulary.get(gram)
+            weight = (1.0 + math.log(count)) * (self.idf[column] if column is not None else self._missing_idf)
+            norm_squared += weight * weight
+            if column is not None:
+                columns.append(column)
+                weights.append(weight)
+
+        if not columns:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64)
+
+        return np.asarray(columns, dtype=np.int64), np.asarray(weights, dtype=np.float64) / math.sqrt(norm_squared)
+
+    def scores(self, text: str) -> np.ndarray:
+        """
+        입력과 모든 문서의 코사인 유사도 계산 (희소 행렬-벡터 곱)
+
+        Args:
+            text (str): 입력 텍스트 (소문자화된 상태)
+
+        Returns:
+            np.ndarray: 문서 순서대로의 코사인 유사도 (0.0-1.0)
+        """
+        columns, weights = self._query_vector(text)
+        if not len(columns) or not self.size:
+            return np.zeros(self.size, dtype=np.float64)
+
+        starts = self._indptr[columns]
+        lengths = self._indptr[columns + 1] - starts
+
+        # 질의 열들의 (문서 번호, 가중치) 구간을 한 번에 모아서 문서별 합산
+        offsets = np.repeat(starts - np.cumsum(lengths) + lengths, lengths) + np.arange(int(lengths.sum()))
+        return np.bincount(self._indices[offsets],
+                           weights=self._data[offsets] * np.repeat(weights, lengths),
+                           minlength=self.size)
+
+    def top_k(self, text: str, k: int, min_score: float = 0.0,
+              scores: Optional[np.ndarray] = None) -> List[Tuple[int, float]]:
+        """
+        코사인 유사도 상위 문서 반환 (argpartition으로 정렬 없이 선택)
+
+        k번째 점수와 같은 동점 문서는 모두 포함하므로 호출자가 동점 순위를 정할 수 있습니다.
+
+        Args:
+            text (str): 입력 텍스트 (소문자화된 상태)
+            k (int): 반환할 문서 수
+            min_score (float): 최소 코사인 유사도
+            scores (np.ndarray): 미리 계산(또는 보정)한 점수 배열 (없으면 계산)
+
+        Returns:
+            List[Tuple[int, float]]: (문서 번호, 점수) 목록 (점수 내림차순, 동점은 문서 순서)
+        """
+        if k <= 0 or not self.size:
+            return []
+
+        if scores is None:
+            scores = self.scores(text)
+
+        cutoff = min_score
+        if k < self.size:
+            cutoff = max(cutoff, float(scores[np.argpartition(scores, self.size - k)[self.size - k]]))
+
+        # 겹치는 n-gram이 없는 문서(점수 0)는 제외, 부동소수점 오차로 1을 넘는 값은 1로 자름
+        positions = np.flatnonzero((scores >= cutoff) & (scores > 0.0))
+        ranked = [(position, min(1.0, round(score, 12))) for position, score in
+                  zip(positions.tolist(), scores[positions].tolist())]
+        ranked.sort(key=lambda item: (-item[1], item[0]))
+        return ranked
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        색인 통계 반환
+
+        Returns:
+            Dict: 색인 통계 정보
+        """
+        return {
+            'documents': self.size,
+            'unique_grams': len(self.vocabulary),
+            'nonzeros': int(self._indptr[-1])
+        }
@@ -0,0 +1,300 @@
+"""
+VoiceMacro Pro - 음성 구간 검출(VAD) 모듈
+오디오 블록을 짧은 프레임으로 나누어 에너지와 영교차율(ZCR)을 한 번에 계산하고,
+연속 음성/행오버 상태로 음성 구간을 표시하여 음성(과 앞쪽 패딩)만 트랜스크립션으로 넘깁니다.
+"""
+
+import math
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from backend.utils.config import Config
+
+# 에너지 로그 계산 시 0 방지
+_ENERGY_EPSILON = 1e-12
+
+
+@dataclass
+class VadResult:
+    """블록 하나의 음성 구간 검출 결과"""
+    audio: np.ndarray                  # 전달할 오디오 (앞쪽 패딩 포함, 없으면 길이 0, 입력 블록의 뷰일 수 있음)
+    is_speech: bool                    # 블록 끝 시점에 음성 구간 안인지
+    speech_started: bool = False       # 이번 블록에서 음성 구간이 시작되었는지
+    speech_ended: bool = False         # 이번 블록에서 음성 구간이 끝났는지
+    segments: List[Tuple[float, float]] = field(default_factory=list)  # 이번 블록에서 끝난 구간 (시작/마지막 음성 끝 초)
+    segment_ends: List[int] = field(default_factory=list)  # 끝난 구간마다 audio 안에서 그 구간 오디오가 끝나는 위치
+
+
+class VoiceActivityDetector:
+    """
+    에너지/영교차율 기반 음성 구간 검출 클래스 (스트림 하나당 인스턴스 하나)
+    - 블록의 모든 프레임 에너지(dBFS)와 영교차율을 행렬 연산으로 한 번에 계산
+    - 음성 판정: 최소 에너지와 배경 잡음 + 여유값을 넘고 영교차율이 잡음보다 낮은 프레임
+    - 연속 onset 프레임이면 구간 시작, 행오버 동안 조용하면 구간 종료
+    - 구간 시작 앞의 패딩은 직전 블록까지의 기록에서 가져옴 (이미 보낸 오디오는 다시 보내지 않음)
+    - 프레임 길이에 맞지 않는 블록 끝부분은 다음 블록과 이어서 판정
+    """
+
+    def __init__(self, sample_rate: int, dtype=np.float32,
+                 frame_ms: Optional[int] = None,
+                 energy_threshold_db: Optional[float] = None,
+                 noise_margin_db: Optional[float] = None,
+                 max_zcr: Optional[float] = None,
+                 onset_ms: Optional[int] = None,
+                 hangover_ms: Optional[int] = None,
+                 padding_ms: Optional[int] = None):
+        """
+        음성 구간 검출기 생성 (지정하지 않은 값은 Config의 VAD 설정 사용)
+
+        Args:
+            sample_rate (int): 샘플레이트 (Hz)
+            dtype: 입력 샘플 자료형 (float32: -1.0 ~ 1.0, int16: PCM16)
+            frame_ms (int): 판정 프레임 길이 (ms)
+            energy_threshold_db (float): 음성으로 볼 최소 에너지 (dBFS)
+            noise_margin_db (float): 배경 잡음보다 높아야 하는 에너지 차이 (dB)
+            max_zcr (float): 음성으로 볼 최대 영교차율 (0.0-1.0)
+            onset_ms (int): 구간 시작으로 볼 연속 음성 길이 (ms)
+            hangover_ms (int): 구간 종료 전 조용해도 유지하는 길이 (ms)
+            padding_ms (int): 구간 시작 앞에 함께 보낼 길이 (ms)
+        """
+        frame_ms = frame_ms or Config.VAD_FRAME_MS
+        onset_ms = Config.VAD_ONSET_MS if onset_ms is None else onset_ms
+        hangover_ms = Config.VAD_HANGOVER_MS if hangover_ms is None else hangover_ms
+        padding_ms = Config.VAD_PADDING_MS if padding_ms is None else padding_ms
+
+        self.sample_rate = sample_rate
+        self.dtype = np.dtype(dtype)
+        self.frame_length = max(2, int(sample_rate * frame_ms / 1000))
+        self.energy_threshold_db = Config.VAD_ENERGY_THRESHOLD_DB if energy_threshold_db is None else energy_threshold_db
+        self.noise_margin_db = Config.VAD_NOISE_MARGIN_DB if noise_margin_db is None else noise_margin_db
+        self.max_zcr = Config.VAD_MAX_ZCR if max_zcr is None else max_zcr
+        self.onset_frames = max(1, math.ceil(onset_ms / frame_ms))
+        self.hangover_frames = max(0, hangover_ms // frame_ms)
+        self.padding_samples = max(0, int(sample_rate * padding_ms / 1000))
+
+        # 정수 PCM은 -1.0 ~ 1.0 범위로 환산하여 에너지 계산
+        self._scale = 1.0 / 32768.0 if self.dtype.kind in 'iu' else 1.0
+
+        # 배경 잡음 추정 (조용한 프레임으로 갱신, 내려갈 때는 빠르게 올라갈 때는 천천히)
+        self.noise_floor_db = self.energy_threshold_db - self.noise_margin_db
+
+        # 직전 블록까지의 기록 (패딩 + onset 프레임 길이) / 프레임에 못 미친 블록 끝부분
+        self._history = np.zeros(self.padding_samples + (self.onset_frames - 1) * self.frame_length, dtype=self.dtype)
+        self._history_length = 0
+        self._carry = np.zeros(self.frame_length, dtype=self.dtype)
+        self._carry_length = 0
+
+        # 스트림 상태 (위치는 스트림 시작부터의 누적 샘플 수)
+        self._position = 0
+        self._forwarded_until = 0
+        self._in_speech = False
+        self._speech_run = 0
+        self._silence_run = 0
+        self._segment_start = 0
+        self._speech_end = 0
+
+        # 검출 통계
+        self.stats = {
+            'frames': 0,
+            'speech_frames': 0,
+            'segments': 0,
+            'input_samples': 0,
+            'forwarded_samples': 0
+        }
+
+    @property
+    def is_speech(self) -> bool:
+        """현재 음성 구간 안인지 여부"""
+        return self._in_speech
+
+    def _frame_features(self, frames: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        프레임별 에너지(dBFS)와 영교차율 계산
+
+        Args:
+            frames (np.ndarray): (프레임 수, 프레임 길이) 샘플 행렬
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: (에너지 dBFS 배열, 영교차율 배열)
+        """
+        values = frames.astype(np.float32, copy=False)
+        energy = np.einsum('ij,ij->i', values, values) * (self._scale * self._scale / self.frame_length)
+        energy_db = 10.0 * np.log10(energy + _ENERGY_EPSILON)
+
+        signs = np.signbit(frames)
+        zcr = np.count_nonzero(signs[:, 1:] != signs[:, :-1], axis=1) / (self.frame_length - 1)
+        return energy_db, zcr
+
+    def _remember(self, data: np.ndarray) -> None:
+        """판정이 끝난 샘플 중 마지막 부분을 패딩용 기록에 보관"""
+        capacity = len(self._history)
+        count = len(data)
+        if not capacity or not count:
+            return
+
+        if count >= capacity:
+            self._history[:] = data[count - capacity:]
+            self._history_length = capacity
+            return
+
+        keep = min(self._history_length, capacity - count)
+        self._history[capacity - count - keep:capacity - count] = self._history[capacity - keep:]
+        self._history[capacity - count:] = data
+        self._history_length = keep + count
+
+    def process(self, samples: np.ndarray) -> VadResult:
+        """
+        오디오 블록의 음성 구간 판정
+
+        Args:
+            samples (np.ndarray): 1차원 오디오 블록 (생성 시 지정한 자료형)
+
+        Returns:
+            VadResult: 판정 결과 (audio는 전달할 음성 구간, 입력 블록의 뷰일 수 있으므로 바로 사용하거나 복사)
+        """
+        samples = samples.reshape(-1)
+        self.stats['input_samples'] += len(samples)
+
+        # 이전 블록에서 남은 부분과 이어서 프레임 단위로 판정
+        if self._carry_length:
+            data = np.concatenate((self._carry[:self._carry_length], samples.astype(self.dtype, copy=False)))
+        else:
+            data = samples
+
+        base = self._position
+        frame_count = len(data) // self.frame_length
+        usable = frame_count * self.frame_length
+
+        spans: List[List[int]] = []
+        closed_spans: List[int] = []
+        segments: List[Tuple[float, float]] = []
+        started = ended = False
+
+        if self._in_speech:
+            spans.append([base, base])
+
+        if frame_count:
+            energy_db, zcr = self._frame_features(data[:usable].reshape(frame_count, self.frame_length))
+
+            for index, (frame_db, frame_zcr) in enumerate(zip(energy_db.tolist(), zcr.tolist())):
+                frame_start = base + index * self.frame_length
+                frame_end = frame_start + self.frame_length
+                threshold = max(self.energy_threshold_db, self.noise_floor_db + self.noise_margin_db)
+                speech = frame_db >= threshold and frame_zcr <= self.max_zcr
+
+                if speech:
+                    self.stats['speech_frames'] += 1
+                    self._silence_run = 0
+                    self._speech_end = frame_end
+                    if not self._in_speech:
+                        self._speech_run += 1
+                        if self._speech_run >= self.onset_frames:
+                            # 구간 시작 (onset 프레임과 앞쪽 패딩부터 전달)
+                            self._in_speech = started = True
+                            self._segment_start = frame_end - self.onset_frames * self.frame_length
+                            forward_start = max(self._segment_start - self.padding_samples,
+                                                self._forwarded_until,
+                                                base - self._history_length)
+                            spans.append([forward_start, frame_end])
+                            continue
+                else:
+                    self._speech_run = 0
+                    if not self._in_speech:
+                        rate = 0.5 if frame_db < self.noise_floor_db else 0.05
+                        self.noise_floor_db += rate * (frame_db - self.noise_floor_db)
+                    else:
+                        self._silence_run += 1
+                        if self._silence_run > self.hangover_frames:
+                            # 구간 종료 (행오버 프레임까지 전달됨)
+                            self._in_speech = False
+                            ended = True
+                            self.stats['segments'] += 1
+                            segments.append((self._segment_start / self.sample_rate,
+                                             self._speech_end / self.sample_rate))
+                            closed_spans.append(len(spans) - 1)
+                            continue
+
+                if self._in_speech:
+                    spans[-1][1] = frame_end
+
+            self.stats['frames'] += frame_count
+
+        audio, span_ends = self._collect(data, base, spans)
+
+        # 다음 블록을 위한 기록/남은 부분 갱신 (전달할 오디오를 먼저 만든 뒤 덮어씀)
+        self._remember(data[:usable])
+        self._carry_length = len(data) - usable
+        self._carry[:self._carry_length] = data[usable:]
+        self._position = base + usable
+
+        return VadResult(audio=audio, is_speech=self._in_speech,
+                         speech_started=started, speech_ended=ended, segments=segments,
+                         segment_ends=[span_ends[index] for index in closed_spans])
+
+    def _collect(self, data: np.ndarray, base: int, spans: List[List[int]]) -> Tuple[np.ndarray, List[int]]:
+        """
+        전달할 구간을 기록/현재 블록에서 모아 하나의 배열로 반환
+
+        Args:
+            data (np.ndarray): 현재 블록 (이전 블록의 남은 부분 포함)
+            base (int): data[0]의 스트림 위치
+            spans (List[List[int]]): 전달할 [시작, 끝) 스트림 위치 목록
+
+        Returns:
+            Tuple[np.ndarray, List[int]]: (전달할 오디오 - 구간이 현재 블록 안에 하나뿐이면 복사 없는 뷰,
+                                           구간별 오디오 안에서의 끝 위치)
+        """
+        pieces = []
+        span_ends = []
+        length = 0
+        from_history = False
+        for start, end in spans:
+            if start < end and start < base:
+                history_end = len(self._history)
+                pieces.append(self._history[history_end - (base - start):history_end])
+                length += base - start
+                from_history = True
+                start = base
+            if end > start:
+                pieces.append(data[start - base:end - base])
+                length += end - start
+            span_ends.append(length)
+
+        spans = [span for span in spans if span[1] > span[0]]
+        if spans:
+            self._forwarded_until = spans[-1][1]
+
+        if not pieces:
+            return data[:0], span_ends
+
+        forwarded = pieces[0] if len(pieces) == 1 and not from_history else np.concatenate(pieces)
+        self.stats['forwarded_samples'] += len(forwarded)
+        return forwarded, span_ends
+
+    def reset(self) -> None:
+        """스트림 상태 초기화 (새 녹음 시작 시)"""
+        self._history_length = 0
+        self._carry_length = 0
+        self._position = 0
+        self._forwarded_until = 0
+        self._in_speech = False
+        self._speech_run = 0
+        self._silence_run = 0
+        self.noise_floor_db = self.energy_threshold_db - self.noise_margin_db
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        검출 통계 반환
+
+        Returns:
+            Dict: 검출 통계 정보
+        """
+        input_samples = self.stats['input_samples']
+        return {
+            **self.stats,
+            'is_speech': self._in_speech,
+            'noise_floor_db': round(self.noise_floor_db, 1),
+            'forwarded_ratio': self.stats['forwarded_samples'] / input_samples if input_samples else 0.0
+        }